@@ -0,0 +1,4 @@
+# benchmarks/__init__.py
+#
+# Standalone performance benchmarks (not part of any test run).
+# See benchmarks/run.py for usage.
@@ -0,0 +1,153 @@
+# benchmarks/bench_comms.py
+#
+# Acquisition throughput: SerialBackend parsing lines from the pty device
+# emulator (the real pyserial stack, no hardware), and the SimBackend loop.
+# Paced-rate and reconnect behaviour are in bench_serial_loopback.
+
+from __future__ import annotations
+
+import time
+import threading
+
+from benchmarks.harness import METRIC_RATE, benchmark
+from benchmarks.device_emulator import DeviceEmulator, EmulatorConfig, pty_available
+
+from comms.sim_backend import SimBackend
+
+
+@benchmark("comms.serial_parse", params=[20_000], metric=METRIC_RATE, unit="lines/s", rounds=3)
+class SerialParse:
+    """Lines written as fast as the pty accepts them; rate = lines parsed per second."""
+
+    def setup(self, ctx, lines):
+        if not pty_available():
+            raise RuntimeError("pseudo-terminals are not available on this platform")
+        from comms.serial_backend import SerialBackend
+
+        self.lines = lines
+        self.emulator = DeviceEmulator(EmulatorConfig(noise=0), link_dir=ctx.workdir)
+        self.emulator.start(paced=False)
+        self.backend = SerialBackend(port=self.emulator.port, timeout=0.01)
+        self.backend.start()
+        # The backend drops the first line after opening (possibly a fragment)
+        self.emulator.write_burst(1)
+        time.sleep(0.1)
+
+    def run(self):
+        start_seq = self.backend.get_stats()["samples"]
+        target = start_seq + self.lines
+
+        writer = threading.Thread(target=self.emulator.write_burst, args=(self.lines,), daemon=True)
+        t0 = time.perf_counter()
+        writer.start()
+        deadline = t0 + 30.0
+        while self.backend.get_stats()["samples"] < target and time.perf_counter() < deadline:
+            time.sleep(0.001)
+        elapsed = time.perf_counter() - t0
+        writer.join(timeout=1.0)
+        return (self.backend.get_stats()["samples"] - start_seq) / elapsed
+
+    def teardown(self):
+        self.backend.stop()
+        self.emulator.stop()
+
+
+@benchmark("comms.sim_loop", metric=METRIC_RATE, unit="samples/s", rounds=3)
+class SimLoop:
+    """SimBackend with no sleep between steps: raw per-sample cost of the loop."""
+
+    window_s = 0.5
+
+    def setup(self, ctx):
+        self.backend = SimBackend(update_interval=0.0)
+        self.backend.start()
+
+    def run(self):
+        start = self.backend.get_stats()["samples"]
+        t0 = time.perf_counter()
+        time.sleep(self.window_s)
+        elapsed = time.perf_counter() - t0
+        return (self.backend.get_stats()["samples"] - start) / elapsed
+
+    def teardown(self):
+        self.backend.stop()
+
+
+@benchmark("comms.multi_glove_merge", params=[4, 10, 32], metric=METRIC_RATE, unit="samples/s", rounds=3)
+class MultiGloveMerge:
+    """
+    Two gloves (channels split evenly) merged by MultiGloveBackend and
+    drained by a CalibratedReader each 'tick'; should stay flat as the
+    channel count grows.
+    """
+
+    samples = 20_000
+    tick = 20          # samples per reader drain (~ one GUI tick at 1 kHz)
+
+    def setup(self, ctx, channels):
+        import numpy as np
+        from comms.calibrated_reader import CalibratedReader
+        from comms.multi_glove import MultiGloveBackend
+
+        left = SimBackend(num_channels=channels // 2)
+        right = SimBackend(num_channels=channels - channels // 2)
+        self.multi = MultiGloveBackend(gloves=[("L", left), ("R", right)])
+        # Feed the gloves' buffers directly (no simulation threads)
+        for idx, (_label, glove) in enumerate(self.multi.gloves):
+            listener = lambda seq, ts, vals, _i=idx: self.multi._on_sample(_i, seq, ts, vals)
+            glove.add_sample_listener(listener)
+        self.left, self.right = left._samples, right._samples
+        self.reader = CalibratedReader(self.multi)
+        rng = np.random.default_rng(0)
+        self.lvals = rng.integers(0, 4096, size=(64, left.num_channels)).tolist()
+        self.rvals = rng.integers(0, 4096, size=(64, right.num_channels)).tolist()
+
+    def run(self):
+        left, right, reader = self.left, self.right, self.reader
+        lvals, rvals = self.lvals, self.rvals
+        t0 = time.perf_counter()
+        for i in range(self.samples):
+            ts = t0 + i * 0.001
+            right.append(ts, rvals[i & 63])
+            left.append(ts, lvals[i & 63])
+            if i % self.tick == 0:
+                reader.read()
+        reader.read()
+        return self.samples / (time.perf_counter() - t0)
+
+
+@benchmark("comms.align_resample", params=["linear", "nearest"], metric=METRIC_RATE, unit="samples/s", rounds=3)
+class AlignResample:
+    """
+    Two 5-channel streams at different rates and jitter pushed into a
+    StreamAligner in tick-sized batches and pulled onto a 100 Hz grid;
+    rate is input samples per second.
+    """
+
+    samples = 50_000
+    tick = 20
+
+    def setup(self, ctx, method):
+        import numpy as np
+        from comms.resample import StreamAligner
+
+        self.aligner = StreamAligner([5, 5], rate_hz=100.0, method=method)
+        rng = np.random.default_rng(0)
+        n = self.samples
+        # ~1 kHz and ~700 Hz with USB-style jitter
+        self.ts = [
+            1000.0 + np.cumsum(rng.uniform(0.5e-3, 1.5e-3, n)),
+            1000.0 + np.cumsum(rng.uniform(1.0e-3, 1.9e-3, n)),
+        ]
+        self.vals = [rng.integers(0, 4096, size=(n, 5)).astype(float) for _ in range(2)]
+
+    def run(self):
+        aligner, tick = self.aligner, self.tick
+        aligner.reset()
+        t0 = time.perf_counter()
+        for start in range(0, self.samples, tick):
+            end = start + tick
+            for i in (0, 1):
+                aligner.push(i, self.ts[i][start:end], self.vals[i][start:end])
+            aligner.pull()
+        return 2 * self.samples / (time.perf_counter() - t0)
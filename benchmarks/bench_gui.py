@@ -0,0 +1,141 @@
+# benchmarks/bench_gui.py
+#
+# GUI-thread work with Qt offscreen: one game_tick (reader, rep engine,
+# widget updates), one clinician live-wall tick, and building the adherence
+# calendar from a long history.
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+from benchmarks.harness import benchmark, qt_app
+from benchmarks.bench_storage import synthetic_sessions
+
+from comms.sample_buffer import SampleBuffer
+
+NUM_CHANNELS = 4
+
+
+class FeedBackend:
+    """
+    Backend-shaped sample source for driving GUI ticks deterministically:
+    push() appends samples, the window drains them via get_samples_since().
+    """
+
+    def __init__(self, num_channels: int = NUM_CHANNELS, seed: int = 0):
+        self.num_channels = num_channels
+        self._samples = SampleBuffer(num_channels)
+        self._rng = np.random.default_rng(seed)
+        self._phase = 0.0
+
+    def push(self, n: int) -> None:
+        now = time.time()
+        for i in range(n):
+            # Slow squeeze/release so values sweep through the target band
+            self._phase += 0.02
+            level = 2048 + 1800 * np.sin(self._phase + np.arange(self.num_channels))
+            noise = self._rng.integers(-30, 30, size=self.num_channels)
+            self._samples.append(now - (n - 1 - i) * 0.01, [int(v) for v in np.clip(level + noise, 0, 4095)])
+
+    def get_samples_since(self, cursor):
+        return self._samples.since(cursor)
+
+    def get_latest(self):
+        return self._samples.latest()
+
+    def get_last_timestamp(self):
+        return self._samples.last_timestamp()
+
+    def get_stats(self) -> dict:
+        return {"samples": self._samples.seq}
+
+
+@benchmark("gui.game_tick")
+class GameTick:
+    """One 20 ms GUI tick with a running session and two new 100 Hz samples."""
+
+    number = 500
+
+    def setup(self, ctx):
+        self.app = qt_app()
+        from host.gui.patient_dashboard.patient_game_app import PatientGameWindow
+
+        self.window = PatientGameWindow(log_to_json=False)
+        self.window._play_sound = lambda cue: None
+        self.window._save_stats = lambda: None
+        self.feed = FeedBackend()
+        self.window.backend = self.feed
+        # Session "running" without letting the timer fire on its own
+        self.window.timer.start()
+        self.window.timer.blockSignals(True)
+
+    def run(self):
+        self.feed.push(2)
+        self.window.game_tick()
+
+    def teardown(self):
+        self.window.timer.stop()
+        self.window.backend = None
+        self.window.close()
+        self.window.deleteLater()
+        self.app.processEvents()
+
+
+@benchmark("gui.adherence_calendar", params=[100, 1_000, 10_000, 100_000], rounds=3)
+class AdherenceCalendarBuild:
+    def setup(self, ctx, sessions):
+        qt_app()
+        import host.gui.common.dashboard_calendar as dashboard_calendar
+
+        self.module = dashboard_calendar
+        self._saved = (dashboard_calendar.SESSIONS_LOG_PATH, dashboard_calendar.PATIENT_PROFILE_PATH)
+
+        dashboard_calendar.SESSIONS_LOG_PATH = ctx.path(f"calendar_sessions_{sessions}.json")
+        with open(dashboard_calendar.SESSIONS_LOG_PATH, "w") as f:
+            json.dump(synthetic_sessions(sessions), f)
+        dashboard_calendar.PATIENT_PROFILE_PATH = ctx.path("patient_profile.json")
+        with open(dashboard_calendar.PATIENT_PROFILE_PATH, "w") as f:
+            json.dump({"start_date": (date.today() - timedelta(days=sessions // 3 + 1)).isoformat()}, f)
+
+    def run(self):
+        cal = self.module.AdherenceCalendar()
+        cal.deleteLater()
+
+    def teardown(self):
+        self.module.SESSIONS_LOG_PATH, self.module.PATIENT_PROFILE_PATH = self._saved
+
+
+@benchmark("gui.live_wall_tick", params=[8, 16], rounds=3)
+class LiveWallTick:
+    """One shared wall tick: every glove gets five new 100 Hz samples (50 ms)."""
+
+    number = 100
+
+    def setup(self, ctx, gloves):
+        self.app = qt_app()
+        from host.gui.clinician_dashboard.live_wall import LiveWallWindow
+
+        self.window = LiveWallWindow()
+        self.window.timer.stop()
+        self.feeds = [FeedBackend(num_channels=6 if i % 2 else NUM_CHANNELS, seed=i) for i in range(gloves)]
+        for i, feed in enumerate(self.feeds):
+            self.window.add_backend(f"P{i + 1}", feed)
+        # Fill the sparklines so every tick draws full-width curves
+        for feed in self.feeds:
+            feed.push(1000)
+        self.window.wall_tick()
+
+    def run(self):
+        for feed in self.feeds:
+            feed.push(5)
+        self.window.wall_tick()
+
+    def teardown(self):
+        self.window.tiles = []   # FeedBackends have nothing to stop
+        self.window.close()
+        self.window.deleteLater()
+        self.app.processEvents()
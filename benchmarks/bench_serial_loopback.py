@@ -0,0 +1,156 @@
+# benchmarks/bench_serial_loopback.py
+#
+# SerialBackend against the pty device emulator at paced rates:
+#   serial.max_rate      highest line rate the backend keeps up with
+#   serial.faulty_stream samples/s recovered from a stream with garbage,
+#                        split and truncated lines
+#   serial.reconnect     time from the device reappearing to the first new sample
+
+from __future__ import annotations
+
+import time
+import logging
+
+from benchmarks.harness import METRIC_LATENCY, METRIC_RATE, benchmark
+from benchmarks.device_emulator import DeviceEmulator, EmulatorConfig, pty_available
+
+logger = logging.getLogger("cardinal_grip.benchmarks.serial")
+
+SUSTAINED_FRACTION = 0.99      # delivered / generated to count a rate as sustained
+DRAIN_S = 0.1                  # wait for lines already in the pty before counting
+RATE_STEP_S = 1.5              # measurement window per rate step
+MAX_RATE_HZ = 25_600
+
+
+def _require_pty() -> None:
+    if not pty_available():
+        raise RuntimeError("pseudo-terminals are not available on this platform")
+
+
+def _wait_for_samples(backend, count: int, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    start = backend.get_stats()["samples"]
+    while time.monotonic() < deadline:
+        if backend.get_stats()["samples"] - start >= count:
+            return True
+        time.sleep(0.002)
+    return False
+
+
+def measure_delivery(ctx, rate_hz: float, seconds: float = RATE_STEP_S, **faults) -> dict:
+    """Stream at rate_hz for `seconds`; counts of generated / delivered lines."""
+    from comms.serial_backend import SerialBackend
+
+    emu = DeviceEmulator(EmulatorConfig(rate_hz=rate_hz, **faults), link_dir=ctx.workdir)
+    emu.start()
+    backend = SerialBackend(port=emu.port, timeout=0.01)
+    try:
+        backend.start()
+        _wait_for_samples(backend, 1, timeout=2.0)
+        # Both counters are read with the emulator paused and the pty drained,
+        # so every delivered line in the window was generated in it
+        emu.pause()
+        time.sleep(DRAIN_S)
+        s0, e0 = backend.get_stats()["samples"], emu.seq
+        emu.resume()
+        t0 = time.perf_counter()
+        time.sleep(seconds)
+        emu.pause()
+        elapsed = time.perf_counter() - t0
+        time.sleep(DRAIN_S)
+        delivered = backend.get_stats()["samples"] - s0
+        generated = emu.seq - e0
+        fraction = delivered / generated if generated else 0.0
+        if fraction > 1.0:
+            raise RuntimeError(f"delivered {delivered} of {generated} generated lines at {rate_hz:.0f} Hz")
+        return {
+            "rate_hz": rate_hz,
+            "generated": generated,
+            "delivered": delivered,
+            "fraction": fraction,
+            "elapsed": elapsed,
+            "bad_lines": backend.get_stats()["bad_lines"],
+            "emulator": emu.stats(),
+        }
+    finally:
+        backend.stop()
+        emu.stop()
+
+
+@benchmark("serial.max_rate", metric=METRIC_RATE, unit="Hz", rounds=1)
+class MaxSustainedRate:
+    """Double the line rate from 100 Hz until the backend falls behind."""
+
+    def setup(self, ctx):
+        _require_pty()
+        self.ctx = ctx
+
+    def run(self):
+        best = 0.0
+        rate = 100.0
+        while rate <= MAX_RATE_HZ:
+            res = measure_delivery(self.ctx, rate, noise=20)
+            logger.info(
+                "%.0f Hz: %d/%d lines (%.1f%%)",
+                rate, res["delivered"], res["generated"], 100 * res["fraction"],
+            )
+            if res["fraction"] < SUSTAINED_FRACTION:
+                break
+            best = rate
+            rate *= 2
+        return best
+
+
+@benchmark("serial.faulty_stream", params=[500], metric=METRIC_RATE, unit="samples/s", rounds=3)
+class FaultyStream:
+    """Noise + 2% garbage + 5% split + 1% truncated lines; valid samples recovered per second."""
+
+    def setup(self, ctx, rate_hz):
+        _require_pty()
+        self.ctx = ctx
+        self.rate_hz = rate_hz
+
+    def run(self):
+        res = measure_delivery(
+            self.ctx,
+            self.rate_hz,
+            seconds=2.0,
+            noise=40,
+            garbage_prob=0.02,
+            partial_prob=0.05,
+            truncate_prob=0.01,
+        )
+        return res["delivered"] / res["elapsed"]
+
+
+@benchmark("serial.reconnect", metric=METRIC_LATENCY, rounds=3)
+class Reconnect:
+    """Unplug for 0.3 s; seconds from the port reappearing to the next parsed sample."""
+
+    down_s = 0.3
+
+    def setup(self, ctx):
+        _require_pty()
+        from comms.serial_backend import SerialBackend
+
+        self.emu = DeviceEmulator(EmulatorConfig(rate_hz=100), link_dir=ctx.workdir)
+        self.emu.start()
+        self.backend = SerialBackend(port=self.emu.port, timeout=0.01)
+        self.backend.start()
+        if not _wait_for_samples(self.backend, 10, timeout=3.0):
+            raise RuntimeError("no samples from the emulator before the reconnect test")
+
+    def run(self):
+        self.emu.disconnect(down_s=self.down_s)
+        replugged = self.emu.last_reconnect
+        before = self.backend.get_stats()["samples"]
+        deadline = time.time() + 15.0
+        while time.time() < deadline:
+            if self.backend.get_stats()["samples"] > before and self.backend.get_last_timestamp() > replugged:
+                return self.backend.get_last_timestamp() - replugged
+            time.sleep(0.002)
+        raise RuntimeError("backend did not reconnect within 15 s")
+
+    def teardown(self):
+        self.backend.stop()
+        self.emu.stop()
@@ -0,0 +1,56 @@
+# benchmarks/bench_server.py
+#
+# Stream server fan-out without the network: one DeviceStream pump
+# encoding frames for N WebSocket clients (half at full rate, half
+# decimated by 4), with the client queues drained like the send tasks do.
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from benchmarks.harness import METRIC_RATE, benchmark
+
+from comms.sample_buffer import SampleBuffer
+
+NUM_CHANNELS = 6
+
+
+class _Device:
+    num_channels = NUM_CHANNELS
+
+    def __init__(self):
+        self._samples = SampleBuffer(NUM_CHANNELS)
+
+    def get_samples_since(self, cursor):
+        return self._samples.since(cursor)
+
+
+@benchmark("server.stream_fanout", params=[1, 16, 64], metric=METRIC_RATE, unit="samples/s", rounds=3)
+class StreamFanout:
+    """Device samples per second pumped to every client; should degrade gently with client count."""
+
+    samples = 20_000
+    tick = 5           # samples per pump (100 Hz device, 50 ms pump)
+
+    def setup(self, ctx, clients):
+        from host.server.stream_server import DeviceStream, StreamClient
+
+        self.device = _Device()
+        self.stream = DeviceStream("bench", self.device)
+        self.stream.clients = [StreamClient(1 if i % 2 == 0 else 4) for i in range(clients)]
+        rng = np.random.default_rng(0)
+        self.rows = rng.integers(0, 4096, size=(64, NUM_CHANNELS)).tolist()
+
+    def run(self):
+        buf, stream, rows, tick = self.device._samples, self.stream, self.rows, self.tick
+        t0 = time.perf_counter()
+        for i in range(0, self.samples, tick):
+            for j in range(i, i + tick):
+                buf.append(t0 + j * 0.01, rows[j & 63])
+            stream.pump_once()
+            for client in stream.clients:
+                while not client.queue.empty():
+                    client.queue.get_nowait()
+        return self.samples / (time.perf_counter() - t0)
@@ -0,0 +1,129 @@
+# benchmarks/bench_storage.py
+#
+# Loading and logging paths that grow with the amount of stored data:
+# ClinicianWindow._load_csv on large session CSVs, and
+# log_session_completion against a long session history.
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from benchmarks.harness import benchmark, qt_app
+
+import host.gui.common.session_logging as session_logging
+
+NUM_CHANNELS = 4
+CSV_CHUNK_ROWS = 500_000
+
+
+# ---------- synthetic data ----------
+
+def write_session_csv(path: str, rows: int, fs: float = 100.0) -> str:
+    """Monitor-style CSV (time_s, ch0..3_adc, tmin_adc, tmax_adc), written in chunks."""
+    rng = np.random.default_rng(0)
+    with open(path, "w", newline="") as f:
+        f.write("time_s," + ",".join(f"ch{c}_adc" for c in range(NUM_CHANNELS)) + ",tmin_adc,tmax_adc\n")
+        for start in range(0, rows, CSV_CHUNK_ROWS):
+            n = min(CSV_CHUNK_ROWS, rows - start)
+            t = (np.arange(start, start + n) / fs)[:, None]
+            adc = rng.integers(0, 4096, size=(n, NUM_CHANNELS))
+            band = np.tile([1200, 2500], (n, 1))
+            np.savetxt(f, np.hstack([t, adc, band]), fmt=["%.3f"] + ["%d"] * (NUM_CHANNELS + 2), delimiter=",")
+    return path
+
+
+def synthetic_sessions(n: int) -> list[dict]:
+    """n sessions_log.json entries spread over the last ~n/3 days."""
+    rng = np.random.default_rng(1)
+    now = datetime.now().replace(microsecond=0)
+    sessions = []
+    for i in range(n):
+        reps = [int(r) for r in rng.integers(0, 12, size=NUM_CHANNELS)]
+        ts = now - timedelta(hours=8 * (n - i))
+        sessions.append({
+            "id": f"session_bench_{i:07d}",
+            "timestamp": ts.isoformat(timespec="seconds"),
+            "mode": "game",
+            "source": "benchmark",
+            "reps_per_channel": reps,
+            "combo_reps": int(rng.integers(0, 4)),
+            "fingers_used": sum(1 for r in reps if r > 0),
+            "total_reps": sum(reps),
+            "csv_path": None,
+        })
+    return sessions
+
+
+# ---------- benchmarks ----------
+
+@benchmark(
+    "storage.clinician_load_csv",
+    params=[10_000, 100_000, 1_000_000],
+    full_params=[10_000_000],
+    rounds=3,
+)
+class ClinicianLoadCsv:
+    def setup(self, ctx, rows):
+        qt_app()
+        from host.gui.clinician_dashboard.clinician_app import ClinicianWindow
+
+        self.path = ctx.cached(
+            f"csv_{rows}",
+            lambda: write_session_csv(ctx.path(f"session_{rows}.csv"), rows),
+        )
+        self.window = ClinicianWindow()
+
+    def run(self):
+        self.window._load_csv(self.path)
+
+    def teardown(self):
+        self.window.close()
+        self.window.deleteLater()
+
+
+@benchmark("storage.log_session_completion", params=[10, 1_000, 10_000, 100_000])
+class LogSessionCompletion:
+    """One completed session appended to a JSON log + SQLite index of `existing` sessions."""
+
+    def setup(self, ctx, existing):
+        self._saved = (session_logging.SESSIONS_JSON_PATH, session_logging.SESSIONS_DB_PATH)
+        session_logging.SESSIONS_JSON_PATH = ctx.path(f"sessions_{existing}.json")
+        session_logging.SESSIONS_DB_PATH = ctx.path(f"sessions_{existing}.db")
+
+        sessions = synthetic_sessions(existing)
+        with open(session_logging.SESSIONS_JSON_PATH, "w") as f:
+            json.dump(sessions, f, indent=2)
+        session_logging._ensure_db()
+        conn = sqlite3.connect(session_logging.SESSIONS_DB_PATH)
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sessions "
+                "(id, timestamp, mode, source, fingers_used, combo_reps, total_reps, csv_path) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (s["id"], s["timestamp"], s["mode"], s["source"],
+                     s["fingers_used"], s["combo_reps"], s["total_reps"], s["csv_path"])
+                    for s in sessions
+                ],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        self.calls = 0
+
+    def run(self):
+        self.calls += 1
+        session_logging.log_session_completion(
+            mode="game",
+            source="benchmark",
+            reps_per_channel=[3, 5, 0, 2],
+            combo_reps=1,
+            session_id=f"session_bench_new_{self.calls}",
+        )
+
+    def teardown(self):
+        session_logging.SESSIONS_JSON_PATH, session_logging.SESSIONS_DB_PATH = self._saved
@@ -0,0 +1,329 @@
+# benchmarks/device_emulator.py
+#
+# Glove emulator on a Linux/macOS pseudo-terminal, for exercising
+# SerialBackend through the real pyserial stack without hardware.
+#
+# The emulator writes the same lines as firmware/esp32_cardinal_grip.ino
+# ("v0,v1,v2,v3", or "seq,t_ms,v0,..." with STREAM_TIMING) at a paced rate,
+# and can inject noise, lines split across writes, truncated lines, garbage
+# and disconnects. Its port is a stable symlink (like /dev/serial/by-id/...)
+# that is re-pointed at a fresh pty after every disconnect, so a backend
+# reopening the same path reconnects the way it would to a replugged board.
+#
+# Like the USB CDC link, a host that doesn't keep up loses lines: writes
+# that would block are dropped and counted instead of applying backpressure.
+#
+# Usage (point the app or record daemon at the printed port):
+#   python -m benchmarks.device_emulator --rate 100
+#   python -m benchmarks.device_emulator --rate 1000 --garbage 0.01 --partial 0.05 --disconnect-every 10
+
+from __future__ import annotations
+
+import os
+import sys
+import math
+import time
+import errno
+import random
+import logging
+import argparse
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger("cardinal_grip.benchmarks.emulator")
+
+ADC_MAX = 4095
+
+
+def pty_available() -> bool:
+    return hasattr(os, "openpty") and sys.platform != "win32"
+
+
+@dataclass
+class EmulatorConfig:
+    rate_hz: float = 100.0           # lines per second (firmware default: 100)
+    channels: int = 4
+    timing: bool = True              # "seq,t_ms," prefix (firmware STREAM_TIMING)
+    noise: int = 20                  # ± ADC jitter per value
+    partial_prob: float = 0.0        # line split across two writes with a short gap
+    truncate_prob: float = 0.0       # line cut off mid-way (no newline until the next line)
+    garbage_prob: float = 0.0        # random bytes line instead of data
+    disconnect_every_s: float = 0.0  # 0 = never
+    disconnect_for_s: float = 0.5    # time unplugged before a new pty appears
+    seed: int = 0
+
+
+class DeviceEmulator:
+    """
+    emu = DeviceEmulator(EmulatorConfig(rate_hz=500, garbage_prob=0.01))
+    emu.start()
+    backend = SerialBackend(port=emu.port)
+    ...
+    emu.stop(); emu.stats()
+    """
+
+    def __init__(self, config: Optional[EmulatorConfig] = None, link_dir: Optional[str] = None):
+        self.config = config or EmulatorConfig()
+        self._own_dir = link_dir is None
+        self.link_dir = link_dir or tempfile.mkdtemp(prefix="cardinal_grip_emu_")
+        self.port = os.path.join(self.link_dir, "ttyCARDINAL")
+
+        self._rng = random.Random(self.config.seed)
+        self._master: Optional[int] = None
+        self._slave: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._lock = threading.Lock()
+        self._t0 = time.monotonic()
+
+        self.seq = 0
+        self.sent = 0
+        self.dropped = 0
+        self.garbage = 0
+        self.partial = 0
+        self.truncated = 0
+        self.disconnects = 0
+        self.last_disconnect: Optional[float] = None   # time.time() of the last unplug
+        self.last_reconnect: Optional[float] = None    # time.time() the new pty appeared
+
+    # ---------- pty / link ----------
+
+    def _plug(self) -> None:
+        import tty
+
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        os.set_blocking(master, False)
+        tmp = self.port + ".new"
+        if os.path.lexists(tmp):
+            os.unlink(tmp)
+        os.symlink(os.ttyname(slave), tmp)
+        os.replace(tmp, self.port)
+        with self._lock:
+            self._master, self._slave = master, slave
+
+    def _unplug(self) -> None:
+        with self._lock:
+            fds = (self._master, self._slave)
+            self._master = self._slave = None
+        for fd in fds:
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        if os.path.lexists(self.port):
+            os.unlink(self.port)
+
+    def disconnect(self, down_s: Optional[float] = None) -> None:
+        """Unplug now; a new pty appears at self.port after down_s seconds."""
+        self.disconnects += 1
+        self.last_disconnect = time.time()
+        self._unplug()
+        time.sleep(self.config.disconnect_for_s if down_s is None else down_s)
+        if self._running:
+            self._plug()
+            self.last_reconnect = time.time()
+
+    # ---------- lines ----------
+
+    def _line(self) -> bytes:
+        cfg = self.config
+        phase = self.seq / max(cfg.rate_hz, 1.0)
+        vals = []
+        for c in range(cfg.channels):
+            base = 2048 + 1600 * math.sin(2 * math.pi * 0.2 * phase + c)
+            v = int(base + self._rng.randint(-cfg.noise, cfg.noise)) if cfg.noise else int(base)
+            vals.append(str(max(0, min(ADC_MAX, v))))
+        fields = vals
+        if cfg.timing:
+            t_ms = int((time.monotonic() - self._t0) * 1000)
+            fields = [str(self.seq), str(t_ms)] + vals
+        self.seq += 1
+        return (",".join(fields) + "\n").encode()
+
+    def _write(self, data: bytes, lines: int = 1) -> bool:
+        with self._lock:
+            fd = self._master
+        if fd is None:
+            self.dropped += lines
+            return False
+        try:
+            n = os.write(fd, data)
+        except BlockingIOError:
+            self.dropped += lines
+            return False
+        except OSError as e:
+            if e.errno in (errno.EIO, errno.EBADF):
+                self.dropped += lines
+                return False
+            raise
+        if n < len(data):
+            # Host buffer full mid-write: the rest of the line is lost
+            self.dropped += lines
+            return False
+        return True
+
+    def _emit_one(self) -> None:
+        cfg = self.config
+        r = self._rng.random()
+        if r < cfg.garbage_prob:
+            junk = bytes(self._rng.randrange(32, 127) for _ in range(self._rng.randint(3, 40)))
+            self.garbage += 1
+            self._write(junk + b"\n")
+            return
+        line = self._line()
+        r -= cfg.garbage_prob
+        if r < cfg.truncate_prob:
+            self.truncated += 1
+            self._write(line[: self._rng.randint(1, len(line) - 2)])
+            return
+        r -= cfg.truncate_prob
+        if r < cfg.partial_prob:
+            cut = self._rng.randint(1, len(line) - 1)
+            self.partial += 1
+            if self._write(line[:cut]):
+                time.sleep(0.0005)
+                if self._write(line[cut:]):
+                    self.sent += 1
+            return
+        if self._write(line):
+            self.sent += 1
+
+    def write_burst(self, lines: int) -> int:
+        """Write `lines` clean lines as fast as the pty accepts them (blocking); returns count."""
+        payload = b"".join(self._line() for _ in range(lines))
+        view = memoryview(payload)
+        with self._lock:
+            fd = self._master
+        while view:
+            try:
+                n = os.write(fd, view[:4096])
+            except BlockingIOError:
+                time.sleep(0.0002)
+                continue
+            view = view[n:]
+        self.sent += lines
+        return lines
+
+    # ---------- loop ----------
+
+    def _run(self) -> None:
+        cfg = self.config
+        period = 1.0 / cfg.rate_hz
+        start = time.monotonic()
+        emitted = 0
+        next_disconnect = start + cfg.disconnect_every_s if cfg.disconnect_every_s > 0 else None
+        while self._running:
+            now = time.monotonic()
+            if next_disconnect is not None and now >= next_disconnect:
+                self.disconnect()
+                # Lines that would have been sampled while unplugged are never sent
+                start = time.monotonic()
+                emitted = 0
+                next_disconnect = start + cfg.disconnect_every_s
+                continue
+            due = int((now - start) / period) + 1
+            if due > emitted:
+                # Catch up in one go if the thread fell behind
+                for _ in range(min(due - emitted, 1000)):
+                    self._emit_one()
+                emitted = due
+            else:
+                time.sleep(max(0.0, start + emitted * period - now))
+
+    def start(self, paced: bool = True) -> None:
+        """Create the pty; with paced=True also start streaming at config.rate_hz."""
+        self._plug()
+        self._running = True
+        if paced:
+            self._thread = threading.Thread(target=self._run, name="device-emulator", daemon=True)
+            self._thread.start()
+        logger.info("Device emulator on %s (%.0f Hz)", self.port, self.config.rate_hz)
+
+    def pause(self) -> None:
+        """Stop streaming but keep the pty open (lines already written can still be read)."""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def resume(self) -> None:
+        """Restart paced streaming after pause()."""
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="device-emulator", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.pause()
+        self._unplug()
+        if self._own_dir:
+            try:
+                os.rmdir(self.link_dir)
+            except OSError:
+                pass
+
+    def stats(self) -> dict:
+        return {
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "garbage": self.garbage,
+            "partial": self.partial,
+            "truncated": self.truncated,
+            "disconnects": self.disconnects,
+        }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="cardinal-grip-emulator",
+        description="Emulate the glove's serial stream on a pseudo-terminal.",
+    )
+    parser.add_argument("--rate", type=float, default=100.0, help="Lines per second (default 100)")
+    parser.add_argument("--channels", type=int, default=4)
+    parser.add_argument("--no-timing", action="store_true", help="Plain v0,v1,... lines (no seq,t_ms prefix)")
+    parser.add_argument("--noise", type=int, default=20, help="± ADC jitter")
+    parser.add_argument("--partial", type=float, default=0.0, help="Probability a line is split across writes")
+    parser.add_argument("--truncate", type=float, default=0.0, help="Probability a line is cut short")
+    parser.add_argument("--garbage", type=float, default=0.0, help="Probability of a garbage line")
+    parser.add_argument("--disconnect-every", type=float, default=0.0, help="Unplug every N seconds (0 = never)")
+    parser.add_argument("--disconnect-for", type=float, default=0.5, help="Seconds unplugged")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if not pty_available():
+        print("Pseudo-terminals are not available on this platform.", file=sys.stderr)
+        return 1
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    emu = DeviceEmulator(EmulatorConfig(
+        rate_hz=args.rate,
+        channels=args.channels,
+        timing=not args.no_timing,
+        noise=args.noise,
+        partial_prob=args.partial,
+        truncate_prob=args.truncate,
+        garbage_prob=args.garbage,
+        disconnect_every_s=args.disconnect_every,
+        disconnect_for_s=args.disconnect_for,
+        seed=args.seed,
+    ))
+    emu.start()
+    print(emu.port, flush=True)
+    try:
+        while True:
+            time.sleep(5.0)
+            logger.info("%s", emu.stats())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emu.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
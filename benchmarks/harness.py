@@ -0,0 +1,297 @@
+# benchmarks/harness.py
+#
+# Minimal benchmark registry + runner + baseline comparison.
+#
+# A benchmark is a class registered with @benchmark:
+#
+#   @benchmark("storage.load_csv", params=[10_000, 100_000], full_params=[10_000_000])
+#   class LoadCsv:
+#       number = 1                 # run() calls per round (result is per call)
+#       def setup(self, ctx, rows): ...
+#       def run(self): ...
+#       def teardown(self): ...    # optional
+#
+# metric="time": run() is timed, lower is better (seconds per call).
+# metric="rate": run() returns a throughput (e.g. samples/s), higher is better.
+# metric="latency": run() returns a duration it measured itself (seconds),
+#                   lower is better (e.g. reconnect time).
+#
+# Each (benchmark, param) gets `rounds` rounds; the median is reported and
+# compared against a saved baseline.
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import platform
+import statistics
+import subprocess
+import tempfile
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("cardinal_grip.benchmarks")
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+METRIC_TIME = "time"
+METRIC_RATE = "rate"
+METRIC_LATENCY = "latency"
+
+DEFAULT_ROUNDS = 5
+DEFAULT_THRESHOLD = 0.10       # 10% worse than baseline = regression
+
+
+@dataclass
+class BenchSpec:
+    name: str
+    cls: type
+    params: List[Any]
+    full_params: List[Any]
+    metric: str
+    unit: str
+    rounds: int
+
+
+@dataclass
+class BenchResult:
+    key: str                     # "name[param]"
+    metric: str
+    unit: str
+    median: Optional[float] = None
+    best: Optional[float] = None
+    rounds: List[float] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+REGISTRY: List[BenchSpec] = []
+
+
+def benchmark(
+    name: str,
+    params=(None,),
+    full_params=(),
+    metric: str = METRIC_TIME,
+    unit: Optional[str] = None,
+    rounds: int = DEFAULT_ROUNDS,
+) -> Callable[[type], type]:
+    def register(cls: type) -> type:
+        REGISTRY.append(
+            BenchSpec(
+                name=name,
+                cls=cls,
+                params=list(params),
+                full_params=list(full_params),
+                metric=metric,
+                unit=unit or ("ops/s" if metric == METRIC_RATE else "s"),
+                rounds=rounds,
+            )
+        )
+        return cls
+    return register
+
+
+_QT_APP = None
+
+
+def qt_app():
+    """The process QApplication (offscreen unless a platform is already chosen), kept alive for the run."""
+    global _QT_APP
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+
+    if _QT_APP is None:
+        _QT_APP = QApplication.instance() or QApplication([sys.argv[0]])
+    return _QT_APP
+
+
+def result_key(name: str, param) -> str:
+    return name if param is None else f"{name}[{param}]"
+
+
+class BenchContext:
+    """Shared per-run state: a scratch directory and a file cache across params."""
+
+    def __init__(self):
+        self.workdir = tempfile.mkdtemp(prefix="cardinal_grip_bench_")
+        self._cache: Dict[str, Any] = {}
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.workdir, name)
+
+    def cached(self, key: str, build: Callable[[], Any]) -> Any:
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def close(self) -> None:
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+def _run_one(spec: BenchSpec, param, ctx: BenchContext, rounds: int) -> BenchResult:
+    key = result_key(spec.name, param)
+    result = BenchResult(key=key, metric=spec.metric, unit=spec.unit)
+    bench = spec.cls()
+    number = max(1, int(getattr(bench, "number", 1)))
+    try:
+        if param is None:
+            bench.setup(ctx)
+        else:
+            bench.setup(ctx, param)
+        try:
+            for _ in range(rounds):
+                if spec.metric in (METRIC_RATE, METRIC_LATENCY):
+                    result.rounds.append(float(bench.run()))
+                else:
+                    t0 = time.perf_counter()
+                    for _ in range(number):
+                        bench.run()
+                    result.rounds.append((time.perf_counter() - t0) / number)
+        finally:
+            teardown = getattr(bench, "teardown", None)
+            if teardown is not None:
+                teardown()
+    except Exception as e:
+        logger.exception("Benchmark %s failed", key)
+        result.error = f"{type(e).__name__}: {e}"
+        return result
+
+    result.median = statistics.median(result.rounds)
+    result.best = max(result.rounds) if spec.metric == METRIC_RATE else min(result.rounds)
+    return result
+
+
+def run_benchmarks(
+    select: Optional[List[str]] = None,
+    full: bool = False,
+    rounds: Optional[int] = None,
+    progress: Callable[[BenchResult], None] = lambda r: None,
+) -> List[BenchResult]:
+    """Run registered benchmarks whose name starts with any of `select`."""
+    ctx = BenchContext()
+    results = []
+    try:
+        for spec in REGISTRY:
+            if select and not any(spec.name.startswith(s) for s in select):
+                continue
+            params = spec.params + (spec.full_params if full else [])
+            for param in params:
+                res = _run_one(spec, param, ctx, rounds or spec.rounds)
+                results.append(res)
+                progress(res)
+    finally:
+        ctx.close()
+    return results
+
+
+# ---------- persistence / comparison ----------
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=5,
+        )
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def results_doc(results: List[BenchResult]) -> dict:
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.node(),
+        },
+        "results": {r.key: asdict(r) for r in results},
+    }
+
+
+def save_results(doc: dict, path: str) -> str:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2)
+    os.replace(tmp, path)
+    return path
+
+
+def load_results(path: str) -> Optional[dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def compare(results: List[BenchResult], baseline: Optional[dict], threshold: float = DEFAULT_THRESHOLD):
+    """
+    Rows of (result, baseline_median, change, status). `change` is the
+    relative slowdown (positive = worse) regardless of metric direction.
+    status: "ok", "REGRESSION", "faster", "new", "error".
+    """
+    base = (baseline or {}).get("results", {})
+    rows = []
+    for r in results:
+        if r.error:
+            rows.append((r, None, None, "error"))
+            continue
+        b = base.get(r.key)
+        b_med = b.get("median") if b else None
+        if not b_med:
+            rows.append((r, None, None, "new"))
+            continue
+        if r.metric == METRIC_RATE:
+            change = b_med / r.median - 1.0 if r.median else float("inf")
+        else:
+            change = r.median / b_med - 1.0
+        if change > threshold:
+            status = "REGRESSION"
+        elif change < -threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((r, b_med, change, status))
+    return rows
+
+
+def _fmt(value: Optional[float], unit: str) -> str:
+    if value is None:
+        return "–"
+    if unit == "s":
+        if value < 1e-3:
+            return f"{value * 1e6:.1f} µs"
+        if value < 1.0:
+            return f"{value * 1e3:.2f} ms"
+        return f"{value:.3f} s"
+    return f"{value:,.0f} {unit}"
+
+
+def format_report(rows, baseline: Optional[dict]) -> str:
+    meta = (baseline or {}).get("meta", {})
+    head = "Baseline: " + (
+        f"{meta.get('created')} (commit {meta.get('commit')}, {meta.get('machine')})" if baseline else "none"
+    )
+    lines = [head, "", f"{'benchmark':<44} {'median':>14} {'baseline':>14} {'change':>8}  status"]
+    for r, b_med, change, status in rows:
+        if r.error:
+            lines.append(f"{r.key:<44} {'':>14} {'':>14} {'':>8}  error: {r.error}")
+            continue
+        ch = f"{change:+.1%}" if change is not None else ""
+        lines.append(f"{r.key:<44} {_fmt(r.median, r.unit):>14} {_fmt(b_med, r.unit):>14} {ch:>8}  {status}")
+    return "\n".join(lines)
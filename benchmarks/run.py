@@ -0,0 +1,112 @@
+# benchmarks/run.py
+#
+# Run the benchmark suite and compare against a saved baseline.
+#
+# Usage:
+#   python -m benchmarks.run                         # all benchmarks, compare to benchmarks/baseline.json
+#   python -m benchmarks.run --only comms storage.log
+#   python -m benchmarks.run --full                  # include the slow sizes (10M-row CSV, ...)
+#   python -m benchmarks.run --save-baseline         # make this run the new baseline
+#   python -m benchmarks.run --baseline old.json --threshold 0.2 --fail-on-regression
+#
+# Every run is also written to benchmarks/results/<timestamp>.json. Baselines
+# are machine specific: record one on the machine you compare on.
+
+from __future__ import annotations
+
+import os
+import sys
+import logging
+import argparse
+from datetime import datetime
+
+from benchmarks.harness import (
+    BASELINE_PATH,
+    DEFAULT_THRESHOLD,
+    RESULTS_DIR,
+    compare,
+    format_report,
+    load_results,
+    results_doc,
+    run_benchmarks,
+    save_results,
+)
+
+# Importing a module registers its benchmarks
+BENCH_MODULES = (
+    "benchmarks.bench_comms",
+    "benchmarks.bench_gui",
+    "benchmarks.bench_serial_loopback",
+    "benchmarks.bench_server",
+    "benchmarks.bench_storage",
+)
+
+
+def _load_modules() -> None:
+    import importlib
+
+    for name in BENCH_MODULES:
+        importlib.import_module(name)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="cardinal-grip-bench",
+        description="Cardinal Grip performance benchmarks with baseline comparison.",
+    )
+    parser.add_argument("--only", nargs="+", metavar="PREFIX", help="Benchmark name prefixes, e.g. comms gui.game_tick")
+    parser.add_argument("--full", action="store_true", help="Include the slow parameter sizes")
+    parser.add_argument("--rounds", type=int, help="Override rounds per benchmark")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline results JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run to --baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Relative slowdown flagged as regression (0.1 = 10%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 if any benchmark regressed or failed")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    # Benchmarked code logs through the app loggers; keep the output to the report
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+
+    _load_modules()
+    from benchmarks.harness import REGISTRY
+
+    if args.list:
+        for spec in REGISTRY:
+            sizes = ", ".join(str(p) for p in spec.params if p is not None)
+            full = ", ".join(str(p) for p in spec.full_params)
+            print(f"{spec.name:<36} {spec.metric:<5} {sizes}{'  (+' + full + ' with --full)' if full else ''}")
+        return 0
+
+    def progress(res):
+        status = f"error: {res.error}" if res.error else f"median {res.median:.6g} {res.unit}"
+        print(f"  {res.key:<44} {status}", file=sys.stderr)
+
+    results = run_benchmarks(select=args.only, full=args.full, rounds=args.rounds, progress=progress)
+    if not results:
+        print("No benchmarks matched.", file=sys.stderr)
+        return 1
+
+    doc = results_doc(results)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    save_results(doc, os.path.join(RESULTS_DIR, f"{stamp}.json"))
+
+    baseline = load_results(args.baseline)
+    rows = compare(results, baseline, args.threshold)
+    print()
+    print(format_report(rows, baseline))
+
+    if args.save_baseline:
+        # A partial run (--only) updates just its own entries
+        if baseline is not None:
+            merged = dict(baseline.get("results", {}))
+            merged.update(doc["results"])
+            doc = {"meta": doc["meta"], "results": merged}
+        save_results(doc, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+
+    bad = [r for r in rows if r[3] in ("REGRESSION", "error")]
+    return 1 if args.fail_on_regression and bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,889 @@
+# comms/acquisition_hub.py
+
+"""
+AcquisitionHub – one owner per physical device, any number of subscribers.
+
+Before this, every window created its own SerialBackend, so opening the
+clinician monitor next to a running patient game tried to open the same
+serial port twice, and the dual launcher shared one backend object by
+poking attributes into the child windows.
+
+Now windows ask the hub for a backend:
+
+    backend = open_shared_backend(SerialBackend, port=None, baud=115200, timeout=0.01)
+    ...
+    backend.stop()   # releases this window's lease only
+
+  - In-process: the first acquire() for a device creates and starts the
+    real backend; later acquires get a BackendLease on the same device.
+    The device is stopped when the last lease is released. Each lease
+    reads the shared SampleBuffer with its own cursor, so subscribers
+    never steal samples from each other.
+
+  - Settings: a device runs with the kwargs of whoever opened it first.
+    A later acquire() asking for a different num_channels / baud gets a
+    warning; one asking for different `filters` gets a lease on the raw
+    stream run through its own pipeline (filters=None: raw), so e.g. the
+    recorder can tap the unfiltered signal of a filtered game session.
+
+  - Out-of-process: the process that owns a device also serves it on
+    127.0.0.1:HUB_PORT (line protocol below). Another process calling
+    open_shared_backend() for the same device gets a RemoteHubBackend
+    instead of fighting over the port.
+
+Wire protocol (newline-delimited, UTF-8):
+    client -> {"op": "subscribe", "kind": "SerialBackend", "port": null,
+               "config": {"filters": "median:5"}}      (config optional)
+    server -> {"ok": true, "port": "/dev/...", "num_channels": 4, "channel_names": [...],
+               "filtered": true, "filters": "median:5"}
+    server -> "seq,timestamp,v0,v1,..."            (one line per sample)
+    client -> {"op": "command", "cmd": "noise 0"}  (optional, any time)
+    client -> {"op": "key", "ch": "q", "down": true}
+
+    client -> {"op": "list"}                       (instead of subscribe)
+    server -> {"ok": true, "devices": [{"kind", "port", "leases", "num_channels"}, ...]}
+
+Set CARDINAL_GRIP_HUB_PORT=0 to disable the socket server.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import queue
+import socket
+import socketserver
+import threading
+import copy
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base_backend import BaseBackend
+from .sample_buffer import SampleBuffer, SampleListener
+from .channel_layout import DEFAULT_NUM_CHANNELS, backend_num_channels
+from .filters import DEFAULT_SAMPLE_RATE, FilterPipeline, make_pipeline
+from .latency import STAGE_FILTER, LatencyTracker
+
+logger = logging.getLogger("cardinal_grip.comms.hub")
+
+DEFAULT_HUB_PORT = 47800
+HUB_HOST = "127.0.0.1"
+
+# Per-client queue of pending sample lines (~20 s at 100 Hz); oldest dropped when full
+CLIENT_QUEUE_SIZE = 2048
+CONNECT_TIMEOUT = 0.25
+
+# Requested kwargs compared against the running device (see AcquisitionHub.acquire)
+CONFIG_KEYS = ("filters", "num_channels", "baud")
+
+
+def hub_port() -> int:
+    """TCP port for the hub server (0 = disabled), from CARDINAL_GRIP_HUB_PORT."""
+    raw = os.environ.get("CARDINAL_GRIP_HUB_PORT", "").strip()
+    if not raw:
+        return DEFAULT_HUB_PORT
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("Ignoring invalid CARDINAL_GRIP_HUB_PORT=%r", raw)
+        return DEFAULT_HUB_PORT
+
+
+def _filter_spec(filters) -> Any:
+    """Comparable form of a `filters` kwarg: "" for none, normalized spec, or the pipeline."""
+    if filters is None:
+        return ""
+    if isinstance(filters, FilterPipeline):
+        return filters if filters else ""
+    return ",".join(p.strip().lower() for p in str(filters).split(",") if p.strip())
+
+
+def _describe_filters(spec) -> Optional[str]:
+    """Spec string for logs / session metadata (None: unfiltered)."""
+    if not spec:
+        return None
+    if isinstance(spec, FilterPipeline):
+        return ",".join(type(f).__name__ for f in spec.filters)
+    return str(spec)
+
+
+def _sample_rate(backend: Any) -> float:
+    rate = getattr(backend, "sample_rate", None)
+    if rate:
+        return float(rate)
+    interval = getattr(backend, "update_interval", None)
+    return 1.0 / interval if interval else DEFAULT_SAMPLE_RATE
+
+
+# ================================================================
+# In-process sharing
+# ================================================================
+
+
+class _Device:
+    """One running backend plus its lease count and the kwargs it was opened with."""
+
+    def __init__(self, kind: str, backend: Any, config: Optional[dict] = None):
+        self.kind = kind
+        self.backend = backend
+        self.config = dict(config or {})
+        self.leases = 0
+
+    @property
+    def filter_spec(self) -> Any:
+        """
+        Filters the device's own stream really runs ("" = none). Backends
+        that filter say so in get_stats()["filtered"]; others (shm, replay,
+        ...) accept and drop a `filters` kwarg, so it is not trusted alone.
+        """
+        fn = getattr(self.backend, "get_stats", None)
+        if fn is None or not fn().get("filtered"):
+            return ""
+        return _filter_spec(self.config.get("filters")) or "unknown"
+
+    @property
+    def port(self) -> Optional[str]:
+        return getattr(self.backend, "port", None)
+
+    @property
+    def num_channels(self) -> int:
+        return backend_num_channels(self.backend)
+
+    @property
+    def channel_names(self) -> Optional[List[str]]:
+        return getattr(self.backend, "channel_names", None)
+
+
+class _LeaseStream:
+    """
+    A lease's own copy of the device's raw stream, run through the lease's
+    own filter pipeline (None: raw). Advanced from the device's sample
+    listener, i.e. in the backend thread, like the device's own buffers;
+    `raw` is separate only when filtering, and shares seq numbers with
+    `samples` just as the backends' get_raw_* do. Like the backends, it
+    records the pipeline's group delay as the "filter" latency stage.
+    """
+
+    def __init__(self, backend: Any, filters, history_size: int = 0):
+        self._backend = backend
+        n = backend_num_channels(backend)
+        self._since = getattr(backend, "get_raw_samples_since", None)
+        if self._since is None:
+            logger.warning(
+                "%s has no raw stream; lease filters run on top of its own",
+                type(backend).__name__,
+            )
+            self._since = backend.get_samples_since
+        if isinstance(filters, FilterPipeline):
+            filters = copy.deepcopy(filters)
+        fs = _sample_rate(backend)
+        self.pipeline = make_pipeline(filters, n, fs=fs)
+        self._filter_delay_ms = self.pipeline.group_delay_ms(fs) if self.pipeline else 0.0
+        self._latency = LatencyTracker.instance()
+
+        raw_latest = getattr(backend, "get_raw_latest", None) or backend.get_latest
+        initial = raw_latest()
+        self.samples = SampleBuffer(n, history_size=history_size, initial=initial)
+        self.raw = SampleBuffer(n, initial=initial) if self.pipeline else self.samples
+
+        self._lock = threading.Lock()
+        self._cursor, _, _ = self._since(0)
+        backend.add_sample_listener(self._on_sample)
+
+    def _on_sample(self, seq: int, ts: float, vals: List[int]) -> None:
+        with self._lock:
+            self._cursor, times, rows = self._since(self._cursor)
+            if not rows:
+                return
+            if self.pipeline:
+                for t, row in zip(times, rows):
+                    self.raw.append(t, row)
+                rows = self.pipeline.process_ints(rows)
+                self._latency.record(STAGE_FILTER, self._filter_delay_ms)
+            for t, row in zip(times, rows):
+                self.samples.append(t, row)
+
+    def close(self) -> None:
+        self._backend.remove_sample_listener(self._on_sample)
+
+
+class BackendLease(BaseBackend):
+    """
+    A subscriber's handle on a shared device.
+
+    Behaves like the backend it wraps (get_latest, get_samples_since, ...),
+    except that stop() releases the lease instead of stopping the device.
+    With `filters` (see AcquisitionHub.acquire) it reads its own filtered
+    copy of the raw stream instead of the device's stream.
+    """
+
+    def __init__(self, hub: "AcquisitionHub", device: _Device, filters=None, history_size: int = 0):
+        self._hub = hub
+        self._device = device
+        self._released = False
+        self._filters = filters
+        self._history_size = history_size
+        self._stream = (
+            _LeaseStream(device.backend, filters, history_size) if filters is not None else None
+        )
+
+    @property
+    def port(self) -> Optional[str]:
+        return self._device.port
+
+    @property
+    def num_channels(self) -> int:
+        return self._device.num_channels
+
+    @property
+    def channel_names(self) -> Optional[List[str]]:
+        return self._device.channel_names
+
+    @property
+    def device_backend(self) -> Any:
+        return self._device.backend
+
+    @property
+    def filtered(self) -> bool:
+        """Whether get_latest() / get_samples_since() are filtered for this lease."""
+        if self._stream is not None:
+            return bool(self._stream.pipeline)
+        return bool(self._device.filter_spec)
+
+    @property
+    def filter_spec(self) -> Optional[str]:
+        """Filters applied to this lease's stream (None: raw)."""
+        if self._stream is not None:
+            return _describe_filters(self._filters)
+        return _describe_filters(self._device.filter_spec)
+
+    def share(self) -> "BackendLease":
+        """Another lease on the same device (e.g. for a second window)."""
+        return self._hub._lease(self._device, filters=self._filters, history_size=self._history_size)
+
+    # ---------- BaseBackend ----------
+
+    def start(self) -> None:
+        # Device is started by the hub on first acquire
+        return
+
+    def stop(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        if self._stream is not None:
+            self._stream.close()
+        self._hub._release(self._device)
+
+    def get_latest(self):
+        if self._stream is not None:
+            return self._stream.samples.latest()
+        return self._device.backend.get_latest()
+
+    def get_last_timestamp(self) -> Optional[float]:
+        if self._stream is not None:
+            return self._stream.samples.last_timestamp()
+        fn = getattr(self._device.backend, "get_last_timestamp", None)
+        return fn() if fn is not None else None
+
+    def get_window(self, n: int):
+        if self._stream is not None:
+            return self._stream.samples.window(n)
+        return self._device.backend.get_window(n)
+
+    def get_samples_since(self, cursor: int):
+        if self._stream is not None:
+            return self._stream.samples.since(cursor)
+        return self._device.backend.get_samples_since(cursor)
+
+    def get_stats(self) -> dict:
+        fn = getattr(self._device.backend, "get_stats", None)
+        stats = dict(fn()) if fn is not None else {}
+        stats["device"] = type(self._device.backend).__name__
+        stats["leases"] = self._device.leases
+        stats["filtered"] = self.filtered
+        stats["filters"] = self.filter_spec
+        return stats
+
+    def get_raw_latest(self):
+        if self._stream is not None:
+            return self._stream.raw.latest()
+        fn = getattr(self._device.backend, "get_raw_latest", None)
+        return fn() if fn is not None else self.get_latest()
+
+    def get_raw_samples_since(self, cursor: int):
+        if self._stream is not None:
+            return self._stream.raw.since(cursor)
+        fn = getattr(self._device.backend, "get_raw_samples_since", None)
+        return fn(cursor) if fn is not None else self.get_samples_since(cursor)
+
+    def add_sample_listener(self, listener: SampleListener) -> None:
+        if self._stream is not None:
+            self._stream.samples.add_listener(listener)
+        else:
+            self._device.backend.add_sample_listener(listener)
+
+    def remove_sample_listener(self, listener: SampleListener) -> None:
+        if self._stream is not None:
+            self._stream.samples.remove_listener(listener)
+        else:
+            self._device.backend.remove_sample_listener(listener)
+
+    def send_command(self, cmd: str) -> None:
+        self._device.backend.send_command(cmd)
+
+    def handle_char(self, ch: str, is_press: bool) -> None:
+        fn = getattr(self._device.backend, "handle_char", None)
+        if fn is not None:
+            fn(ch, is_press)
+
+
+class AcquisitionHub:
+    """
+    Process-wide registry of running devices, keyed by (backend kind, port).
+
+    port=None means "auto": reuse any running device of that kind, else
+    create one and let the backend auto-detect.
+    """
+
+    _instance: Optional["AcquisitionHub"] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "AcquisitionHub":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._devices: Dict[Tuple[str, Optional[str]], _Device] = {}
+        self._server: Optional["_HubServer"] = None
+        self._server_thread: Optional[threading.Thread] = None
+
+    # ---------- lookup ----------
+
+    def find(self, kind: str, port: Optional[str] = None) -> Optional[_Device]:
+        with self._lock:
+            if port:
+                return self._devices.get((kind, port))
+            for (k, _p), dev in self._devices.items():
+                if k == kind:
+                    return dev
+            return None
+
+    def devices(self) -> List[dict]:
+        """Snapshot of running devices: [{kind, port, leases, num_channels}]."""
+        with self._lock:
+            return [
+                {
+                    "kind": dev.kind,
+                    "port": dev.port,
+                    "leases": dev.leases,
+                    "num_channels": dev.num_channels,
+                }
+                for dev in self._devices.values()
+            ]
+
+    def lease_all(self) -> List[BackendLease]:
+        """A new lease on every running device (e.g. for a wall of all live streams)."""
+        with self._lock:
+            return [self._lease(dev) for dev in list(self._devices.values())]
+
+    # ---------- acquire / release ----------
+
+    def acquire(self, backend_cls, port: Optional[str] = None, **kwargs) -> BackendLease:
+        """
+        Lease the device (backend_cls, port), creating and starting it if needed.
+
+        kwargs (baud, timeout, num_channels, history_size, ...) configure the
+        device when it is created. For a device that is already running they
+        are checked against it (check_config): mismatches are logged, and a
+        different `filters` gives this lease its own pipeline over the raw
+        stream. Raises whatever backend.start() raises.
+        """
+        kind = backend_cls.__name__
+        with self._lock:
+            dev = self.find(kind, port)
+            if dev is None:
+                backend = backend_cls(port=port, **kwargs)
+                backend.start()
+                dev = _Device(kind, backend, kwargs)
+                self._devices[(kind, dev.port)] = dev
+                logger.info("AcquisitionHub opened %s on %s", kind, dev.port or "(sim)")
+                self._ensure_server()
+                filters = None
+                if "filters" in kwargs and _filter_spec(kwargs["filters"]) != dev.filter_spec:
+                    # The backend ignored them; run them in the lease instead
+                    filters = _filter_spec(kwargs["filters"])
+                    logger.info("%s does not filter its own stream; lease runs %r", kind, filters)
+                return self._lease(dev, filters=filters, history_size=kwargs.get("history_size", 0))
+            return self._lease(
+                dev,
+                filters=self.check_config(dev, kwargs),
+                history_size=kwargs.get("history_size", 0),
+            )
+
+    def check_config(self, dev: _Device, requested: dict) -> Any:
+        """
+        Compare requested kwargs (CONFIG_KEYS) with a running device; log a
+        warning for each mismatch. Returns the filters the lease needs to
+        apply itself ("" = raw), or None when the device's own stream fits.
+        """
+        running = {
+            "num_channels": dev.num_channels,
+            "baud": getattr(dev.backend, "baud", None),
+        }
+        for key, actual in running.items():
+            wanted = requested.get(key)
+            if wanted is not None and actual is not None and wanted != actual:
+                logger.warning(
+                    "AcquisitionHub: %s on %s is already running with %s=%s; ignoring requested %s",
+                    dev.kind,
+                    dev.port,
+                    key,
+                    actual,
+                    wanted,
+                )
+
+        if "filters" not in requested:
+            return None
+        wanted = _filter_spec(requested["filters"])
+        if wanted == dev.filter_spec:
+            return None
+        logger.warning(
+            "AcquisitionHub: %s on %s is running with filters %r; this lease reads the raw stream with filters %r",
+            dev.kind,
+            dev.port,
+            dev.filter_spec or None,
+            wanted or None,
+        )
+        return wanted
+
+    def _lease(self, dev: _Device, filters=None, history_size: int = 0) -> BackendLease:
+        with self._lock:
+            dev.leases += 1
+            logger.debug(
+                "AcquisitionHub lease on %s %s (leases=%d)", dev.kind, dev.port, dev.leases
+            )
+            return BackendLease(self, dev, filters=filters, history_size=history_size)
+
+    def _release(self, dev: _Device) -> None:
+        with self._lock:
+            dev.leases -= 1
+            logger.debug(
+                "AcquisitionHub release on %s %s (leases=%d)", dev.kind, dev.port, dev.leases
+            )
+            if dev.leases > 0:
+                return
+            for key, d in list(self._devices.items()):
+                if d is dev:
+                    del self._devices[key]
+            stop_server = not self._devices
+
+        try:
+            dev.backend.stop()
+        except Exception:
+            logger.exception("Error while stopping %s on %s", dev.kind, dev.port)
+        logger.info("AcquisitionHub closed %s on %s", dev.kind, dev.port or "(sim)")
+
+        if stop_server:
+            self.stop_server()
+
+    # ---------- socket server ----------
+
+    def _ensure_server(self) -> None:
+        if self._server is not None:
+            return
+        port = hub_port()
+        if port <= 0:
+            return
+        try:
+            server = _HubServer((HUB_HOST, port), _HubClientHandler)
+        except OSError as e:
+            # Another process is already serving; that's fine
+            logger.debug("AcquisitionHub server not started on %s:%d: %s", HUB_HOST, port, e)
+            return
+        server.hub = self
+        self._server = server
+        self._server_thread = threading.Thread(
+            target=server.serve_forever, name="acquisition-hub", daemon=True
+        )
+        self._server_thread.start()
+        logger.info("AcquisitionHub serving on %s:%d", HUB_HOST, port)
+
+    def stop_server(self) -> None:
+        server = self._server
+        if server is None:
+            return
+        self._server = None
+        try:
+            server.shutdown()
+            server.server_close()
+        except Exception:
+            logger.exception("Error while stopping AcquisitionHub server")
+        self._server_thread = None
+        logger.info("AcquisitionHub server stopped")
+
+
+class _HubServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    hub: AcquisitionHub
+
+
+class _HubClientHandler(socketserver.StreamRequestHandler):
+    """One out-of-process subscriber."""
+
+    def handle(self) -> None:
+        peer = "%s:%d" % self.client_address[:2]
+        try:
+            req = json.loads(self.rfile.readline().decode("utf-8") or "{}")
+        except ValueError:
+            self._reply({"ok": False, "error": "bad request"})
+            return
+        hub: AcquisitionHub = self.server.hub
+        if req.get("op") == "list":
+            self._reply({"ok": True, "devices": hub.devices()})
+            return
+        if req.get("op") != "subscribe":
+            self._reply({"ok": False, "error": "expected subscribe or list"})
+            return
+
+        config = req.get("config") if isinstance(req.get("config"), dict) else {}
+        with hub._lock:
+            dev = hub.find(req.get("kind", ""), req.get("port") or None)
+            lease = (
+                hub._lease(dev, filters=hub.check_config(dev, config)) if dev is not None else None
+            )
+        if lease is None:
+            self._reply({"ok": False, "error": "device not open in this process"})
+            return
+
+        pending: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=CLIENT_QUEUE_SIZE)
+
+        def on_sample(seq: int, ts: float, vals: List[int]) -> None:
+            line = f"{seq},{ts:.6f}," + ",".join(str(v) for v in vals) + "\n"
+            try:
+                pending.put_nowait(line.encode("ascii"))
+            except queue.Full:
+                try:
+                    pending.get_nowait()
+                    pending.put_nowait(line.encode("ascii"))
+                except (queue.Empty, queue.Full):
+                    pass
+
+        commands = threading.Thread(
+            target=self._command_loop, args=(lease, pending), daemon=True
+        )
+        try:
+            self._reply({
+                "ok": True,
+                "port": lease.port,
+                "num_channels": lease.num_channels,
+                "channel_names": lease.channel_names,
+                "filtered": lease.filtered,
+                "filters": lease.filter_spec,
+            })
+            lease.add_sample_listener(on_sample)
+            commands.start()
+            logger.info("AcquisitionHub client %s subscribed to %s", peer, lease.port)
+
+            while True:
+                data = pending.get()
+                if data is None:
+                    break
+                self.wfile.write(data)
+        except OSError:
+            pass
+        finally:
+            lease.remove_sample_listener(on_sample)
+            lease.stop()
+            logger.info("AcquisitionHub client %s disconnected", peer)
+
+    def _command_loop(self, lease: BackendLease, pending: queue.Queue) -> None:
+        try:
+            for raw in self.rfile:
+                try:
+                    msg = json.loads(raw.decode("utf-8"))
+                except ValueError:
+                    continue
+                op = msg.get("op")
+                if op == "command":
+                    lease.send_command(str(msg.get("cmd", "")))
+                elif op == "key":
+                    lease.handle_char(str(msg.get("ch", "")), bool(msg.get("down")))
+        except OSError:
+            pass
+        finally:
+            # EOF / error: wake the writer so the handler exits
+            while True:
+                try:
+                    pending.put_nowait(None)
+                    break
+                except queue.Full:
+                    try:
+                        pending.get_nowait()
+                    except queue.Empty:
+                        pass
+
+    def _reply(self, obj: dict) -> None:
+        self.wfile.write((json.dumps(obj) + "\n").encode("utf-8"))
+
+
+# ================================================================
+# Out-of-process client
+# ================================================================
+
+
+class RemoteHubBackend(BaseBackend):
+    """
+    Backend fed by another process's AcquisitionHub over localhost TCP.
+
+    Same read API as the local backends (get_latest, get_samples_since, ...).
+    The stream is whatever the owning hub serves for `config`: with
+    config={"filters": None} that is the device's raw stream, and
+    get_stats() reports the filter state the hub answered with.
+    """
+
+    def __init__(
+        self,
+        kind: str = "SerialBackend",
+        port: Optional[str] = None,
+        num_channels: int = DEFAULT_NUM_CHANNELS,
+        history_size: int = 0,
+        host: str = HUB_HOST,
+        hub_tcp_port: Optional[int] = None,
+        config: Optional[dict] = None,
+    ):
+        self.kind = kind
+        self.port = port
+        # Requested settings (CONFIG_KEYS) sent with the subscribe; see AcquisitionHub.check_config
+        self.config = dict(config or {})
+        self.num_channels = num_channels
+        self.channel_names: Optional[List[str]] = None
+        self.filtered: Optional[bool] = None
+        self.filter_spec: Optional[str] = None
+        self.host = host
+        self.hub_tcp_port = hub_port() if hub_tcp_port is None else hub_tcp_port
+
+        self._history_size = history_size
+        self._samples = SampleBuffer(num_channels, history_size=history_size)
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._write_lock = threading.Lock()
+
+    # ---------- lifecycle ----------
+
+    def start(self) -> None:
+        """Connect and subscribe; raises ConnectionError if the hub refuses."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        sock = socket.create_connection(
+            (self.host, self.hub_tcp_port), timeout=CONNECT_TIMEOUT
+        )
+        try:
+            req = {"op": "subscribe", "kind": self.kind, "port": self.port}
+            if self.config:
+                req["config"] = self.config
+            sock.sendall((json.dumps(req) + "\n").encode("utf-8"))
+            rfile = sock.makefile("rb")
+            reply = json.loads(rfile.readline().decode("utf-8") or "{}")
+        except (OSError, ValueError) as e:
+            sock.close()
+            raise ConnectionError(f"Acquisition hub handshake failed: {e}") from e
+
+        if not reply.get("ok"):
+            sock.close()
+            raise ConnectionError(reply.get("error", "subscribe refused"))
+
+        self.port = reply.get("port", self.port)
+        n = int(reply.get("num_channels", self.num_channels))
+        if n != self.num_channels:
+            self.num_channels = n
+            self._samples = SampleBuffer(n, history_size=self._history_size)
+        names = reply.get("channel_names")
+        self.channel_names = list(names) if isinstance(names, list) and len(names) == n else None
+        # Older hubs don't say; leave it unknown rather than guess
+        self.filtered = bool(reply["filtered"]) if "filtered" in reply else None
+        self.filter_spec = reply.get("filters")
+
+        sock.settimeout(None)
+        self._sock = sock
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._read_loop, args=(rfile,), daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "RemoteHubBackend subscribed to %s on %s:%d",
+            self.port,
+            self.host,
+            self.hub_tcp_port,
+        )
+
+    def stop(self) -> None:
+        self._running = False
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        if self._thread is not None:
+            self._thread.join(timeout=0.5)
+            self._thread = None
+        logger.info("RemoteHubBackend stopped for %s", self.port)
+
+    def _read_loop(self, rfile) -> None:
+        n = self.num_channels
+        try:
+            for raw in rfile:
+                parts = raw.decode("ascii", errors="ignore").strip().split(",")
+                if len(parts) != n + 2:
+                    continue
+                try:
+                    ts = float(parts[1])
+                    vals = [int(p) for p in parts[2:]]
+                except ValueError:
+                    continue
+                self._samples.append(ts, vals)
+        except (OSError, ValueError):
+            pass
+        if self._running:
+            logger.warning("RemoteHubBackend lost connection to hub for %s", self.port)
+
+    # ---------- BaseBackend ----------
+
+    def get_latest(self) -> List[int]:
+        return self._samples.latest()
+
+    def get_last_timestamp(self) -> Optional[float]:
+        return self._samples.last_timestamp()
+
+    def get_window(self, n: int) -> List[List[int]]:
+        return self._samples.window(n)
+
+    def get_samples_since(self, cursor: int):
+        return self._samples.since(cursor)
+
+    def add_sample_listener(self, listener: SampleListener) -> None:
+        self._samples.add_listener(listener)
+
+    def remove_sample_listener(self, listener: SampleListener) -> None:
+        self._samples.remove_listener(listener)
+
+    def get_stats(self) -> dict:
+        return {
+            "samples": self._samples.seq,
+            "remote": f"{self.host}:{self.hub_tcp_port}",
+            "filtered": self.filtered,
+            "filters": self.filter_spec,
+        }
+
+    def _send(self, obj: dict) -> None:
+        sock = self._sock
+        if sock is None:
+            return
+        try:
+            with self._write_lock:
+                sock.sendall((json.dumps(obj) + "\n").encode("utf-8"))
+        except OSError:
+            logger.debug("RemoteHubBackend send failed: %r", obj)
+
+    def send_command(self, cmd: str) -> None:
+        if cmd:
+            self._send({"op": "command", "cmd": cmd})
+
+    def handle_char(self, ch: str, is_press: bool) -> None:
+        if ch:
+            self._send({"op": "key", "ch": ch, "down": bool(is_press)})
+
+
+def remote_devices(host: str = HUB_HOST, hub_tcp_port: Optional[int] = None) -> List[dict]:
+    """
+    Devices served by the hub listening on host:port (the "list" op), as
+    AcquisitionHub.devices() reports them. [] if no hub answers.
+    """
+    port = hub_port() if hub_tcp_port is None else hub_tcp_port
+    if port <= 0:
+        return []
+    try:
+        with socket.create_connection((host, port), timeout=CONNECT_TIMEOUT) as sock:
+            sock.sendall((json.dumps({"op": "list"}) + "\n").encode("utf-8"))
+            reply = json.loads(sock.makefile("rb").readline().decode("utf-8") or "{}")
+    except (OSError, ValueError) as e:
+        logger.debug("No acquisition hub listing on %s:%d: %s", host, port, e)
+        return []
+    devices = reply.get("devices") if reply.get("ok") else None
+    return [d for d in devices if isinstance(d, dict)] if isinstance(devices, list) else []
+
+
+# ================================================================
+# Entry point for windows
+# ================================================================
+
+
+def open_shared_backend(backend_cls, port: Optional[str] = None, **kwargs):
+    """
+    Return a started backend for (backend_cls, port), sharing wherever possible:
+
+      1. a lease on a device this process already runs;
+      2. a RemoteHubBackend if another process's hub serves the device;
+      3. otherwise open the device here (and serve it to other processes).
+
+    Call .stop() on the result when done; it never stops a device that
+    other subscribers are still using.
+    """
+    hub = AcquisitionHub.instance()
+
+    # "shm" / "shm:<name>": read a shared-memory bus published by another process
+    if port and (port == "shm" or port.startswith("shm:")):
+        from .shm_bus import ShmBackend, DEFAULT_BUS_NAME
+        name = port[4:] or DEFAULT_BUS_NAME
+        return hub.acquire(ShmBackend, port=f"shm:{name}", name=name, **kwargs)
+
+    # "multi:L=<port>,R=<port>": several gloves as one aligned stream
+    if port and port.startswith("multi:"):
+        from .multi_glove import MultiGloveBackend
+        return hub.acquire(MultiGloveBackend, port=port, **kwargs)
+
+    # "multi@<rate>:L=<port>,...": the same, resampled onto a fixed-rate grid
+    if port and port.startswith("multi@"):
+        from .resample import AlignedBackend
+        return hub.acquire(AlignedBackend, port=port, **kwargs)
+
+    # "replay:<path>": a recorded session played back in real time
+    if port and port.startswith("replay:"):
+        from .replay_backend import ReplayBackend
+        return hub.acquire(ReplayBackend, port=port, **kwargs)
+
+    kind = backend_cls.__name__
+    if hub.find(kind, port) is not None:
+        return hub.acquire(backend_cls, port=port, **kwargs)
+
+    if hub_port() > 0 and hub._server is None:
+        config = {k: kwargs[k] for k in CONFIG_KEYS if k in kwargs}
+        if isinstance(config.get("filters"), FilterPipeline):
+            # Only spec strings travel over the wire
+            logger.warning("FilterPipeline object cannot be sent to the hub; subscribing to the device's stream")
+            config.pop("filters")
+        remote = RemoteHubBackend(
+            kind=kind,
+            port=port,
+            num_channels=kwargs.get("num_channels") or DEFAULT_NUM_CHANNELS,
+            history_size=kwargs.get("history_size", 0),
+            config=config,
+        )
+        try:
+            remote.start()
+            return remote
+        except OSError:
+            # No hub listening, or it does not have this device
+            pass
+
+    return hub.acquire(backend_cls, port=port, **kwargs)
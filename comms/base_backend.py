@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import Protocol, runtime_checkable, List, Optional
 
 
@@ -22,6 +23,17 @@ class BaseBackend(Protocol):
 
     Backends may also expose:
       - get_window(n): last n samples for stats / smoothing
+      - get_samples_since(cursor): every sample received after a cursor,
+        as (new_cursor, timestamps, values); used to run rep detection
+        on the full backend rate instead of GUI ticks
+      - add_sample_listener(fn) / remove_sample_listener(fn): push-style
+        fn(seq, ts, values) callbacks from the backend thread (used by
+        comms.acquisition_hub to fan samples out)
+      - get_raw_latest() / get_raw_samples_since(cursor): the unfiltered
+        stream when a comms.filters pipeline is configured (get_latest()
+        and friends then return the filtered values)
+      - get_stats(): small JSON-friendly dict of counters (samples, bad
+        lines, reconnects, ...) for structured logs; see backend_stats()
     """
 
     def start(self) -> None:
@@ -53,3 +65,22 @@ class BaseBackend(Protocol):
         sample was updated. Backends that don't track this may return None.
         """
         ...
+
+
+def backend_stats(backend) -> dict:
+    """
+    Snapshot of a backend for structured log fields (logger.app_logging's
+    JSON Lines log): type, port, age of the latest sample, plus whatever
+    the backend's own get_stats() reports.
+    """
+    if backend is None:
+        return {}
+    stats = {"type": type(backend).__name__, "port": getattr(backend, "port", None)}
+    get_ts = getattr(backend, "get_last_timestamp", None)
+    last_ts = get_ts() if get_ts is not None else None
+    if last_ts is not None:
+        stats["age_ms"] = round((time.time() - last_ts) * 1000.0, 1)
+    get_stats = getattr(backend, "get_stats", None)
+    if get_stats is not None:
+        stats.update(get_stats())
+    return stats
@@ -0,0 +1,101 @@
+# comms/calibrated_reader.py
+
+"""
+Per-consumer reader that turns backend samples into calibrated batches.
+
+Each GUI tick calls read() once: it drains every sample since the previous
+call (get_samples_since, or get_latest for backends without a cursor),
+normalises them to an (N, C) int array, and converts the whole batch to
+force with one table lookup (model.units.ForceScale). Widgets then read
+the cached batch instead of converting values themselves.
+
+    reader = CalibratedReader(backend, scale)   # num_channels from the backend
+    batch = reader.read()
+    batch.adc[-1], batch.force[-1] if batch.force is not None else None
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from .channel_layout import backend_num_channels
+
+ADC_MAX = 4095
+
+
+@dataclass
+class CalibratedBatch:
+    ts: np.ndarray                     # (N,) backend timestamps, seconds
+    adc: np.ndarray                    # (N, C) int32, clamped to 0..4095
+    force: Optional[np.ndarray]        # (N, C) float32 in the scale's unit, None if uncalibrated
+
+    def __len__(self) -> int:
+        return self.ts.size
+
+
+class CalibratedReader:
+    """
+    scale: anything with convert((N, C) adc) -> (N, C) force or None
+           (model.units.ForceScale); None = ADC only.
+    """
+
+    def __init__(self, backend, scale=None, num_channels: Optional[int] = None):
+        self.backend = backend
+        self.scale = scale
+        self.num_channels = num_channels or backend_num_channels(backend)
+        self.cursor = 0
+        # Latest sample of the most recent non-empty batch (already converted)
+        self.latest_ts: Optional[float] = None
+        self.latest_adc: Optional[np.ndarray] = None
+        self.latest_force: Optional[np.ndarray] = None
+
+    def reset(self) -> None:
+        self.cursor = 0
+        self.latest_ts = None
+        self.latest_adc = None
+        self.latest_force = None
+
+    def _empty(self) -> CalibratedBatch:
+        return CalibratedBatch(
+            ts=np.zeros(0, dtype=float),
+            adc=np.zeros((0, self.num_channels), dtype=np.int32),
+            force=None,
+        )
+
+    def _drain(self):
+        backend = self.backend
+        if hasattr(backend, "get_samples_since"):
+            self.cursor, ts, vals = backend.get_samples_since(self.cursor)
+            return ts, vals
+        vals = backend.get_latest()
+        if vals is None:
+            return [], []
+        if isinstance(vals, (int, float)):
+            vals = [vals] * self.num_channels
+        ts = backend.get_last_timestamp() if hasattr(backend, "get_last_timestamp") else None
+        return [ts or time.time()], [list(vals)]
+
+    def read(self) -> CalibratedBatch:
+        """Every new sample since the last read, converted once."""
+        if self.backend is None:
+            return self._empty()
+        ts, vals = self._drain()
+        if not len(ts):
+            return self._empty()
+
+        n, c = len(ts), self.num_channels
+        adc = np.zeros((n, c), dtype=np.int32)
+        arr = np.asarray(vals, dtype=float).reshape(n, -1)[:, :c]
+        adc[:, : arr.shape[1]] = np.clip(np.rint(arr), 0, ADC_MAX)
+
+        force = self.scale.convert(adc) if self.scale is not None else None
+        batch = CalibratedBatch(ts=np.asarray(ts, dtype=float), adc=adc, force=force)
+
+        self.latest_ts = float(batch.ts[-1])
+        self.latest_adc = adc[-1]
+        self.latest_force = force[-1] if force is not None else None
+        return batch
@@ -0,0 +1,65 @@
+# comms/channel_layout.py
+
+"""
+Channel count and names as a per-device property.
+
+Every backend exposes `num_channels`; backends whose channels have their
+own names (multi-glove streams, devices configured with names) also expose
+`channel_names`. Windows, writers and plots size themselves from the
+backend they are reading instead of a module-level constant:
+
+    n = backend_num_channels(backend)
+    names = backend_channel_names(backend)   # ["Index", ..., "Thumb", "Palm"]
+
+Firmware channel order is index, middle, ring, pinky; the next hardware
+revision appends thumb and palm sensors. Channels past the known names
+are labelled "Ch<n>". Multi-glove streams (comms.multi_glove) prefix each
+glove's names, e.g. "L Index" ... "R Palm".
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+DEFAULT_NUM_CHANNELS = 4
+MAX_CHANNELS = 64
+
+CHANNEL_NAMES = ("Index", "Middle", "Ring", "Pinky", "Thumb", "Palm")
+
+
+def channel_names(
+    num_channels: int,
+    base: Sequence[str] = CHANNEL_NAMES,
+    prefix: str = "",
+) -> List[str]:
+    """`num_channels` display names: `base` first, then "Ch<n>"."""
+    names = [base[i] if i < len(base) else f"Ch{i}" for i in range(num_channels)]
+    if prefix:
+        names = [f"{prefix} {name}" for name in names]
+    return names
+
+
+def backend_num_channels(backend, default: int = DEFAULT_NUM_CHANNELS) -> int:
+    """Channel count a backend reports (default when it doesn't say)."""
+    n = getattr(backend, "num_channels", None) if backend is not None else None
+    try:
+        n = int(n)
+    except (TypeError, ValueError):
+        return default
+    return n if 0 < n <= MAX_CHANNELS else default
+
+
+def backend_channel_names(
+    backend,
+    base: Sequence[str] = CHANNEL_NAMES,
+    num_channels: Optional[int] = None,
+) -> List[str]:
+    """
+    The backend's own channel names when it has them (multi-glove, or a
+    hub lease on one), else channel_names() over `base`.
+    """
+    n = backend_num_channels(backend) if num_channels is None else num_channels
+    names = getattr(backend, "channel_names", None) if backend is not None else None
+    if names and len(names) == n:
+        return list(names)
+    return channel_names(n, base)
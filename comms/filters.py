@@ -0,0 +1,275 @@
+# comms/filters.py
+
+"""
+Streaming per-channel signal conditioning for the backends.
+
+Filters run in the backend thread on (N, C) sample batches (N samples,
+C channels), vectorized across channels and, where the filter allows it,
+across the batch. Each filter keeps its own state between batches, so
+feeding one sample at a time and feeding a whole block give the same
+output.
+
+    pipeline = FilterPipeline.from_spec("median:5,lowpass:10", fs=100.0)
+    filtered = pipeline.process(batch)      # (N, C) float array
+
+Spec grammar (comma-separated, applied left to right):
+    ema:<alpha>          exponential moving average, 0 < alpha <= 1
+    median:<window>      moving median over the last <window> samples
+    lowpass:<cutoff_hz>  2nd-order Butterworth low-pass (biquad)
+
+Smoothing costs delay: every filter shifts the signal later in time
+(group_delay_samples()), on top of the compute time the latency tracker
+already sees. The backends record the pipeline's delay as the "filter"
+latency stage. At 100 Hz:
+
+    median:5,lowpass:10   ~42 ms  (heavy smoothing; most of the 50 ms budget)
+    median:3,lowpass:15   ~24 ms  (smooth bars, half the budget)
+    median:3              ~10 ms  (default: spike rejection only)
+    ema:0.5               ~10 ms
+
+Backends filter each read chunk with one process() call; per-sample
+process_sample() calls cost several times more per sample.
+"""
+
+from __future__ import annotations
+
+import math
+import logging
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger("cardinal_grip.comms.filters")
+
+DEFAULT_SAMPLE_RATE = 100.0      # firmware streams at 100 Hz
+# Spike rejection for ~10 ms of delay at 100 Hz, well inside the 50 ms
+# biofeedback budget; see the table above for smoother (slower) specs
+DEFAULT_FILTER_SPEC = "median:3"
+
+
+class StreamFilter:
+    """Base class: stateful (N, C) -> (N, C) transform."""
+
+    def __init__(self, num_channels: int):
+        self.num_channels = num_channels
+
+    def process(self, batch: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+    def group_delay_samples(self) -> float:
+        """Delay of slow (in-band) signal changes through this filter, in samples."""
+        return 0.0
+
+
+class EMAFilter(StreamFilter):
+    """y[n] = alpha * x[n] + (1 - alpha) * y[n-1], seeded with the first sample."""
+
+    def __init__(self, num_channels: int, alpha: float = 0.3):
+        super().__init__(num_channels)
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"EMA alpha must be in (0, 1], got {alpha}")
+        self.alpha = float(alpha)
+        self.reset()
+
+    def group_delay_samples(self) -> float:
+        return (1.0 - self.alpha) / self.alpha
+
+    def reset(self) -> None:
+        self._y: Optional[np.ndarray] = None
+
+    def process(self, batch: np.ndarray) -> np.ndarray:
+        n = batch.shape[0]
+        if n == 0:
+            return batch
+        a = self.alpha
+        y = batch[0].astype(float) if self._y is None else self._y
+
+        # Recursive in time, vectorized across channels
+        out = np.empty(batch.shape, dtype=float)
+        for k in range(n):
+            y = a * batch[k] + (1.0 - a) * y
+            out[k] = y
+        self._y = out[-1].copy()
+        return out
+
+
+class MovingMedianFilter(StreamFilter):
+    """Median of the last `window` samples per channel (spike / glitch rejection)."""
+
+    def __init__(self, num_channels: int, window: int = 5):
+        super().__init__(num_channels)
+        if window < 1:
+            raise ValueError(f"Median window must be >= 1, got {window}")
+        self.window = int(window)
+        self.reset()
+
+    def group_delay_samples(self) -> float:
+        return (self.window - 1) / 2.0
+
+    def reset(self) -> None:
+        self._tail = np.zeros((0, self.num_channels), dtype=float)
+
+    def process(self, batch: np.ndarray) -> np.ndarray:
+        n = batch.shape[0]
+        if n == 0 or self.window == 1:
+            return batch
+        if self._tail.shape[0] == 0:
+            # Warm up by repeating the first sample
+            self._tail = np.repeat(batch[:1].astype(float), self.window - 1, axis=0)
+        ext = np.concatenate((self._tail, batch), axis=0)
+        windows = np.lib.stride_tricks.sliding_window_view(ext, self.window, axis=0)
+        out = np.median(windows, axis=-1)                           # (N, C)
+        self._tail = ext[-(self.window - 1):].copy()
+        return out
+
+
+class BiquadLowPass(StreamFilter):
+    """
+    2nd-order Butterworth low-pass (RBJ cookbook coefficients, Q = 1/sqrt(2)),
+    transposed direct form II with per-channel state.
+    """
+
+    def __init__(
+        self,
+        num_channels: int,
+        cutoff_hz: float = 10.0,
+        fs: float = DEFAULT_SAMPLE_RATE,
+        q: float = 1.0 / math.sqrt(2.0),
+    ):
+        super().__init__(num_channels)
+        if not 0.0 < cutoff_hz < fs / 2.0:
+            raise ValueError(f"Low-pass cutoff must be in (0, fs/2={fs / 2.0}), got {cutoff_hz}")
+        self.cutoff_hz = float(cutoff_hz)
+        self.fs = float(fs)
+
+        w0 = 2.0 * math.pi * cutoff_hz / fs
+        alpha = math.sin(w0) / (2.0 * q)
+        cos_w0 = math.cos(w0)
+        a0 = 1.0 + alpha
+        self.b0 = (1.0 - cos_w0) / 2.0 / a0
+        self.b1 = (1.0 - cos_w0) / a0
+        self.b2 = self.b0
+        self.a1 = -2.0 * cos_w0 / a0
+        self.a2 = (1.0 - alpha) / a0
+        self.reset()
+
+    def reset(self) -> None:
+        self._z1: Optional[np.ndarray] = None
+        self._z2: Optional[np.ndarray] = None
+
+    def group_delay_samples(self) -> float:
+        # DC group delay of b(z)/a(z): sum(k*b_k)/sum(b_k) - sum(k*a_k)/sum(a_k)
+        b = (self.b0, self.b1, self.b2)
+        a = (1.0, self.a1, self.a2)
+        num = sum(k * bk for k, bk in enumerate(b)) / sum(b)
+        den = sum(k * ak for k, ak in enumerate(a)) / sum(a)
+        return num - den
+
+    def _prime(self, x0: np.ndarray) -> None:
+        # Steady state for a constant input x0 (unity DC gain), so the first
+        # samples don't ramp up from zero
+        self._z1 = x0 * (1.0 - self.b0)
+        self._z2 = x0 * (self.b2 - self.a2)
+
+    def process(self, batch: np.ndarray) -> np.ndarray:
+        n = batch.shape[0]
+        if n == 0:
+            return batch
+        x = batch.astype(float, copy=False)
+        if self._z1 is None:
+            self._prime(x[0].copy())
+
+        b0, b1, b2, a1, a2 = self.b0, self.b1, self.b2, self.a1, self.a2
+        z1, z2 = self._z1, self._z2
+        out = np.empty(x.shape, dtype=float)
+        for k in range(n):
+            xk = x[k]
+            yk = b0 * xk + z1
+            z1 = b1 * xk - a1 * yk + z2
+            z2 = b2 * xk - a2 * yk
+            out[k] = yk
+        self._z1, self._z2 = z1, z2
+        return out
+
+
+class FilterPipeline:
+    """Filters applied in order; output is clamped to the ADC range."""
+
+    def __init__(self, filters: Sequence[StreamFilter], clamp=(0, 4095)):
+        self.filters: List[StreamFilter] = list(filters)
+        self.clamp = clamp
+
+    @classmethod
+    def from_spec(
+        cls,
+        spec: str,
+        num_channels: int = 4,
+        fs: float = DEFAULT_SAMPLE_RATE,
+    ) -> "FilterPipeline":
+        """Build from e.g. "median:5,lowpass:10" (see module docstring)."""
+        filters: List[StreamFilter] = []
+        for part in (spec or "").split(","):
+            part = part.strip().lower()
+            if not part:
+                continue
+            name, _, arg = part.partition(":")
+            try:
+                if name == "ema":
+                    filters.append(EMAFilter(num_channels, float(arg or 0.3)))
+                elif name == "median":
+                    filters.append(MovingMedianFilter(num_channels, int(arg or 5)))
+                elif name == "lowpass":
+                    filters.append(BiquadLowPass(num_channels, float(arg or 10.0), fs=fs))
+                else:
+                    raise ValueError(f"unknown filter {name!r}")
+            except ValueError as e:
+                raise ValueError(f"Bad filter spec {part!r}: {e}") from e
+        return cls(filters)
+
+    def __bool__(self) -> bool:
+        return bool(self.filters)
+
+    def reset(self) -> None:
+        for f in self.filters:
+            f.reset()
+
+    def group_delay_samples(self) -> float:
+        """Total delay the pipeline adds to the signal, in samples."""
+        return sum(f.group_delay_samples() for f in self.filters)
+
+    def group_delay_ms(self, fs: float = DEFAULT_SAMPLE_RATE) -> float:
+        return self.group_delay_samples() / fs * 1000.0
+
+    def process(self, batch) -> np.ndarray:
+        """(N, C) or (C,) array-like -> float array of the same shape."""
+        arr = np.asarray(batch, dtype=float)
+        single = arr.ndim == 1
+        if single:
+            arr = arr[None, :]
+        for f in self.filters:
+            arr = f.process(arr)
+        if self.clamp is not None:
+            arr = np.clip(arr, self.clamp[0], self.clamp[1])
+        return arr[0] if single else arr
+
+    def process_ints(self, batch) -> List[List[int]]:
+        """(N, C) samples in, rounded int rows out (backend read loops)."""
+        return np.rint(self.process(batch)).astype(int).tolist()
+
+    def process_sample(self, vals: List[int]) -> List[int]:
+        """One sample in, one rounded int sample out (backend read loops)."""
+        return [int(round(v)) for v in self.process(vals)]
+
+
+def make_pipeline(filters, num_channels: int, fs: float = DEFAULT_SAMPLE_RATE) -> Optional[FilterPipeline]:
+    """Backend helper: accept None, a spec string or a ready FilterPipeline."""
+    if filters is None or filters == "":
+        return None
+    if isinstance(filters, FilterPipeline):
+        return filters or None
+    pipeline = FilterPipeline.from_spec(str(filters), num_channels=num_channels, fs=fs)
+    logger.info("Signal filters enabled: %s", filters)
+    return pipeline or None
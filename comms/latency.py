@@ -0,0 +1,194 @@
+# comms/latency.py
+
+"""
+End-to-end latency instrumentation, sensor sample -> pixels.
+
+Every stage is measured against the host timestamp a sample gets when it
+is parsed (the `ts` stored in the SampleBuffer), so the numbers add up
+along one path:
+
+    device   serial transport delay above the best observed one, from the
+             firmware's "seq,t_ms,..." prefix (relative: device and host
+             clocks are only aligned by their minimum offset)
+    parse    readline() returned -> sample parsed and filtered
+    filter   group delay of the backend's filter pipeline: how much later
+             the filtered signal follows the real one (not compute time,
+             so it is not included in the stages below; see comms.filters)
+    deliver  sample parsed -> a GUI reader picked it up
+    apply    sample parsed -> widgets updated with it
+    paint    sample parsed -> first paint that shows it completed
+
+Off the sample path, `audio` holds cue trigger -> QSoundEffect playing
+(recorded by host/gui/common/audio_cues.py), so the overlay shows the
+sound half of the feedback loop next to the visual half.
+
+Stages keep a rolling window of the most recent measurements; snapshot()
+returns p50 / p95 / p99 / max per stage in milliseconds.
+
+    tracker = LatencyTracker.instance()
+    tracker.record(STAGE_APPLY, (time.time() - sample_ts) * 1000.0)
+    tracker.snapshot()  ->  {"apply": {"p50": 3.1, "p95": 7.9, ...}, ...}
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+
+STAGE_DEVICE = "device"
+STAGE_PARSE = "parse"
+STAGE_FILTER = "filter"
+STAGE_DELIVER = "deliver"
+STAGE_APPLY = "apply"
+STAGE_PAINT = "paint"
+STAGES = (STAGE_DEVICE, STAGE_PARSE, STAGE_FILTER, STAGE_DELIVER, STAGE_APPLY, STAGE_PAINT)
+STAGE_AUDIO = "audio"          # cue trigger -> playing; not sample-relative
+
+DEFAULT_WINDOW = 2048          # measurements kept per stage (~20 s at 100 Hz)
+LATENCY_BUDGET_MS = 50.0       # biofeedback loop target (sample -> pixels)
+
+HISTOGRAM_EDGES_MS = (0, 1, 2, 5, 10, 20, 30, 50, 75, 100, 200, 500, float("inf"))
+
+
+class _Ring:
+    """Fixed-size float ring (most recent `size` values)."""
+
+    def __init__(self, size: int):
+        self.data = np.zeros(size, dtype=float)
+        self.count = 0          # total ever written
+
+    def add(self, value: float) -> None:
+        self.data[self.count % self.data.size] = value
+        self.count += 1
+
+    def values(self) -> np.ndarray:
+        n = min(self.count, self.data.size)
+        return self.data[:n].copy()
+
+
+class _DeviceClock:
+    """Per-source device clock alignment + sequence gap counting."""
+
+    def __init__(self):
+        self.min_offset: Optional[float] = None
+        self.last_seq: Optional[int] = None
+        self.gaps = 0
+        self.lost = 0
+
+
+class LatencyTracker:
+    """
+    Rolling per-stage latency windows. Thread-safe; record() is called from
+    backend threads (device / parse) and the GUI thread (the rest).
+    """
+
+    _instance: Optional["LatencyTracker"] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "LatencyTracker":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.window = window
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._rings: Dict[str, _Ring] = {}
+        self._clocks: Dict[str, _DeviceClock] = {}
+
+    # ---------- recording ----------
+
+    def record(self, stage: str, ms: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            ring = self._rings.get(stage)
+            if ring is None:
+                ring = self._rings[stage] = _Ring(self.window)
+            ring.add(ms)
+
+    def record_device(self, source: str, seq: int, t_ms: int, t_recv: float) -> None:
+        """
+        Firmware timing prefix for one line. The smallest (host - device)
+        offset seen so far is taken as the pure clock offset; the excess on
+        each line is its transport delay. Sequence jumps count as lost lines.
+        """
+        if not self.enabled:
+            return
+        offset = t_recv - t_ms / 1000.0
+        with self._lock:
+            clock = self._clocks.get(source)
+            if clock is None:
+                clock = self._clocks[source] = _DeviceClock()
+            if clock.last_seq is not None:
+                if seq < clock.last_seq:
+                    # Device restarted: its clock and counter start over
+                    clock.min_offset = None
+                elif seq > clock.last_seq + 1:
+                    clock.gaps += 1
+                    clock.lost += seq - clock.last_seq - 1
+            clock.last_seq = seq
+            if clock.min_offset is None or offset < clock.min_offset:
+                clock.min_offset = offset
+            excess_ms = (offset - clock.min_offset) * 1000.0
+
+            ring = self._rings.get(STAGE_DEVICE)
+            if ring is None:
+                ring = self._rings[STAGE_DEVICE] = _Ring(self.window)
+            ring.add(excess_ms)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._rings.clear()
+            self._clocks.clear()
+
+    # ---------- reading ----------
+
+    def values(self, stage: str) -> np.ndarray:
+        with self._lock:
+            ring = self._rings.get(stage)
+            return ring.values() if ring is not None else np.zeros(0)
+
+    def stats(self, stage: str) -> Optional[dict]:
+        """{"n", "p50", "p95", "p99", "max"} in ms, or None if no data yet."""
+        vals = self.values(stage)
+        if vals.size == 0:
+            return None
+        p50, p95, p99 = np.percentile(vals, [50, 95, 99])
+        return {
+            "n": int(vals.size),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "max": float(vals.max()),
+        }
+
+    def histogram(self, stage: str, edges=HISTOGRAM_EDGES_MS) -> list:
+        """[(lo_ms, hi_ms, count), ...] over the current window."""
+        counts, _ = np.histogram(self.values(stage), bins=np.asarray(edges, dtype=float))
+        return [(edges[i], edges[i + 1], int(c)) for i, c in enumerate(counts)]
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Stats for every stage that has data, in pipeline order."""
+        with self._lock:
+            present = [s for s in STAGES if s in self._rings] + [
+                s for s in self._rings if s not in STAGES
+            ]
+        out = {}
+        for stage in present:
+            st = self.stats(stage)
+            if st is not None:
+                out[stage] = st
+        return out
+
+    def device_counters(self) -> Dict[str, dict]:
+        """Per source: {"gaps", "lost"} from firmware sequence numbers."""
+        with self._lock:
+            return {
+                src: {"gaps": c.gaps, "lost": c.lost} for src, c in self._clocks.items()
+            }
@@ -0,0 +1,252 @@
+# comms/multi_glove.py
+
+"""
+MultiGloveBackend – several gloves read as one time-aligned stream.
+
+Channels are concatenated in glove order, so a left and a right 5-channel
+glove become one 10-channel device ("L Index" ... "R Palm"). Every sample
+of the lead glove (the first one) produces one output sample; the other
+gloves contribute their most recent sample at that moment (sample-and-hold
+on the host clock). Output timing therefore follows the lead glove, and a
+glove that stops streaming is held at its last value and counted as stale
+in get_stats().
+
+    backend = open_shared_backend(SerialBackend, port="multi:L=/dev/ttyACM0,R=/dev/ttyACM1")
+
+    backend = MultiGloveBackend(gloves=[("L", SimBackend()), ("R", SimBackend(num_channels=6))])
+    backend.start()
+
+Port spec: "multi:" followed by comma-separated LABEL=DEVICE entries, where
+DEVICE is a serial port, "auto" or "sim"; append "#N" to set the channel
+count (e.g. "R=sim#6"). Remaining kwargs (baud, timeout, filters, ...)
+are passed to each glove's backend.
+"""
+
+from __future__ import annotations
+
+import time
+import threading
+import logging
+from functools import partial
+from itertools import chain
+from typing import Any, List, Optional, Sequence, Tuple
+
+from .base_backend import BaseBackend, backend_stats
+from .sample_buffer import SampleBuffer, SampleListener
+from .channel_layout import backend_channel_names, backend_num_channels
+
+logger = logging.getLogger("cardinal_grip.comms.multi_glove")
+
+MULTI_PREFIX = "multi:"
+
+# A non-lead glove whose latest sample is older than this is reported stale
+STALE_AFTER_S = 0.25
+
+
+def parse_glove_spec(spec: str) -> List[Tuple[str, str, Optional[int]]]:
+    """
+    "multi:L=/dev/ttyACM0,R=sim#6" -> [("L", "/dev/ttyACM0", None), ("R", "sim", 6)].
+    Entries without a label are named G0, G1, ...
+    """
+    if spec.startswith(MULTI_PREFIX):
+        spec = spec[len(MULTI_PREFIX):]
+    elif spec.startswith("multi@"):
+        # Resampled variant (comms.resample): "multi@100:L=...,R=..."
+        spec = spec.partition(":")[2]
+    gloves = []
+    for i, entry in enumerate(p.strip() for p in spec.split(",")):
+        if not entry:
+            continue
+        label, sep, device = entry.partition("=")
+        if not sep:
+            label, device = f"G{i}", entry
+        device, _, count = device.partition("#")
+        try:
+            channels = int(count) if count else None
+        except ValueError:
+            raise ValueError(f"Bad channel count in glove spec entry {entry!r}") from None
+        gloves.append((label.strip(), device.strip(), channels))
+    if not gloves:
+        raise ValueError(f"No gloves in spec {spec!r}")
+    return gloves
+
+
+def merged_channel_names(gloves: Sequence[Tuple[str, Any]], widths: Sequence[int]) -> Optional[List[str]]:
+    """
+    Names for the concatenated channels: "<label> <name>" per glove. A
+    single unlabelled glove keeps its own names (None if it has none).
+    """
+    if len(gloves) == 1 and not gloves[0][0]:
+        return getattr(gloves[0][1], "channel_names", None)
+    return [
+        f"{label} {name}"
+        for (label, b), width in zip(gloves, widths)
+        for name in backend_channel_names(b, num_channels=width)
+    ]
+
+
+def build_gloves(spec: str, **kwargs) -> List[Tuple[str, Any]]:
+    """One backend per spec entry (SerialBackend or SimBackend), not started."""
+    from .serial_backend import SerialBackend
+    from .sim_backend import SimBackend
+
+    gloves = []
+    for label, device, channels in parse_glove_spec(spec):
+        opts = dict(kwargs)
+        if channels is not None:
+            opts["num_channels"] = channels
+        if device.lower() == "sim":
+            backend = SimBackend(**opts)
+        else:
+            port = None if device.lower() in ("", "auto") else device
+            backend = SerialBackend(port=port, **opts)
+        gloves.append((label, backend))
+    return gloves
+
+
+class MultiGloveBackend(BaseBackend):
+    """
+    BaseBackend over several glove backends (see module docstring).
+
+    gloves: [(label, backend), ...]; the first is the lead. Built from the
+    `port` spec when not given. Backends passed in are started and stopped
+    with this one.
+    """
+
+    def __init__(
+        self,
+        port: Optional[str] = None,
+        gloves: Optional[Sequence[Tuple[str, Any]]] = None,
+        history_size: int = 0,
+        stale_after_s: float = STALE_AFTER_S,
+        **kwargs,
+    ):
+        # The combined count is derived from the gloves, not passed down
+        kwargs.pop("num_channels", None)
+        if gloves is None:
+            if not port:
+                raise ValueError("MultiGloveBackend needs gloves or a 'multi:' port spec")
+            gloves = build_gloves(port, **kwargs)
+        self.gloves: List[Tuple[str, Any]] = list(gloves)
+        self.labels = [label for label, _b in self.gloves]
+        self.port = port or MULTI_PREFIX + ",".join(
+            f"{label}={getattr(b, 'port', None) or type(b).__name__}" for label, b in self.gloves
+        )
+        self.stale_after_s = stale_after_s
+
+        # Channel layout: per-glove widths and names, concatenated
+        self._widths = [backend_num_channels(b) for _l, b in self.gloves]
+        self.num_channels = sum(self._widths)
+        self.channel_names = merged_channel_names(self.gloves, self._widths)
+
+        # Latest sample per glove (written by each glove's thread)
+        self._lock = threading.Lock()
+        self._parts: List[List[int]] = [[0] * w for w in self._widths]
+        self._part_ts: List[float] = [0.0] * len(self.gloves)
+        self._stale = 0
+        self._listeners: List[SampleListener] = []
+
+        self._samples = SampleBuffer(self.num_channels, history_size=history_size)
+
+        logger.debug(
+            "MultiGloveBackend initialized (%s; %d channels)",
+            ", ".join(f"{l}:{w}" for l, w in zip(self.labels, self._widths)),
+            self.num_channels,
+        )
+
+    # ---------- alignment ----------
+
+    def _on_sample(self, idx: int, seq: int, ts: float, vals: List[int]) -> None:
+        width = self._widths[idx]
+        if len(vals) != width:
+            vals = (list(vals) + [0] * width)[:width]
+        with self._lock:
+            self._parts[idx] = vals
+            self._part_ts[idx] = ts
+            if idx != 0:
+                return
+            combined = list(chain.from_iterable(self._parts))
+            if any(ts - t > self.stale_after_s for t in self._part_ts[1:]):
+                self._stale += 1
+        self._samples.append(ts, combined)
+
+    # ---------- lifecycle ----------
+
+    def start(self) -> None:
+        """Start every glove; a glove that fails to start stops the others again."""
+        if self._listeners:
+            return
+        started = []
+        try:
+            for idx, (label, backend) in enumerate(self.gloves):
+                listener = partial(self._on_sample, idx)
+                backend.add_sample_listener(listener)
+                self._listeners.append(listener)
+                backend.start()
+                started.append(backend)
+        except Exception:
+            logger.exception("MultiGloveBackend: glove %r failed to start", label)
+            for (_l, backend), listener in zip(self.gloves, self._listeners):
+                backend.remove_sample_listener(listener)
+            self._listeners = []
+            for backend in started:
+                backend.stop()
+            raise
+        logger.info("MultiGloveBackend started %s (%d channels)", self.port, self.num_channels)
+
+    def stop(self) -> None:
+        for (_label, backend), listener in zip(self.gloves, self._listeners):
+            backend.remove_sample_listener(listener)
+        self._listeners = []
+        for label, backend in self.gloves:
+            try:
+                backend.stop()
+            except Exception:
+                logger.exception("MultiGloveBackend: error stopping glove %r", label)
+        logger.info("MultiGloveBackend stopped %s", self.port)
+
+    # ---------- BaseBackend ----------
+
+    def get_latest(self) -> List[int]:
+        return self._samples.latest()
+
+    def get_window(self, n: int) -> List[List[int]]:
+        return self._samples.window(n)
+
+    def get_samples_since(self, cursor: int) -> Tuple[int, List[float], List[List[int]]]:
+        return self._samples.since(cursor)
+
+    def add_sample_listener(self, listener: SampleListener) -> None:
+        self._samples.add_listener(listener)
+
+    def remove_sample_listener(self, listener: SampleListener) -> None:
+        self._samples.remove_listener(listener)
+
+    def get_last_timestamp(self) -> Optional[float]:
+        return self._samples.last_timestamp()
+
+    def get_stats(self) -> dict:
+        now = time.time()
+        with self._lock:
+            ages = [round((now - t) * 1000.0, 1) if t else None for t in self._part_ts]
+            stale = self._stale
+        gloves = {
+            label: dict(backend_stats(backend), age_ms=age)
+            for (label, backend), age in zip(self.gloves, ages)
+        }
+        return {
+            "samples": self._samples.seq,
+            "stale_samples": stale,
+            # Filters run per glove (the kwargs are passed on to each one)
+            "filtered": all(g.get("filtered") for g in gloves.values()),
+            "gloves": gloves,
+        }
+
+    def send_command(self, cmd: str) -> None:
+        for _label, backend in self.gloves:
+            backend.send_command(cmd)
+
+    def handle_char(self, ch: str, is_press: bool) -> None:
+        for _label, backend in self.gloves:
+            if hasattr(backend, "handle_char"):
+                backend.handle_char(ch, is_press)
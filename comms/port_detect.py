@@ -0,0 +1,522 @@
+# comms/port_detect.py
+
+"""
+Glove serial port detection shared by the GUIs, SerialBackend and the CLI tools.
+
+    port = detect_port()                 # cached device, else scored + probed
+    port = detect_port(probe=False)      # cache + scores only (no port is opened)
+
+Order of preference:
+  1. The last good device (USB VID/PID + serial number, see SerialBackend),
+     if it is plugged in: no port is opened, so this takes milliseconds.
+  2. Candidates scored from USB ids, device names and descriptions
+     (ESP32-S3 native USB, CP210x, CH34x, FTDI; /dev/ttyACM*, /dev/ttyUSB*,
+     /dev/cu.usbmodem*, ...). Bluetooth and plain UARTs are skipped.
+  3. Candidates are probed in parallel: each port is opened briefly (DTR/RTS
+     held low so ESP32 dev boards don't reset) and must show the firmware
+     banner or three consecutive sample lines. The first port to pass wins.
+Probe outcomes are cached in data/serial_port_cache.json; ports that
+recently failed a probe are not reopened on the next run.
+
+    python -m comms.port_detect --list
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import glob
+import json
+import time
+import logging
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict
+from typing import List, Optional
+
+import serial
+import serial.tools.list_ports
+
+logger = logging.getLogger("cardinal_grip.comms.port_detect")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PORT_CACHE_PATH = os.path.join(PROJECT_ROOT, "data", "serial_port_cache.json")
+SERIAL_BY_ID_DIR = "/dev/serial/by-id"
+
+FIRMWARE_BANNER = "# Cardinal Grip FSR streamer"
+
+PROBE_TIMEOUT_S = 1.5          # per port; probes run in parallel
+PROBE_WORKERS = 8
+NEGATIVE_TTL_S = 24 * 3600     # don't re-probe a port that wasn't a glove for a day
+MIN_SCORE = 1
+STRONG_SCORE = 5               # known USB bridge: usable even if the probe saw nothing
+ADC_MAX = 4095
+MAX_CHANNELS = 16
+
+# (vid, pid or None for any) -> (score, label)
+KNOWN_USB_IDS = {
+    (0x303A, None): (6, "Espressif native USB"),
+    (0x239A, None): (6, "Adafruit"),
+    (0x10C4, 0xEA60): (5, "CP210x"),
+    (0x1A86, 0x7523): (5, "CH340"),
+    (0x1A86, 0x55D4): (5, "CH9102"),
+    (0x0403, 0x6001): (4, "FTDI FT232R"),
+    (0x0403, 0x6015): (4, "FTDI FT231X"),
+    (0x2341, None): (3, "Arduino"),
+}
+
+_DEVICE_PREFIXES = (
+    ("/dev/cu.usbmodem", 3),
+    ("/dev/cu.usbserial", 3),
+    ("/dev/cu.wchusbserial", 3),
+    ("/dev/ttyACM", 3),
+    ("/dev/ttyUSB", 3),
+    ("/dev/tty.usbmodem", 1),      # macOS dial-in twin of cu.*; cu.* is preferred
+    ("/dev/tty.usbserial", 1),
+)
+
+_HINTS = (
+    ("esp32", 2), ("feather", 2), ("arduino", 2),
+    ("cp210", 2), ("ch340", 2), ("ch910", 2), ("wchusb", 2),
+    ("usb", 1),
+)
+
+_cache_lock = threading.Lock()
+
+
+# ---------- candidates ----------
+
+@dataclass
+class PortCandidate:
+    device: str
+    score: int
+    vid: Optional[int] = None
+    pid: Optional[int] = None
+    serial_number: Optional[str] = None
+    description: str = ""
+    reasons: List[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """Cache key: USB identity where there is one, else the device path."""
+        if self.vid is not None:
+            return _usb_key(self.vid, self.pid, self.serial_number)
+        return self.device
+
+
+def _usb_key(vid: int, pid: Optional[int], serial_number: Optional[str]) -> str:
+    return f"{vid:04x}:{pid or 0:04x}:{serial_number or ''}"
+
+
+def score_port(info) -> PortCandidate:
+    """Score one serial.tools.list_ports entry; <= 0 means 'not a glove'."""
+    dev = info.device or ""
+    desc = info.description or ""
+    combo = f"{dev} {desc} {info.hwid or ''}".lower()
+    cand = PortCandidate(
+        device=dev,
+        score=0,
+        vid=info.vid,
+        pid=info.pid,
+        serial_number=info.serial_number,
+        description=desc,
+    )
+    if "bluetooth" in combo or "debug-console" in combo:
+        cand.score = -10
+        cand.reasons.append("bluetooth/console")
+        return cand
+
+    if info.vid is not None:
+        known = KNOWN_USB_IDS.get((info.vid, info.pid)) or KNOWN_USB_IDS.get((info.vid, None))
+        if known:
+            cand.score += known[0]
+            cand.reasons.append(known[1])
+        else:
+            cand.score += 1
+            cand.reasons.append("USB")
+
+    for prefix, points in _DEVICE_PREFIXES:
+        if dev.startswith(prefix):
+            cand.score += points
+            cand.reasons.append(prefix)
+            break
+
+    for hint, points in _HINTS:
+        if hint in combo:
+            cand.score += points
+            cand.reasons.append(hint)
+            break
+    return cand
+
+
+def list_candidates() -> List[PortCandidate]:
+    """Every port that could be a glove, best first."""
+    cands = [score_port(p) for p in serial.tools.list_ports.comports()]
+    cands = [c for c in cands if c.score >= MIN_SCORE]
+    cands.sort(key=lambda c: (-c.score, c.device))
+    return cands
+
+
+# ---------- USB identity (last good device) ----------
+
+def _by_id_links(device: str) -> list[str]:
+    """/dev/serial/by-id symlinks resolving to `device` (Linux udev; empty elsewhere)."""
+    real = os.path.realpath(device)
+    return [p for p in sorted(glob.glob(os.path.join(SERIAL_BY_ID_DIR, "*"))) if os.path.realpath(p) == real]
+
+
+def device_identity(port: str) -> Optional[dict]:
+    """
+    USB identity of a port: {"vid", "pid", "serial_number", "device", "by_id"},
+    or None for ports pyserial can't tie to a USB device (ptys, plain UARTs).
+    """
+    real = os.path.realpath(port)
+    for p in serial.tools.list_ports.comports():
+        if p.device in (port, real) or os.path.realpath(p.device) == real:
+            if p.vid is None:
+                return None
+            links = _by_id_links(p.device)
+            return {
+                "vid": p.vid,
+                "pid": p.pid,
+                "serial_number": p.serial_number,
+                "device": p.device,
+                "by_id": links[0] if links else None,
+            }
+    return None
+
+
+def find_device(identity: dict) -> Optional[str]:
+    """Current path of the device with this USB identity (it may have been renumbered)."""
+    by_id = identity.get("by_id")
+    if by_id and os.path.exists(by_id):
+        return by_id
+    for p in serial.tools.list_ports.comports():
+        if (
+            p.vid == identity.get("vid")
+            and p.pid == identity.get("pid")
+            and p.serial_number == identity.get("serial_number")
+        ):
+            return p.device
+    return None
+
+
+# ---------- cache ----------
+
+def _load_cache(path: str = PORT_CACHE_PATH) -> dict:
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        logger.exception("Failed to read serial port cache %s", path)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _update_cache(mutate, path: str = PORT_CACHE_PATH) -> None:
+    with _cache_lock:
+        data = _load_cache(path)
+        mutate(data)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, path)
+        except Exception:
+            logger.exception("Failed to write serial port cache %s", path)
+
+
+def load_last_device(path: str = PORT_CACHE_PATH) -> Optional[dict]:
+    last = _load_cache(path).get("last_good")
+    return last if isinstance(last, dict) and last.get("vid") is not None else None
+
+
+def save_last_device(identity: dict, path: str = PORT_CACHE_PATH) -> None:
+    def mutate(data):
+        data["last_good"] = identity
+    _update_cache(mutate, path)
+
+
+def cached_channel_count(port: Optional[str] = None, path: str = PORT_CACHE_PATH) -> Optional[int]:
+    """
+    Channel count a probe saw on `port` (None: the last good device), so a
+    backend can size itself before the first line arrives.
+    """
+    data = _load_cache(path)
+    ports = data.get("ports") if isinstance(data.get("ports"), dict) else {}
+    entry = None
+    last = data.get("last_good")
+    if isinstance(last, dict) and last.get("vid") is not None:
+        if port is None or port in (last.get("device"), last.get("by_id")):
+            entry = ports.get(_usb_key(last["vid"], last.get("pid"), last.get("serial_number")))
+    if entry is None and port is not None:
+        real = os.path.realpath(port)
+        for e in ports.values():
+            if e.get("device") and os.path.realpath(e["device"]) == real:
+                entry = e
+                break
+    n = entry.get("channels") if isinstance(entry, dict) and entry.get("ok") else None
+    return int(n) if isinstance(n, int) and 0 < n <= MAX_CHANNELS else None
+
+
+def clear_cache(path: str = PORT_CACHE_PATH) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+# ---------- probing ----------
+
+@dataclass
+class ProbeResult:
+    device: str
+    ok: bool
+    kind: str                   # "banner", "samples", "silent", "other", "error"
+    detail: str = ""
+    channels: Optional[int] = None
+    timing: Optional[bool] = None   # lines carry the "seq,t_ms," prefix
+    elapsed_ms: float = 0.0
+
+
+def _int_fields(line: str) -> Optional[List[int]]:
+    parts = [p.strip() for p in line.split(",")]
+    if not parts or len(parts) > MAX_CHANNELS + 2:
+        return None
+    try:
+        return [int(p) for p in parts]
+    except ValueError:
+        return None
+
+
+def classify_lines(rows: List[List[int]]) -> Optional[tuple]:
+    """
+    (channels, timing) for consecutive integer lines that look like sample
+    lines, else None. The "seq,t_ms," prefix shows as a first field counting
+    up by one and a non-decreasing second field.
+    """
+    if len(rows) < 2 or len({len(r) for r in rows}) != 1:
+        return None
+    n = len(rows[0])
+    timing = n >= 3 and all(
+        b[0] == a[0] + 1 and b[1] >= a[1] for a, b in zip(rows, rows[1:])
+    )
+    values = [r[2:] if timing else r for r in rows]
+    if not all(0 <= v <= ADC_MAX for r in values for v in r):
+        return None
+    return len(values[0]), timing
+
+
+def probe_port(device: str, baud: int = 115200, timeout: float = PROBE_TIMEOUT_S) -> ProbeResult:
+    """Open `device` briefly and look for the firmware banner or sample lines."""
+    t0 = time.perf_counter()
+
+    def done(ok, kind, detail="", channels=None, timing=None):
+        return ProbeResult(device, ok, kind, detail, channels, timing, (time.perf_counter() - t0) * 1000.0)
+
+    ser = serial.Serial()
+    ser.port = device
+    ser.baudrate = baud
+    ser.timeout = 0.05
+    # Don't pulse EN/IO0 on ESP32 dev boards (auto-reset circuit) when opening
+    ser.dtr = False
+    ser.rts = False
+    try:
+        ser.open()
+    except Exception as e:
+        return done(False, "error", str(e))
+
+    try:
+        buf = bytearray()
+        rows: List[List[int]] = []
+        skipped_first = False
+        saw_bytes = False
+        while time.perf_counter() - t0 < timeout:
+            chunk = ser.read(ser.in_waiting or 1)
+            if not chunk:
+                continue
+            saw_bytes = True
+            buf += chunk
+            while True:
+                nl = buf.find(b"\n")
+                if nl < 0:
+                    break
+                text = bytes(buf[:nl]).decode(errors="ignore").strip()
+                del buf[: nl + 1]
+                if text.startswith(FIRMWARE_BANNER):
+                    return done(True, "banner", text)
+                if not skipped_first:
+                    skipped_first = True      # probably joined mid-line
+                    continue
+                fields = _int_fields(text) if text else None
+                if fields is None:
+                    rows.clear()
+                    continue
+                rows.append(fields)
+                shape = classify_lines(rows[-3:]) if len(rows) >= 3 else None
+                if shape is not None:
+                    return done(True, "samples", text, channels=shape[0], timing=shape[1])
+            if len(buf) > 512:
+                buf.clear()
+        return done(False, "other" if saw_bytes else "silent")
+    finally:
+        try:
+            ser.close()
+        except Exception:
+            pass
+
+
+# ---------- detection ----------
+
+def detect_port(
+    baud: int = 115200,
+    probe: bool = True,
+    use_cache: bool = True,
+    timeout: float = PROBE_TIMEOUT_S,
+) -> Optional[str]:
+    """Best glove port, or None. See the module docstring for the order."""
+    t0 = time.perf_counter()
+    cache = _load_cache() if use_cache else {}
+
+    last = cache.get("last_good")
+    if isinstance(last, dict) and last.get("vid") is not None:
+        port = find_device(last)
+        if port:
+            logger.info(
+                "Using last good serial device %s (%.0f ms)",
+                port,
+                (time.perf_counter() - t0) * 1000.0,
+            )
+            return port
+
+    candidates = list_candidates()
+    if not candidates:
+        logger.warning("No candidate glove serial ports found.")
+        return None
+    if not probe:
+        best = candidates[0]
+        logger.info("Best-scored serial port: %s (score=%d, %s)", best.device, best.score, ", ".join(best.reasons))
+        return best.device
+
+    now = time.time()
+    known = cache.get("ports", {}) if isinstance(cache.get("ports"), dict) else {}
+
+    def recently_rejected(c: PortCandidate) -> bool:
+        entry = known.get(c.key)
+        return bool(entry) and not entry.get("ok") and now - entry.get("checked", 0) < NEGATIVE_TTL_S
+
+    to_probe = [c for c in candidates if not recently_rejected(c)]
+    results: dict = {}
+    winner: Optional[PortCandidate] = None
+    if to_probe:
+        pool = ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(to_probe)), thread_name_prefix="port-probe")
+        try:
+            futures = {pool.submit(probe_port, c.device, baud, timeout): c for c in to_probe}
+            for fut in as_completed(futures):
+                cand = futures[fut]
+                try:
+                    res = fut.result()
+                except Exception as e:
+                    res = ProbeResult(cand.device, False, "error", str(e))
+                results[cand.key] = (cand, res)
+                logger.debug("Probe %s: %s %s (%.0f ms)", cand.device, res.kind, res.detail, res.elapsed_ms)
+                if res.ok:
+                    winner = cand
+                    break
+        finally:
+            # Remaining probes finish on their own (bounded by `timeout`)
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def mutate(data):
+        ports = data.setdefault("ports", {})
+        for key, (cand, res) in results.items():
+            if res.kind == "error":
+                continue            # busy / permission: says nothing about the port
+            ports[key] = {
+                "device": cand.device,
+                "ok": res.ok,
+                "kind": res.kind,
+                "channels": res.channels,
+                "timing": res.timing,
+                "checked": now,
+            }
+    if use_cache and results:
+        _update_cache(mutate)
+
+    elapsed_ms = (time.perf_counter() - t0) * 1000.0
+    if winner is not None:
+        res = results[winner.key][1]
+        logger.info(
+            "Detected glove on %s via %s (%.0f ms)",
+            winner.device,
+            res.kind,
+            elapsed_ms,
+            extra={"probe": asdict(res), "candidates": len(candidates)},
+        )
+        return winner.device
+
+    # Nothing answered (board still booting, or firmware not streaming yet):
+    # a known USB bridge is still the best guess
+    best = candidates[0]
+    if best.score >= STRONG_SCORE:
+        logger.warning(
+            "No port answered a probe; falling back to %s (score=%d, %s)",
+            best.device,
+            best.score,
+            ", ".join(best.reasons),
+        )
+        return best.device
+    logger.warning("No glove found on %d candidate port(s) (%.0f ms)", len(candidates), elapsed_ms)
+    return None
+
+
+# ---------- CLI ----------
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="cardinal-grip-ports",
+        description="Find the Cardinal Grip glove's serial port.",
+    )
+    parser.add_argument("--list", action="store_true", help="List scored candidates (and probe them with --probe)")
+    parser.add_argument("--probe", action="store_true", help="With --list: open each candidate and report what it sends")
+    parser.add_argument("--no-probe", action="store_true", help="Detect from cache and scores only")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore (and don't update) the port cache")
+    parser.add_argument("--clear-cache", action="store_true", help="Forget cached probe results and the last device")
+    parser.add_argument("--baud", type=int, default=115200)
+    parser.add_argument("--timeout", type=float, default=PROBE_TIMEOUT_S, help="Probe timeout per port (s)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.clear_cache:
+        clear_cache()
+        print(f"Cleared {PORT_CACHE_PATH}")
+
+    if args.list:
+        cands = list_candidates()
+        if not cands:
+            print("No candidate ports.")
+        for c in cands:
+            line = f"{c.device:<32} score={c.score:<3} {', '.join(c.reasons)}  [{c.description}]"
+            if args.probe:
+                res = probe_port(c.device, args.baud, args.timeout)
+                line += f"  -> {res.kind} ({res.elapsed_ms:.0f} ms)"
+                if res.channels:
+                    line += f" channels={res.channels} timing={res.timing}"
+            print(line)
+        return 0
+
+    port = detect_port(args.baud, probe=not args.no_probe, use_cache=not args.no_cache, timeout=args.timeout)
+    if port is None:
+        print("No glove port found.", file=sys.stderr)
+        return 1
+    print(port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
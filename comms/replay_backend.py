@@ -0,0 +1,166 @@
+# comms/replay_backend.py
+
+"""
+ReplayBackend – plays a recorded session (CSV or .cgs) back as a live stream.
+
+Samples are emitted on the host clock at their recorded spacing (scaled
+by `speed`), so anything that reads a live backend – GUI windows, the
+recorder, the clinician live wall – can be driven from data/logs without
+a glove attached:
+
+    backend = ReplayBackend(path="data/logs/patient_session_20251120_011321.csv", loop=True)
+    backend = open_shared_backend(SerialBackend, port="replay:data/logs/....csv")
+
+`offset_s` starts playback part-way through the file, so several replays
+of the same recording do not move in lockstep. Channel count (and names,
+from the .meta.json sidecar) follow the file.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import threading
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .base_backend import BaseBackend
+from .sample_buffer import SampleBuffer, SampleListener
+
+logger = logging.getLogger("cardinal_grip.comms.replay")
+
+REPLAY_PREFIX = "replay:"
+UPDATE_INTERVAL_S = 0.01
+
+
+class ReplayBackend(BaseBackend):
+    """
+    path: session file (or `port` = "replay:<path>"). speed: playback rate
+    (2.0 = twice real time). loop: restart at the end instead of going quiet.
+    """
+
+    def __init__(
+        self,
+        port: Optional[str] = None,
+        path: Optional[str] = None,
+        speed: float = 1.0,
+        loop: bool = True,
+        offset_s: float = 0.0,
+        history_size: int = 0,
+        update_interval: float = UPDATE_INTERVAL_S,
+        **kwargs,
+    ):
+        from model.session_store import load_session, read_session_meta
+
+        if path is None and port:
+            path = port[len(REPLAY_PREFIX):] if port.startswith(REPLAY_PREFIX) else port
+        if not path:
+            raise ValueError("ReplayBackend needs a session path (or 'replay:<path>' port)")
+        self.path = path
+        self.port = REPLAY_PREFIX + path
+        self.speed = max(1e-3, float(speed))
+        self.loop = loop
+        self.update_interval = update_interval
+
+        session = load_session(path)
+        if session.num_samples == 0:
+            raise ValueError(f"{path} has no samples to replay")
+        self._t = session.time - session.time[0]                       # (N,) from 0
+        self._rows = np.clip(session.channels.T, 0, 4095).astype(np.int64).tolist()
+        # A gap-free loop: one median sample period between the last and first sample
+        period = float(np.median(np.diff(self._t))) if self._t.size > 1 else update_interval
+        self._duration = float(self._t[-1]) + max(period, 1e-3)
+        self.num_channels = session.num_channels
+        meta = read_session_meta(path) or {}
+        names = meta.get("channel_names")
+        self.channel_names = list(names) if names and len(names) == self.num_channels else None
+
+        self._offset = float(offset_s) % self._duration
+        self._samples = SampleBuffer(self.num_channels, history_size=history_size, initial=self._rows[0])
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._loops = 0
+
+        logger.debug(
+            "ReplayBackend initialized (%s: %d samples, %d channels, %.1f s, speed=%.2f)",
+            os.path.basename(path),
+            len(self._rows),
+            self.num_channels,
+            self._duration,
+            self.speed,
+        )
+
+    # ---------- playback ----------
+
+    def _run_loop(self) -> None:
+        t_start = time.time()
+        pos = int(np.searchsorted(self._t, self._offset))   # next row to emit
+        base = self._offset                                 # recording time at t_start
+        n = len(self._rows)
+        while self._running:
+            now = time.time()
+            play_t = base + (now - t_start) * self.speed
+            while self._running:
+                if pos >= n:
+                    if not self.loop:
+                        break
+                    # Wrap: the recording restarts one period after its last sample
+                    base -= self._duration
+                    play_t -= self._duration
+                    pos = 0
+                    self._loops += 1
+                if self._t[pos] > play_t:
+                    break
+                ts = t_start + (self._t[pos] - base) / self.speed
+                self._samples.append(ts, self._rows[pos])
+                pos += 1
+            if pos >= n and not self.loop:
+                logger.info("ReplayBackend reached the end of %s", self.path)
+                break
+            time.sleep(self.update_interval)
+
+    # ---------- lifecycle ----------
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run_loop, name="replay-backend", daemon=True)
+        self._thread.start()
+        logger.info("ReplayBackend started %s", self.path)
+
+    def stop(self) -> None:
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        logger.info("ReplayBackend stopped %s", self.path)
+
+    # ---------- BaseBackend ----------
+
+    def get_latest(self) -> List[int]:
+        return self._samples.latest()
+
+    def get_window(self, n: int) -> List[List[int]]:
+        return self._samples.window(n)
+
+    def get_samples_since(self, cursor: int) -> Tuple[int, List[float], List[List[int]]]:
+        return self._samples.since(cursor)
+
+    def add_sample_listener(self, listener: SampleListener) -> None:
+        self._samples.add_listener(listener)
+
+    def remove_sample_listener(self, listener: SampleListener) -> None:
+        self._samples.remove_listener(listener)
+
+    def get_last_timestamp(self) -> Optional[float]:
+        return self._samples.last_timestamp()
+
+    def get_stats(self) -> dict:
+        return {"samples": self._samples.seq, "loops": self._loops, "speed": self.speed}
+
+    def send_command(self, cmd: str) -> None:
+        """Recordings take no device commands."""
+        logger.debug("ReplayBackend ignoring command %r", cmd)
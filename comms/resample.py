@@ -0,0 +1,381 @@
+# comms/resample.py
+
+"""
+Streaming resampling and multi-stream alignment onto a fixed-rate grid.
+
+Backends deliver samples whenever they arrive: ~100 Hz with USB jitter
+from one glove, a different rate from a second glove or a reference
+device. StreamAligner turns any number of such streams into one uniformly
+spaced stream on the host clock:
+
+    aligner = StreamAligner([4, 6], rate_hz=100.0, method="linear")
+    aligner.push(0, ts_left, vals_left)      # (N,), (N, 4) batches
+    aligner.push(1, ts_right, vals_right)
+    grid_ts, grid_vals = aligner.pull(time.time())   # (M,), (M, 10)
+
+Grid points are multiples of 1/rate_hz, so streams resampled separately
+at the same rate line up exactly. A grid point is emitted once every
+stream has a sample at or after it ("linear" interpolates between the
+samples either side, "nearest" takes the closer one). Latency is bounded:
+a grid point older than max_latency_s is emitted anyway, holding the last
+value of any stream that has not caught up (counted in `held`). When every
+stream stops, nothing is emitted; a backlog longer than max_backlog_s
+after a pause is skipped rather than filled in.
+
+All work is vectorized over the pushed batch and across channels.
+
+AlignedBackend wraps this as a backend (one or several gloves in, one
+fixed-rate stream out), so the rep engine and plots read a clean grid:
+
+    backend = open_shared_backend(SerialBackend, port="multi@100:L=/dev/ttyACM0,R=/dev/ttyACM1")
+    backend = open_shared_backend(SerialBackend, port="multi@100:/dev/ttyACM0")   # one glove
+    backend = AlignedBackend(gloves=[("", SerialBackend())], rate_hz=100.0)
+"""
+
+from __future__ import annotations
+
+import math
+import time
+import threading
+import logging
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base_backend import BaseBackend, backend_stats
+from .sample_buffer import SampleBuffer, SampleListener
+from .channel_layout import backend_num_channels
+
+logger = logging.getLogger("cardinal_grip.comms.resample")
+
+RESAMPLE_METHODS = ("linear", "nearest")
+DEFAULT_RATE_HZ = 100.0
+DEFAULT_MAX_LATENCY_S = 0.1
+DEFAULT_MAX_BACKLOG_S = 1.0
+PUMP_INTERVAL_S = 0.005
+
+
+class StreamAligner:
+    """
+    widths: channels per input stream; output rows are the streams'
+    channels concatenated in this order.
+    """
+
+    def __init__(
+        self,
+        widths: Sequence[int],
+        rate_hz: float = DEFAULT_RATE_HZ,
+        method: str = "linear",
+        max_latency_s: float = DEFAULT_MAX_LATENCY_S,
+        max_backlog_s: float = DEFAULT_MAX_BACKLOG_S,
+    ):
+        if method not in RESAMPLE_METHODS:
+            raise ValueError(f"Unknown resample method {method!r} (expected one of {RESAMPLE_METHODS})")
+        if rate_hz <= 0:
+            raise ValueError(f"rate_hz must be positive, got {rate_hz}")
+        self.widths = [int(w) for w in widths]
+        self.num_channels = sum(self.widths)
+        self.rate_hz = float(rate_hz)
+        self.period = 1.0 / self.rate_hz
+        self.method = method
+        self.max_latency_s = float(max_latency_s)
+        self.max_backlog_s = float(max_backlog_s)
+
+        # Counters
+        self.emitted = 0
+        self.held = 0          # grid points emitted with at least one stream held
+        self.skipped = 0       # grid points dropped after a pause
+
+        self.reset()
+
+    def reset(self) -> None:
+        self._ts: List[np.ndarray] = [np.zeros(0) for _ in self.widths]
+        self._vals: List[np.ndarray] = [np.zeros((0, w)) for w in self.widths]
+        self._next_k: Optional[int] = None   # next grid index (t = k * period)
+
+    # ---------- input ----------
+
+    def push(self, stream: int, timestamps, values) -> None:
+        """Append a batch for one stream; timestamps must not go backwards."""
+        ts = np.asarray(timestamps, dtype=float).reshape(-1)
+        if not ts.size:
+            return
+        w = self.widths[stream]
+        vals = np.asarray(values, dtype=float).reshape(ts.size, -1)
+        if vals.shape[1] != w:
+            fixed = np.zeros((ts.size, w))
+            n = min(w, vals.shape[1])
+            fixed[:, :n] = vals[:, :n]
+            vals = fixed
+        old = self._ts[stream]
+        if old.size and ts[0] < old[-1]:
+            # Out-of-order batch (reconnect with a reset clock): keep what is monotonic
+            keep = ts >= old[-1]
+            ts, vals = ts[keep], vals[keep]
+            if not ts.size:
+                return
+        self._ts[stream] = np.concatenate((old, ts))
+        self._vals[stream] = np.concatenate((self._vals[stream], vals))
+
+    # ---------- output ----------
+
+    def _sample_at(self, stream: int, grid: np.ndarray) -> np.ndarray:
+        ts, vals = self._ts[stream], self._vals[stream]
+        if not ts.size:
+            return np.zeros((grid.size, self.widths[stream]))
+        last = ts.size - 1
+        idx = np.searchsorted(ts, grid, side="right")   # first sample after each grid point
+        i0 = np.clip(idx - 1, 0, last)
+        i1 = np.clip(idx, 0, last)
+        if self.method == "nearest":
+            pick = np.where(np.abs(ts[i1] - grid) < np.abs(grid - ts[i0]), i1, i0)
+            return vals[pick]
+        t0, t1 = ts[i0], ts[i1]
+        span = t1 - t0
+        frac = np.divide(grid - t0, span, out=np.zeros_like(grid), where=span > 0)
+        frac = np.clip(frac, 0.0, 1.0)[:, None]
+        return vals[i0] + frac * (vals[i1] - vals[i0])
+
+    def pull(self, now: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Grid points that are ready: (timestamps (M,), values (M, C)).
+        Pass the current host time to enforce max_latency_s.
+        """
+        empty = (np.zeros(0), np.zeros((0, self.num_channels)))
+        lasts = [ts[-1] if ts.size else None for ts in self._ts]
+        known = [t for t in lasts if t is not None]
+        if not known:
+            return empty
+
+        ready = min(known) if len(known) == len(lasts) else -math.inf
+        until = ready
+        if now is not None:
+            # Don't wait past max_latency_s for a lagging stream, but never
+            # run ahead of the freshest one
+            until = max(ready, min(max(known), now - self.max_latency_s))
+
+        if self._next_k is None:
+            firsts = [ts[0] for ts in self._ts if ts.size]
+            self._next_k = math.ceil(max(firsts) / self.period)
+        k_end = math.floor(until / self.period)
+        if k_end < self._next_k:
+            return empty
+
+        backlog = k_end - self._next_k + 1
+        max_points = max(1, int(min(self.max_backlog_s * self.rate_hz, backlog)))
+        if backlog > max_points:
+            self.skipped += backlog - max_points
+            self._next_k = k_end - max_points + 1
+
+        grid = np.arange(self._next_k, k_end + 1) * self.period
+        self._next_k = k_end + 1
+
+        parts = [self._sample_at(i, grid) for i in range(len(self.widths))]
+        out = np.concatenate(parts, axis=1) if len(parts) > 1 else parts[0]
+
+        held = np.zeros(grid.size, dtype=bool)
+        for t_last in lasts:
+            held |= grid > t_last if t_last is not None else True
+        self.held += int(held.sum())
+        self.emitted += grid.size
+
+        # Keep the last sample at or before the newest grid point (the left
+        # neighbour of the next one) and everything after it
+        t_grid = grid[-1]
+        for i, ts in enumerate(self._ts):
+            if ts.size > 1:
+                cut = max(0, int(np.searchsorted(ts, t_grid, side="right")) - 1)
+                if cut:
+                    self._ts[i] = ts[cut:]
+                    self._vals[i] = self._vals[i][cut:]
+        return grid, out
+
+    def stats(self) -> dict:
+        return {
+            "rate_hz": self.rate_hz,
+            "method": self.method,
+            "emitted": self.emitted,
+            "held": self.held,
+            "skipped": self.skipped,
+        }
+
+
+def resample(timestamps, values, rate_hz: float = DEFAULT_RATE_HZ, method: str = "linear"):
+    """One recorded stream onto the grid in one call: (grid_ts, grid_values)."""
+    vals = np.asarray(values, dtype=float)
+    width = vals.shape[1] if vals.ndim > 1 else 1
+    aligner = StreamAligner([width], rate_hz, method, max_backlog_s=math.inf)
+    aligner.push(0, timestamps, vals)
+    return aligner.pull()
+
+
+# ================================================================
+# Backend
+# ================================================================
+
+
+def parse_aligned_spec(port: str) -> Tuple[Optional[float], str]:
+    """"multi@100:L=...,R=..." -> (100.0, "multi:L=...,R=..."); no "@rate" -> (None, port)."""
+    head, sep, rest = port.partition(":")
+    if not sep or "@" not in head:
+        return None, port
+    prefix, _, rate = head.partition("@")
+    try:
+        return float(rate), f"{prefix}:{rest}"
+    except ValueError:
+        raise ValueError(f"Bad resample rate in {port!r}") from None
+
+
+class AlignedBackend(BaseBackend):
+    """
+    Fixed-rate stream from one or more glove backends.
+
+    A pump thread drains each glove with get_samples_since() every
+    PUMP_INTERVAL_S, pushes the batches into a StreamAligner and appends
+    the grid samples to this backend's buffer (rounded to ADC counts), so
+    listeners and cursor readers see rate_hz samples per second.
+    """
+
+    def __init__(
+        self,
+        port: Optional[str] = None,
+        gloves: Optional[Sequence[Tuple[str, Any]]] = None,
+        rate_hz: Optional[float] = None,
+        method: str = "linear",
+        max_latency_s: float = DEFAULT_MAX_LATENCY_S,
+        history_size: int = 0,
+        **kwargs,
+    ):
+        from .multi_glove import build_gloves, merged_channel_names
+
+        kwargs.pop("num_channels", None)
+        spec_rate = None
+        if port:
+            spec_rate, spec = parse_aligned_spec(port)
+        if gloves is None:
+            if not port:
+                raise ValueError("AlignedBackend needs gloves or a 'multi@<rate>:' port spec")
+            gloves = build_gloves(spec, **kwargs)
+            if len(gloves) == 1 and gloves[0][0] == "G0":
+                # "multi@100:/dev/ttyACM0": one glove, resampled, own names
+                gloves = [("", gloves[0][1])]
+        self.gloves: List[Tuple[str, Any]] = list(gloves)
+        self.rate_hz = float(rate_hz or spec_rate or DEFAULT_RATE_HZ)
+        self.port = port or f"multi@{self.rate_hz:g}:" + ",".join(
+            f"{label}={getattr(b, 'port', None) or type(b).__name__}" for label, b in self.gloves
+        )
+
+        widths = [backend_num_channels(b) for _l, b in self.gloves]
+        self.num_channels = sum(widths)
+        self.channel_names = merged_channel_names(self.gloves, widths)
+        self.aligner = StreamAligner(widths, self.rate_hz, method, max_latency_s)
+
+        self._samples = SampleBuffer(self.num_channels, history_size=history_size)
+        self._cursors = [0] * len(self.gloves)
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        logger.debug(
+            "AlignedBackend initialized (%d glove(s), %d channels, %.0f Hz %s)",
+            len(self.gloves),
+            self.num_channels,
+            self.rate_hz,
+            method,
+        )
+
+    # ---------- pump ----------
+
+    def _pump_once(self) -> int:
+        aligner = self.aligner
+        for i, (_label, backend) in enumerate(self.gloves):
+            self._cursors[i], ts, vals = backend.get_samples_since(self._cursors[i])
+            if ts:
+                aligner.push(i, ts, vals)
+        grid_ts, grid_vals = aligner.pull(time.time())
+        if grid_ts.size:
+            rows = np.rint(grid_vals).astype(np.int64).tolist()
+            for t, row in zip(grid_ts.tolist(), rows):
+                self._samples.append(t, row)
+        return int(grid_ts.size)
+
+    def _pump_loop(self) -> None:
+        logger.debug("AlignedBackend pump entering.")
+        while self._running:
+            try:
+                self._pump_once()
+            except Exception:
+                logger.exception("AlignedBackend pump failed")
+            time.sleep(PUMP_INTERVAL_S)
+        logger.debug("AlignedBackend pump exiting.")
+
+    # ---------- lifecycle ----------
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        started = []
+        try:
+            for _label, backend in self.gloves:
+                backend.start()
+                started.append(backend)
+        except Exception:
+            for backend in started:
+                backend.stop()
+            raise
+        # Only samples from now on: nothing older than the first grid point
+        self._cursors = [b._samples.seq if hasattr(b, "_samples") else 0 for _l, b in self.gloves]
+        self.aligner.reset()
+        self._running = True
+        self._thread = threading.Thread(target=self._pump_loop, name="aligned-backend", daemon=True)
+        self._thread.start()
+        logger.info("AlignedBackend started %s (%d channels @ %.0f Hz)", self.port, self.num_channels, self.rate_hz)
+
+    def stop(self) -> None:
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        for label, backend in self.gloves:
+            try:
+                backend.stop()
+            except Exception:
+                logger.exception("AlignedBackend: error stopping glove %r", label)
+        logger.info("AlignedBackend stopped %s", self.port)
+
+    # ---------- BaseBackend ----------
+
+    def get_latest(self) -> List[int]:
+        return self._samples.latest()
+
+    def get_window(self, n: int) -> List[List[int]]:
+        return self._samples.window(n)
+
+    def get_samples_since(self, cursor: int) -> Tuple[int, List[float], List[List[int]]]:
+        return self._samples.since(cursor)
+
+    def add_sample_listener(self, listener: SampleListener) -> None:
+        self._samples.add_listener(listener)
+
+    def remove_sample_listener(self, listener: SampleListener) -> None:
+        self._samples.remove_listener(listener)
+
+    def get_last_timestamp(self) -> Optional[float]:
+        return self._samples.last_timestamp()
+
+    def get_stats(self) -> dict:
+        gloves = {label or f"G{i}": backend_stats(b) for i, (label, b) in enumerate(self.gloves)}
+        return {
+            "samples": self._samples.seq,
+            "aligner": self.aligner.stats(),
+            "filtered": all(g.get("filtered") for g in gloves.values()),
+            "gloves": gloves,
+        }
+
+    def send_command(self, cmd: str) -> None:
+        for _label, backend in self.gloves:
+            backend.send_command(cmd)
+
+    def handle_char(self, ch: str, is_press: bool) -> None:
+        for _label, backend in self.gloves:
+            if hasattr(backend, "handle_char"):
+                backend.handle_char(ch, is_press)
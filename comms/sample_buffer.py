@@ -0,0 +1,172 @@
+# comms/sample_buffer.py
+
+"""
+Thread-safe sample store shared by the backends.
+
+Every sample pushed by a backend thread gets a monotonically increasing
+sequence number. Consumers keep a cursor (the last seq they saw) and call
+since(cursor) to get *every* sample that arrived in between, instead of
+only the most recent one. That lets rep detection run on the full backend
+rate rather than on GUI ticks.
+
+Listeners (add_listener) are push-style subscribers called from the
+writer thread for every sample; the acquisition hub uses them to fan
+samples out to socket clients without polling.
+"""
+
+from __future__ import annotations
+
+import threading
+import logging
+from collections import deque
+from itertools import islice
+from typing import Callable, Deque, List, Optional, Tuple
+
+logger = logging.getLogger("cardinal_grip.comms.buffer")
+
+# How many recent samples are kept for cursor reads (~10 s at 100 Hz)
+DEFAULT_RECENT_SIZE = 1024
+
+# listener(seq, timestamp, values)
+SampleListener = Callable[[int, float, List[int]], None]
+
+
+class SampleBuffer:
+    """
+    Latest value + optional history + cursor-readable recent samples.
+
+    - append(ts, vals): called from the backend thread.
+    - latest() / last_timestamp() / window(n): same semantics the backends
+      already exposed through get_latest() / get_last_timestamp() / get_window().
+    - since(cursor): (new_cursor, [ts...], [vals...]) of samples with seq > cursor.
+    """
+
+    def __init__(
+        self,
+        num_channels: int,
+        history_size: int = 0,
+        recent_size: int = DEFAULT_RECENT_SIZE,
+        initial: Optional[List[int]] = None,
+    ):
+        self.num_channels = num_channels
+        self._lock = threading.Lock()
+
+        self._latest: List[int] = (
+            list(initial) if initial is not None else [0] * num_channels
+        )
+        self._last_timestamp: float = 0.0
+        self._seq: int = 0
+
+        # Optional history: deque of (timestamp, [ch0..]) for get_window()
+        self._history: Optional[Deque[Tuple[float, List[int]]]] = (
+            deque(maxlen=history_size) if history_size > 0 else None
+        )
+
+        # Always-on ring for cursor reads: (seq, timestamp, [ch0..])
+        self._recent: Deque[Tuple[int, float, List[int]]] = deque(
+            maxlen=max(1, recent_size)
+        )
+
+        # Push subscribers; replaced (never mutated) so append() can iterate lock-free
+        self._listeners: Tuple[SampleListener, ...] = ()
+
+    # ---------- writer side ----------
+
+    def append(self, ts: float, vals: List[int]) -> int:
+        """Store one sample, notify listeners; returns its sequence number."""
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            self._latest = vals
+            self._last_timestamp = ts
+            self._recent.append((seq, ts, vals))
+            if self._history is not None:
+                self._history.append((ts, vals))
+            listeners = self._listeners
+
+        for listener in listeners:
+            try:
+                listener(seq, ts, vals)
+            except Exception:
+                logger.exception("SampleBuffer listener %r failed", listener)
+        return seq
+
+    def reset(self, vals: List[int], ts: float) -> None:
+        """Replace the latest value and drop history (keeps seq monotonic)."""
+        with self._lock:
+            self._latest = list(vals)
+            self._last_timestamp = ts
+            if self._history is not None:
+                self._history.clear()
+
+    def add_listener(self, listener: SampleListener) -> None:
+        """Call listener(seq, ts, vals) from the writer thread for every new sample."""
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners = self._listeners + (listener,)
+
+    def remove_listener(self, listener: SampleListener) -> None:
+        with self._lock:
+            self._listeners = tuple(l for l in self._listeners if l is not listener)
+
+    # ---------- reader side ----------
+
+    @property
+    def seq(self) -> int:
+        with self._lock:
+            return self._seq
+
+    def latest(self) -> List[int]:
+        with self._lock:
+            return list(self._latest)
+
+    def last_timestamp(self) -> Optional[float]:
+        with self._lock:
+            ts = self._last_timestamp
+        return ts or None
+
+    def window(self, n: int) -> List[List[int]]:
+        """
+        Return up to the last n samples (most recent last).
+
+        If history is disabled, this falls back to repeating the latest sample.
+        """
+        if n <= 0:
+            return []
+
+        with self._lock:
+            if self._history is None or not self._history:
+                return [list(self._latest) for _ in range(n)]
+
+            items = list(self._history)[-n:]
+        return [list(vals) for (_ts, vals) in items]
+
+    def since(self, cursor: int) -> Tuple[int, List[float], List[List[int]]]:
+        """
+        Return (new_cursor, timestamps, values) for samples with seq > cursor.
+
+        If the consumer fell further behind than the recent ring holds, the
+        oldest samples are gone; what remains is returned and the gap logged.
+        """
+        with self._lock:
+            seq = self._seq
+            if cursor >= seq or not self._recent:
+                return seq, [], []
+
+            first_seq = self._recent[0][0]
+            if cursor + 1 < first_seq:
+                logger.debug(
+                    "SampleBuffer reader overrun: cursor=%d, oldest=%d (dropped %d)",
+                    cursor,
+                    first_seq,
+                    first_seq - cursor - 1,
+                )
+                start = 0
+            else:
+                start = cursor + 1 - first_seq
+
+            items = list(islice(self._recent, start, None))
+
+        timestamps = [ts for (_s, ts, _v) in items]
+        values = [vals for (_s, _ts, vals) in items]
+        return seq, timestamps, values
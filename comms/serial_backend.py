@@ -1,69 +1,54 @@
 # comms/serial_backend.py
 
+import os
+import glob
+import random
 import threading
 import time
 import logging
-from collections import deque
-from typing import List, Tuple, Deque, Optional
+from typing import List, Tuple, Optional
 
 import serial
 import serial.tools.list_ports
 
 from .base_backend import BaseBackend
+from .sample_buffer import SampleBuffer, SampleListener
+from .filters import DEFAULT_SAMPLE_RATE, make_pipeline
+from .latency import STAGE_FILTER, STAGE_PARSE, LatencyTracker
+from .channel_layout import DEFAULT_NUM_CHANNELS
+from .port_detect import (
+    SERIAL_BY_ID_DIR,
+    cached_channel_count,
+    detect_port,
+    device_identity,
+    find_device,
+    load_last_device,
+    save_last_device,
+)
 
 logger = logging.getLogger("cardinal_grip.comms.serial")
 
-# ================================================================
-
-def auto_detect_port() -> Optional[str]:
-    """
-    Try to automatically find a USB serial port that looks like an ESP32 / Feather.
+# Reconnect: exponential backoff from RECONNECT_MIN_S up to reconnect_backoff,
+# with jitter; while waiting, the port (and /dev/serial/by-id) is polled so a
+# replugged device is reopened as soon as it reappears.
+RECONNECT_MIN_S = 0.05
+HOTPLUG_POLL_S = 0.02
 
-    On macOS, these are typically:
-      - /dev/cu.usbmodemXXXX
-      - /dev/cu.usbserial-XXXX
+# Longest partial line kept between reads; anything longer is noise
+MAX_LINE_BYTES = 256
 
-    On Terminal (bash/zsh): "ls /dev/cu.*" to find list of ports
+# ================================================================
 
-    Example 1 --port /dev/cu.usbserial-0001
-    Example 2 --port /dev/cu.usbserial-0002
-    Example 3 --port /dev/cu.usbmodem14101
-    Example 4 --port /dev/cu.usbmodem14201
-    Example 5 --port /dev/cu.usbmodem14301
+def auto_detect_port(probe: bool = True) -> Optional[str]:
+    """
+    Find the glove's serial port (see comms.port_detect): the last good
+    device if it is plugged in, else the best-scored candidate that answers
+    a probe. probe=False never opens a port (cache + scores only), for
+    filling in UI defaults.
 
     Returns the device path as a string, or None if nothing suitable is found.
     """
-    ports = list(serial.tools.list_ports.comports())
-    if not ports:
-        logger.info("No serial ports detected by pyserial.")
-    else:
-        logger.debug("Available serial ports:")
-        for p in ports:
-            logger.debug("  %s  –  %s", p.device, p.description)
-
-    candidates: list[str] = []
-
-    for p in ports:
-        dev = p.device or ""
-        desc = (p.description or "").lower()
-
-        # Heuristics for macOS + ESP32 / Adafruit
-        if dev.startswith("/dev/cu.usbmodem") or dev.startswith("/dev/cu.usbserial"):
-            candidates.append(dev)
-            continue
-
-        if "esp32" in desc or "feather" in desc:
-            candidates.append(dev)
-
-    if not candidates:
-        logger.warning("No candidate ESP32/Feather serial ports found.")
-        return None
-
-    # Prefer usbmodem over usbserial if both exist
-    candidates.sort(key=lambda d: (not d.startswith("/dev/cu.usbmodem"), d))
-    chosen = candidates[0]
-    logger.info("Auto-detected serial port: %s", chosen)
-    return chosen
+    return detect_port(probe=probe)
 
 # ================================================================
 
@@ -74,6 +59,8 @@ class SerialBackend(BaseBackend):
 
     - Opens a serial port.
     - Starts a background thread that reads lines continuously.
+    - num_channels is a property of the device: pass it, or leave it None
+      to use what the port probe saw (comms.port_detect), else 4.
     - Expects each line to include num_channels ADC values, either as:
         "v0,v1,v2,v3"
       or with metadata prefix, e.g.:
@@ -89,35 +76,57 @@ class SerialBackend(BaseBackend):
         port: Optional[str] = None,   # None or "" => auto-detect
         baud: int = 115200,
         timeout: float = 0.01,
-        num_channels: int = 4,
+        num_channels: Optional[int] = None,   # None => from the port probe cache, else 4
         history_size: int = 0,        # >0 => keep last N samples for stats
-        reconnect_backoff: float = 1.0,
+        reconnect_backoff: float = 1.0,   # cap of the exponential reconnect backoff
+        filters=None,                 # None, FilterPipeline or spec e.g. "median:5,lowpass:10"
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        channel_names: Optional[List[str]] = None,
     ):
-        # Timestamp of when _latest was last updated (host time.time())
-        self._last_timestamp: float = 0.0
-
         self.port = port or None
+        # Auto-detected ports may come back under another name; explicit ones are reopened as given
+        self._auto_port = not port
         self.baud = baud
+        self.sample_rate = sample_rate
         self.timeout = timeout
+        if num_channels is None:
+            num_channels = cached_channel_count(port or None) or DEFAULT_NUM_CHANNELS
         self.num_channels = num_channels
+        # Display names when the device has its own (None: the app's finger names)
+        self.channel_names = list(channel_names) if channel_names else None
         self.reconnect_backoff = max(0.1, reconnect_backoff)
 
         self.ser: Optional[serial.Serial] = None
         self._thread: Optional[threading.Thread] = None
         self._running = False
 
-        # latest will be a list of ints: [ch0, ch1, ...]
-        self._latest: List[int] = [0] * self.num_channels
-        self._lock = threading.Lock()
+        # Latest value, optional history and cursor-readable recent samples
+        self._samples = SampleBuffer(self.num_channels, history_size=history_size)
 
-        # Optional history: deque of (timestamp, [ch0..])
-        self._history: Optional[Deque[Tuple[float, List[int]]]] = (
-            deque(maxlen=history_size) if history_size > 0 else None
-        )
+        # Optional conditioning in the reader thread. get_* return the filtered
+        # stream; get_raw_* the unfiltered one (same seq numbers).
+        self._filters = make_pipeline(filters, self.num_channels, fs=sample_rate)
+        self._raw = SampleBuffer(self.num_channels) if self._filters else self._samples
+        self._filter_delay_ms = self._filters.group_delay_ms(sample_rate) if self._filters else 0.0
 
         # Separate lock for writes (send_command)
         self._write_lock = threading.Lock()
 
+        # Reader-thread counters (get_stats)
+        self._bad_lines = 0
+        self._read_errors = 0
+        self._reconnects = 0
+        self._last_gap_ms: Optional[float] = None
+        self._latency = LatencyTracker.instance()
+
+        # Reconnect state (reader thread only)
+        self._identity: Optional[dict] = load_last_device() if self._auto_port else None
+        self._backoff = RECONNECT_MIN_S
+        self._rx = bytearray()
+        self._skip_partial = False
+        self._fresh_open = False
+        self._disconnected_at: Optional[float] = None
+
         logger.debug(
             "SerialBackend initialized (port=%r, baud=%d, timeout=%.3f, num_channels=%d, history_size=%d)",
             self.port,
@@ -135,6 +144,11 @@ class SerialBackend(BaseBackend):
 
         If self.port is None or empty, auto-detect a suitable port.
         """
+        if not self.port and self._identity is not None:
+            # Last good device first: no scan if it's still plugged in
+            self.port = find_device(self._identity)
+            if self.port:
+                logger.info("Using last known device %s", self.port)
         if not self.port:
             detected = auto_detect_port()
             if detected is None:
@@ -149,6 +163,10 @@ class SerialBackend(BaseBackend):
 
         logger.info("Opening serial port %s @ %d", self.port, self.baud)
         self.ser = serial.Serial(self.port, self.baud, timeout=self.timeout)
+        # The first bytes may start mid-line: drop everything up to the first newline
+        self._rx.clear()
+        self._skip_partial = True
+        self._fresh_open = True
 
     def start(self) -> None:
         """
@@ -219,77 +237,199 @@ class SerialBackend(BaseBackend):
 
     def _read_loop(self) -> None:
         """
-        Continuously read lines from serial and store the most recent vector.
+        Continuously read from serial and store every complete sample line.
 
-        Runs in a background thread and will attempt to reconnect if the
-        device disappears.
+        Runs in a background thread. Bytes are read in chunks (whatever is
+        pending, at least one byte) and split into lines here, which is much
+        cheaper than pyserial's byte-at-a-time readline(). On errors the
+        port is closed and reopened with exponential backoff; the sample
+        buffer (and every reader's cursor) carries on across the gap.
         """
         logger.debug("SerialBackend read loop entering for port %s", self.port)
         while self._running:
             # Ensure port is open
             if self.ser is None or not self.ser.is_open:
                 try:
-                    self.open()
+                    self._reopen()
                 except Exception:
+                    delay = self._next_backoff()
                     logger.warning(
-                        "Failed to open serial port %s, retrying in %.1fs",
+                        "Failed to open serial port %s, retrying in %.2fs",
                         self.port or "(auto)",
-                        self.reconnect_backoff,
+                        delay,
                     )
-                    time.sleep(self.reconnect_backoff)
+                    self._wait_for_device(delay)
                     continue
 
             try:
-                raw = self.ser.readline()
+                chunk = self.ser.read(self.ser.in_waiting or 1)
+                t_recv = time.time()
             except Exception as e:
                 logger.warning(
-                    "Serial read error on %s: %s; closing and retrying.",
+                    "Serial read error on %s: %s; closing and reconnecting.",
                     self.port,
                     e,
                 )
+                self._read_errors += 1
+                if self._disconnected_at is None:
+                    self._disconnected_at = time.time()
                 self.close()
-                time.sleep(self.reconnect_backoff)
+                self._wait_for_device(self._next_backoff())
                 continue
 
-            line = raw.decode(errors="ignore").strip()
-            if not line:
-                time.sleep(0.001)
-                continue
+            if chunk:
+                self._feed(chunk, t_recv)
 
-            parts = [p.strip() for p in line.split(",") if p.strip()]
-            if len(parts) < self.num_channels:
-                # malformed / short line; ignore quietly at runtime but keep at debug if needed
-                logger.debug(
-                    "Ignoring short/malformed line on %s: %r",
-                    self.port,
-                    line,
-                )
+        logger.debug("SerialBackend read loop exiting for port %s", self.port)
+        # Safe even if stop() already closed it; close() is idempotent now
+        self.close()
+
+    def _feed(self, chunk: bytes, t_recv: float) -> None:
+        """Append received bytes and store every complete line as one batch."""
+        buf = self._rx
+        buf += chunk
+        batch: List[List[int]] = []
+        while True:
+            nl = buf.find(b"\n")
+            if nl < 0:
+                break
+            raw = bytes(buf[:nl])
+            del buf[: nl + 1]
+            if self._skip_partial:
+                # First line after (re)open: most likely the tail of a line
+                self._skip_partial = False
                 continue
+            line = raw.decode(errors="ignore").strip()
+            if line:
+                vals = self._handle_line(line, t_recv)
+                if vals is not None:
+                    batch.append(vals)
+        if len(buf) > MAX_LINE_BYTES:
+            self._bad_lines += 1
+            buf.clear()
+        if batch:
+            self._store(batch, t_recv)
+
+    def _handle_line(self, line: str, t_recv: float) -> Optional[List[int]]:
+        """Parse one line into clamped channel values (None if unusable)."""
+        parts = [p.strip() for p in line.split(",") if p.strip()]
+        if len(parts) < self.num_channels:
+            # malformed / short line; ignore quietly at runtime but keep at debug if needed
+            self._bad_lines += 1
+            logger.debug(
+                "Ignoring short/malformed line on %s: %r",
+                self.port,
+                line,
+            )
+            return None
 
-            chan_fields = parts[-self.num_channels :]
+        chan_fields = parts[-self.num_channels :]
+        try:
+            vals = [int(float(p)) for p in chan_fields]
+        except ValueError:
+            self._bad_lines += 1
+            logger.debug(
+                "Ignoring non-numeric serial line on %s: %r",
+                self.port,
+                line,
+            )
+            return None
+
+        if self._fresh_open:
+            self._on_connected()
+
+        # Firmware built with STREAM_TIMING prefixes "seq,t_ms,"
+        if len(parts) == self.num_channels + 2:
             try:
-                vals = [int(float(p)) for p in chan_fields]
+                self._latency.record_device(self.port, int(parts[0]), int(parts[1]), t_recv)
             except ValueError:
-                logger.debug(
-                    "Ignoring non-numeric serial line on %s: %r",
-                    self.port,
-                    line,
-                )
-                continue
-
-            # Clamp to 0..4095 range
-            vals = [max(0, min(4095, v)) for v in vals]
-            ts = time.time()
+                pass
 
-            with self._lock:
-                self._latest = vals
-                self._last_timestamp = ts
-                if self._history is not None:
-                    self._history.append((ts, list(vals)))
+        # Clamp to 0..4095 range
+        return [max(0, min(4095, v)) for v in vals]
 
-        logger.debug("SerialBackend read loop exiting for port %s", self.port)
-        # Safe even if stop() already closed it; close() is idempotent now
-        self.close()
+    def _store(self, batch: List[List[int]], t_recv: float) -> None:
+        """
+        Store the samples of one read chunk. Filters run once over the whole
+        chunk as an (N, C) array; per-sample calls cost ~7x more.
+        """
+        ts = time.time()
+        if self._filters:
+            for vals in batch:
+                self._raw.append(ts, vals)
+            batch = self._filters.process_ints(batch)
+            self._latency.record(STAGE_FILTER, self._filter_delay_ms)
+        for vals in batch:
+            self._samples.append(ts, vals)
+        self._latency.record(STAGE_PARSE, (time.time() - t_recv) * 1000.0)
+
+    # ---------- reconnect ----------
+
+    def _reopen(self) -> None:
+        """Open the port, re-resolving auto-detected devices after a disconnect."""
+        if self._auto_port and self._disconnected_at is not None:
+            port = find_device(self._identity) if self._identity else None
+            if port is None and not (self.port and os.path.exists(self.port)):
+                # Scores only: probing other ports here would delay the reconnect
+                port = auto_detect_port(probe=False)
+            if port:
+                self.port = port
+        self.open()
+
+    def _on_connected(self) -> None:
+        """First valid line on a new connection: reset backoff, remember the device."""
+        self._fresh_open = False
+        self._backoff = RECONNECT_MIN_S
+        if self._disconnected_at is not None:
+            self._last_gap_ms = (time.time() - self._disconnected_at) * 1000.0
+            self._disconnected_at = None
+            self._reconnects += 1
+            logger.info(
+                "Reconnected to %s after %.0f ms",
+                self.port,
+                self._last_gap_ms,
+                extra={"gap_ms": round(self._last_gap_ms, 1), "reconnects": self._reconnects},
+            )
+        try:
+            identity = device_identity(self.port)
+        except Exception:
+            logger.exception("Failed to read USB identity of %s", self.port)
+            return
+        if identity is not None and identity != self._identity:
+            self._identity = identity
+            save_last_device(identity)
+
+    def _next_backoff(self) -> float:
+        """Current backoff with jitter (50-100%); doubles up to reconnect_backoff."""
+        delay = self._backoff
+        self._backoff = min(self.reconnect_backoff, self._backoff * 2.0)
+        return delay * random.uniform(0.5, 1.0)
+
+    def _device_present(self) -> bool:
+        paths = [self.port]
+        if self._identity:
+            paths.append(self._identity.get("by_id"))
+        if any(p and os.path.exists(p) for p in paths):
+            return True
+        serial_number = self._identity.get("serial_number") if self._identity else None
+        if serial_number:
+            return any(serial_number in os.path.basename(p) for p in glob.glob(os.path.join(SERIAL_BY_ID_DIR, "*")))
+        return False
+
+    def _wait_for_device(self, delay: float) -> None:
+        """
+        Sleep up to `delay`, polling for the device (re)appearing; returns
+        early on a hotplug so a bumped cable reconnects within a poll tick.
+        """
+        deadline = time.monotonic() + delay
+        present = self._device_present()
+        while self._running and time.monotonic() < deadline:
+            time.sleep(HOTPLUG_POLL_S)
+            now_present = self._device_present()
+            if now_present and not present:
+                logger.debug("Serial device reappeared (%s)", self.port)
+                return
+            present = now_present
 
     # ---------- public API ----------
 
@@ -299,18 +439,14 @@ class SerialBackend(BaseBackend):
 
         Non-blocking and safe to call from GUI thread.
         """
-        with self._lock:
-            latest = list(self._latest)
-        return latest
+        return self._samples.latest()
 
     def get_last_timestamp(self) -> Optional[float]:
         """
         Return host timestamp (time.time()) of the last sample update,
         or None if we have never seen a sample yet.
         """
-        with self._lock:
-            ts = self._last_timestamp
-        return ts or None
+        return self._samples.last_timestamp()
 
     def get_window(self, n: int) -> List[List[int]]:
         """
@@ -318,15 +454,44 @@ class SerialBackend(BaseBackend):
 
         If history is disabled, this falls back to repeating the latest sample.
         """
-        if n <= 0:
-            return []
-
-        with self._lock:
-            if self._history is None or not self._history:
-                return [list(self._latest) for _ in range(n)]
+        return self._samples.window(n)
 
-            items = list(self._history)[-n:]
-        return [vals for (_ts, vals) in items]
+    def get_samples_since(
+        self, cursor: int
+    ) -> Tuple[int, List[float], List[List[int]]]:
+        """
+        Return (new_cursor, timestamps, values) for every sample received
+        after `cursor` (start with 0). Non-blocking.
+        """
+        return self._samples.since(cursor)
+
+    def get_stats(self) -> dict:
+        """Counters for structured logs (see comms.base_backend.backend_stats)."""
+        return {
+            "samples": self._samples.seq,
+            "bad_lines": self._bad_lines,
+            "read_errors": self._read_errors,
+            "reconnects": self._reconnects,
+            "last_gap_ms": round(self._last_gap_ms, 1) if self._last_gap_ms is not None else None,
+            "filtered": bool(self._filters),
+        }
+
+    def get_raw_latest(self) -> List[int]:
+        """Most recent unfiltered sample (same as get_latest() without filters)."""
+        return self._raw.latest()
+
+    def get_raw_samples_since(
+        self, cursor: int
+    ) -> Tuple[int, List[float], List[List[int]]]:
+        """Unfiltered counterpart of get_samples_since(); cursors are shared."""
+        return self._raw.since(cursor)
+
+    def add_sample_listener(self, listener: SampleListener) -> None:
+        """Call listener(seq, ts, vals) from the reader thread for every new sample."""
+        self._samples.add_listener(listener)
+
+    def remove_sample_listener(self, listener: SampleListener) -> None:
+        self._samples.remove_listener(listener)
 
     def send_command(self, cmd: str) -> None:
         """
@@ -0,0 +1,455 @@
+# comms/shm_bus.py
+
+"""
+Shared-memory live sample bus.
+
+One writer process runs the real backend (SerialBackend / SimBackend) and
+publishes every sample into a multiprocessing.shared_memory ring. Any
+number of reader processes (clinician dashboard, patient game, headless
+recorder) map the same block and read it through ShmBackend, each with its
+own GIL and event loop, without a socket hop per sample.
+
+Block layout (all little-endian, 8-byte aligned):
+
+    header   uint64[8]   magic, version, num_channels, capacity,
+                         write_seq (seqlock), total_written, 0, 0
+    ts       float64[capacity]                host timestamps (time.time())
+    values   int32[capacity, num_channels]    ADC counts
+
+Seqlock: the writer bumps write_seq to odd, writes one slot, bumps
+total_written, then bumps write_seq back to even. Readers copy the slots
+they need and retry if write_seq was odd or changed meanwhile, so they
+never take a lock the writer could wait on.
+
+Sample numbering matches SampleBuffer: the k-th published sample has
+seq k (1-based), total_written is the latest seq, and since(cursor)
+returns everything with seq > cursor.
+
+Writer process:
+    python -m comms.shm_bus --sim                   # simulated glove
+    python -m comms.shm_bus --port /dev/cu.usbmodem14101
+Readers:
+    backend = ShmBackend()       # or port "shm" / "shm:<name>" in the GUIs
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import signal
+import logging
+import threading
+import argparse
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# comms/shm_bus.py → parent = comms/, grandparent = project root
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from comms.base_backend import BaseBackend
+from comms.sample_buffer import SampleListener
+
+logger = logging.getLogger("cardinal_grip.comms.shm")
+
+LOG_FILE = os.path.join(PROJECT_ROOT, "logger", "cardinal_grip.log")
+
+DEFAULT_BUS_NAME = "cardinal_grip_bus"
+DEFAULT_CAPACITY = 8192          # ~80 s at 100 Hz
+LISTENER_POLL_S = 0.005          # ShmBackend listener thread poll interval
+
+SHM_MAGIC = 0x43475242_55530001  # "CGRBUS" + 1
+SHM_VERSION = 1
+
+_H_MAGIC, _H_VERSION, _H_CHANNELS, _H_CAPACITY, _H_SEQ, _H_TOTAL = range(6)
+_HEADER_WORDS = 8
+_HEADER_BYTES = _HEADER_WORDS * 8
+
+# Reader retries before giving up on a consistent snapshot for this call
+MAX_READ_RETRIES = 100
+
+
+def _block_size(num_channels: int, capacity: int) -> int:
+    return _HEADER_BYTES + capacity * 8 + capacity * num_channels * 4
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing block without letting this process's resource
+    tracker unlink it at exit (it belongs to the writer).
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        logger.debug("Could not unregister %s from resource_tracker", name)
+    return shm
+
+
+class ShmSampleRing:
+    """
+    Fixed-size sample ring in shared memory.
+
+    create=True allocates the block (writer side); otherwise an existing
+    block is attached and its geometry is read from the header.
+    """
+
+    def __init__(
+        self,
+        name: str = DEFAULT_BUS_NAME,
+        num_channels: int = 4,
+        capacity: int = DEFAULT_CAPACITY,
+        create: bool = False,
+    ):
+        self.name = name
+        self.owner = create
+
+        if create:
+            size = _block_size(num_channels, capacity)
+            try:
+                self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            except FileExistsError:
+                # Stale block from a writer that died without unlinking
+                logger.warning("Shared memory %s already exists; replacing it", name)
+                stale = _attach(name)
+                stale.close()
+                stale.unlink()
+                self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            self._shm = _attach(name)
+
+        buf = self._shm.buf
+        self._header = np.ndarray((_HEADER_WORDS,), dtype="<u8", buffer=buf, offset=0)
+
+        if create:
+            self._header[:] = 0
+            self._header[_H_CHANNELS] = num_channels
+            self._header[_H_CAPACITY] = capacity
+            self._header[_H_VERSION] = SHM_VERSION
+            self._header[_H_MAGIC] = SHM_MAGIC
+        elif int(self._header[_H_MAGIC]) != SHM_MAGIC:
+            self._shm.close()
+            raise ValueError(f"Shared memory {name!r} is not a Cardinal Grip sample bus")
+        elif int(self._header[_H_VERSION]) != SHM_VERSION:
+            self._shm.close()
+            raise ValueError(
+                f"Shared memory {name!r} has version {int(self._header[_H_VERSION])}, "
+                f"expected {SHM_VERSION}"
+            )
+
+        self.num_channels = int(self._header[_H_CHANNELS])
+        self.capacity = int(self._header[_H_CAPACITY])
+
+        ts_off = _HEADER_BYTES
+        vals_off = ts_off + self.capacity * 8
+        self._ts = np.ndarray((self.capacity,), dtype="<f8", buffer=buf, offset=ts_off)
+        self._vals = np.ndarray(
+            (self.capacity, self.num_channels), dtype="<i4", buffer=buf, offset=vals_off
+        )
+
+        logger.debug(
+            "ShmSampleRing %s %s (channels=%d, capacity=%d)",
+            "created" if create else "attached",
+            name,
+            self.num_channels,
+            self.capacity,
+        )
+
+    # ---------- writer side (single writer) ----------
+
+    def write(self, ts: float, vals) -> int:
+        """Publish one sample; returns its seq."""
+        h = self._header
+        total = int(h[_H_TOTAL])
+        slot = total % self.capacity
+
+        h[_H_SEQ] += 1                      # odd: write in progress
+        self._ts[slot] = ts
+        self._vals[slot, :] = vals[: self.num_channels]
+        h[_H_TOTAL] = total + 1
+        h[_H_SEQ] += 1                      # even: consistent again
+        return total + 1
+
+    # ---------- reader side ----------
+
+    @property
+    def total(self) -> int:
+        return int(self._header[_H_TOTAL])
+
+    def read_since(self, cursor: int) -> Tuple[int, np.ndarray, np.ndarray]:
+        """
+        (new_cursor, ts (N,), values (N, C)) for samples with seq > cursor.
+
+        A reader that fell more than `capacity` samples behind gets the
+        most recent `capacity` samples.
+        """
+        h = self._header
+        for _ in range(MAX_READ_RETRIES):
+            s1 = int(h[_H_SEQ])
+            if s1 & 1:
+                time.sleep(0)
+                continue
+            total = int(h[_H_TOTAL])
+            if cursor >= total:
+                return total, self._ts[:0].copy(), self._vals[:0].copy()
+
+            start = max(cursor, total - self.capacity)
+            idx = np.arange(start, total) % self.capacity
+            ts = self._ts[idx]               # fancy indexing copies
+            vals = self._vals[idx]
+            if int(h[_H_SEQ]) == s1:
+                if start > cursor and cursor > 0:
+                    logger.debug(
+                        "ShmSampleRing reader overrun: cursor=%d, oldest=%d", cursor, start + 1
+                    )
+                return total, ts, vals
+
+        logger.debug("ShmSampleRing read_since(%d) gave up after %d retries", cursor, MAX_READ_RETRIES)
+        return cursor, self._ts[:0].copy(), self._vals[:0].copy()
+
+    def latest(self) -> Tuple[Optional[float], Optional[np.ndarray]]:
+        total = self.total
+        _cur, ts, vals = self.read_since(max(0, total - 1))
+        if ts.size == 0:
+            return None, None
+        return float(ts[-1]), vals[-1]
+
+    # ---------- teardown ----------
+
+    def close(self) -> None:
+        # Drop numpy views before closing the mapping
+        self._header = self._ts = self._vals = None
+        try:
+            self._shm.close()
+        except BufferError:
+            logger.debug("ShmSampleRing %s still has exported views", self.name)
+
+    def unlink(self) -> None:
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ShmPublisher:
+    """Feeds every sample of a backend into a ShmSampleRing (backend thread)."""
+
+    def __init__(self, ring: ShmSampleRing):
+        self.ring = ring
+        self._backend = None
+
+    def _on_sample(self, seq: int, ts: float, vals: List[int]) -> None:
+        self.ring.write(ts, vals)
+
+    def attach(self, backend) -> None:
+        self._backend = backend
+        backend.add_sample_listener(self._on_sample)
+
+    def detach(self) -> None:
+        if self._backend is not None:
+            self._backend.remove_sample_listener(self._on_sample)
+            self._backend = None
+
+
+class ShmBackend(BaseBackend):
+    """
+    Read-only backend over a ShmSampleRing published by another process.
+
+    There is no control channel back to the writer: send_command() and
+    handle_char() are no-ops. The bus carries whatever the writer published,
+    so get_raw_* read the same stream. Sample listeners are fed by a polling
+    thread that only runs while someone is listening.
+    """
+
+    def __init__(
+        self,
+        name: str = DEFAULT_BUS_NAME,
+        num_channels: int = 4,
+        poll_interval: float = LISTENER_POLL_S,
+        **kwargs,
+    ):
+        self.name = name
+        self.port = f"shm:{name}"
+        self.num_channels = num_channels
+        self.poll_interval = poll_interval
+        self._ring: Optional[ShmSampleRing] = None
+
+        # Replaced (never mutated) so the poll thread can iterate lock-free
+        self._listeners: Tuple[SampleListener, ...] = ()
+        self._listener_lock = threading.Lock()
+        self._poll_thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Attach to the ring; raises FileNotFoundError if no writer is running."""
+        if self._ring is not None:
+            return
+        self._ring = ShmSampleRing(self.name, create=False)
+        self.num_channels = self._ring.num_channels
+        logger.info("ShmBackend attached to %s (%d channels)", self.name, self.num_channels)
+        self._ensure_poll_thread()
+
+    def stop(self) -> None:
+        with self._listener_lock:
+            self._listeners = ()
+            thread, self._poll_thread = self._poll_thread, None
+        if thread is not None:
+            thread.join(timeout=1.0)
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+            logger.info("ShmBackend detached from %s", self.name)
+
+    # ---------- listeners ----------
+
+    def add_sample_listener(self, listener: SampleListener) -> None:
+        """Call listener(seq, ts, vals) from the poll thread for every new sample."""
+        with self._listener_lock:
+            if listener not in self._listeners:
+                self._listeners = self._listeners + (listener,)
+        self._ensure_poll_thread()
+
+    def remove_sample_listener(self, listener: SampleListener) -> None:
+        with self._listener_lock:
+            self._listeners = tuple(l for l in self._listeners if l is not listener)
+
+    def _ensure_poll_thread(self) -> None:
+        with self._listener_lock:
+            if self._ring is None or not self._listeners or self._poll_thread is not None:
+                return
+            self._poll_thread = threading.Thread(
+                target=self._poll_loop, name=f"shm-listen-{self.name}", daemon=True
+            )
+            self._poll_thread.start()
+
+    def _poll_loop(self) -> None:
+        ring = self._ring
+        cursor = ring.total if ring is not None else 0
+        while True:
+            with self._listener_lock:
+                listeners = self._listeners
+                if not listeners or self._ring is None:
+                    self._poll_thread = None
+                    return
+            cursor, ts, vals = ring.read_since(cursor)
+            first = cursor - len(ts) + 1
+            for i, (t, v) in enumerate(zip(ts.tolist(), vals.tolist())):
+                for listener in listeners:
+                    try:
+                        listener(first + i, t, v)
+                    except Exception:
+                        logger.exception("ShmBackend listener %r failed", listener)
+            time.sleep(self.poll_interval)
+
+    def get_latest(self) -> List[int]:
+        if self._ring is None:
+            return [0] * self.num_channels
+        _ts, vals = self._ring.latest()
+        return vals.tolist() if vals is not None else [0] * self.num_channels
+
+    def get_last_timestamp(self) -> Optional[float]:
+        if self._ring is None:
+            return None
+        ts, _vals = self._ring.latest()
+        return ts
+
+    def get_window(self, n: int) -> List[List[int]]:
+        if n <= 0 or self._ring is None:
+            return []
+        _cur, _ts, vals = self._ring.read_since(max(0, self._ring.total - n))
+        return vals.tolist()
+
+    def get_samples_since(self, cursor: int) -> Tuple[int, List[float], List[List[int]]]:
+        if self._ring is None:
+            return cursor, [], []
+        new_cursor, ts, vals = self._ring.read_since(cursor)
+        return new_cursor, ts.tolist(), vals.tolist()
+
+    def get_raw_latest(self) -> List[int]:
+        return self.get_latest()
+
+    def get_raw_samples_since(self, cursor: int) -> Tuple[int, List[float], List[List[int]]]:
+        return self.get_samples_since(cursor)
+
+    def get_stats(self) -> dict:
+        return {"samples": self._ring.total if self._ring is not None else 0}
+
+    def send_command(self, cmd: str) -> None:
+        logger.debug("ShmBackend.send_command(%r) ignored (read-only bus).", cmd)
+
+    def handle_char(self, ch: str, is_press: bool) -> None:
+        return
+
+
+# ================================================================
+# Writer process
+# ================================================================
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Publish a Cardinal Grip backend into a shared-memory sample bus.",
+    )
+    parser.add_argument("--name", default=DEFAULT_BUS_NAME, help="Shared memory block name")
+    parser.add_argument("--capacity", type=int, default=DEFAULT_CAPACITY, help="Ring size in samples")
+    parser.add_argument("--sim", action="store_true", help="Use SimBackend instead of serial")
+    parser.add_argument("--port", default=None, help="Serial port (default: auto-detect)")
+    parser.add_argument("--baud", type=int, default=115200)
+    parser.add_argument("--channels", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    from logger.app_logging import configure_logging
+    configure_logging(LOG_FILE, level=logging.INFO)
+
+    if args.sim:
+        from comms.sim_backend import SimBackend
+        backend = SimBackend(num_channels=args.channels, update_interval=0.01)
+    else:
+        from comms.serial_backend import SerialBackend
+        backend = SerialBackend(
+            port=args.port, baud=args.baud, timeout=0.01, num_channels=args.channels
+        )
+
+    ring = ShmSampleRing(
+        args.name, num_channels=backend.num_channels, capacity=args.capacity, create=True
+    )
+    publisher = ShmPublisher(ring)
+
+    stopping = False
+
+    def request_stop(signum, _frame):
+        nonlocal stopping
+        logger.info("Signal %d received; stopping sample bus %s", signum, args.name)
+        stopping = True
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    try:
+        publisher.attach(backend)
+        backend.start()
+        logger.info("Publishing %s to shared memory %s", type(backend).__name__, args.name)
+        while not stopping:
+            time.sleep(0.2)
+    except Exception:
+        logger.exception("Sample bus writer failed")
+        return 1
+    finally:
+        publisher.detach()
+        backend.stop()
+        published = ring.total
+        ring.close()
+        ring.unlink()
+        logger.info("Sample bus %s closed after %d samples", args.name, published)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
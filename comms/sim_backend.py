@@ -13,14 +13,17 @@ import random
 import threading
 import time
 import logging
-from collections import deque
-from typing import List, Deque, Tuple, Optional, Set
+from typing import List, Tuple, Optional, Set
 
 from .base_backend import BaseBackend
+from .sample_buffer import SampleBuffer, SampleListener
+from .filters import make_pipeline
+from .latency import STAGE_FILTER, LatencyTracker
+from .channel_layout import DEFAULT_NUM_CHANNELS
 
 logger = logging.getLogger("cardinal_grip.comms.sim")
 
-NUM_CHANNELS = 4
+NUM_CHANNELS = DEFAULT_NUM_CHANNELS
 
 # Baseline / range
 MIN_LEVEL = 0
@@ -37,6 +40,17 @@ DOWN_RATE_FAST = 2200.0    # when 'x' is held, drop faster
 
 DEFAULT_JITTER_AMOUNT = 40
 
+# Per-channel keys: (slow, fast, medium) -- medium is `medium` + `fast` held.
+# Channels past this table only follow the global 'z' / 'x' keys.
+CHANNEL_KEYS = (
+    ("q", "u", "w"),   # index
+    ("w", "i", "q"),   # middle
+    ("e", "o", "e"),   # ring
+    ("r", "p", "r"),   # pinky
+    ("t", "[", "t"),   # thumb
+    ("y", "]", "y"),   # palm
+)
+
 
 class SimBackend(BaseBackend):
     """
@@ -54,20 +68,16 @@ class SimBackend(BaseBackend):
         timeout: float = 0.01,
         update_interval: Optional[float] = None,
         history_size: int = 0,
-        num_channels: int = NUM_CHANNELS,
+        num_channels: Optional[int] = NUM_CHANNELS,
+        filters=None,
         **kwargs,
     ):
         """
-        Accepts num_channels for API compatibility with SerialBackend.
-        We currently simulate 4 channels regardless, but keep the signature
-        so callers can pass num_channels=4 without errors.
+        Simulates `num_channels` channels; see CHANNEL_KEYS for the keys
+        that drive each one.
         """
-        if num_channels != NUM_CHANNELS:
-            logger.warning(
-                "[SimBackend] num_channels=%d requested, simulator uses %d fixed channels.",
-                num_channels,
-                NUM_CHANNELS,
-            )
+        self.num_channels = max(1, int(num_channels or NUM_CHANNELS))
+        n = self.num_channels
 
         # Kept for API symmetry; unused by simulator
         self.port = port
@@ -84,13 +94,27 @@ class SimBackend(BaseBackend):
         self._lock = threading.Lock()
 
         # Channel levels (floats, then jittered & clamped to ints)
-        self._levels: List[float] = [LOW_LEVEL] * NUM_CHANNELS
-        self._latest: List[int] = [int(LOW_LEVEL)] * NUM_CHANNELS
+        self._levels: List[float] = [LOW_LEVEL] * n
+
+        # Latest value, optional history and cursor-readable recent samples
+        self._samples = SampleBuffer(
+            n,
+            history_size=history_size,
+            initial=[int(LOW_LEVEL)] * n,
+        )
 
-        # Optional history for stats/debugging
-        self._history: Optional[Deque[Tuple[float, List[int]]]] = (
-            deque(maxlen=history_size) if history_size > 0 else None
+        # Optional conditioning in the simulation thread (see comms.filters);
+        # get_raw_* expose the jittered, unfiltered stream.
+        fs = 1.0 / max(self.update_interval, 1e-3)
+        self._filters = make_pipeline(filters, n, fs=fs)
+        self._filter_delay_ms = self._filters.group_delay_ms(fs) if self._filters else 0.0
+        self._latency = LatencyTracker.instance()
+        self._raw = (
+            SampleBuffer(n, initial=[int(LOW_LEVEL)] * n)
+            if self._filters
+            else self._samples
         )
+        self._reset_filters = False
 
         # Pressed key set
         self._pressed_keys: Set[str] = set()
@@ -102,13 +126,11 @@ class SimBackend(BaseBackend):
         now = time.time()
         self._last_update_time = now
 
-        # For latency API: host timestamp of last sample update
-        self._last_timestamp: float = 0.0
-
         logger.debug(
-            "SimBackend initialized (update_interval=%.3f, history_size=%d)",
+            "SimBackend initialized (update_interval=%.3f, history_size=%d, num_channels=%d)",
             self.update_interval,
             history_size,
+            n,
         )
 
     # ------------------------------------------------------------------
@@ -138,12 +160,10 @@ class SimBackend(BaseBackend):
 
     def get_latest(self) -> List[int]:
         """
-        Return the latest 4-channel values as a list of ints.
+        Return the latest num_channels values as a list of ints.
         patient_game_app.game_tick() / patient_app.poll_sensor() call this frequently.
         """
-        with self._lock:
-            latest = list(self._latest)
-        return latest
+        return self._samples.latest()
 
     def get_window(self, n: int) -> List[List[int]]:
         """
@@ -151,23 +171,46 @@ class SimBackend(BaseBackend):
 
         If history is disabled, this falls back to repeating the latest sample.
         """
-        if n <= 0:
-            return []
+        return self._samples.window(n)
 
-        with self._lock:
-            if self._history is None or not self._history:
-                return [list(self._latest) for _ in range(n)]
+    def get_samples_since(
+        self, cursor: int
+    ) -> Tuple[int, List[float], List[List[int]]]:
+        """
+        Return (new_cursor, timestamps, values) for every simulated sample
+        produced after `cursor` (start with 0).
+        """
+        return self._samples.since(cursor)
+
+    def get_stats(self) -> dict:
+        """Counters for structured logs (see comms.base_backend.backend_stats)."""
+        return {
+            "samples": self._samples.seq,
+            "filtered": bool(self._filters),
+        }
+
+    def get_raw_latest(self) -> List[int]:
+        """Most recent unfiltered (jittered) sample."""
+        return self._raw.latest()
 
-            items = list(self._history)[-n:]
-        return [vals for (_ts, vals) in items]
+    def get_raw_samples_since(
+        self, cursor: int
+    ) -> Tuple[int, List[float], List[List[int]]]:
+        """Unfiltered counterpart of get_samples_since(); cursors are shared."""
+        return self._raw.since(cursor)
+
+    def add_sample_listener(self, listener: SampleListener) -> None:
+        """Call listener(seq, ts, vals) from the reader thread for every new sample."""
+        self._samples.add_listener(listener)
+
+    def remove_sample_listener(self, listener: SampleListener) -> None:
+        self._samples.remove_listener(listener)
 
     def get_last_timestamp(self) -> Optional[float]:
         """
-        Return host-side timestamp (time.time()) when _latest was last updated.
+        Return host-side timestamp (time.time()) when the latest sample was produced.
         """
-        with self._lock:
-            ts = self._last_timestamp
-        return ts or None
+        return self._samples.last_timestamp()
 
     def get_age_ms(self) -> Optional[float]:
         """
@@ -208,11 +251,12 @@ class SimBackend(BaseBackend):
                 except ValueError:
                     logger.warning("SimBackend noise command ignored (bad value): %r", cmd)
             elif head == "reset":
-                self._levels = [LOW_LEVEL] * NUM_CHANNELS
-                self._latest = [int(LOW_LEVEL)] * NUM_CHANNELS
-                self._last_timestamp = time.time()
-                if self._history is not None:
-                    self._history.clear()
+                self._levels = [LOW_LEVEL] * self.num_channels
+                now = time.time()
+                self._samples.reset([int(LOW_LEVEL)] * self.num_channels, now)
+                if self._filters:
+                    self._raw.reset([int(LOW_LEVEL)] * self.num_channels, now)
+                    self._reset_filters = True
                 logger.info("SimBackend levels reset to LOW_LEVEL.")
             else:
                 logger.debug("SimBackend send_command(%r) ignored (unknown).", cmd)
@@ -238,13 +282,15 @@ class SimBackend(BaseBackend):
                 self._pressed_keys.add(c)
             else:
                 self._pressed_keys.discard(c)
+            pressed = sorted(self._pressed_keys)
 
-        # Avoid spamming logs for every key event; only debug if needed:
+        # Rate-limited by configure_logging; log a snapshot, since the record
+        # is formatted later on the logging thread
         logger.debug(
             "SimBackend key %r %s; pressed_keys=%r",
             c,
             "down" if is_press else "up",
-            self._pressed_keys,
+            pressed,
         )
 
     # ------------------------------------------------------------------
@@ -267,7 +313,7 @@ class SimBackend(BaseBackend):
                 jitter_amount = self._jitter_amount
 
             # Compute new level for each channel
-            for ch_idx in range(NUM_CHANNELS):
+            for ch_idx in range(self.num_channels):
                 up_rate = self._compute_up_rate_for_channel(ch_idx, keys)
 
                 # Global 'z' raises everything at least at slow rate
@@ -299,10 +345,15 @@ class SimBackend(BaseBackend):
 
             with self._lock:
                 self._levels = levels
-                self._latest = jittered
-                self._last_timestamp = ts
-                if self._history is not None:
-                    self._history.append((ts, list(jittered)))
+                reset_filters, self._reset_filters = self._reset_filters, False
+
+            if self._filters:
+                if reset_filters:
+                    self._filters.reset()
+                self._raw.append(ts, jittered)
+                jittered = self._filters.process_sample(jittered)
+                self._latency.record(STAGE_FILTER, self._filter_delay_ms)
+            self._samples.append(ts, jittered)
 
             time.sleep(self.update_interval)
 
@@ -320,47 +371,18 @@ class SimBackend(BaseBackend):
         Channel 2 (1): w slow, i fast, q+i medium
         Channel 3 (2): e slow, o fast, e+o medium
         Channel 4 (3): r slow, p fast, r+p medium
+        Channel 5 (4): t slow, [ fast, t+[ medium   (thumb)
+        Channel 6 (5): y slow, ] fast, y+] medium   (palm)
         """
-        if ch_idx == 0:
-            if "w" in keys and "u" in keys:
-                return MEDIUM_UP_RATE
-            elif "u" in keys:
-                return FAST_UP_RATE
-            elif "q" in keys:
-                return SLOW_UP_RATE
-            else:
-                return 0.0
-
-        if ch_idx == 1:
-            if "q" in keys and "i" in keys:
-                return MEDIUM_UP_RATE
-            elif "i" in keys:
-                return FAST_UP_RATE
-            elif "w" in keys:
-                return SLOW_UP_RATE
-            else:
-                return 0.0
-
-        if ch_idx == 2:
-            if "e" in keys and "o" in keys:
-                return MEDIUM_UP_RATE
-            elif "o" in keys:
-                return FAST_UP_RATE
-            elif "e" in keys:
-                return SLOW_UP_RATE
-            else:
-                return 0.0
-
-        if ch_idx == 3:
-            if "r" in keys and "p" in keys:
-                return MEDIUM_UP_RATE
-            elif "p" in keys:
-                return FAST_UP_RATE
-            elif "r" in keys:
-                return SLOW_UP_RATE
-            else:
-                return 0.0
-
+        if ch_idx >= len(CHANNEL_KEYS):
+            return 0.0
+        slow, fast, medium = CHANNEL_KEYS[ch_idx]
+        if medium in keys and fast in keys:
+            return MEDIUM_UP_RATE
+        elif fast in keys:
+            return FAST_UP_RATE
+        elif slow in keys:
+            return SLOW_UP_RATE
         return 0.0
 
     # ------------------------------------------------------------------
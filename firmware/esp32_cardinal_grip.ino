@@ -1,5 +1,6 @@
 // firmware/esp32_grip_serial.ino
 // Board-agnostic FSR streaming over Serial as CSV: v1,v2,v3,v4
+// (or seq,t_ms,v1,v2,v3,v4 with STREAM_TIMING, see below)
 
 #include <Arduino.h>
 
@@ -40,6 +41,11 @@ const int fingerPins[NUM_FINGERS] = {34, 35, 32, 33};
 const long BAUD = 115200;   // both of you can use 115200, just match in Python
 const unsigned long SAMPLE_INTERVAL_MS = 10;  // ~100 Hz
 
+// Prefix each line with a sequence number and millis() so the host can
+// measure transport latency and dropped lines (comms/latency.py). The host
+// reads the last NUM_FINGERS fields either way, so this is safe to leave on.
+#define STREAM_TIMING 1
+
 void setup() {
   Serial.begin(BAUD);
   // Give USB some time on some boards (Feathers/ S3, etc.)
@@ -73,6 +79,14 @@ void loop() {
       vals[i] = analogRead(fingerPins[i]);  // 0–4095
     }
 
+#if STREAM_TIMING
+    static unsigned long seq = 0;
+    Serial.print(seq++);
+    Serial.print(',');
+    Serial.print(now);
+    Serial.print(',');
+#endif
+
     // Stream as CSV: "v1,v2,v3,v4"
     for (int i = 0; i < NUM_FINGERS; ++i) {
       Serial.print(vals[i]);
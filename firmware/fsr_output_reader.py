@@ -1,7 +1,7 @@
 # firmware/fsr_output_reader.py
 #
 # CLI tool to read whatever the board is printing over serial.
-# - Can auto-detect ESP32 / Feather ports on macOS
+# - Can auto-detect the glove's port (shared with the apps: comms/port_detect.py)
 # - OR you can specify the port explicitly
 # - You can also list all ports for debugging
 #
@@ -15,12 +15,20 @@
 #   python firmware/fsr_output_reader.py --port /dev/cu.usbmodem14201
 #   python firmware/fsr_output_reader.py --port /dev/cu.usbmodem14301
 
+import os
+import sys
 import argparse
 import time
 
 import serial
 import serial.tools.list_ports
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from comms.port_detect import detect_port
+
 
 def list_all_ports() -> None:
     ports = list(serial.tools.list_ports.comports())
@@ -34,45 +42,17 @@ def list_all_ports() -> None:
     print("")
 
 
-def auto_detect_port() -> str:
-    ports = list(serial.tools.list_ports.comports())
-    candidates = []
-
-    for p in ports:
-        dev = p.device
-        desc = (p.description or "").lower()
-        hwid = (p.hwid or "").lower()
-        combo = f"{dev} {desc} {hwid}"
-
-        # Filter out obvious Bluetooth virtual ports
-        if "bluetooth" in combo:
-            continue
-
-        # Look for typical USB-serial / MCU hints
-        score = 0
-        if "usbserial" in combo or "usb modem" in combo or "usbmodem" in combo:
-            score += 3
-        if "cp210" in combo or "ch340" in combo or "wchusb" in combo:
-            score += 2
-        if "esp32" in combo or "feather" in combo or "arduino" in combo:
-            score += 2
-        if "usb" in combo:
-            score += 1
-
-        if score > 0:
-            candidates.append((score, dev))
-
-    if not candidates:
+def auto_detect_port(baud: int = 115200) -> str:
+    # Same detection as the apps (comms.port_detect): last good device,
+    # then scored candidates probed for the firmware banner / sample lines
+    port = detect_port(baud)
+    if port is None:
         raise RuntimeError(
             "No suitable serial ports found by auto-detect.\n"
             "Tip: run with --list to see what's available, or pass --port explicitly."
         )
-
-    # Highest score first
-    candidates.sort(reverse=True, key=lambda t: t[0])
-    best_score, best_dev = candidates[0]
-    print(f"Auto-detected port: {best_dev} (score={best_score})")
-    return best_dev
+    print(f"Auto-detected port: {port}")
+    return port
 
 
 class FSRReader:
@@ -111,7 +91,7 @@ def main() -> None:
         port = args.port
         print(f"Using explicit port: {port}")
     else:
-        port = auto_detect_port()
+        port = auto_detect_port(args.baud)
 
     reader = FSRReader(port=port, baud=args.baud)
     print(f"\nReading from {reader.port} at {reader.baud} baud (Ctrl+C to stop).\n")
@@ -8,6 +8,9 @@ Clinician viewer for offline analysis.
 - Plots up to 4 channels over time with toggles
 - Shows rich stats (min, max, mean, std, percentiles, % in-band) per channel
 - Reads Min/Max ADC thresholds from CSV when present and syncs the controls
+- Shows force (N or lbf, per clinician settings) next to ADC when a glove
+  calibration is available: the one the session's .meta.json references,
+  else the glove's current calibration
 - Grid + hover crosshair for detailed inspection
 
 NOTE: If CSV has no tmin/tmax columns, thresholds fall back to current spinbox values.
@@ -15,7 +18,6 @@ NOTE: If CSV has no tmin/tmax columns, thresholds fall back to current spinbox v
 
 import os
 import sys
-import csv
 import statistics
 from glob import glob
 import logging
@@ -52,12 +54,24 @@ if PROJECT_ROOT not in sys.path:
 
 from logger.app_logging import configure_logging  # safe after sys.path tweak
 from host.gui.common.instance_tracker import InstanceTrackerMixin
-
-NUM_CHANNELS = 4
-CHANNEL_NAMES = ["Digitus Indicis", "Digitus Medius", "Digitus Annularis", "Digitus Minimus"]
+from model.session_store import load_session_csv, read_session_meta
+from model.calibration_store import load_calibration_ref, load_current_calibration
+from model.units import ForceScale, load_force_unit
+from host.gui.common.force_axis import attach_force_axis, update_force_axis
+from comms.channel_layout import DEFAULT_NUM_CHANNELS, channel_names
+
+# Until a session file says otherwise (header columns / .meta.json)
+NUM_CHANNELS = DEFAULT_NUM_CHANNELS
+CHANNEL_NAMES = [
+    "Digitus Indicis", "Digitus Medius", "Digitus Annularis", "Digitus Minimus",
+    "Pollex", "Palma",
+]
+CURVE_COLORS = ["r", "g", "b", "y", "m", "c", "w"]
 
 # Optional patient profile shown in the header (single local patient for now)
 PATIENT_PROFILE_PATH = os.path.join(PROJECT_ROOT, "data", "patient_profile.json")
+# Units choice (Metric / Imperial) from the clinician settings page
+CLINICIAN_SETTINGS_PATH = os.path.join(PROJECT_ROOT, "data", "clinician_settings.json")
 
 # Logging: reuse same log directory + file
 LOG_DIR = os.path.join(PROJECT_ROOT, "logger")
@@ -109,9 +123,17 @@ class ClinicianWindow(InstanceTrackerMixin, QWidget):
 
         # Numeric data arrays
         self.time: np.ndarray | None = None          # shape (N,)
-        self.channel_data: np.ndarray | None = None  # shape (4, N)
+        self.channel_data: np.ndarray | None = None  # shape (C, N)
+        self.force_data: np.ndarray | None = None    # shape (C, N), force_scale.unit; None if uncalibrated
         self.loaded_path: str | None = None
 
+        # Channel count / names follow the loaded session (_apply_channel_layout)
+        self.num_channels = NUM_CHANNELS
+        self.channel_names = channel_names(NUM_CHANNELS, CHANNEL_NAMES)
+
+        # ADC -> force for the loaded session (re-resolved on every load)
+        self.force_scale, _ = ForceScale.from_settings(CLINICIAN_SETTINGS_PATH, num_channels=self.num_channels)
+
         # Logical thresholds for overlay
         self.tmin = 1200
         self.tmax = 2000
@@ -155,17 +177,10 @@ class ClinicianWindow(InstanceTrackerMixin, QWidget):
         self.plot_widget.setLabel("left", "Force", units="ADC")
         self.plot_widget.setLabel("bottom", "Time", units="s")
         self.plot_widget.addLegend()
+        self.force_axis = attach_force_axis(self.plot_widget, self.force_scale)
         center_row.addWidget(self.plot_widget, stretch=3)
 
-        colors = ["r", "g", "b", "y"]
         self.curves = []
-        for c in range(NUM_CHANNELS):
-            curve = self.plot_widget.plot(
-                [], [],
-                pen=pg.mkPen(colors[c % len(colors)], width=2),
-                name=f"Ch{c} ({CHANNEL_NAMES[c]})",
-            )
-            self.curves.append(curve)
 
         # Threshold overlay lines (horizontal)
         self.min_line = pg.InfiniteLine(
@@ -211,16 +226,10 @@ class ClinicianWindow(InstanceTrackerMixin, QWidget):
 
         # Channel visibility
         vis_group = QGroupBox("Channels")
-        vis_layout = QVBoxLayout()
-        vis_group.setLayout(vis_layout)
+        self.vis_layout = QVBoxLayout()
+        vis_group.setLayout(self.vis_layout)
 
         self.channel_checkboxes: list[QCheckBox] = []
-        for c in range(NUM_CHANNELS):
-            cb = QCheckBox(f"Ch{c} – {CHANNEL_NAMES[c]}")
-            cb.setChecked(True)
-            cb.stateChanged.connect(self.update_plot)
-            self.channel_checkboxes.append(cb)
-            vis_layout.addWidget(cb)
 
         right_panel.addWidget(vis_group)
 
@@ -243,22 +252,19 @@ class ClinicianWindow(InstanceTrackerMixin, QWidget):
         self.max_spin.valueChanged.connect(self._on_max_changed)
         thresh_layout.addWidget(self.max_spin)
 
+        self.thresh_force_label = QLabel("")
+        self.thresh_force_label.setStyleSheet("color: gray;")
+        thresh_layout.addWidget(self.thresh_force_label)
+
         right_panel.addWidget(thresh_group)
 
         # Stats panel
         stats_group = QGroupBox("Statistics (per channel, all samples)")
-        stats_layout = QVBoxLayout()
-        stats_group.setLayout(stats_layout)
+        self.stats_layout = QVBoxLayout()
+        stats_group.setLayout(self.stats_layout)
 
         self.stats_labels: list[QLabel] = []
-        for c in range(NUM_CHANNELS):
-            lbl = QLabel(
-                f"Ch{c}: min –  max –  mean –  std –  "
-                f"p25–p50–p75 –  in-band –"
-            )
-            lbl.setFont(QFont("Arial", 10))
-            self.stats_labels.append(lbl)
-            stats_layout.addWidget(lbl)
+        self._build_channel_widgets()
 
         right_panel.addWidget(stats_group)
         right_panel.addStretch(1)
@@ -272,6 +278,8 @@ class ClinicianWindow(InstanceTrackerMixin, QWidget):
         self.footer_label.setStyleSheet("color: gray; padding-top: 6px;")
         main_layout.addWidget(self.footer_label)
 
+        self._update_threshold_force_label()
+
     # ---------- PATIENT LABEL ----------
 
     def _refresh_patient_label(self):
@@ -322,7 +330,89 @@ class ClinicianWindow(InstanceTrackerMixin, QWidget):
 
         self.v_line.setPos(t)
         self.h_line.setPos(y)
-        self.hover_label.setText(f"t = {t:0.2f} s, Force = {y:0.1f} ADC")
+        text = f"t = {t:0.2f} s, Force = {y:0.1f} ADC"
+        force = self.force_scale.convert_mean(y)
+        if force is not None:
+            text += f" (≈{self.force_scale.format(force)})"
+        self.hover_label.setText(text)
+
+    # ---------- Channel layout ----------
+
+    def _build_channel_widgets(self):
+        """Curve, visibility checkbox and stats label per channel."""
+        for c in range(self.num_channels):
+            name = self.channel_names[c]
+            curve = self.plot_widget.plot(
+                [], [],
+                pen=pg.mkPen(CURVE_COLORS[c % len(CURVE_COLORS)], width=2),
+                name=f"Ch{c} ({name})",
+            )
+            self.curves.append(curve)
+
+            cb = QCheckBox(f"Ch{c} – {name}")
+            cb.setChecked(True)
+            cb.stateChanged.connect(self.update_plot)
+            self.channel_checkboxes.append(cb)
+            self.vis_layout.addWidget(cb)
+
+            lbl = QLabel(
+                f"Ch{c}: min –  max –  mean –  std –  "
+                f"p25–p50–p75 –  in-band –"
+            )
+            lbl.setWordWrap(True)
+            lbl.setFont(QFont("Arial", 10))
+            self.stats_labels.append(lbl)
+            self.stats_layout.addWidget(lbl)
+
+    def _apply_channel_layout(self, num_channels: int, names=None):
+        """Rebuild the per-channel widgets for a session with a different layout."""
+        if not names or len(names) != num_channels:
+            names = channel_names(num_channels, CHANNEL_NAMES)
+        if num_channels == self.num_channels and list(names) == self.channel_names:
+            return
+        self.num_channels = num_channels
+        self.channel_names = list(names)
+
+        for curve in self.curves:
+            self.plot_widget.removeItem(curve)
+        for w in self.channel_checkboxes + self.stats_labels:
+            w.deleteLater()
+        self.curves = []
+        self.channel_checkboxes = []
+        self.stats_labels = []
+        self._build_channel_widgets()
+
+    # ---------- Force units ----------
+
+    def _resolve_force_scale(self, path: str) -> ForceScale:
+        """
+        Calibration for a session file: the one its metadata references,
+        falling back to the glove's current calibration.
+        """
+        unit = load_force_unit(CLINICIAN_SETTINGS_PATH)
+        meta = read_session_meta(path) or {}
+        calibration, doc = load_calibration_ref(meta.get("calibration"))
+        if calibration is None:
+            calibration, doc = load_current_calibration()
+        if doc is not None:
+            logger.info(
+                "ClinicianWindow #%d using calibration %s v%s for %s",
+                self.instance_id,
+                doc.get("glove_id"),
+                doc.get("version"),
+                os.path.basename(path),
+            )
+        return ForceScale(calibration, unit, num_channels=self.num_channels)
+
+    def _update_threshold_force_label(self):
+        lo = self.force_scale.convert_mean(self.tmin)
+        hi = self.force_scale.convert_mean(self.tmax)
+        if lo is None or hi is None:
+            self.thresh_force_label.setText("")
+            return
+        self.thresh_force_label.setText(
+            f"≈ {lo:.1f}–{self.force_scale.format(hi)}"
+        )
 
     # ---------- Threshold handlers ----------
 
@@ -336,6 +426,7 @@ class ClinicianWindow(InstanceTrackerMixin, QWidget):
             self.max_spin.blockSignals(False)
         self.min_line.setPos(self.tmin)
         self.max_line.setPos(self.tmax)
+        self._update_threshold_force_label()
         self.update_stats()
 
     def _on_max_changed(self, value: int):
@@ -348,6 +439,7 @@ class ClinicianWindow(InstanceTrackerMixin, QWidget):
             self.min_spin.blockSignals(False)
         self.min_line.setPos(self.tmin)
         self.max_line.setPos(self.tmax)
+        self._update_threshold_force_label()
         self.update_stats()
 
     # ---------- CSV LOADING ----------
@@ -390,8 +482,8 @@ class ClinicianWindow(InstanceTrackerMixin, QWidget):
     def _load_csv(self, path: str):
         """
         Load a CSV produced by patient_app.py:
-            time_s, ch0_adc, ch1_adc, ch2_adc, ch3_adc, [tmin_adc, tmax_adc]
-        Threshold columns are optional.
+            time_s, ch0_adc, ..., ch<C-1>_adc, [tmin_adc, tmax_adc]
+        Threshold columns are optional; the channel count comes from the header.
         """
         logger.info(
             "ClinicianWindow #%d attempting to load CSV: %s",
@@ -399,68 +491,24 @@ class ClinicianWindow(InstanceTrackerMixin, QWidget):
             path,
         )
         try:
-            with open(path, "r", newline="") as f:
-                reader = csv.reader(f)
-                header = next(reader, None)
-
-                if header is None:
-                    raise ValueError("CSV file is empty")
-
-                name_to_idx = {name: i for i, name in enumerate(header)}
-
-                def col_index(name, default=None):
-                    return name_to_idx.get(name, default)
-
-                t_idx = col_index("time_s", 0)
-                ch_idx = [
-                    col_index("ch0_adc", 1),
-                    col_index("ch1_adc", 2),
-                    col_index("ch2_adc", 3),
-                    col_index("ch3_adc", 4),
-                ]
-
-                tmin_idx = col_index("tmin_adc", None)
-                tmax_idx = col_index("tmax_adc", None)
-
-                times: list[float] = []
-                channels: list[list[float]] = [[] for _ in range(NUM_CHANNELS)]
-
-                first_tmin = None
-                first_tmax = None
-
-                for row in reader:
-                    if not row:
-                        continue
-                    try:
-                        t = float(row[t_idx])
-                    except (ValueError, IndexError):
-                        continue
-                    times.append(t)
-
-                    for c in range(NUM_CHANNELS):
-                        try:
-                            v = float(row[ch_idx[c]])
-                        except (ValueError, IndexError, TypeError):
-                            v = 0.0
-                        channels[c].append(v)
-
-                    # Capture thresholds from the first row that has them
-                    if first_tmin is None and tmin_idx is not None and tmin_idx < len(row):
-                        try:
-                            first_tmin = float(row[tmin_idx])
-                        except (ValueError, TypeError):
-                            pass
-                    if first_tmax is None and tmax_idx is not None and tmax_idx < len(row):
-                        try:
-                            first_tmax = float(row[tmax_idx])
-                        except (ValueError, TypeError):
-                            pass
-
-            # Convert to NumPy
-            self.time = np.array(times, dtype=float)
-            self.channel_data = np.array(channels, dtype=float)  # shape (4, N)
+            session = load_session_csv(path)
+            first_tmin = session.tmin
+            first_tmax = session.tmax
+
+            meta = read_session_meta(path) or {}
+            self._apply_channel_layout(session.num_channels, meta.get("channel_names"))
+
+            self.time = session.time
+            self.channel_data = session.channels  # shape (C, N)
             self.loaded_path = path
 
+            # Convert the whole session once; plot axis, thresholds and stats reuse it
+            self.force_scale = self._resolve_force_scale(path)
+            force = self.force_scale.convert(self.channel_data.T)
+            self.force_data = force.T if force is not None else None
+            update_force_axis(self.force_axis, self.force_scale)
+            self._update_threshold_force_label()
+
             base = os.path.basename(path)
             self.file_label.setText(f"Loaded: {base}")
             self.file_label.setStyleSheet("color: black;")
@@ -514,7 +562,7 @@ class ClinicianWindow(InstanceTrackerMixin, QWidget):
             return
 
         visible_any = False
-        for c in range(NUM_CHANNELS):
+        for c in range(self.num_channels):
             if self.channel_checkboxes[c].isChecked():
                 self.curves[c].setData(self.time, self.channel_data[c, :])
                 visible_any = True
@@ -530,42 +578,54 @@ class ClinicianWindow(InstanceTrackerMixin, QWidget):
         """
         Compute min / max / mean / std / percentiles and
         % time in threshold band for each channel and update labels.
+        With a calibration, the same statistics are shown in force units
+        (from the per-load force_data, not re-converted here).
         """
+        empty = "min –  max –  mean –  std –  p25–p50–p75 –  in-band –"
         if self.time is None or self.time.size == 0 or self.channel_data is None:
-            for c in range(NUM_CHANNELS):
-                self.stats_labels[c].setText(
-                    f"Ch{c}: min –  max –  mean –  std –  p25–p50–p75 –  in-band –"
-                )
+            for c in range(self.num_channels):
+                self.stats_labels[c].setText(f"Ch{c}: {empty}")
             return
 
-        data = self.channel_data  # shape (4, N)
-
-        for c in range(NUM_CHANNELS):
-            ch = data[c, :]  # (N,)
-            if ch.size == 0:
-                self.stats_labels[c].setText(
-                    f"Ch{c}: min –  max –  mean –  std –  p25–p50–p75 –  in-band –"
-                )
-                continue
-
-            mn = float(np.min(ch))
-            mx = float(np.max(ch))
-            avg = float(np.mean(ch))
-            std = float(np.std(ch, ddof=0))
-
-            p25, p50, p75 = np.percentile(ch, [25, 50, 75])
-
-            # % of samples inside threshold band
-            in_band_mask = (ch >= self.tmin) & (ch <= self.tmax)
-            pct_in_band = float(in_band_mask.mean() * 100.0)
+        data = self.channel_data  # shape (C, N)
+        if data.shape[1] == 0:
+            for c in range(self.num_channels):
+                self.stats_labels[c].setText(f"Ch{c}: {empty}")
+            return
 
-            self.stats_labels[c].setText(
+        # All channels at once (one pass per statistic, not per channel)
+        mn = data.min(axis=1)
+        mx = data.max(axis=1)
+        avg = data.mean(axis=1)
+        std = data.std(axis=1, ddof=0)
+        p25, p50, p75 = np.percentile(data, [25, 50, 75], axis=1)
+        # % of samples inside threshold band
+        pct_in_band = ((data >= self.tmin) & (data <= self.tmax)).mean(axis=1) * 100.0
+
+        fdata = self.force_data
+        if fdata is not None:
+            f_ok = np.isfinite(fdata).all(axis=1)
+            f25, f50, f75 = np.percentile(fdata, [25, 50, 75], axis=1)
+
+        for c in range(self.num_channels):
+            text = (
                 f"Ch{c}: "
-                f"min {mn:.0f}   max {mx:.0f}   mean {avg:.1f}   std {std:.1f}   "
-                f"p25 {p25:.0f}   p50 {p50:.0f}   p75 {p75:.0f}   "
-                f"in-band {pct_in_band:5.1f}%"
+                f"min {mn[c]:.0f}   max {mx[c]:.0f}   mean {avg[c]:.1f}   std {std[c]:.1f}   "
+                f"p25 {p25[c]:.0f}   p50 {p50[c]:.0f}   p75 {p75[c]:.0f}   "
+                f"in-band {pct_in_band[c]:5.1f}%"
             )
 
+            if fdata is not None and c < fdata.shape[0] and f_ok[c]:
+                fc = fdata[c, :]
+                text += (
+                    f"\n      {self.force_scale.unit}: "
+                    f"min {fc.min():.1f}   max {fc.max():.1f}   "
+                    f"mean {fc.mean():.1f}   std {fc.std(ddof=0):.1f}   "
+                    f"p25 {f25[c]:.1f}   p50 {f50[c]:.1f}   p75 {f75[c]:.1f}"
+                )
+
+            self.stats_labels[c].setText(text)
+
     # ---------- Window close / instance logging ----------
 
     def closeEvent(self, event):
@@ -7,6 +7,7 @@ import sqlite3
 from datetime import datetime
 from collections import defaultdict
 import logging
+import argparse
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
@@ -37,6 +38,7 @@ if PROJECT_ROOT not in sys.path:
     sys.path.append(PROJECT_ROOT)
 
 from logger.app_logging import configure_logging  # now safe: PROJECT_ROOT is on sys.path
+from logger.profiling import DEFAULT_CALL_TARGETS, add_profile_argument, start_profiling
 
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
 os.makedirs(DATA_DIR, exist_ok=True)
@@ -57,7 +59,14 @@ from host.gui.common.dashboard_calendar import DashboardWindow
 from host.gui.clinician_dashboard.clinician_app import ClinicianWindow
 from host.gui.patient_dashboard.patient_app import PatientWindow
 from host.gui.patient_dashboard.patient_dual_launcher import DualPatientGameWindow
+from host.gui.clinician_dashboard.live_wall import LiveWallWindow, latest_recordings
 
+# --profile: the clinician's own hot paths, on top of the shared GUI ticks
+CLINICIAN_CALL_TARGETS = (
+    "host.gui.clinician_dashboard.clinician_app:ClinicianWindow._load_csv",
+    "host.gui.clinician_dashboard.clinician_app:ClinicianWindow.update_stats",
+    "host.gui.clinician_dashboard.live_wall:LiveWallWindow.wall_tick",
+)
 
 # ---------- Helpers for sessions ----------
 
@@ -116,7 +125,7 @@ class ClinicianDashboardPage(QWidget):
     """
     Main clinician dashboard:
       - High-level stats from sessions_log.json
-      - Quick actions (monitor, multi-finger monitor, dual view, calendar)
+      - Quick actions (monitor, multi-finger monitor, dual view, live wall, calendar)
     """
 
     def __init__(self, parent_shell):
@@ -173,6 +182,10 @@ class ClinicianDashboardPage(QWidget):
         btn_dual.clicked.connect(self.shell.open_dual)
         actions_layout.addWidget(btn_dual)
 
+        btn_wall = QPushButton("Live Wall (All Patients)")
+        btn_wall.clicked.connect(self.shell.open_live_wall)
+        actions_layout.addWidget(btn_wall)
+
         btn_calendar = QPushButton("Open Exercise Calendar")
         btn_calendar.clicked.connect(lambda: self.shell.switch_page("calendar"))
         actions_layout.addWidget(btn_calendar)
@@ -619,6 +632,7 @@ class ClinicianShellWindow(QWidget):
           * Clinician monitor
           * Multi-finger monitor (patient-style)
           * Dual view (patient game + monitor)
+          * Live wall (every patient stream in one window)
     """
 
     _instance_count = 0
@@ -797,6 +811,20 @@ class ClinicianShellWindow(QWidget):
         win.show()
         self._open_windows.append(win)
 
+    def open_live_wall(self):
+        """
+        Open the live wall with every running device (this process's hub
+        and any other process's); with none, replay the newest recordings.
+        """
+        logger.info("Opening clinician live wall")
+        win = LiveWallWindow()
+        win.add_hub_devices()
+        if not win.tiles:
+            for path in latest_recordings():
+                win.add_replay(path)
+        win.show()
+        self._open_windows.append(win)
+
     # ---- Close event ----
 
     def closeEvent(self, event):
@@ -825,16 +853,34 @@ class ClinicianShellWindow(QWidget):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Clinician Dashboard")
+    add_profile_argument(parser)
+    # Anything unrecognised is left for Qt (-style, -platform, ...)
+    args, qt_args = parser.parse_known_args()
+
     # Configure logging for this process
     configure_logging(LOG_FILE)
     logger.info("Clinician Dashboard Qt App Launching")
 
-    app = QApplication(sys.argv)
+    app = QApplication([sys.argv[0]] + qt_args)
+    # Wrap before any window exists: timers bind the (wrapped) methods on creation
+    profiler = (
+        start_profiling(
+            "clinician_dashboard",
+            args.profile,
+            call_targets=DEFAULT_CALL_TARGETS + CLINICIAN_CALL_TARGETS,
+        )
+        if args.profile
+        else None
+    )
     win = ClinicianShellWindow()
     win.show()
     logger.info("Clinician Dashboard Qt App Launched")
 
     exit_code = app.exec()
+
+    if profiler is not None:
+        profiler.stop()
     logger.info("Clinician Dashboard Qt App Closed with exit code %d", exit_code)
     sys.exit(exit_code)
 
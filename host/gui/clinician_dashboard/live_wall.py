@@ -0,0 +1,467 @@
+# host/gui/clinician_dashboard/live_wall.py
+
+"""
+Clinician live wall: many patient streams in one window.
+
+Opening one ClinicianWindow / PatientWindow per patient gives every
+stream its own backend poll timer and its own pyqtgraph widget, which
+stops scaling well before a room of 8-16 gloves. The wall instead:
+
+  - drives every tile from ONE QTimer (WALL_TICK_MS): each tick drains
+    all readers, then redraws all tiles with widget updates suspended,
+    so the whole wall repaints once per tick;
+  - draws all tiles as PlotItems in a single GraphicsLayoutWidget (one
+    scene), with axes, mouse interaction and auto-range turned off;
+  - decimates on ingest: each tile keeps SPARK_POINTS peak-per-bin values
+    over the last WINDOW_S seconds, so redraw cost does not depend on the
+    sample rate.
+
+Sources (CLI flags, or the buttons in the window):
+    --sim N                 N simulated gloves (--sim-channels for their count)
+    --replay FILE...        recorded sessions, played back in real time
+    --source PORT...        anything open_shared_backend() accepts (serial port,
+                            "shm:<name>", "multi:...", "replay:<file>")
+    --hub                   every device already running: this process's hub
+                            plus whatever another process's hub serves
+                            (subscribed over RemoteHubBackend)
+
+With no sources, the newest DEFAULT_REPLAYS recordings in data/logs are
+replayed.
+
+    python -m host.gui.clinician_dashboard.live_wall --sim 4 --replay data/logs/*.csv
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import logging
+import argparse
+from glob import glob
+from typing import List, Optional
+
+import numpy as np
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import (
+    QApplication,
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QFileDialog,
+    QSpinBox,
+)
+
+import pyqtgraph as pg
+
+# ------------ PATH SETUP ------------
+CLINICIAN_DASHBOARD_DIR = os.path.dirname(__file__)   # .../host/gui/clinician_dashboard
+GUI_DIR = os.path.dirname(CLINICIAN_DASHBOARD_DIR)    # .../host/gui
+HOST_DIR = os.path.dirname(GUI_DIR)                   # .../host
+PROJECT_ROOT = os.path.dirname(HOST_DIR)              # .../cardinal-grip
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from logger.app_logging import configure_logging  # safe after sys.path tweak
+from logger.profiling import add_profile_argument, start_profiling
+from host.gui.common.instance_tracker import InstanceTrackerMixin
+from comms.acquisition_hub import AcquisitionHub, RemoteHubBackend, open_shared_backend, remote_devices
+from comms.calibrated_reader import ADC_MAX, CalibratedReader
+from comms.channel_layout import backend_channel_names
+from comms.replay_backend import ReplayBackend
+from comms.serial_backend import SerialBackend
+from comms.sim_backend import SimBackend
+
+LOGS_DIR = os.path.join(PROJECT_ROOT, "data", "logs")
+
+LOG_DIR = os.path.join(PROJECT_ROOT, "logger")
+os.makedirs(LOG_DIR, exist_ok=True)
+LOG_FILE = os.path.join(LOG_DIR, "cardinal_grip.log")
+
+logger = logging.getLogger("cardinal_grip.gui.live_wall")
+
+WALL_TICK_MS = 50            # one shared render loop for every tile (20 fps)
+WINDOW_S = 10.0              # sparkline history
+SPARK_POINTS = 200           # bins per sparkline -> 50 ms per bin
+LABEL_REFRESH_TICKS = 10     # tile titles / status text ~2x per second
+STALE_AFTER_S = 1.0          # no samples for this long -> tile title turns red
+DEFAULT_COLUMNS = 4
+DEFAULT_REPLAYS = 8          # shell default when no device is running
+REPLAY_STAGGER_S = 7.0       # offset between replays so copies of a file differ
+
+CURVE_COLORS = ["r", "g", "b", "y", "m", "c", "w"]
+
+# --profile targets for this window
+WALL_CALL_TARGETS = (
+    "host.gui.clinician_dashboard.live_wall:LiveWallWindow.wall_tick",
+)
+
+
+class _WallTile:
+    """
+    One stream on the wall: its backend, a reader, and a peak-per-bin ring
+    of SPARK_POINTS bins (bin id = floor(ts / bin_s), slot = id % points).
+    """
+
+    def __init__(self, label: str, backend, plot: pg.PlotItem):
+        self.label = label
+        self.backend = backend
+        self.reader = CalibratedReader(backend)
+        self.num_channels = self.reader.num_channels
+        self.plot = plot
+        self.bin_s = WINDOW_S / SPARK_POINTS
+
+        self.bin_ids = np.full(SPARK_POINTS, -1, dtype=np.int64)
+        self.bins = np.zeros((SPARK_POINTS, self.num_channels), dtype=np.float32)
+        self.last_ts: Optional[float] = None
+        self.latest: Optional[np.ndarray] = None
+
+        # Bare PlotCurveItems: PlotDataItem's extra bookkeeping costs more
+        # than the drawing at this size
+        names = backend_channel_names(backend, num_channels=self.num_channels)
+        self.curves = []
+        for c in range(self.num_channels):
+            curve = pg.PlotCurveItem(pen=pg.mkPen(CURVE_COLORS[c % len(CURVE_COLORS)], width=1), name=names[c])
+            plot.addItem(curve)
+            self.curves.append(curve)
+
+    def ingest(self) -> int:
+        """Drain the reader into the bins (vectorized over the batch)."""
+        batch = self.reader.read()
+        n = len(batch)
+        if not n:
+            return 0
+        ids = np.floor(batch.ts / self.bin_s).astype(np.int64)
+        # Peak per bin: batches are time-ordered, so equal ids are contiguous
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+        ids = ids[starts][-SPARK_POINTS:]
+        peaks = np.maximum.reduceat(batch.adc, starts, axis=0)[-SPARK_POINTS:]
+
+        slots = ids % SPARK_POINTS
+        fresh = self.bin_ids[slots] != ids
+        self.bins[slots[fresh]] = peaks[fresh]
+        held = ~fresh
+        self.bins[slots[held]] = np.maximum(self.bins[slots[held]], peaks[held])
+        self.bin_ids[slots] = ids
+
+        self.last_ts = float(batch.ts[-1])
+        self.latest = batch.adc[-1]
+        return n
+
+    def render(self, now: float) -> None:
+        cur = int(now // self.bin_s)
+        ids = np.arange(cur - SPARK_POINTS + 1, cur + 1)
+        slots = ids % SPARK_POINTS
+        valid = self.bin_ids[slots] == ids
+        x = (ids - cur) * self.bin_s
+        y = self.bins[slots]
+        y = np.where(valid[:, None], y, np.nan)
+        for c, curve in enumerate(self.curves):
+            curve.setData(x, y[:, c], connect="finite", skipFiniteCheck=True)
+
+    def title(self, now: float) -> str:
+        stale = self.last_ts is None or now - self.last_ts > STALE_AFTER_S
+        color = "#FF6347" if stale else "#DDDDDD"
+        if self.latest is None:
+            detail = "waiting for data"
+        elif stale:
+            detail = f"no data for {now - self.last_ts:.0f} s"
+        else:
+            detail = f"peak {int(self.latest.max())}"
+        return f"<span style='color:{color}'>{self.label} · {self.num_channels} ch · {detail}</span>"
+
+    def close(self) -> None:
+        try:
+            self.backend.stop()
+        except Exception:
+            logger.exception("Live wall: error stopping %s", self.label)
+
+
+class LiveWallWindow(InstanceTrackerMixin, QWidget):
+    def __init__(self, columns: int = DEFAULT_COLUMNS, parent=None):
+        super().__init__(parent)
+
+        logger.info(
+            "LiveWallWindow #%d created (active=%d, lifetime=%d)",
+            self.instance_id,
+            type(self).active_count(),
+            type(self).lifetime_count(),
+        )
+
+        self.setWindowTitle("Cardinal Grip – Live Wall")
+        self.resize(1400, 900)
+
+        self.columns = columns
+        self.tiles: List[_WallTile] = []
+        self._sim_count = 0
+        self._replay_count = 0
+        self._ticks = 0
+        self._tick_ms = 0.0           # EMA of wall_tick duration
+        self._samples_per_s = 0.0     # EMA of ingested samples/s (all tiles)
+
+        main_layout = QVBoxLayout()
+        self.setLayout(main_layout)
+
+        # ===== TOP BAR: sources + status =====
+        top_row = QHBoxLayout()
+
+        self.add_sim_button = QPushButton("Add simulated glove")
+        self.add_sim_button.clicked.connect(lambda: self.add_sim())
+        top_row.addWidget(self.add_sim_button)
+
+        self.add_replay_button = QPushButton("Add recording…")
+        self.add_replay_button.clicked.connect(self.handle_add_replay)
+        top_row.addWidget(self.add_replay_button)
+
+        self.add_hub_button = QPushButton("Add running devices")
+        self.add_hub_button.clicked.connect(self.add_hub_devices)
+        top_row.addWidget(self.add_hub_button)
+
+        self.clear_button = QPushButton("Clear")
+        self.clear_button.clicked.connect(self.clear_tiles)
+        top_row.addWidget(self.clear_button)
+
+        top_row.addWidget(QLabel("Columns:"))
+        self.columns_spin = QSpinBox()
+        self.columns_spin.setRange(1, 8)
+        self.columns_spin.setValue(columns)
+        self.columns_spin.valueChanged.connect(self._set_columns)
+        top_row.addWidget(self.columns_spin)
+
+        self.status_label = QLabel("No streams")
+        self.status_label.setStyleSheet("color: gray;")
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        top_row.addWidget(self.status_label, stretch=1)
+
+        main_layout.addLayout(top_row)
+
+        # ===== WALL: one scene for every tile =====
+        self.view = pg.GraphicsLayoutWidget()
+        self.view.setAntialiasing(False)
+        main_layout.addWidget(self.view, stretch=1)
+
+        # ===== SHARED RENDER LOOP =====
+        self.timer = QTimer(self)
+        self.timer.setInterval(WALL_TICK_MS)
+        self.timer.timeout.connect(self.wall_tick)
+        self.timer.start()
+
+    # ---------- sources ----------
+
+    def _new_plot(self) -> pg.PlotItem:
+        idx = len(self.tiles)
+        plot = self.view.addPlot(row=idx // self.columns, col=idx % self.columns)
+        plot.hideAxis("left")
+        plot.hideAxis("bottom")
+        plot.setMouseEnabled(x=False, y=False)
+        plot.hideButtons()
+        plot.setMenuEnabled(False)
+        plot.disableAutoRange()
+        plot.setXRange(-WINDOW_S, 0, padding=0)
+        plot.setYRange(0, ADC_MAX, padding=0.02)
+        return plot
+
+    def add_backend(self, label: str, backend) -> None:
+        """Add a started backend as a tile; the wall stops it when the tile goes."""
+        tile = _WallTile(label, backend, self._new_plot())
+        tile.plot.setTitle(tile.title(time.time()), size="9pt")
+        self.tiles.append(tile)
+        logger.info("Live wall: added %s (%d channels, %d tiles)", label, tile.num_channels, len(self.tiles))
+
+    def add_sim(self, num_channels: Optional[int] = None) -> None:
+        self._sim_count += 1
+        backend = SimBackend(num_channels=num_channels, timeout=0.01)
+        backend.start()
+        self.add_backend(f"Sim {self._sim_count}", backend)
+
+    def add_replay(self, path: str, speed: float = 1.0) -> None:
+        """A private player per tile, staggered, so one file can fill several tiles."""
+        try:
+            backend = ReplayBackend(path=path, speed=speed, offset_s=self._replay_count * REPLAY_STAGGER_S)
+            backend.start()
+        except Exception:
+            logger.exception("Live wall: could not replay %s", path)
+            return
+        self._replay_count += 1
+        self.add_backend(os.path.splitext(os.path.basename(path))[0], backend)
+
+    def add_port(self, port: str, baud: int = 115200) -> None:
+        try:
+            backend = open_shared_backend(SerialBackend, port=port, baud=baud, timeout=0.01)
+        except Exception:
+            logger.exception("Live wall: could not open %s", port)
+            return
+        if _device_key(backend) in self._device_keys():
+            logger.info("Live wall: %s is already on the wall", port)
+            backend.stop()
+            return
+        self.add_backend(getattr(backend, "port", None) or port, backend)
+
+    def add_hub_devices(self) -> None:
+        """
+        Every running device: leases on this process's hub, then a
+        RemoteHubBackend for each device another process's hub lists.
+        Devices already on the wall are skipped, so the button can be
+        pressed again to pick up new ones.
+        """
+        on_wall = self._device_keys()
+        added = 0
+        for lease in AcquisitionHub.instance().lease_all():
+            key = _device_key(lease)
+            if key in on_wall:
+                lease.stop()
+                continue
+            on_wall.add(key)
+            self.add_backend(lease.port or key[0], lease)
+            added += 1
+
+        for dev in remote_devices():
+            key = (dev.get("kind"), dev.get("port"))
+            if key in on_wall or not key[0]:
+                continue
+            remote = RemoteHubBackend(kind=key[0], port=key[1])
+            try:
+                remote.start()
+            except OSError:
+                logger.exception("Live wall: could not subscribe to %s %s", key[0], key[1])
+                continue
+            on_wall.add(key)
+            self.add_backend(remote.port or key[0], remote)
+            added += 1
+
+        if not added:
+            self.status_label.setText("No new running devices")
+
+    def _device_keys(self) -> set:
+        return {_device_key(tile.backend) for tile in self.tiles}
+
+    def handle_add_replay(self) -> None:
+        paths, _ = QFileDialog.getOpenFileNames(
+            self, "Add recordings", LOGS_DIR, "Sessions (*.csv *.cgs);;All files (*)"
+        )
+        for path in paths:
+            self.add_replay(path)
+
+    def clear_tiles(self) -> None:
+        for tile in self.tiles:
+            tile.close()
+        self.tiles = []
+        self.view.clear()
+        self.status_label.setText("No streams")
+
+    def _set_columns(self, columns: int) -> None:
+        """Re-flow the existing tiles into `columns` columns."""
+        self.columns = columns
+        for tile in self.tiles:
+            self.view.removeItem(tile.plot)
+        for idx, tile in enumerate(self.tiles):
+            self.view.addItem(tile.plot, row=idx // columns, col=idx % columns)
+
+    # ---------- shared render loop ----------
+
+    def wall_tick(self) -> None:
+        if not self.tiles:
+            return
+        t0 = time.perf_counter()
+        now = time.time()
+
+        samples = 0
+        for tile in self.tiles:
+            samples += tile.ingest()
+
+        refresh_text = self._ticks % LABEL_REFRESH_TICKS == 0
+        self.view.setUpdatesEnabled(False)
+        try:
+            for tile in self.tiles:
+                tile.render(now)
+                if refresh_text:
+                    tile.plot.setTitle(tile.title(now), size="9pt")
+        finally:
+            self.view.setUpdatesEnabled(True)
+
+        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        self._tick_ms += 0.1 * (elapsed_ms - self._tick_ms)
+        self._samples_per_s += 0.1 * (samples * 1000.0 / WALL_TICK_MS - self._samples_per_s)
+        if refresh_text:
+            self.status_label.setText(
+                f"{len(self.tiles)} streams · {self._samples_per_s:,.0f} samples/s · "
+                f"tick {self._tick_ms:.1f} ms / {WALL_TICK_MS} ms"
+            )
+        self._ticks += 1
+
+    # ---------- Window close / instance logging ----------
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        self.clear_tiles()
+        logger.info(
+            "LiveWallWindow #%d closeEvent called (active=%d)",
+            self.instance_id,
+            type(self).active_count(),
+        )
+        super().closeEvent(event)
+
+
+def _device_key(backend) -> tuple:
+    """(backend kind, port) of a hub lease / RemoteHubBackend; private tiles never match."""
+    if isinstance(backend, RemoteHubBackend):
+        return (backend.kind, backend.port)
+    device = getattr(backend, "device_backend", None)
+    if device is None:
+        return (None, id(backend))
+    return (type(device).__name__, backend.port)
+
+
+def latest_recordings(limit: int = DEFAULT_REPLAYS) -> List[str]:
+    """Newest session CSVs in data/logs (newest first)."""
+    paths = sorted(glob(os.path.join(LOGS_DIR, "*.csv")), key=os.path.getmtime, reverse=True)
+    return paths[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clinician live wall (many patient streams)")
+    parser.add_argument("--sim", type=int, default=0, help="Number of simulated gloves")
+    parser.add_argument("--sim-channels", type=int, default=None, help="Channels per simulated glove")
+    parser.add_argument("--replay", nargs="*", default=[], help="Session files to replay")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed")
+    parser.add_argument("--source", nargs="*", default=[], help="Ports for open_shared_backend()")
+    parser.add_argument("--hub", action="store_true", help="Add every running device (this process's hub and another process's)")
+    parser.add_argument("--columns", type=int, default=DEFAULT_COLUMNS)
+    add_profile_argument(parser)
+    args, qt_args = parser.parse_known_args()
+
+    configure_logging(LOG_FILE)
+    logger.info("Live Wall Qt App Launching")
+
+    app = QApplication([sys.argv[0]] + qt_args)
+    profiler = start_profiling("live_wall", args.profile, call_targets=WALL_CALL_TARGETS) if args.profile else None
+
+    win = LiveWallWindow(columns=args.columns)
+    for port in args.source:
+        win.add_port(port)
+    if args.hub:
+        win.add_hub_devices()
+    for _ in range(args.sim):
+        win.add_sim(args.sim_channels)
+    for path in args.replay:
+        win.add_replay(path, speed=args.speed)
+    if not win.tiles:
+        for path in latest_recordings():
+            win.add_replay(path, speed=args.speed)
+    win.show()
+    logger.info("Live Wall Qt App Launched (%d streams)", len(win.tiles))
+
+    exit_code = app.exec()
+
+    if profiler is not None:
+        profiler.stop()
+    logger.info("Live Wall Qt App Closed with exit code %d", exit_code)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
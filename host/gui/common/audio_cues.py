@@ -0,0 +1,234 @@
+# host/gui/common/audio_cues.py
+
+"""
+Process-wide audio cue manager for the patient windows.
+
+Before this, every PatientGameWindow created its own nine QSoundEffect
+objects, so the dual launcher (which embeds a second game window) loaded
+every WAV twice, and replaying a cue stop()'ed the previous instance.
+
+AudioCueManager.instance():
+  - loads every audio/*.wav cue once per process, up front when the
+    manager is first created, and shares them between all windows;
+  - keeps a small pool of voices per cue, so overlapping cues (e.g. the
+    'applepay' in-band chime and the 'duolingo' rep chime, or two reps in
+    quick succession) play on top of each other instead of cutting off;
+  - measures trigger → playback-start latency per cue (latency_stats(),
+    log_latency_summary()) and feeds it to LatencyTracker's "audio" stage,
+    so the latency overlay shows it next to sample → pixels.
+
+QSoundEffect is Qt's low-latency path for short uncompressed WAVs; the
+voices are pre-loaded up front so play() never waits on file I/O.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import logging
+from collections import deque
+
+from PyQt6.QtCore import QUrl
+from PyQt6.QtMultimedia import QSoundEffect
+
+# ----- PATH SETUP -----
+COMMON_DIR = os.path.dirname(__file__)        # .../host/gui/common
+GUI_DIR = os.path.dirname(COMMON_DIR)         # .../host/gui
+HOST_DIR = os.path.dirname(GUI_DIR)           # .../host
+PROJECT_ROOT = os.path.dirname(HOST_DIR)      # .../cardinal-grip
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from comms.latency import STAGE_AUDIO, LatencyTracker
+
+AUDIO_DIR = os.path.join(PROJECT_ROOT, "audio")
+
+logger = logging.getLogger("cardinal_grip.gui.audio")
+
+# Cue name -> file in audio/
+CUE_FILES = {
+    "applepay": "applepay_mono.wav",
+    "bruh": "bruh_mono.wav",
+    "duolingo": "duolingo_mono.wav",
+    "mario": "mario_mono.wav",
+    "oof": "oof_mono.wav",
+    "rizz": "rizz_mono.wav",
+    "spongebob": "spongebob_mono.wav",
+    "wow": "wow_mono.wav",
+    "yay": "yay_mono.wav",
+}
+
+VOICES_PER_CUE = 2
+DEFAULT_VOLUME = 0.9
+LATENCY_HISTORY = 200
+
+
+class _Voice:
+    """One QSoundEffect plus the bookkeeping for latency measurement."""
+
+    def __init__(self, manager: "AudioCueManager", cue: str, path: str, volume: float):
+        self.cue = cue
+        self.effect = QSoundEffect()
+        self.effect.setSource(QUrl.fromLocalFile(path))
+        self.effect.setVolume(volume)
+        self.triggered_at: float | None = None
+        self.started_at = 0.0
+        self.effect.playingChanged.connect(
+            lambda: manager._on_playing_changed(self)
+        )
+        self.effect.statusChanged.connect(
+            lambda: manager._on_status_changed(self)
+        )
+
+    def is_ready(self) -> bool:
+        return self.effect.status() == QSoundEffect.Status.Ready
+
+    def is_busy(self) -> bool:
+        return self.effect.isPlaying() or self.triggered_at is not None
+
+
+class AudioCueManager:
+    """
+    Shared, preloaded sound cues with a per-cue voice pool.
+
+    Must be used from the Qt GUI thread after QApplication exists.
+    """
+
+    _instance: "AudioCueManager | None" = None
+
+    @classmethod
+    def instance(cls) -> "AudioCueManager":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(
+        self,
+        audio_dir: str = AUDIO_DIR,
+        voices_per_cue: int = VOICES_PER_CUE,
+        volume: float = DEFAULT_VOLUME,
+    ):
+        self.audio_dir = audio_dir
+        self.voices_per_cue = max(1, voices_per_cue)
+        self.volume = volume
+        self.enabled = True
+
+        self._voices: dict[str, list[_Voice]] = {}
+        self._latencies: dict[str, deque] = {}
+
+        t0 = time.perf_counter()
+        for cue, filename in CUE_FILES.items():
+            self._load_cue(cue, filename)
+        logger.info(
+            "AudioCueManager loaded %d cue(s) x %d voice(s) in %.1f ms",
+            len(self._voices),
+            self.voices_per_cue,
+            (time.perf_counter() - t0) * 1000.0,
+        )
+
+    def _load_cue(self, cue: str, filename: str) -> None:
+        path = os.path.join(self.audio_dir, filename)
+        if not os.path.isfile(path):
+            logger.warning("Audio cue %r missing: %s", cue, path)
+            return
+        self._voices[cue] = [
+            _Voice(self, cue, path, self.volume) for _ in range(self.voices_per_cue)
+        ]
+        self._latencies[cue] = deque(maxlen=LATENCY_HISTORY)
+
+    # ---------- playback ----------
+
+    def has_cue(self, cue: str) -> bool:
+        return cue in self._voices
+
+    def play(self, cue: str | None) -> None:
+        """
+        Play a cue on a free voice; if all voices are busy, restart the one
+        that started longest ago. Unknown cues / disabled audio are no-ops.
+        """
+        if not cue or not self.enabled:
+            return
+        voices = self._voices.get(cue)
+        if not voices:
+            return
+
+        voice = next((v for v in voices if not v.is_busy()), None)
+        if voice is None:
+            voice = min(voices, key=lambda v: v.started_at)
+            voice.effect.stop()
+
+        if not voice.is_ready():
+            logger.debug("Audio cue %r not ready yet (status=%s)", cue, voice.effect.status())
+
+        voice.triggered_at = time.perf_counter()
+        voice.started_at = voice.triggered_at
+        voice.effect.play()
+        if voice.effect.status() in (QSoundEffect.Status.Error, QSoundEffect.Status.Null):
+            # play() was a no-op: no playingChanged will ever clear the trigger
+            logger.debug("Audio cue %r did not start (status=%s)", cue, voice.effect.status())
+            voice.triggered_at = None
+
+    def stop_all(self) -> None:
+        for voices in self._voices.values():
+            for v in voices:
+                v.effect.stop()
+                v.triggered_at = None
+
+    def _on_playing_changed(self, voice: _Voice) -> None:
+        if not voice.effect.isPlaying():
+            return
+        if voice.triggered_at is None:
+            return
+        latency_ms = (time.perf_counter() - voice.triggered_at) * 1000.0
+        voice.triggered_at = None
+        self._latencies[voice.cue].append(latency_ms)
+        LatencyTracker.instance().record(STAGE_AUDIO, latency_ms)
+        logger.debug("Audio cue %r started after %.1f ms", voice.cue, latency_ms)
+
+    def _on_status_changed(self, voice: _Voice) -> None:
+        status = voice.effect.status()
+        if voice.triggered_at is not None and status in (
+            QSoundEffect.Status.Error,
+            QSoundEffect.Status.Null,
+        ):
+            # A pending play that can no longer start; free the voice again
+            logger.warning("Audio cue %r failed to play (status=%s)", voice.cue, status)
+            voice.triggered_at = None
+
+    # ---------- latency stats ----------
+
+    def latency_stats(self) -> dict[str, dict[str, float]]:
+        """
+        Per-cue trigger → playing latency over the last LATENCY_HISTORY plays:
+            {cue: {"count": n, "p50_ms": .., "p95_ms": .., "max_ms": ..}}
+        """
+        out: dict[str, dict[str, float]] = {}
+        for cue, samples in self._latencies.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            n = len(ordered)
+            out[cue] = {
+                "count": float(n),
+                "p50_ms": ordered[int(0.50 * (n - 1))],
+                "p95_ms": ordered[int(0.95 * (n - 1))],
+                "max_ms": ordered[-1],
+            }
+        return out
+
+    def log_latency_summary(self, log_fields: dict | None = None) -> None:
+        """One INFO line with p50/p95 per cue (call when a game window closes)."""
+        stats = self.latency_stats()
+        if not stats:
+            return
+        summary = ", ".join(
+            f"{cue} p50 {st['p50_ms']:.1f} / p95 {st['p95_ms']:.1f} ms (n={int(st['count'])})"
+            for cue, st in sorted(stats.items())
+        )
+        logger.info(
+            "Audio cue latency: %s",
+            summary,
+            extra={**(log_fields or {}), "audio_latency_ms": stats},
+        )
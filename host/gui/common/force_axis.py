@@ -0,0 +1,57 @@
+# host/gui/common/force_axis.py
+
+"""
+Secondary plot axis that labels ADC-valued plots in force units.
+
+Curves and threshold lines stay in ADC counts; the right-hand axis puts
+force tick labels at the same positions, using the channel-averaged
+calibration curve (ForceScale.mean_curve). Calibrations are monotonic, so
+the labels read correctly even for non-linear sensors.
+"""
+
+import pyqtgraph as pg
+
+
+class ForceAxisItem(pg.AxisItem):
+    def __init__(self, orientation: str = "right", **kwargs):
+        super().__init__(orientation, **kwargs)
+        # Tick positions are ADC counts; an SI prefix ("k") would be meaningless here
+        self.enableAutoSIPrefix(False)
+        self._curve = None
+
+    def set_scale(self, scale) -> None:
+        """scale: model.units.ForceScale (or None to blank the labels)."""
+        self._curve = scale.mean_curve if scale is not None and scale.calibrated else None
+        self.picture = None      # drop the cached tick picture
+        self.update()
+
+    def tickStrings(self, values, scale, spacing):
+        if self._curve is None:
+            return ["" for _ in values]
+        last = self._curve.size - 1
+        out = []
+        for v in values:
+            i = int(round(v))
+            if 0 <= i <= last:
+                out.append(f"{self._curve[i]:.1f}")
+            else:
+                out.append("")
+        return out
+
+
+def attach_force_axis(plot_widget: pg.PlotWidget, scale) -> ForceAxisItem:
+    """Add a ForceAxisItem on the right of plot_widget and label it for scale."""
+    axis = ForceAxisItem("right")
+    plot_item = plot_widget.getPlotItem()
+    plot_item.setAxisItems({"right": axis})
+    plot_item.showAxis("right")
+    update_force_axis(axis, scale)
+    return axis
+
+
+def update_force_axis(axis: ForceAxisItem, scale) -> None:
+    axis.set_scale(scale)
+    if scale is not None and scale.calibrated:
+        axis.setLabel(f"Force ({scale.unit})")
+    else:
+        axis.setLabel("Force (uncalibrated)")
@@ -98,6 +98,11 @@ class InstanceTrackerMixin:
         """Monotonic ID per class: 1, 2, 3, ..."""
         return getattr(self, "_id", -1)
 
+    @property
+    def log_fields(self) -> dict:
+        """Structured fields for logger calls: logger.info(..., extra=self.log_fields)."""
+        return {"window": type(self).__name__, "instance_id": self.instance_id}
+
     @property
     def lifetime_index(self) -> int:
         """Alias for instance_id; 'nth' instance of this class ever created."""
@@ -0,0 +1,164 @@
+# host/gui/common/latency_overlay.py
+
+"""
+GUI side of the latency instrumentation (comms.latency).
+
+FrameLatencyProbe records the three GUI stages for the newest sample of
+each tick: deliver (reader returned it), apply (widgets updated) and paint
+(a probe widget finished painting the update). LatencyOverlay is a small
+corner panel showing the rolling p50/p95/p99 per stage; F12 toggles it,
+CARDINAL_GRIP_LATENCY_OVERLAY=1 shows it at start.
+
+    self.latency_probe = FrameLatencyProbe(self.bar_widgets[0], parent=self)
+    self.latency_overlay = LatencyOverlay(self)
+    ...
+    batch = self.reader.read()
+    self.latency_probe.delivered(self.reader.latest_ts)
+    ...update widgets...
+    self.latency_probe.applied(self.reader.latest_ts)
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Optional
+
+from PyQt6.QtCore import QEvent, QObject, Qt, QTimer
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QLabel, QWidget
+
+from comms.latency import (
+    LATENCY_BUDGET_MS,
+    STAGE_APPLY,
+    STAGE_DELIVER,
+    STAGE_FILTER,
+    STAGE_PAINT,
+    LatencyTracker,
+)
+
+OVERLAY_ENV = "CARDINAL_GRIP_LATENCY_OVERLAY"
+OVERLAY_REFRESH_MS = 500
+OVERLAY_TOGGLE_KEY = Qt.Key.Key_F12
+
+
+class FrameLatencyProbe(QObject):
+    """
+    Per-window GUI stage recorder.
+
+    Paint completion is taken from `widget`, which should be one that
+    repaints whenever new data is applied (a finger bar): the probe's event
+    filter runs the widget's own paintEvent and records once it returns.
+    """
+
+    def __init__(self, widget: QWidget, tracker: Optional[LatencyTracker] = None, parent=None):
+        super().__init__(parent)
+        self.tracker = tracker or LatencyTracker.instance()
+        self.widget = widget
+        self._pending_ts: Optional[float] = None
+        widget.installEventFilter(self)
+
+    def set_widget(self, widget: QWidget) -> None:
+        """Measure paints of another widget (the window rebuilt its bars)."""
+        if widget is self.widget:
+            return
+        try:
+            self.widget.removeEventFilter(self)
+        except RuntimeError:
+            pass    # old widget already deleted
+        self.widget = widget
+        self._pending_ts = None
+        widget.installEventFilter(self)
+
+    def delivered(self, sample_ts: Optional[float]) -> None:
+        if sample_ts is not None:
+            self.tracker.record(STAGE_DELIVER, (time.time() - sample_ts) * 1000.0)
+
+    def applied(self, sample_ts: Optional[float]) -> None:
+        if sample_ts is None:
+            return
+        self.tracker.record(STAGE_APPLY, (time.time() - sample_ts) * 1000.0)
+        # The next paint of the probe widget shows this sample
+        self._pending_ts = sample_ts
+
+    def eventFilter(self, obj, event):
+        if obj is self.widget and event.type() == QEvent.Type.Paint and self._pending_ts is not None:
+            # Paint now so the measurement covers the paint itself; the
+            # widget is already inside its paint event, so this is safe.
+            type(obj).paintEvent(obj, event)
+            self.tracker.record(STAGE_PAINT, (time.time() - self._pending_ts) * 1000.0)
+            self._pending_ts = None
+            return True
+        return super().eventFilter(obj, event)
+
+
+class LatencyOverlay(QLabel):
+    """Top-right corner panel with per-stage percentiles, refreshed ~2 Hz while visible."""
+
+    def __init__(self, parent: QWidget, tracker: Optional[LatencyTracker] = None):
+        super().__init__(parent)
+        self.tracker = tracker or LatencyTracker.instance()
+        self.setFont(QFont("Menlo", 10))
+        self.setTextFormat(Qt.TextFormat.RichText)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setStyleSheet(
+            "background-color: rgba(0, 0, 0, 170); color: white; padding: 6px; border-radius: 4px;"
+        )
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(OVERLAY_REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+        self.setVisible(os.environ.get(OVERLAY_ENV, "") not in ("", "0"))
+
+    def setVisible(self, visible: bool) -> None:
+        super().setVisible(visible)
+        if visible:
+            self.refresh()
+            self._timer.start()
+        else:
+            self._timer.stop()
+
+    def toggle(self) -> None:
+        self.setVisible(not self.isVisible())
+
+    def handle_key(self, event) -> bool:
+        """Call from the window's keyPressEvent; True if the key was the toggle."""
+        if event.key() == OVERLAY_TOGGLE_KEY:
+            self.toggle()
+            return True
+        return False
+
+    def refresh(self) -> None:
+        snap = self.tracker.snapshot()
+        rows = ["<tr><td>stage</td><td align='right'>p50</td><td align='right'>p95</td>"
+                "<td align='right'>p99</td><td align='right'>n</td></tr>"]
+        for stage, st in snap.items():
+            rows.append(
+                f"<tr><td>{stage}</td><td align='right'>{st['p50']:.1f}</td>"
+                f"<td align='right'>{st['p95']:.1f}</td><td align='right'>{st['p99']:.1f}</td>"
+                f"<td align='right'>{st['n']}</td></tr>"
+            )
+
+        paint = snap.get(STAGE_PAINT) or snap.get(STAGE_APPLY)
+        # Filter group delay is signal lag the sample timestamps don't see; count it too
+        filt = snap.get(STAGE_FILTER)
+        filter_ms = filt["p50"] if filt is not None else 0.0
+        if paint is None:
+            verdict = "sample→pixels: waiting for data"
+        else:
+            total = paint["p95"] + filter_ms
+            ok = total <= LATENCY_BUDGET_MS
+            color = "#7CFC00" if ok else "#FF6347"
+            extra = f" + filter {filter_ms:.1f}" if filt is not None else ""
+            verdict = (
+                f"<span style='color:{color}'>sample→pixels p95 {paint['p95']:.1f}{extra} ms "
+                f"(budget {LATENCY_BUDGET_MS:.0f})</span>"
+            )
+
+        self.setText(f"<b>Latency (ms)</b><table cellspacing='4'>{''.join(rows)}</table>{verdict}")
+        self.adjustSize()
+        parent = self.parentWidget()
+        if parent is not None:
+            self.move(max(0, parent.width() - self.width() - 8), 8)
+        self.raise_()
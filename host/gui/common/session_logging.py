@@ -134,6 +134,33 @@ def _insert_into_db(session_dict: dict):
         )
 
 
+def _ensure_scores_table(conn):
+    """
+    Offline re-scoring results, one row per (csv_path, scenario).
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS session_scores (
+            csv_path TEXT NOT NULL,
+            scenario TEXT NOT NULL,
+            scored_at TEXT,
+            tmin REAL,
+            tmax REAL,
+            hold_seconds REAL,
+            combo_hold_seconds REAL,
+            samples INTEGER,
+            duration_s REAL,
+            fingers_used INTEGER,
+            total_reps INTEGER,
+            combo_reps INTEGER,
+            reps_per_channel TEXT,
+            pct_in_band TEXT,
+            PRIMARY KEY (csv_path, scenario)
+        )
+        """
+    )
+
+
 # ---------- PUBLIC API ----------
 
 def log_session_completion(
@@ -220,3 +247,79 @@ def record_session(session_id: str, reps_per_channel, combo_reps: int):
         timestamp=datetime.now(),
         session_id=session_id,
     )
+
+
+def record_session_scores(results, scenario: str):
+    """
+    Insert / replace offline re-scoring results into the SQLite index.
+
+    results  – iterable of dicts as produced by model.session_rescore.score_session
+    scenario – label for the threshold / hold combination, e.g. "band_900_1800_hold_5"
+
+    All rows are written in a single transaction. Returns the row count.
+    """
+    _ensure_db()
+    scored_at = datetime.now().isoformat(timespec="seconds")
+    rows = [
+        (
+            r["csv_path"],
+            scenario,
+            scored_at,
+            float(r["tmin"]),
+            float(r["tmax"]),
+            float(r["hold_seconds"]),
+            float(r["combo_hold_seconds"]),
+            int(r["samples"]),
+            float(r["duration_s"]),
+            int(r["fingers_used"]),
+            int(r["total_reps"]),
+            int(r["combo_reps"]),
+            json.dumps(r["reps_per_channel"]),
+            json.dumps(r["pct_in_band"]),
+        )
+        for r in results
+    ]
+
+    conn = sqlite3.connect(SESSIONS_DB_PATH)
+    try:
+        _ensure_scores_table(conn)
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO session_scores
+            (csv_path, scenario, scored_at, tmin, tmax, hold_seconds, combo_hold_seconds,
+             samples, duration_s, fingers_used, total_reps, combo_reps,
+             reps_per_channel, pct_in_band)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    logger.info(
+        "Recorded %d session score row(s) for scenario %s into SQLite",
+        len(rows),
+        scenario,
+    )
+    return len(rows)
+
+
+def indexed_csv_paths() -> list[str]:
+    """
+    CSV paths referenced by the SQLite session index (existing files only).
+    """
+    _ensure_db()
+    try:
+        conn = sqlite3.connect(SESSIONS_DB_PATH)
+        try:
+            cur = conn.execute(
+                "SELECT DISTINCT csv_path FROM sessions WHERE csv_path IS NOT NULL"
+            )
+            paths = [row[0] for row in cur.fetchall()]
+        finally:
+            conn.close()
+    except Exception:
+        logger.exception("Failed to read csv paths from %s", SESSIONS_DB_PATH)
+        return []
+    return [p for p in paths if p and os.path.isfile(p)]
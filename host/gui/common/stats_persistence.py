@@ -0,0 +1,247 @@
+# host/gui/common/stats_persistence.py
+
+"""
+Debounced, atomic JSON persistence for patient_stats.json.
+
+The game loop used to rewrite the stats file synchronously on every rep and
+combo, i.e. file I/O on the 50 Hz GUI timer. StatsPersister moves that work
+onto a background thread:
+
+  - submit(data) is non-blocking: it just stores the newest snapshot.
+  - A worker thread coalesces snapshots and writes at most every
+    `min_interval` seconds.
+  - flush() forces the pending snapshot to disk (session stop / window close).
+  - Every write goes to a temp file in the same directory, is fsync'ed and
+    then os.replace()'d over the target, so a crash mid-write never leaves
+    a truncated JSON file behind.
+  - All persisters are flushed from an atexit hook, so an unhandled
+    exception that unwinds the interpreter still saves the last snapshot.
+
+Use get_persister(path) so every window writing the same file shares one
+worker instead of racing each other.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import atexit
+import logging
+import tempfile
+import threading
+
+logger = logging.getLogger("cardinal_grip.stats")
+
+DEFAULT_MIN_INTERVAL_S = 2.0
+
+
+def atomic_write_json(path: str, data) -> None:
+    """
+    Write `data` as JSON to `path` atomically (temp file + fsync + rename).
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.",
+        suffix=".tmp",
+        dir=directory,
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class StatsPersister:
+    """
+    Background writer that coalesces JSON snapshots for a single file.
+    """
+
+    def __init__(self, path: str, min_interval: float = DEFAULT_MIN_INTERVAL_S):
+        self.path = path
+        self.min_interval = max(0.0, min_interval)
+
+        self._cond = threading.Condition()
+        self._pending: dict | None = None
+        self._pending_version = 0
+        self._written_version = 0
+        self._flush_requested = False
+        self._running = False
+        self._thread: threading.Thread | None = None
+        self._last_write = 0.0
+
+        logger.debug(
+            "StatsPersister initialized (path=%s, min_interval=%.2fs)",
+            self.path,
+            self.min_interval,
+        )
+
+    # ---------- public API ----------
+
+    def submit(self, data: dict) -> None:
+        """
+        Queue a snapshot for writing. Never blocks on I/O.
+
+        Only the newest snapshot is kept; older unwritten ones are dropped.
+        """
+        with self._cond:
+            self._pending = data
+            self._pending_version += 1
+            self._ensure_thread()
+            self._cond.notify()
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """
+        Write the pending snapshot now and wait until it is on disk.
+
+        Returns True if everything submitted so far has been written.
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            target = self._pending_version
+            if self._written_version >= target:
+                return True
+
+            if not self._running:
+                # Worker already gone (e.g. during interpreter shutdown):
+                # write inline rather than losing the snapshot.
+                self._write_pending_locked()
+                return self._written_version >= target
+
+            self._flush_requested = True
+            self._cond.notify()
+            while self._written_version < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(
+                        "StatsPersister.flush() timed out for %s", self.path
+                    )
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Flush pending data and stop the worker thread."""
+        self.flush(timeout=timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    # ---------- worker ----------
+
+    def _ensure_thread(self) -> None:
+        # Caller holds self._cond
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"StatsPersister({os.path.basename(self.path)})",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        logger.debug("StatsPersister worker started for %s", self.path)
+        with self._cond:
+            while self._running:
+                has_pending = self._written_version < self._pending_version
+                if not has_pending:
+                    self._cond.wait()
+                    continue
+
+                wait_for = self._last_write + self.min_interval - time.monotonic()
+                if wait_for > 0 and not self._flush_requested:
+                    # Debounce: let more updates coalesce into this write.
+                    self._cond.wait(wait_for)
+                    continue
+
+                self._write_pending_locked()
+
+            # Final drain on shutdown
+            if self._written_version < self._pending_version:
+                self._write_pending_locked()
+        logger.debug("StatsPersister worker exiting for %s", self.path)
+
+    def _write_pending_locked(self) -> None:
+        """
+        Write the current snapshot. Called with self._cond held; the lock is
+        released during the actual disk I/O so submit() never waits on it.
+        """
+        data = self._pending
+        version = self._pending_version
+        self._flush_requested = False
+        if data is None:
+            self._written_version = version
+            self._cond.notify_all()
+            return
+
+        self._cond.release()
+        try:
+            t0 = time.perf_counter()
+            atomic_write_json(self.path, data)
+            logger.debug(
+                "Wrote stats to %s in %.1f ms",
+                self.path,
+                (time.perf_counter() - t0) * 1000.0,
+            )
+        except Exception:
+            logger.exception("Failed to save game stats to %s", self.path)
+        finally:
+            self._cond.acquire()
+
+        self._last_write = time.monotonic()
+        # A newer submit() may have landed while we were writing; only mark
+        # the version we actually wrote.
+        self._written_version = max(self._written_version, version)
+        self._cond.notify_all()
+
+
+# ---------- process-wide registry ----------
+
+_persisters: dict[str, StatsPersister] = {}
+_registry_lock = threading.Lock()
+
+
+def get_persister(
+    path: str,
+    min_interval: float = DEFAULT_MIN_INTERVAL_S,
+) -> StatsPersister:
+    """
+    Return the shared StatsPersister for `path`, creating it on first use.
+    """
+    key = os.path.abspath(path)
+    with _registry_lock:
+        persister = _persisters.get(key)
+        if persister is None:
+            persister = StatsPersister(key, min_interval=min_interval)
+            _persisters[key] = persister
+        return persister
+
+
+def flush_all(timeout: float = 2.0) -> None:
+    """Flush every registered persister (used at exit)."""
+    with _registry_lock:
+        persisters = list(_persisters.values())
+    for p in persisters:
+        try:
+            p.close(timeout=timeout)
+        except Exception:
+            logger.exception("Failed to flush stats persister for %s", p.path)
+
+
+atexit.register(flush_all)
@@ -50,15 +50,35 @@ from host.gui.common.session_logging import log_session_completion
 
 # Instance tracking mixin
 from host.gui.common.instance_tracker import InstanceTrackerMixin
+from host.gui.common.force_axis import attach_force_axis, update_force_axis
+from host.gui.common.latency_overlay import FrameLatencyProbe, LatencyOverlay
 
 # ========= BACKEND SELECTION (REAL SERIAL VS SIMULATED) =========
+from model.zones import ZONE_IN, ZONE_LOW, ZoneTracker
+from model.units import ForceScale
+from model.calibration_store import calibration_ref
+from model.session_store import write_session_meta
 from comms.serial_backend import auto_detect_port
 from comms.serial_backend import SerialBackend
 # from comms.sim_backend import SimBackend as SerialBackend
+from comms.acquisition_hub import open_shared_backend
+from comms.filters import DEFAULT_FILTER_SPEC
+from comms.calibrated_reader import CalibratedReader
+from comms.base_backend import backend_stats
+from comms.latency import LatencyTracker
+from comms.channel_layout import DEFAULT_NUM_CHANNELS, backend_channel_names, backend_num_channels, channel_names
 # ================================================================
 
-NUM_CHANNELS = 4
-CHANNEL_NAMES = ["Digitus Indicis", "Digitus Medius", "Digitus Annularis", "Digitus Minimus"]
+# Until a backend reports its own layout (comms.channel_layout)
+NUM_CHANNELS = DEFAULT_NUM_CHANNELS
+CHANNEL_NAMES = [
+    "Digitus Indicis", "Digitus Medius", "Digitus Annularis", "Digitus Minimus",
+    "Pollex", "Palma",
+]
+CURVE_COLORS = ["r", "g", "b", "y", "m", "c", "w"]
+
+# Backend-side smoothing (comms.filters); "" = raw ADC values
+SIGNAL_FILTERS = DEFAULT_FILTER_SPEC
 
 
 class PatientWindow(InstanceTrackerMixin, QWidget):
@@ -87,10 +107,24 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
         self.backend: SerialBackend | None = None
         self.start_time = None
 
+        # Channel count / names follow the connected device (_apply_channel_layout)
+        self.num_channels = NUM_CHANNELS
+        self.channel_names = channel_names(NUM_CHANNELS, CHANNEL_NAMES)
+
         # values[c] is a deque of samples for channel c
-        self.values = [deque(maxlen=2000) for _ in range(NUM_CHANNELS)]
+        self.values = [deque(maxlen=2000) for _ in range(self.num_channels)]
+        self.forces = [deque(maxlen=2000) for _ in range(self.num_channels)]   # same samples, display unit
         self.times = deque(maxlen=2000)   # shared time axis
 
+        # ADC -> N / lbf (settings "units" + current glove calibration);
+        # applied once per batch by the reader, see poll_sensor
+        self.force_scale, self.calibration_doc = ForceScale.from_settings(num_channels=self.num_channels)
+        self.reader: CalibratedReader | None = None
+        self._zones = None
+
+        # Debounced zones for the status line (same rules as the game)
+        self.zone_tracker = ZoneTracker(self.num_channels)
+
         # ---------- MAIN LAYOUT ----------
         main_layout = QVBoxLayout()
         self.setLayout(main_layout)
@@ -105,7 +139,7 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
 
         # --- Placeholder to auto-detected port, if any ---
         try:
-            detected = auto_detect_port()
+            detected = auto_detect_port(probe=False)
         except Exception:
             logger.exception("auto_detect_port failed")
             detected = None
@@ -152,7 +186,7 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
         band_layout.addWidget(self.target_min_slider)
 
         self.target_min_value_label = QLabel(str(self.target_min_slider.value()))
-        self.target_min_value_label.setFixedWidth(60)
+        self.target_min_value_label.setFixedWidth(110)
         self.target_min_value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         band_layout.addWidget(self.target_min_value_label)
 
@@ -163,7 +197,7 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
         band_layout.addWidget(self.target_max_slider)
 
         self.target_max_value_label = QLabel(str(self.target_max_slider.value()))
-        self.target_max_value_label.setFixedWidth(60)
+        self.target_max_value_label.setFixedWidth(110)
         self.target_max_value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         band_layout.addWidget(self.target_max_value_label)
 
@@ -177,52 +211,24 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
         self.target_min_slider.valueChanged.connect(self._update_band_visuals)
         self.target_max_slider.valueChanged.connect(self._update_band_visuals)
 
-        # ===== CENTER: Four finger bars =====
-        bars_row = QHBoxLayout()
-        main_layout.addLayout(bars_row)
+        # ===== CENTER: one bar per channel =====
+        self.bars_row = QHBoxLayout()
+        main_layout.addLayout(self.bars_row)
 
         self.bar_widgets = []
         self.value_labels = []
+        self._build_bars()
 
-        for i in range(NUM_CHANNELS):
-            col = QVBoxLayout()
-
-            name_label = QLabel(CHANNEL_NAMES[i])
-            name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            name_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-            col.addWidget(name_label)
-
-            bar = QProgressBar()
-            bar.setOrientation(Qt.Orientation.Vertical)
-            bar.setRange(0, 4095)
-            bar.setValue(0)
-            bar.setFixedWidth(60)
-            col.addWidget(bar, stretch=1, alignment=Qt.AlignmentFlag.AlignHCenter)
-            self.bar_widgets.append(bar)
-
-            val_label = QLabel("Force: 0")
-            val_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            col.addWidget(val_label)
-            self.value_labels.append(val_label)
-
-            bars_row.addLayout(col)
-
-        # ===== PLOT: 4 curves over time =====
+        # ===== PLOT: one curve per channel over time =====
         self.plot_widget = pg.PlotWidget()
         self.plot_widget.setLabel("left", "Force", units="ADC")
         self.plot_widget.setLabel("bottom", "Time", units="s")
         self.plot_widget.addLegend()
+        self.force_axis = attach_force_axis(self.plot_widget, self.force_scale)
         main_layout.addWidget(self.plot_widget, stretch=1)
 
-        colors = ["r", "g", "b", "y"]
         self.curves = []
-        for c in range(NUM_CHANNELS):
-            curve = self.plot_widget.plot(
-                [], [],
-                pen=pg.mkPen(colors[c % len(colors)], width=2),
-                name=f"Ch{c} ({CHANNEL_NAMES[c]})",
-            )
-            self.curves.append(curve)
+        self._build_curves()
 
         # ---- Threshold lines on plot ----
         initial_tmin = self.target_min_slider.value()
@@ -285,8 +291,84 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
         self.timer.setInterval(20)  # 20 ms -> ~50 Hz
         self.timer.timeout.connect(self.poll_sensor)
 
+        # ===== LATENCY: GUI stages + F12 overlay =====
+        self.latency_probe = FrameLatencyProbe(self.bar_widgets[0], parent=self)
+        self.latency_overlay = LatencyOverlay(self)
+
         self.setFocus()
 
+    # ---------- CHANNEL LAYOUT ----------
+
+    def _build_bars(self):
+        for i in range(self.num_channels):
+            col = QVBoxLayout()
+
+            name_label = QLabel(self.channel_names[i])
+            name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            name_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+            col.addWidget(name_label)
+
+            bar = QProgressBar()
+            bar.setOrientation(Qt.Orientation.Vertical)
+            bar.setRange(0, 4095)
+            bar.setValue(0)
+            bar.setFixedWidth(60)
+            col.addWidget(bar, stretch=1, alignment=Qt.AlignmentFlag.AlignHCenter)
+            self.bar_widgets.append(bar)
+
+            val_label = QLabel("Force: 0")
+            val_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            col.addWidget(val_label)
+            self.value_labels.append(val_label)
+
+            self.bars_row.addLayout(col)
+
+    def _build_curves(self):
+        for c in range(self.num_channels):
+            curve = self.plot_widget.plot(
+                [], [],
+                pen=pg.mkPen(CURVE_COLORS[c % len(CURVE_COLORS)], width=2),
+                name=f"Ch{c} ({self.channel_names[c]})",
+            )
+            self.curves.append(curve)
+
+    def _apply_channel_layout(self, backend):
+        """Resize bars, curves and per-channel state to the backend's channels."""
+        n = backend_num_channels(backend)
+        names = backend_channel_names(backend, CHANNEL_NAMES, n)
+        if n == self.num_channels and names == self.channel_names:
+            return
+        logger.info(
+            "PatientWindow #%d channel layout: %d channels (%s)",
+            self.instance_id,
+            n,
+            ", ".join(names),
+        )
+        self.num_channels = n
+        self.channel_names = names
+
+        while self.bars_row.count():
+            col = self.bars_row.takeAt(0).layout()
+            while col is not None and col.count():
+                w = col.takeAt(0).widget()
+                if w is not None:
+                    w.deleteLater()
+        self.bar_widgets = []
+        self.value_labels = []
+        self._build_bars()
+        self.latency_probe.set_widget(self.bar_widgets[0])
+
+        for curve in self.curves:
+            self.plot_widget.removeItem(curve)
+        self.curves = []
+        self._build_curves()
+
+        self.values = [deque(maxlen=2000) for _ in range(n)]
+        self.forces = [deque(maxlen=2000) for _ in range(n)]
+        self.times.clear()
+        self.zone_tracker = ZoneTracker(n)
+        self._zones = None
+
     # ---------- BAND VISUALS / HELPERS ----------
 
     def _update_band_visuals(self):
@@ -299,8 +381,8 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
             self.target_max_slider.setValue(tmax)
             self.target_max_slider.blockSignals(False)
 
-        self.target_min_value_label.setText(str(tmin))
-        self.target_max_value_label.setText(str(tmax))
+        self.target_min_value_label.setText(self._band_text(tmin))
+        self.target_max_value_label.setText(self._band_text(tmax))
 
         if hasattr(self, "min_line") and self.min_line is not None:
             self.min_line.setPos(tmin)
@@ -310,6 +392,24 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
     def _update_band_labels(self):
         self._update_band_visuals()
 
+    def _band_text(self, adc: int) -> str:
+        """Threshold label: ADC, plus the channel-averaged force when calibrated."""
+        force = self.force_scale.convert_mean(adc)
+        if force is None:
+            return str(adc)
+        return f"{adc} (≈{self.force_scale.format(force)})"
+
+    def _force_text(self, adc: int, force) -> str:
+        if force is None:
+            return f"Force: {adc}"
+        return f"Force: {adc} · {self.force_scale.format(force)}"
+
+    def _reload_force_scale(self):
+        """Pick up units / calibration changes made since the window opened."""
+        self.force_scale, self.calibration_doc = ForceScale.from_settings(num_channels=self.num_channels)
+        update_force_axis(self.force_axis, self.force_scale)
+        self._update_band_visuals()
+
     # ---------- HOVER HANDLER ----------
 
     def _on_plot_mouse_moved(self, pos):
@@ -326,7 +426,11 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
 
         self.v_line.setPos(t)
         self.h_line.setPos(y)
-        self.hover_label.setText(f"t = {t:0.2f} s, Force = {y:0.1f} ADC")
+        text = f"t = {t:0.2f} s, Force = {y:0.1f} ADC"
+        force = self.force_scale.convert_mean(y)
+        if force is not None:
+            text += f" (≈{self.force_scale.format(force)})"
+        self.hover_label.setText(text)
 
     # ---------- CONNECTION LOGIC ----------
 
@@ -355,10 +459,11 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
             port_arg = port_text
 
         try:
-            # self.backend = SerialBackend(port=port_arg, baud=baud, timeout=0.01, num_channels=1) #NOTE: testing 1 fsr
-            # self.backend = SerialBackend(port=port_arg, baud=baud, timeout=0.01, num_channels=4) #NOTE: testing 4 fsrs
-            self.backend = SerialBackend(port=port_arg, baud=baud, timeout=0.01) #NOTE: UNCOMMENT for real application
-            self.backend.start()
+            # Shared through the acquisition hub: other windows / processes on the
+            # same device get their own lease instead of a second serial connection.
+            # self.backend = open_shared_backend(SerialBackend, port=port_arg, baud=baud, timeout=0.01, filters=SIGNAL_FILTERS, num_channels=1) #NOTE: testing 1 fsr
+            # self.backend = open_shared_backend(SerialBackend, port=port_arg, baud=baud, timeout=0.01, filters=SIGNAL_FILTERS, num_channels=4) #NOTE: testing 4 fsrs
+            self.backend = open_shared_backend(SerialBackend, port=port_arg, baud=baud, timeout=0.01, filters=SIGNAL_FILTERS) #NOTE: UNCOMMENT for real application
         except Exception as e:
             logger.exception("Failed to open serial port %s", port_arg or "(auto-detect)")
             QMessageBox.critical(
@@ -383,6 +488,7 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
             self.instance_id,
             actual_port,
             baud,
+            extra={**self.log_fields, "backend": backend_stats(self.backend)},
         )
 
     def handle_disconnect(self):
@@ -390,25 +496,29 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
         if self.backend is not None:
             self.backend.stop()
             self.backend = None
+        self.reader = None
 
         self.status_label.setText("Status: Disconnected")
         self.connect_button.setEnabled(True)
         self.disconnect_button.setEnabled(False)
 
-        logger.info("PatientWindow #%d is Disconnected", self.instance_id)
+        logger.info("PatientWindow #%d is Disconnected", self.instance_id, extra=self.log_fields)
 
     # ---------- SESSION RESET ----------
 
     def reset_session(self):
-        for c in range(NUM_CHANNELS):
+        for c in range(self.num_channels):
             self.values[c].clear()
+            self.forces[c].clear()
         self.times.clear()
         self.start_time = time.time()
+        self.zone_tracker.reset()
+        self._zones = None
 
         for curve in self.curves:
             curve.setData([], [])
 
-        for i in range(NUM_CHANNELS):
+        for i in range(self.num_channels):
             self.bar_widgets[i].setValue(0)
             self.value_labels[i].setText("Force: 0")
 
@@ -421,18 +531,26 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
     def poll_sensor(self):
         if self.backend is None:
             return
+        if self.reader is None or self.reader.backend is not self.backend:
+            # New backend (connect, or handed over by the dual launcher)
+            self._apply_channel_layout(self.backend)
+            self._reload_force_scale()
+            self.reader = CalibratedReader(self.backend, self.force_scale, num_channels=self.num_channels)
 
         now_gui = time.time()
 
-        vals = self.backend.get_latest()
+        # One backend read and one calibration lookup per tick; every widget
+        # below uses the converted batch / latest sample cached by the reader.
+        batch = self.reader.read()
+        vals = self.reader.latest_adc
         if vals is None:
             return
+        forces = self.reader.latest_force
+        last_ts = self.reader.latest_ts
+        if len(batch):
+            self.latency_probe.delivered(last_ts)
 
         # Latency measurement via BaseBackend API
-        last_ts = None
-        if hasattr(self.backend, "get_last_timestamp"):
-            last_ts = self.backend.get_last_timestamp()
-
         if last_ts is not None:
             age_ms = (now_gui - last_ts) * 1000.0
             # print every ~10th tick to avoid spam
@@ -443,19 +561,15 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
                     type(self).active_count(),
                     type(self).lifetime_count(),
                     age_ms,
-                    vals,
+                    vals.tolist(),
+                    extra={
+                        **self.log_fields,
+                        "age_ms": round(age_ms, 1),
+                        "batch": len(batch),
+                        "backend": backend_stats(self.backend),
+                    },
                 )
 
-        if isinstance(vals, (int, float)):
-            vals = [int(vals)] * NUM_CHANNELS
-        elif isinstance(vals, (list, tuple)):
-            vals = list(vals)
-        else:
-            return
-
-        if len(vals) < NUM_CHANNELS:
-            vals += [0] * (NUM_CHANNELS - len(vals))
-
         now = time.time()
         if self.start_time is None:
             self.start_time = now
@@ -466,40 +580,43 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
         tmin = self.target_min_slider.value()
         tmax = self.target_max_slider.value()
 
-        zones = []
-
-        for c in range(NUM_CHANNELS):
-            v = max(0, min(4095, int(vals[c])))
+        for c in range(self.num_channels):
+            v = int(vals[c])
+            f = float(forces[c]) if forces is not None else None
             self.values[c].append(v)
+            self.forces[c].append(f)
 
             self.bar_widgets[c].setValue(v)
-            self.value_labels[c].setText(f"Force: {v}")
-
-            if tmin <= v <= tmax:
-                zone = "in"
-            elif v < tmin:
-                zone = "low"
-            else:
-                zone = "high"
-            zones.append(zone)
-
-        parts = []
-        for name, zone in zip(CHANNEL_NAMES, zones):
-            if zone == "in":
-                sym = "✅"
-            elif zone == "low":
-                sym = "⬆️"
-            else:
-                sym = "⬇️"
-            parts.append(f"{name}:{sym}")
-        self.status_label.setText("Status: " + "  ".join(parts))
+            self.value_labels[c].setText(self._force_text(v, f))
+
+        # Zones follow every backend sample (dwell timing), not just the latest
+        if len(batch):
+            self._zones = self.zone_tracker.update(batch.ts, batch.adc, tmin, tmax)[-1]
+        if self._zones is not None:
+            parts = []
+            for name, zone in zip(self.channel_names, self._zones):
+                if zone == ZONE_IN:
+                    sym = "✅"
+                elif zone == ZONE_LOW:
+                    sym = "⬆️"
+                else:
+                    sym = "⬇️"
+                parts.append(f"{name}:{sym}")
+            status = "Status: " + "  ".join(parts)
+            if status != self.status_label.text():
+                self.status_label.setText(status)
 
         t_list = list(self.times)
-        for c in range(NUM_CHANNELS):
+        for c in range(self.num_channels):
             self.curves[c].setData(t_list, list(self.values[c]))
 
+        if len(batch):
+            self.latency_probe.applied(last_ts)
+
     # ==== SIM BACKEND / KEYBOARD INPUT HOOK (comment out for real hardware) ====
     def keyPressEvent(self, event):
+        if self.latency_overlay.handle_key(event):
+            return
         if self.backend is not None and hasattr(self.backend, "handle_char"):
             ch = event.text()
             if ch:
@@ -540,25 +657,52 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
         tmin = self.target_min_slider.value()
         tmax = self.target_max_slider.value()
 
+        # Force columns (display unit) follow the ADC columns when calibrated;
+        # readers that only know ch{c}_adc / tmin_adc / tmax_adc are unaffected
+        scale = self.force_scale
+        with_force = scale.calibrated
+        unit_suffix = scale.unit.lower()
+
         try:
             with open(path, "w", newline="") as f:
                 writer = csv.writer(f)
                 header = (
                     ["time_s"]
-                    + [f"ch{c}_adc" for c in range(NUM_CHANNELS)]
+                    + [f"ch{c}_adc" for c in range(self.num_channels)]
                     + ["tmin_adc", "tmax_adc"]
                 )
+                if with_force:
+                    header += [f"ch{c}_{unit_suffix}" for c in range(self.num_channels)]
                 writer.writerow(header)
 
                 length = len(self.times)
                 for i in range(length):
                     row = [self.times[i]]
-                    for c in range(NUM_CHANNELS):
+                    for c in range(self.num_channels):
                         row.append(self.values[c][i])
                     row.append(tmin)
                     row.append(tmax)
+                    if with_force:
+                        for c in range(self.num_channels):
+                            fv = self.forces[c][i]
+                            row.append("" if fv is None else f"{fv:.3f}")
                     writer.writerow(row)
 
+            try:
+                write_session_meta(
+                    path,
+                    {
+                        "source": "patient_app",
+                        "num_channels": self.num_channels,
+                        "channel_names": self.channel_names,
+                        "force_unit": scale.unit if with_force else None,
+                        "calibration": calibration_ref(self.calibration_doc),
+                        "saved_on": datetime.now().isoformat(timespec="seconds"),
+                    },
+                )
+            except Exception:
+                logger.exception("Failed to write session metadata for %s", path)
+
             QMessageBox.information(self, "Saved", f"Session saved to:\n{path}")
             logger.info(
                 "PatientWindow #%d session CSV saved to %s",
@@ -592,6 +736,7 @@ class PatientWindow(InstanceTrackerMixin, QWidget):
             "PatientWindow #%d closeEvent called (active=%d)",
             self.instance_id,
             type(self).active_count(),
+            extra={**self.log_fields, "latency_ms": LatencyTracker.instance().snapshot()},
         )
         # Do NOT manually decrement counters; InstanceTrackerMixin
         # will update on QObject.destroyed.
@@ -4,6 +4,7 @@ import os
 import sys
 import json
 import logging
+import argparse
 from datetime import datetime, date
 
 from PyQt6.QtCore import Qt, QDate
@@ -45,6 +46,7 @@ SESSIONS_JSON_PATH = os.path.join(DATA_DIR, "sessions_log.json")
 
 # ---------- LOGGING SETUP ----------
 from logger.app_logging import configure_logging
+from logger.profiling import add_profile_argument, start_profiling
 
 # Logging setup constants (configure_logging is only called in main())
 LOG_DIR = os.path.join(PROJECT_ROOT, "logger")  # logs in logger directory
@@ -819,17 +821,27 @@ class PatientShellWindow(QWidget):
 # =====================================================================
 
 def main():
+    parser = argparse.ArgumentParser(description="Patient Dashboard")
+    add_profile_argument(parser)
+    # Anything unrecognised is left for Qt (-style, -platform, ...)
+    args, qt_args = parser.parse_known_args()
+
     # Configure logging for this process (console + file)
     configure_logging(LOG_FILE)
     logger.info("Patient Dashboard Qt App Launching")
 
-    app = QApplication(sys.argv)
+    app = QApplication([sys.argv[0]] + qt_args)
+    # Wrap before any window exists: timers bind the (wrapped) methods on creation
+    profiler = start_profiling("patient_dashboard", args.profile) if args.profile else None
     win = PatientShellWindow()
     win.show()
     logger.info("Patient Dashboard Qt App Launched")
 
     exit_code = app.exec()
 
+    if profiler is not None:
+        profiler.stop()
+
     logger.info("Patient Dashboard Qt App Closed with exit code %d", exit_code)
     sys.exit(exit_code)
 
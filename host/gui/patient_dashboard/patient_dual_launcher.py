@@ -7,7 +7,8 @@ Dual view launcher:
 
 Design:
   * PatientGameWindow owns the backend and handles connect()/disconnect().
-  * Dual view reuses that backend for PatientWindow (monitor).
+  * Dual view gives PatientWindow (monitor) a second lease on the same
+    device through comms.acquisition_hub.
   * ONE shared Min/Max ADC slider pair lives in the dual view and
     drives both child windows' thresholds + visuals.
   * Session logging:
@@ -121,7 +122,7 @@ class DualPatientGameWindow(InstanceTrackerMixin, QWidget):
         self.port_edit.setFixedWidth(220)
         # --- Placeholder to auto-detected port, if any ---
         try:
-            detected = auto_detect_port()
+            detected = auto_detect_port(probe=False)
         except Exception:
             logger.exception("auto_detect_port failed in dual launcher")
             detected = None
@@ -176,7 +177,7 @@ class DualPatientGameWindow(InstanceTrackerMixin, QWidget):
         band_layout.addWidget(self.shared_min_slider)
 
         self.shared_min_label = QLabel("1200")
-        self.shared_min_label.setFixedWidth(60)
+        self.shared_min_label.setFixedWidth(110)
         self.shared_min_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         band_layout.addWidget(self.shared_min_label)
 
@@ -189,7 +190,7 @@ class DualPatientGameWindow(InstanceTrackerMixin, QWidget):
         band_layout.addWidget(self.shared_max_slider)
 
         self.shared_max_label = QLabel("2000")
-        self.shared_max_label.setFixedWidth(60)
+        self.shared_max_label.setFixedWidth(110)
         self.shared_max_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         band_layout.addWidget(self.shared_max_label)
 
@@ -276,9 +277,9 @@ class DualPatientGameWindow(InstanceTrackerMixin, QWidget):
         tmin = self.shared_min_slider.value()
         tmax = self.shared_max_slider.value()
 
-        # update labels
-        self.shared_min_label.setText(str(tmin))
-        self.shared_max_label.setText(str(tmax))
+        # update labels (ADC, plus force when the glove is calibrated)
+        self.shared_min_label.setText(self.patient_window._band_text(tmin))
+        self.shared_max_label.setText(self.patient_window._band_text(tmax))
 
         # Game window thresholds
         try:
@@ -353,8 +354,11 @@ class DualPatientGameWindow(InstanceTrackerMixin, QWidget):
 
         self.shared_backend = backend
 
-        # Share backend with patient monitor
-        self.patient_window.backend = backend
+        # Give the patient monitor its own lease on the same device, so each
+        # window's disconnect only releases its own subscription.
+        self.patient_window.backend = (
+            backend.share() if hasattr(backend, "share") else backend
+        )
         if hasattr(self.patient_window, "reset_session"):
             self.patient_window.reset_session()
         if hasattr(self.patient_window, "timer"):
@@ -5,9 +5,10 @@ import sys
 import json
 import time
 import logging
+import argparse
 from datetime import datetime
 
-from PyQt6.QtCore import QTimer, Qt, QUrl
+from PyQt6.QtCore import QTimer, Qt
 from PyQt6.QtWidgets import (
     QApplication,
     QWidget,
@@ -22,9 +23,9 @@ from PyQt6.QtWidgets import (
     QGroupBox,
 )
 from PyQt6.QtGui import QFont, QPainter, QPen, QColor
-from PyQt6.QtMultimedia import QSoundEffect
 
 from logger.app_logging import configure_logging
+from logger.profiling import add_profile_argument, start_profiling
 
 # -------- PATH SETUP --------
 PATIENT_DASHBOARD_DIR = os.path.dirname(__file__)   # .../host/gui/patient_dashboard
@@ -44,18 +45,68 @@ logger = logging.getLogger("cardinal_grip.gui.patient_game")
 
 from host.gui.common.session_logging import log_session_completion
 from host.gui.common.instance_tracker import InstanceTrackerMixin
+from host.gui.common.stats_persistence import get_persister
+from host.gui.common.audio_cues import AudioCueManager
+from host.gui.common.latency_overlay import FrameLatencyProbe, LatencyOverlay
+from model.rep_engine import (
+    RepEngine,
+    EVENT_ENTER,
+    EVENT_REP,
+    EVENT_COMBO_ENTER,
+    EVENT_COMBO_FAIL,
+    EVENT_COMBO,
+)
+from model.zones import ZoneTracker, zone_color
+from model.units import ForceScale
 
 # ========= BACKEND SELECTION (REAL SERIAL VS SIMULATED) =========
 from comms.serial_backend import auto_detect_port
 from comms.serial_backend import SerialBackend
 # from comms.sim_backend import SimBackend as SerialBackend
+from comms.acquisition_hub import open_shared_backend
+from comms.filters import DEFAULT_FILTER_SPEC
+from comms.calibrated_reader import CalibratedReader
+from comms.base_backend import backend_stats
+from comms.latency import LatencyTracker
+from comms.channel_layout import (
+    CHANNEL_NAMES,
+    DEFAULT_NUM_CHANNELS,
+    backend_channel_names,
+    backend_num_channels,
+    channel_names,
+)
 # ================================================================
 
-NUM_CHANNELS = 4
-CHANNEL_NAMES = ["Index", "Middle", "Ring", "Pinky"]
+# Until a backend reports its own layout (comms.channel_layout)
+NUM_CHANNELS = DEFAULT_NUM_CHANNELS
+
+# Backend-side smoothing (comms.filters); "" = raw ADC values
+SIGNAL_FILTERS = DEFAULT_FILTER_SPEC
 
 HOLD_SECONDS = 5.0  # seconds in-band to count a rep
 
+# Zone color -> chunk color, and the full bar stylesheet for each, built once
+BAR_PALETTE = {
+    "orange": "#FF9800",
+    "yellow": "#FFEB3B",
+    "yellowgreen": "#CDDC39",
+    "green": "#4CAF50",
+    "darkgreen": "#2E7D32",
+    "darkred": "#B71C1C",
+    "red": "#F44336",
+}
+BAR_STYLESHEETS = {
+    name: (
+        "QProgressBar {"
+        "  border: 1px solid #999;"
+        "  border-radius: 3px;"
+        "  background: #eee;"
+        "}"
+        f"QProgressBar::chunk {{ background-color: {chunk_color}; }}"
+    )
+    for name, chunk_color in BAR_PALETTE.items()
+}
+
 
 class ThresholdProgressBar(QProgressBar):
     """Vertical progress bar with faint dashed lines for min/max thresholds."""
@@ -106,6 +157,17 @@ class ThresholdProgressBar(QProgressBar):
         painter.end()
 
 
+def _fit_reps(reps, num_channels: int) -> list[int]:
+    """Persisted per-channel reps resized to num_channels (pad with 0 / drop extras)."""
+    out = []
+    for r in list(reps)[:num_channels]:
+        try:
+            out.append(int(r))
+        except (TypeError, ValueError):
+            out.append(0)
+    return out + [0] * (num_channels - len(out))
+
+
 class PatientGameWindow(InstanceTrackerMixin, QWidget):
     def __init__(self, parent=None, log_to_json: bool = True):
         """
@@ -136,37 +198,45 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
         self.backend: SerialBackend | None = None
         self.last_time = None
 
-        self.hold_time = [0.0] * NUM_CHANNELS
-        self.in_band_prev = [False] * NUM_CHANNELS
-
-        self.combo_hold_time = 0.0
         self.combo_reps = 0
-        self.last_all_in_band = False
+
+        # Channel count / names follow the connected device (_apply_channel_layout)
+        self.num_channels = NUM_CHANNELS
+        self.channel_names = channel_names(NUM_CHANNELS, CHANNEL_NAMES)
+
+        # Drains the backend each tick and converts the batch to force once
+        # (settings "units" + current glove calibration)
+        self.force_scale, self.calibration_doc = ForceScale.from_settings(num_channels=self.num_channels)
+        self.reader: CalibratedReader | None = None
 
         self.session_start_time: float | None = None
         self.current_session_id: str | None = None
 
         # Persistent stats (cumulative, for patient_stats.json)
-        self.reps_per_channel = [0] * NUM_CHANNELS
+        self.reps_per_channel = [0] * self.num_channels
         self.sessions_completed = 0
         self.stats_path = os.path.join(PROJECT_ROOT, "data", "patient_stats.json")
         self._load_stats()
+        # Debounced background writer; never touches disk from game_tick
+        self._stats_writer = get_persister(self.stats_path)
+
+        # Rep / combo rules live in the GUI-independent engine, seeded with
+        # the persisted cumulative counts. reps_per_channel is shared by
+        # reference; combo_reps is copied back after each batch.
+        # Zone hysteresis + dwell keeps single noisy samples from ending holds
+        # or retriggering the in-band cue.
+        self._make_rep_engine()
 
         self.emoji_cycle = ["👍", "👏", "🙌", "👌"]
         self.emoji_index = 0
 
-        # Audio
-        self.sounds: dict[str, QSoundEffect | None] = {}
-        self._init_sounds()
+        # Audio (cues are shared across windows; see AudioCueManager)
+        self.audio = AudioCueManager.instance()
         self.combo_fail_sounds = [
-            self.sounds.get("oof"),
-            self.sounds.get("spongebob"),
-            self.sounds.get("bruh"),
+            c for c in ("oof", "spongebob", "bruh") if self.audio.has_cue(c)
         ]
         self.combo_success_sounds = [
-            self.sounds.get("rizz"),
-            self.sounds.get("wow"),
-            self.sounds.get("yay"),
+            c for c in ("rizz", "wow", "yay") if self.audio.has_cue(c)
         ]
         self.combo_fail_index = 0
         self.combo_success_index = 0
@@ -184,7 +254,7 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
         self.port_edit.setFixedWidth(220)
 
         try:
-            detected = auto_detect_port()
+            detected = auto_detect_port(probe=False)
         except Exception:
             detected = None
 
@@ -239,7 +309,7 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
         band_layout.addWidget(self.target_min_slider)
 
         self.target_min_value_label = QLabel(str(self.target_min_slider.value()))
-        self.target_min_value_label.setFixedWidth(60)
+        self.target_min_value_label.setFixedWidth(110)
         self.target_min_value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         band_layout.addWidget(self.target_min_value_label)
 
@@ -250,7 +320,7 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
         band_layout.addWidget(self.target_max_slider)
 
         self.target_max_value_label = QLabel(str(self.target_max_slider.value()))
-        self.target_max_value_label.setFixedWidth(60)
+        self.target_max_value_label.setFixedWidth(110)
         self.target_max_value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         band_layout.addWidget(self.target_max_value_label)
 
@@ -265,49 +335,20 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
         self.target_max_slider.valueChanged.connect(self._on_max_slider_changed)
 
         # ----- Center: per-finger bars -----
-        center_row = QHBoxLayout()
-        main_layout.addLayout(center_row, stretch=1)
+        self.center_row = QHBoxLayout()
+        main_layout.addLayout(self.center_row, stretch=1)
 
         self.bar_widgets: list[ThresholdProgressBar] = []
         self.value_labels: list[QLabel] = []
         self.countdown_labels: list[QLabel] = []
         self.rep_labels: list[QLabel] = []
 
-        for i in range(NUM_CHANNELS):
-            col = QVBoxLayout()
+        # Last applied zone color / label text per widget, so game_tick only
+        # re-styles (expensive re-polish) or re-lays-out on actual changes.
+        self._bar_colors: list[str | None] = [None] * self.num_channels
+        self._label_texts: dict[int, str] = {}
 
-            name_label = QLabel(CHANNEL_NAMES[i])
-            name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            name_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-            col.addWidget(name_label)
-
-            bar = ThresholdProgressBar()
-            bar.setOrientation(Qt.Orientation.Vertical)
-            bar.setRange(0, 4095)
-            bar.setValue(0)
-            bar.setFixedWidth(60)
-            bar.setStyleSheet("QProgressBar::chunk { background-color: orange; }")
-            col.addWidget(bar, stretch=1, alignment=Qt.AlignmentFlag.AlignHCenter)
-            self.bar_widgets.append(bar)
-
-            val_label = QLabel("Force: 0")
-            val_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            col.addWidget(val_label)
-            self.value_labels.append(val_label)
-
-            cd_label = QLabel("Hold: –")
-            cd_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            cd_label.setStyleSheet("font-size: 11pt;")
-            col.addWidget(cd_label)
-            self.countdown_labels.append(cd_label)
-
-            rep_label = QLabel(f"Reps: {self.reps_per_channel[i]}")
-            rep_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            rep_label.setStyleSheet("font-size: 11pt; font-weight: bold;")
-            col.addWidget(rep_label)
-            self.rep_labels.append(rep_label)
-
-            center_row.addLayout(col)
+        self._build_bars()
 
         self._update_band_labels()
 
@@ -365,71 +406,143 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
         self.timer.setInterval(20)  # 20 ms -> ~50 Hz
         self.timer.timeout.connect(self.game_tick)
 
-    # -------- Audio helpers --------
+        # Latency: GUI stages + F12 overlay
+        self.latency_probe = FrameLatencyProbe(self.bar_widgets[0], parent=self)
+        self.latency_overlay = LatencyOverlay(self)
+
+    # -------- Channel layout --------
+
+    def _build_bars(self):
+        # One container widget per column, so a layout change can drop a
+        # whole column (widgets and layout) with one deleteLater()
+        for i in range(self.num_channels):
+            column = QWidget()
+            col = QVBoxLayout(column)
+            col.setContentsMargins(0, 0, 0, 0)
+
+            name_label = QLabel(self.channel_names[i])
+            name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            name_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+            col.addWidget(name_label)
+
+            bar = ThresholdProgressBar()
+            bar.setOrientation(Qt.Orientation.Vertical)
+            bar.setRange(0, 4095)
+            bar.setValue(0)
+            bar.setFixedWidth(60)
+            bar.setStyleSheet("QProgressBar::chunk { background-color: orange; }")
+            col.addWidget(bar, stretch=1, alignment=Qt.AlignmentFlag.AlignHCenter)
+            self.bar_widgets.append(bar)
 
-    def _init_sounds(self):
-        audio_dir = os.path.join(PROJECT_ROOT, "audio")
-
-        def make_sound(filename: str) -> QSoundEffect | None:
-            path = os.path.join(audio_dir, filename)
-            if not os.path.isfile(path):
-                return None
-            s = QSoundEffect()
-            s.setSource(QUrl.fromLocalFile(path))
-            s.setVolume(0.9)
-            return s
-
-        self.sounds["applepay"] = make_sound("applepay_mono.wav")
-        self.sounds["bruh"] = make_sound("bruh_mono.wav")
-        self.sounds["duolingo"] = make_sound("duolingo_mono.wav")
-        self.sounds["mario"] = make_sound("mario_mono.wav")
-        self.sounds["oof"] = make_sound("oof_mono.wav")
-        self.sounds["rizz"] = make_sound("rizz_mono.wav")
-        self.sounds["spongebob"] = make_sound("spongebob_mono.wav")
-        self.sounds["wow"] = make_sound("wow_mono.wav")
-        self.sounds["yay"] = make_sound("yay_mono.wav")
-
-    def _play_sound(self, sound: QSoundEffect | None):
-        if sound is None:
+            val_label = QLabel("Force: 0")
+            val_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            col.addWidget(val_label)
+            self.value_labels.append(val_label)
+
+            cd_label = QLabel("Hold: –")
+            cd_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            cd_label.setStyleSheet("font-size: 11pt;")
+            col.addWidget(cd_label)
+            self.countdown_labels.append(cd_label)
+
+            rep_label = QLabel(f"Reps: {self.reps_per_channel[i]}")
+            rep_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            rep_label.setStyleSheet("font-size: 11pt; font-weight: bold;")
+            col.addWidget(rep_label)
+            self.rep_labels.append(rep_label)
+
+            self.center_row.addWidget(column)
+
+    def _make_rep_engine(self):
+        self.rep_engine = RepEngine(
+            num_channels=self.num_channels,
+            hold_seconds=HOLD_SECONDS,
+            reps_per_channel=self.reps_per_channel,
+            combo_reps=self.combo_reps,
+            zone_tracker=ZoneTracker(self.num_channels),
+        )
+        self.reps_per_channel = self.rep_engine.reps_per_channel
+
+    def _apply_channel_layout(self, backend):
+        """Resize bars, rep engine and stats to the backend's channels."""
+        n = backend_num_channels(backend)
+        names = backend_channel_names(backend, CHANNEL_NAMES, n)
+        if n == self.num_channels and names == self.channel_names:
             return
-        sound.stop()
-        sound.play()
+        logger.info(
+            "PatientGameWindow #%d channel layout: %d channels (%s)",
+            self.instance_id,
+            n,
+            ", ".join(names),
+        )
+        self.num_channels = n
+        self.channel_names = names
+
+        while self.center_row.count():
+            column = self.center_row.takeAt(0).widget()
+            if column is not None:
+                column.hide()
+                column.deleteLater()
+        self.bar_widgets = []
+        self.value_labels = []
+        self.countdown_labels = []
+        self.rep_labels = []
+        self._bar_colors = [None] * n
+        self._label_texts = {}
+
+        # Cumulative reps stay with their channel index (a glove gaining a
+        # thumb sensor keeps its finger counts)
+        self.combo_reps = self.rep_engine.combo_reps
+        self.reps_per_channel = _fit_reps(self.reps_per_channel, n)
+        self._make_rep_engine()
+
+        self._build_bars()
+        self.latency_probe.set_widget(self.bar_widgets[0])
+        self._update_band_labels()
+        self.total_reps_label.setText(self._total_reps_text())
+
+    # -------- Audio helpers --------
+
+    def _play_sound(self, cue: str | None):
+        self.audio.play(cue)
 
     # -------- JSON stats --------
 
     def _load_stats(self):
         os.makedirs(os.path.join(PROJECT_ROOT, "data"), exist_ok=True)
         if not os.path.isfile(self.stats_path):
-            self.reps_per_channel = [0] * NUM_CHANNELS
+            self.reps_per_channel = [0] * self.num_channels
             self.sessions_completed = 0
             self.combo_reps = 0
             return
         try:
             with open(self.stats_path, "r") as f:
                 data = json.load(f)
-            self.reps_per_channel = data.get("reps_per_channel", [0] * NUM_CHANNELS)
-            if len(self.reps_per_channel) != NUM_CHANNELS:
-                self.reps_per_channel = [0] * NUM_CHANNELS
+            self.reps_per_channel = _fit_reps(data.get("reps_per_channel", []), self.num_channels)
             self.sessions_completed = int(data.get("sessions_completed", 0))
             self.combo_reps = int(data.get("combo_reps", 0))
         except Exception:
             logger.exception("Failed to load game stats from %s", self.stats_path)
-            self.reps_per_channel = [0] * NUM_CHANNELS
+            self.reps_per_channel = [0] * self.num_channels
             self.sessions_completed = 0
             self.combo_reps = 0
 
-    def _save_stats(self):
+    def _save_stats(self, flush: bool = False):
+        """
+        Queue a stats snapshot for the background writer.
+
+        flush=True blocks until it is on disk (session stop / window close);
+        otherwise writes are coalesced and happen off the GUI thread.
+        """
         data = {
-            "reps_per_channel": self.reps_per_channel,
+            "reps_per_channel": list(self.reps_per_channel),
             "sessions_completed": self.sessions_completed,
             "combo_reps": self.combo_reps,
             "last_updated": datetime.now().isoformat(timespec="seconds"),
         }
-        try:
-            with open(self.stats_path, "w") as f:
-                json.dump(data, f, indent=2)
-        except Exception:
-            logger.exception("Failed to save game stats to %s", self.stats_path)
+        self._stats_writer.submit(data)
+        if flush:
+            self._stats_writer.flush()
 
     def _total_reps_text(self):
         total = sum(self.reps_per_channel)
@@ -438,11 +551,17 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
     def _update_band_labels(self):
         tmin = self.target_min_slider.value()
         tmax = self.target_max_slider.value()
-        self.target_min_value_label.setText(str(tmin))
-        self.target_max_value_label.setText(str(tmax))
+        self.target_min_value_label.setText(self._band_text(tmin))
+        self.target_max_value_label.setText(self._band_text(tmax))
         for bar in self.bar_widgets:
             bar.set_thresholds(tmin, tmax)
 
+    def _band_text(self, adc: int) -> str:
+        force = self.force_scale.convert_mean(adc)
+        if force is None:
+            return str(adc)
+        return f"{adc} (≈{self.force_scale.format(force)})"
+
     def _on_min_slider_changed(self, value: int):
         if value > self.target_max_slider.value():
             self.target_max_slider.blockSignals(True)
@@ -484,10 +603,11 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
             port_arg = port_text
 
         try:
-            # self.backend = SerialBackend(port=port_arg, baud=baud, timeout=0.01, num_channels=1) #NOTE: testing 1 fsr
-            # self.backend = SerialBackend(port=port_arg, baud=baud, timeout=0.01, num_channels=4) #NOTE: testing 4 fsrs
-            self.backend = SerialBackend(port=port_arg, baud=baud, timeout=0.01) #NOTE: UNCOMMENT for real application
-            self.backend.start()
+            # Shared through the acquisition hub: other windows / processes on the
+            # same device get their own lease instead of a second serial connection.
+            # self.backend = open_shared_backend(SerialBackend, port=port_arg, baud=baud, timeout=0.01, filters=SIGNAL_FILTERS, num_channels=1) #NOTE: testing 1 fsr
+            # self.backend = open_shared_backend(SerialBackend, port=port_arg, baud=baud, timeout=0.01, filters=SIGNAL_FILTERS, num_channels=4) #NOTE: testing 4 fsrs
+            self.backend = open_shared_backend(SerialBackend, port=port_arg, baud=baud, timeout=0.01, filters=SIGNAL_FILTERS) #NOTE: UNCOMMENT for real application
         except Exception as e:
             logger.exception("Failed to open serial port %s", port_arg or "(auto-detect)")
             QMessageBox.critical(
@@ -498,6 +618,12 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
             self.backend = None
             return
 
+        # Units / calibration may have changed since the window opened
+        self._apply_channel_layout(self.backend)
+        self.force_scale, self.calibration_doc = ForceScale.from_settings(num_channels=self.num_channels)
+        self.reader = CalibratedReader(self.backend, self.force_scale, num_channels=self.num_channels)
+        self._update_band_labels()
+
         actual_port = getattr(self.backend, "port", None) or "(auto)"
         self.status_label.setText(
             f"Status: Connected to {actual_port} @ {baud} – click 'Start Session' to begin."
@@ -516,6 +642,7 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
             self.instance_id,
             actual_port,
             baud,
+            extra={**self.log_fields, "backend": backend_stats(self.backend)},
         )
 
     def handle_disconnect(self):
@@ -523,19 +650,20 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
         if self.backend is not None:
             self.backend.stop()
             self.backend = None
+        self.reader = None
         self.status_label.setText("Status: Disconnected")
         self.connect_button.setEnabled(True)
         self.disconnect_button.setEnabled(False)
         self.start_button.setEnabled(False)
 
-        logger.info("PatientGameWindow #%d Disconnected", self.instance_id)
+        logger.info("PatientGameWindow #%d Disconnected", self.instance_id, extra=self.log_fields)
 
     def start_session(self):
-        self.hold_time = [0.0] * NUM_CHANNELS
-        self.in_band_prev = [False] * NUM_CHANNELS
-        self.combo_hold_time = 0.0
+        self.rep_engine.reset_holds()
         self.last_time = time.time()
-        self.last_all_in_band = False
+        # Skip samples that arrived before the session started
+        if self.reader is not None:
+            self.reader.read()
         self.combo_bar.setValue(0)
         self.combo_countdown_label.setText("All-fingers hold: –")
         self.emoji_label.setText("")
@@ -565,7 +693,7 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
         if self.timer.isActive():
             self.timer.stop()
             self.sessions_completed += 1
-            self._save_stats()
+            self._save_stats(flush=True)
 
             logger.info(
                 "PatientGameWindow #%d Session Stopped (id=%s)",
@@ -595,10 +723,9 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
         self.start_button.setEnabled(self.backend is not None)
         self.stop_button.setEnabled(False)
 
-        self.combo_hold_time = 0.0
+        self.rep_engine.reset_holds()
         self.combo_bar.setValue(0)
         self.combo_countdown_label.setText("All-fingers hold: –")
-        self.last_all_in_band = False
 
         # Leave self.current_session_id as-is; dual launcher may inspect it.
         # Standalone game mode will overwrite on next start_session().
@@ -611,117 +738,88 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
 
         now_gui = time.time()
 
-        vals = self.backend.get_latest()
+        # Every sample since the previous tick feeds the rep engine, so rep
+        # timing follows the backend rate rather than the GUI frame rate.
+        # The reader converts the batch to force once; widgets use its cache.
+        if self.reader is None or self.reader.backend is not self.backend:
+            self._apply_channel_layout(self.backend)
+            self.reader = CalibratedReader(self.backend, self.force_scale, num_channels=self.num_channels)
+        batch = self.reader.read()
+        vals = self.reader.latest_adc
+        forces = self.reader.latest_force
+        last_ts = self.reader.latest_ts
         if vals is None:
             return
+        if len(batch):
+            self.latency_probe.delivered(last_ts)
 
         # Latency measurement via BaseBackend API
-        last_ts = None
-        if hasattr(self.backend, "get_last_timestamp"):
-            last_ts = self.backend.get_last_timestamp()
-
         if last_ts is not None:
             age_ms = (now_gui - last_ts) * 1000.0
             if int(now_gui * 50) % 10 == 0:
                 logger.debug(
-                    "PatientGameWindow #%d (active=%d, lifetime=%d) - [Game: latency] age=%5.1f ms, vals=%s",
+                    "PatientGameWindow #%d (active=%d, lifetime=%d) - [Game: latency] age=%5.1f ms, batch=%d, vals=%s",
                     self.instance_id,
                     type(self).active_count(),
                     type(self).lifetime_count(),
                     age_ms,
-                    vals,
+                    len(batch),
+                    vals.tolist(),
+                    extra={
+                        **self.log_fields,
+                        "age_ms": round(age_ms, 1),
+                        "batch": len(batch),
+                        "backend": backend_stats(self.backend),
+                    },
                 )
 
-        if isinstance(vals, (int, float)):
-            vals = [vals] * NUM_CHANNELS
-        elif isinstance(vals, (list, tuple)):
-            if len(vals) < NUM_CHANNELS:
-                vals = list(vals) + [0] * (NUM_CHANNELS - len(vals))
-        else:
-            return
-
-        now = time.time()
-        dt = 0.0 if self.last_time is None else (now - self.last_time)
-        self.last_time = now
+        self.last_time = time.time()
 
         tmin = self.target_min_slider.value()
         tmax = self.target_max_slider.value()
 
-        in_band_flags = [False] * NUM_CHANNELS
-
-        for i in range(NUM_CHANNELS):
+        session_active = self.timer.isActive()
+        events = []
+        if session_active and len(batch):
+            events = self.rep_engine.process(batch.ts, batch.adc, tmin, tmax)
+        # In a session the bars follow the engine's debounced zones, so color
+        # and rep counting agree; otherwise the tracker is idle and the live
+        # value picks the zone
+        zones = self.rep_engine.zone_tracker.zones if session_active else None
+
+        # ---- Per-finger display (latest sample) ----
+        for i in range(self.num_channels):
             val = int(vals[i])
-            val = max(0, min(4095, val))
 
             self.bar_widgets[i].setValue(val)
-            self.value_labels[i].setText(f"Force: {val}")
-
-            if val < tmin:
-                zone = "low"
-                frac_below = (val / tmin) if tmin > 0 else 0.0
-                color = "orange" if frac_below < 0.5 else "yellow"
-            elif val > tmax:
-                zone = "high"
-                span_high = max(1, 4095 - tmax)
-                frac_above = (val - tmax) / span_high
-                color = "darkred" if frac_above < 0.5 else "red"
-            else:
-                zone = "in_band"
-                span = max(tmax - tmin, 1)
-                frac_in = (val - tmin) / span
-                if frac_in < 1 / 3:
-                    color = "yellowgreen"
-                elif frac_in < 2 / 3:
-                    color = "green"
-                else:
-                    color = "darkgreen"
-
-            in_band_flags[i] = (zone == "in_band")
-            self._set_bar_color(self.bar_widgets[i], color)
-
-            if zone == "in_band" and not self.in_band_prev[i] and self.timer.isActive():
-                self._play_sound(self.sounds.get("applepay"))
-
-            if self.timer.isActive() and zone == "in_band":
-                self.hold_time[i] += dt
-                remaining = max(0.0, HOLD_SECONDS - self.hold_time[i])
-                if remaining > 0:
-                    self.countdown_labels[i].setText(f"Hold: {remaining:0.1f} s")
-                else:
-                    self.reps_per_channel[i] += 1
-                    self.rep_labels[i].setText(f"Reps: {self.reps_per_channel[i]}")
-                    self.total_reps_label.setText(self._total_reps_text())
-                    self.countdown_labels[i].setText("Nice! ✅")
-                    self._play_sound(self.sounds.get("duolingo"))
-                    self.hold_time[i] = 0.0
-                    self._save_stats()
-            else:
-                self.hold_time[i] = 0.0
-                self.countdown_labels[i].setText("Hold: –")
-
-            self.in_band_prev[i] = (zone == "in_band")
-
-        all_in_band = self.timer.isActive() and all(in_band_flags)
-
-        if all_in_band:
-            if not self.last_all_in_band:
-                self._play_sound(self.sounds.get("mario"))
-
-            self.combo_hold_time += dt
-            combo_remaining = max(0.0, HOLD_SECONDS - self.combo_hold_time)
-            pct = int(max(0.0, min(1.0, self.combo_hold_time / HOLD_SECONDS)) * 100.0)
-            self.combo_bar.setValue(pct)
-
-            if combo_remaining > 0:
-                self.combo_countdown_label.setText(
-                    f"All-fingers hold: {combo_remaining:0.1f} s"
-                )
+            if forces is None:
+                text = f"Force: {val}"
             else:
-                self.combo_reps += 1
-                self.combo_reps_label.setText(
-                    f"All-fingers reps: {self.combo_reps}"
-                )
-
+                text = f"Force: {val} · {self.force_scale.format(forces[i])}"
+            self._set_label_text(self.value_labels[i], text)
+            self._set_bar_color(i, zone_color(val, tmin, tmax, zones[i] if zones is not None else None))
+
+        # ---- Engine events → sounds / labels / stats ----
+        rep_channels = set()
+        combo_done = False
+        for ev in events:
+            if ev.kind == EVENT_ENTER:
+                self._play_sound("applepay")
+            elif ev.kind == EVENT_REP:
+                rep_channels.add(ev.channel)
+                self.rep_labels[ev.channel].setText(f"Reps: {ev.count}")
+                self._play_sound("duolingo")
+            elif ev.kind == EVENT_COMBO_ENTER:
+                self._play_sound("mario")
+            elif ev.kind == EVENT_COMBO_FAIL:
+                if self.combo_fail_sounds:
+                    s = self.combo_fail_sounds[self.combo_fail_index]
+                    self.combo_fail_index = (
+                        self.combo_fail_index + 1
+                    ) % len(self.combo_fail_sounds)
+                    self._play_sound(s)
+            elif ev.kind == EVENT_COMBO:
+                combo_done = True
                 emoji = self.emoji_cycle[self.emoji_index]
                 self.emoji_index = (self.emoji_index + 1) % len(self.emoji_cycle)
                 self.emoji_label.setText(emoji)
@@ -733,31 +831,44 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
                     ) % len(self.combo_success_sounds)
                     self._play_sound(s)
 
-                self.combo_hold_time = 0.0
-                self.combo_bar.setValue(0)
-                self.combo_countdown_label.setText("Great job! 🎉")
-                self._save_stats()
-        else:
-            if (
-                self.last_all_in_band
-                and self.timer.isActive()
-                and self.combo_hold_time > 0.0
-            ):
-                if self.combo_fail_sounds:
-                    s = self.combo_fail_sounds[self.combo_fail_index]
-                    self.combo_fail_index = (
-                        self.combo_fail_index + 1
-                    ) % len(self.combo_fail_sounds)
-                    self._play_sound(s)
+        self.combo_reps = self.rep_engine.combo_reps
+        if rep_channels:
+            self.total_reps_label.setText(self._total_reps_text())
+        if combo_done:
+            self.combo_reps_label.setText(f"All-fingers reps: {self.combo_reps}")
+        if rep_channels or combo_done:
+            self._save_stats()
+
+        # ---- Countdowns from engine state ----
+        engine = self.rep_engine
+        for i in range(self.num_channels):
+            if i in rep_channels:
+                text = "Nice! ✅"
+            elif session_active and engine.in_band[i]:
+                text = f"Hold: {engine.hold_remaining(i):0.1f} s"
+            else:
+                text = "Hold: –"
+            self._set_label_text(self.countdown_labels[i], text)
 
-            self.combo_hold_time = 0.0
+        if combo_done:
+            self.combo_bar.setValue(0)
+            self.combo_countdown_label.setText("Great job! 🎉")
+        elif session_active and engine.all_in_band:
+            self.combo_bar.setValue(int(engine.combo_fraction() * 100.0))
+            self.combo_countdown_label.setText(
+                f"All-fingers hold: {engine.combo_remaining():0.1f} s"
+            )
+        else:
             self.combo_bar.setValue(0)
             self.combo_countdown_label.setText("All-fingers hold: –")
 
-        self.last_all_in_band = all_in_band
+        if len(batch):
+            self.latency_probe.applied(last_ts)
 
     # ---- Keyboard → backend passthrough (SimBackend) ----
     def keyPressEvent(self, event):
+        if self.latency_overlay.handle_key(event):
+            return
         if self.backend is not None and hasattr(self.backend, "handle_char"):
             ch = event.text()
             if ch:
@@ -771,27 +882,23 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
                 self.backend.handle_char(ch, False)
         super().keyReleaseEvent(event)
 
-    # ---- Color helper ----
-    def _set_bar_color(self, bar: QProgressBar, color: str):
-        palette = {
-            "orange": "#FF9800",
-            "yellow": "#FFEB3B",
-            "yellowgreen": "#CDDC39",
-            "green": "#4CAF50",
-            "darkgreen": "#2E7D32",
-            "darkred": "#B71C1C",
-            "red": "#F44336",
-        }
-        chunk_color = palette.get(color, "#FF9800")
-
-        bar.setStyleSheet(
-            "QProgressBar {"
-            "  border: 1px solid #999;"
-            "  border-radius: 3px;"
-            "  background: #eee;"
-            "}"
-            f"QProgressBar::chunk {{ background-color: {chunk_color}; }}"
-        )
+    # ---- Cached widget helpers ----
+    def _set_bar_color(self, index: int, color: str):
+        """Apply the precomputed stylesheet only when the zone color changes."""
+        if color not in BAR_STYLESHEETS:
+            color = "orange"
+        if self._bar_colors[index] == color:
+            return
+        self._bar_colors[index] = color
+        self.bar_widgets[index].setStyleSheet(BAR_STYLESHEETS[color])
+
+    def _set_label_text(self, label: QLabel, text: str):
+        """setText() only when the text differs from what we last set."""
+        key = id(label)
+        if self._label_texts.get(key) == text:
+            return
+        self._label_texts[key] = text
+        label.setText(text)
 
     # ---------- Patient Game Window Instance Close ----------
 
@@ -800,26 +907,41 @@ class PatientGameWindow(InstanceTrackerMixin, QWidget):
         if self.backend is not None:
             self.handle_disconnect()
 
+        # Make sure any coalesced rep/combo updates reach disk
+        self._stats_writer.flush()
+
         logger.info(
             "PatientGameWindow #%d closeEvent called (active=%d)",
             self.instance_id,
             type(self).active_count(),
+            extra={**self.log_fields, "latency_ms": LatencyTracker.instance().snapshot()},
         )
+        self.audio.log_latency_summary(self.log_fields)
         # Do NOT touch counters here; InstanceTrackerMixin will update on destroyed.
         super().closeEvent(event)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Patient Game")
+    add_profile_argument(parser)
+    # Anything unrecognised is left for Qt (-style, -platform, ...)
+    args, qt_args = parser.parse_known_args()
+
     configure_logging(LOG_FILE)
     logger.info("Patient Game Qt App Launching")
 
-    app = QApplication(sys.argv)
+    app = QApplication([sys.argv[0]] + qt_args)
+    # Wrap before any window exists: timers bind the (wrapped) methods on creation
+    profiler = start_profiling("patient_game", args.profile) if args.profile else None
     win = PatientGameWindow()
     win.show()
     logger.info("Patient Game Qt App Launched")
 
     exit_code = app.exec()
 
+    if profiler is not None:
+        profiler.stop()
+
     logger.info("Patient Game Qt App Closed with exit code %d", exit_code)
     sys.exit(exit_code)
 
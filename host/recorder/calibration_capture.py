@@ -0,0 +1,262 @@
+# host/recorder/calibration_capture.py
+#
+# Multi-point force calibration capture.
+#
+# Walks the clinician through a list of known loads per channel, records every
+# sample while each load rests on the sensor, fits a calibration from all of
+# the (ADC, force) pairs (model.calibration_fit), prints the residuals and
+# saves the next versioned calibration file for the glove
+# (model.calibration_store). The raw pairs are saved next to it as
+# vNNN_pairs.csv so a calibration can be refit later without re-capturing.
+#
+# Usage:
+#   python -m host.recorder.calibration_capture --sim --glove-id left_01
+#   python -m host.recorder.calibration_capture --port /dev/ttyACM0 --weights 0,0.5,1,2,5 --robust
+#   python -m host.recorder.calibration_capture --from-pairs data/calibration/left_01/v001_pairs.csv --kind piecewise
+#
+# Pairs CSV columns: channel,adc,force_n
+
+from __future__ import annotations
+
+import os
+import sys
+import csv
+import time
+import logging
+import argparse
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# host/recorder/calibration_capture.py → parent = recorder/, grandparent = host/, great-grandparent = project root
+RECORDER_DIR = os.path.dirname(os.path.abspath(__file__))
+HOST_DIR = os.path.dirname(RECORDER_DIR)
+PROJECT_ROOT = os.path.dirname(HOST_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from comms.acquisition_hub import open_shared_backend
+from model.calibration_force import GloveCalibration
+from model.calibration_fit import FIT_KINDS, fit_calibration
+from model.calibration_store import (
+    CALIBRATION_DIR,
+    DEFAULT_GLOVE_ID,
+    load_current_calibration,
+    save_glove_calibration,
+)
+
+logger = logging.getLogger("cardinal_grip.calibration")
+
+LOG_FILE = os.path.join(PROJECT_ROOT, "logger", "cardinal_grip.log")
+
+GRAVITY = 9.80665              # m/s^2, kg -> N
+DEFAULT_WEIGHTS_KG = "0,0.2,0.5,1,2"
+DEFAULT_CAPTURE_SECONDS = 3.0
+DEFAULT_SETTLE_SECONDS = 1.0
+
+# channel -> (adc samples, force samples)
+Pairs = Dict[int, Tuple[List[float], List[float]]]
+
+
+# ---------- Pairs I/O ----------
+
+def read_pairs_csv(path: str) -> Pairs:
+    pairs: Pairs = {}
+    with open(path, "r", newline="") as f:
+        for row in csv.DictReader(f):
+            adc, force = pairs.setdefault(int(row["channel"]), ([], []))
+            adc.append(float(row["adc"]))
+            force.append(float(row["force_n"]))
+    return pairs
+
+
+def write_pairs_csv(path: str, pairs: Pairs) -> None:
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["channel", "adc", "force_n"])
+        for ch in sorted(pairs):
+            for a, fn in zip(*pairs[ch]):
+                w.writerow([ch, f"{a:g}", f"{fn:g}"])
+
+
+# ---------- Live capture ----------
+
+def capture_load(backend, channel: int, seconds: float, settle: float) -> np.ndarray:
+    """Every sample of `channel` over `seconds`, after letting the load settle."""
+    time.sleep(settle)
+    cursor, _, _ = backend.get_samples_since(0)
+    time.sleep(seconds)
+    _, ts, vals = backend.get_samples_since(cursor)
+    if not ts:
+        return np.empty(0)
+    return np.asarray(vals, dtype=float)[:, channel]
+
+
+def capture_pairs(backend, channels: List[int], forces_n: List[float], seconds: float, settle: float) -> Pairs:
+    pairs: Pairs = {}
+    for ch in channels:
+        for force in forces_n:
+            label = "no load" if force == 0 else f"{force:.2f} N ({force / GRAVITY:.3f} kg)"
+            input(f"Channel {ch}: place {label}, then press Enter... ")
+            samples = capture_load(backend, ch, seconds, settle)
+            if samples.size == 0:
+                print("  no samples received; skipped")
+                logger.warning("Calibration capture: no samples for channel %d at %.3f N", ch, force)
+                continue
+            adc, f = pairs.setdefault(ch, ([], []))
+            adc.extend(samples.tolist())
+            f.extend([force] * samples.size)
+            print(f"  {samples.size} samples, mean ADC {samples.mean():.1f} (sd {samples.std():.1f})")
+    return pairs
+
+
+# ---------- Fit + report ----------
+
+def fit_channels(pairs: Pairs, num_channels: int, kind: str, robust: bool):
+    """Per-channel FitResults (None where a channel wasn't captured or failed to fit)."""
+    results = []
+    for ch in range(num_channels):
+        if ch not in pairs:
+            results.append(None)
+            continue
+        adc, force = pairs[ch]
+        try:
+            results.append(fit_calibration(adc, force, kind=kind, robust=robust))
+        except ValueError as e:
+            print(f"Channel {ch}: fit failed ({e})")
+            logger.warning("Calibration fit failed for channel %d: %s", ch, e)
+            results.append(None)
+    return results
+
+
+def print_report(results) -> None:
+    print()
+    print(f"{'ch':>3} {'kind':>9} {'n':>6} {'rmse N':>9} {'max |r| N':>10} {'r2':>8}")
+    for ch, r in enumerate(results):
+        if r is None:
+            print(f"{ch:>3} {'-':>9}")
+            continue
+        print(
+            f"{ch:>3} {r.kind:>9} {r.n:>6} {r.rmse:>9.3f} "
+            f"{r.max_abs_residual:>10.3f} {r.r2:>8.4f}"
+        )
+    print()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="cardinal-grip-calibrate",
+        description="Capture known loads and fit a per-glove force calibration.",
+    )
+    src = parser.add_mutually_exclusive_group()
+    src.add_argument("--sim", action="store_true", help="Capture from SimBackend instead of serial")
+    src.add_argument("--from-pairs", metavar="CSV", help="Refit from a saved channel,adc,force_n CSV instead of capturing")
+    parser.add_argument("--port", default=None, help="Serial port, 'shm[:name]', or omit to auto-detect")
+    parser.add_argument("--baud", type=int, default=115200)
+    parser.add_argument("--channels", type=int, default=4)
+    parser.add_argument("--channel", default="all", help='Channel to calibrate, or "all" (default)')
+    parser.add_argument("--weights", default=DEFAULT_WEIGHTS_KG, help="Comma-separated loads (kg unless --newtons)")
+    parser.add_argument("--newtons", action="store_true", help="--weights are in newtons")
+    parser.add_argument("--seconds", type=float, default=DEFAULT_CAPTURE_SECONDS, help="Capture time per load")
+    parser.add_argument("--settle", type=float, default=DEFAULT_SETTLE_SECONDS, help="Ignore the first N s after each load is placed")
+    parser.add_argument("--kind", choices=FIT_KINDS, default="power", help="Calibration model")
+    parser.add_argument("--robust", action="store_true", help="Huber robust fit instead of plain least squares")
+    parser.add_argument("--glove-id", default=DEFAULT_GLOVE_ID)
+    parser.add_argument("--notes", default="")
+    parser.add_argument("--calibration-dir", default=CALIBRATION_DIR, help=argparse.SUPPRESS)
+    parser.add_argument("--dry-run", action="store_true", help="Fit and report, don't save")
+    args = parser.parse_args(argv)
+
+    from logger.app_logging import configure_logging
+    configure_logging(LOG_FILE, level=logging.INFO)
+
+    if args.from_pairs:
+        try:
+            pairs = read_pairs_csv(args.from_pairs)
+        except Exception:
+            logger.exception("Failed to read calibration pairs from %s", args.from_pairs)
+            return 1
+        num_channels = max(args.channels, max(pairs, default=-1) + 1)
+        capture_info = {"pairs_source": os.path.abspath(args.from_pairs)}
+    else:
+        try:
+            forces = [float(w) for w in args.weights.split(",") if w.strip()]
+        except ValueError:
+            parser.error("--weights must be comma-separated numbers")
+        if not args.newtons:
+            forces = [w * GRAVITY for w in forces]
+        if len(set(forces)) < 2:
+            parser.error("need at least two different loads")
+        channels = list(range(args.channels)) if args.channel == "all" else [int(args.channel)]
+        if any(not 0 <= ch < args.channels for ch in channels):
+            parser.error(f"--channel must be in 0..{args.channels - 1}")
+
+        if args.sim:
+            from comms.sim_backend import SimBackend as backend_cls
+        else:
+            from comms.serial_backend import SerialBackend as backend_cls
+        try:
+            # Raw (unfiltered) samples: the fit sees what the sensor reports
+            backend = open_shared_backend(
+                backend_cls, port=args.port, baud=args.baud, timeout=0.01, num_channels=args.channels
+            )
+        except Exception:
+            logger.exception("Failed to open backend %s", args.port or "(auto-detect)")
+            return 1
+        try:
+            pairs = capture_pairs(backend, channels, forces, args.seconds, args.settle)
+        except (KeyboardInterrupt, EOFError):
+            print("\nCalibration capture cancelled.")
+            return 1
+        finally:
+            backend.stop()
+        num_channels = args.channels
+        capture_info = {
+            "device": getattr(backend, "port", None),
+            "loads_n": [round(f, 6) for f in sorted(set(forces))],
+            "seconds_per_load": args.seconds,
+            "settle_seconds": args.settle,
+        }
+
+    results = fit_channels(pairs, num_channels, args.kind, args.robust)
+    print_report(results)
+    if all(r is None for r in results):
+        print("Nothing to save.")
+        return 1
+    if args.dry_run:
+        return 0
+
+    # Channels not (re)fitted this time carry over from the glove's current calibration
+    previous, previous_doc = load_current_calibration(args.glove_id, args.calibration_dir)
+    channels_out, fits = [], []
+    for ch, r in enumerate(results):
+        if r is not None:
+            channels_out.append(r.calibration)
+            fits.append(dict(r.summary(), channel=ch))
+        elif previous is not None and ch < previous.num_channels:
+            channels_out.append(previous.channels[ch])
+            fits.append(dict(channel=ch, carried_from=previous_doc.get("version")))
+        else:
+            print(f"Channel {ch} has no fit and no previous calibration; calibrate all channels first.")
+            return 1
+    glove = GloveCalibration(channels_out)
+    try:
+        path, version = save_glove_calibration(
+            glove,
+            args.glove_id,
+            fits=fits,
+            notes=args.notes,
+            extra={"capture": capture_info},
+            base_dir=args.calibration_dir,
+        )
+        write_pairs_csv(path[: -len(".json")] + "_pairs.csv", pairs)
+    except Exception:
+        logger.exception("Failed to save calibration for glove %s", args.glove_id)
+        return 1
+
+    print(f"Saved {args.glove_id} v{version:03d}: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
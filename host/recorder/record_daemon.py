@@ -0,0 +1,300 @@
+# host/recorder/record_daemon.py
+#
+# Headless acquisition + recording (no Qt, no display).
+#
+# Streams every backend sample into the session store (CSV or binary .cgs,
+# rotated into parts), runs the RepEngine on the full sample rate, and logs
+# each finished part through session_logging.log_session_completion so it
+# shows up in the dashboards' session history.
+#
+# Usage:
+#   python -m host.recorder.record_daemon --sim --duration 60
+#   python -m host.recorder.record_daemon --port /dev/ttyACM0 --format bin --rotate-minutes 30
+#   python -m host.recorder.record_daemon --port shm:cardinal_grip_bus     # from comms.shm_bus
+#
+# Stops cleanly on SIGTERM / SIGINT (closes the current part, logs it, stops the backend).
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import signal
+import logging
+import argparse
+from datetime import datetime
+
+# host/recorder/record_daemon.py → parent = recorder/, grandparent = host/, great-grandparent = project root
+RECORDER_DIR = os.path.dirname(os.path.abspath(__file__))
+HOST_DIR = os.path.dirname(RECORDER_DIR)
+PROJECT_ROOT = os.path.dirname(HOST_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from comms.acquisition_hub import open_shared_backend
+from comms.base_backend import backend_stats
+from comms.channel_layout import backend_num_channels
+from model.calibration_store import DEFAULT_GLOVE_ID, calibration_ref, load_current_calibration
+from model.rep_engine import RepEngine, DEFAULT_HOLD_SECONDS, EVENT_REP, EVENT_COMBO
+from model.session_store import RotatingSessionWriter, SESSION_WRITERS
+from model.zones import ZoneTracker
+
+logger = logging.getLogger("cardinal_grip.recorder")
+
+LOGS_DIR = os.path.join(PROJECT_ROOT, "data", "logs")
+LOG_FILE = os.path.join(PROJECT_ROOT, "logger", "cardinal_grip.log")
+
+DEFAULT_TMIN = 1200
+DEFAULT_TMAX = 2000
+
+POLL_INTERVAL = 0.1        # s between buffer drains (backend ring holds ~10 s)
+FLUSH_INTERVAL = 5.0       # s between fsyncs of the current part
+
+
+def stream_filter_state(backend, raw: bool) -> dict:
+    """
+    What the recorded stream actually went through, for the session
+    metadata: {"filtered": bool | None, "filters": spec | None}. Taken from
+    the backend (get_stats), not the command line; "filtered" is None when
+    the backend does not say.
+    """
+    if raw and hasattr(backend, "get_raw_samples_since"):
+        return {"filtered": False, "filters": None}
+    get_stats = getattr(backend, "get_stats", None)
+    stats = get_stats() if get_stats is not None else {}
+    filtered = stats.get("filtered")
+    return {
+        "filtered": filtered,
+        "filters": stats.get("filters") if filtered else None,
+    }
+
+
+class Recorder:
+    """
+    Drains a backend into a RotatingSessionWriter and a RepEngine.
+
+    Each finished part is logged as one "recorder" session with the reps
+    earned during that part. raw=True reads the backend's unfiltered
+    stream (get_raw_samples_since) where it has one.
+    """
+
+    def __init__(
+        self,
+        backend,
+        writer: RotatingSessionWriter,
+        engine: RepEngine,
+        tmin: float,
+        tmax: float,
+        log_sessions: bool = True,
+        raw: bool = False,
+    ):
+        self.backend = backend
+        self.writer = writer
+        self.engine = engine
+        self.tmin = tmin
+        self.tmax = tmax
+        self.log_sessions = log_sessions
+
+        raw_since = getattr(backend, "get_raw_samples_since", None) if raw else None
+        self._read_since = raw_since or backend.get_samples_since
+        self.reads_raw = raw_since is not None
+
+        self._cursor = 0
+        self._part_reps = list(engine.reps_per_channel)
+        self._part_combo = engine.combo_reps
+        self.total_samples = 0
+
+        writer.on_rotate = self._on_part_finished
+
+    def poll(self) -> int:
+        """Move every new sample to disk + engine; returns how many."""
+        self._cursor, ts, vals = self._read_since(self._cursor)
+        if not ts:
+            return 0
+        self.writer.write_batch(ts, vals)
+        for ev in self.engine.process(ts, vals, self.tmin, self.tmax):
+            if ev.kind == EVENT_REP:
+                logger.debug("Rep on channel %d (total %d)", ev.channel, ev.count)
+            elif ev.kind == EVENT_COMBO:
+                logger.debug("Combo rep (total %d)", ev.count)
+        self.total_samples += len(ts)
+        return len(ts)
+
+    def _on_part_finished(self, part_writer) -> None:
+        reps = [
+            now - before
+            for now, before in zip(self.engine.reps_per_channel, self._part_reps)
+        ]
+        combo = self.engine.combo_reps - self._part_combo
+        self._part_reps = list(self.engine.reps_per_channel)
+        self._part_combo = self.engine.combo_reps
+
+        logger.info(
+            "Finished %s (%d samples, reps=%s, combo=%d)",
+            part_writer.path,
+            part_writer.samples,
+            reps,
+            combo,
+        )
+        if not self.log_sessions or part_writer.samples == 0:
+            return
+        try:
+            from host.gui.common.session_logging import log_session_completion
+
+            log_session_completion(
+                mode="recorder",
+                source="record_daemon",
+                reps_per_channel=reps,
+                combo_reps=combo,
+                csv_path=os.path.abspath(part_writer.path),
+                timestamp=part_writer.started_at,
+                session_id=part_writer.started_at.strftime("record_%Y%m%d_%H%M%S"),
+            )
+        except Exception:
+            logger.exception("Failed to log recorder session for %s", part_writer.path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="cardinal-grip-record",
+        description="Headless Cardinal Grip acquisition and recording.",
+    )
+    parser.add_argument("--sim", action="store_true", help="Record from SimBackend instead of serial")
+    parser.add_argument("--port", default=None, help="Serial port, 'shm[:name]', 'multi:L=<port>,R=<port>', 'multi@<Hz>:...' (resampled), or omit to auto-detect")
+    parser.add_argument("--baud", type=int, default=115200)
+    parser.add_argument("--channels", type=int, default=None, help="Channel count (default: what the device reports, else 4)")
+    parser.add_argument("--format", choices=sorted(SESSION_WRITERS), default="csv", help="Session file format")
+    parser.add_argument("--out-dir", default=LOGS_DIR, help="Where session files are written")
+    parser.add_argument("--rotate-minutes", type=float, default=30.0, help="Start a new file every N minutes (0 = never)")
+    parser.add_argument("--duration", type=float, default=0.0, help="Stop after N seconds (0 = until signalled)")
+    parser.add_argument("--tmin", type=float, default=DEFAULT_TMIN, help="Target band min (ADC)")
+    parser.add_argument("--tmax", type=float, default=DEFAULT_TMAX, help="Target band max (ADC)")
+    parser.add_argument("--hold", type=float, default=DEFAULT_HOLD_SECONDS, help="Rep hold seconds")
+    parser.add_argument("--filters", default="", help='Backend filter spec, e.g. "median:5,lowpass:10" (default: raw)')
+    parser.add_argument("--glove-id", default=DEFAULT_GLOVE_ID, help="Glove whose current calibration the session references")
+    parser.add_argument("--no-log", action="store_true", help="Don't add sessions to the session log / index")
+    args = parser.parse_args(argv)
+
+    from logger.app_logging import configure_logging
+    configure_logging(LOG_FILE, level=logging.INFO)
+
+    if args.tmax < args.tmin:
+        parser.error("--tmax must be >= --tmin")
+
+    if args.sim:
+        from comms.sim_backend import SimBackend as backend_cls
+    else:
+        from comms.serial_backend import SerialBackend as backend_cls
+
+    stopping = False
+
+    def request_stop(signum, _frame):
+        nonlocal stopping
+        logger.info("Signal %d received; finishing recording", signum)
+        stopping = True
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    try:
+        backend = open_shared_backend(
+            backend_cls,
+            port=args.port,
+            baud=args.baud,
+            timeout=0.01,
+            num_channels=args.channels,
+            filters=args.filters or None,
+        )
+    except Exception:
+        logger.exception("Failed to open backend %s", args.port or "(auto-detect)")
+        return 1
+
+    actual_port = getattr(backend, "port", None) or ("sim" if args.sim else "(auto)")
+    # The device's layout wins over --channels (multi-glove, hub / shm readers)
+    num_channels = backend_num_channels(backend, default=args.channels or 4)
+    channel_names = getattr(backend, "channel_names", None)
+    # No --filters: record the raw signal even if the device is shared with a filtered session
+    raw = not args.filters
+    filter_state = stream_filter_state(backend, raw)
+    if args.filters and filter_state["filtered"] is False:
+        logger.warning("Requested filters %r but the stream is not filtered", args.filters)
+    _, calibration_doc = load_current_calibration(args.glove_id)
+    if calibration_doc is None:
+        logger.info("No force calibration for glove %s; sessions are ADC only", args.glove_id)
+    writer = RotatingSessionWriter(
+        args.out_dir,
+        fmt=args.format,
+        prefix="record_session",
+        rotate_seconds=args.rotate_minutes * 60.0,
+        num_channels=num_channels,
+        tmin=args.tmin,
+        tmax=args.tmax,
+        meta={
+            "source": "record_daemon",
+            "device": actual_port,
+            "channel_names": channel_names,
+            "hold_seconds": args.hold,
+            **filter_state,
+            "calibration": calibration_ref(calibration_doc),
+            "recorded_on": datetime.now().isoformat(timespec="seconds"),
+        },
+    )
+    engine = RepEngine(
+        num_channels=num_channels,
+        hold_seconds=args.hold,
+        zone_tracker=ZoneTracker(num_channels),
+    )
+    recorder = Recorder(
+        backend, writer, engine, args.tmin, args.tmax, log_sessions=not args.no_log, raw=raw
+    )
+
+    logger.info(
+        "Recording from %s to %s (%s, rotate every %.1f min)",
+        actual_port,
+        args.out_dir,
+        args.format,
+        args.rotate_minutes,
+    )
+
+    started = time.monotonic()
+    last_flush = started
+    exit_code = 0
+    try:
+        while not stopping:
+            recorder.poll()
+            now = time.monotonic()
+            if now - last_flush >= FLUSH_INTERVAL:
+                writer.flush()
+                last_flush = now
+                logger.debug(
+                    "Recorder flushed %s (%d samples so far)",
+                    writer.paths[-1] if writer.paths else "-",
+                    recorder.total_samples,
+                    extra={"backend": backend_stats(backend)},
+                )
+            if args.duration > 0 and now - started >= args.duration:
+                logger.info("Duration of %.1f s reached", args.duration)
+                break
+            time.sleep(POLL_INTERVAL)
+        recorder.poll()
+    except Exception:
+        logger.exception("Recorder loop failed")
+        exit_code = 1
+    finally:
+        writer.close()
+        final_stats = backend_stats(backend)
+        backend.stop()
+
+    logger.info(
+        "Recording stopped: %d samples in %d file(s), reps=%s, combo=%d",
+        recorder.total_samples,
+        len(writer.paths),
+        list(engine.reps_per_channel),
+        engine.combo_reps,
+        extra={"backend": final_stats, "files": list(writer.paths)},
+    )
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# host/server/stream_client.py
+#
+# Minimal subscriber for host.server.stream_server: prints the stream
+# description, then one line per second with the received sample rate,
+# current decimation, samples dropped by the server and the age of the
+# newest sample. --slow makes it a deliberately slow client, to watch the
+# server's backpressure (drops + adaptive decimation) from the outside.
+# Frames are acknowledged (?ack=1) unless --no-ack is given, in which case
+# only TCP limits how far behind the client can fall.
+#
+# Usage:
+#   python -m host.server.stream_client ws://127.0.0.1:8765/ws/stream/sim
+#   python -m host.server.stream_client ws://127.0.0.1:8765/ws/stream/sim --decimate 4 --duration 10
+#   python -m host.server.stream_client ws://127.0.0.1:8765/ws/stream/sim --slow 0.5
+#   python -m host.server.stream_client ws://glove-pc:8765/ws/stream/sim --token <secret>
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import argparse
+
+# host/server/stream_client.py → parent = server/, grandparent = host/, great-grandparent = project root
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+HOST_DIR = os.path.dirname(SERVER_DIR)
+PROJECT_ROOT = os.path.dirname(HOST_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from host.server.stream_server import TOKEN_ENV, decode_frame
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="cardinal-grip-stream-client",
+        description="Subscribe to a Cardinal Grip stream server and print stream health.",
+    )
+    parser.add_argument("url", help="ws://host:port/ws/stream/<device>")
+    parser.add_argument("--decimate", type=int, default=1, help="Ask for every Nth sample")
+    parser.add_argument("--duration", type=float, default=0.0, help="Stop after N seconds (0 = until Ctrl-C)")
+    parser.add_argument("--slow", type=float, default=0.0, help="Sleep N seconds after each frame")
+    parser.add_argument("--no-ack", action="store_true", help="Don't acknowledge frames (TCP flow control only)")
+    parser.add_argument(
+        "--token",
+        default=os.environ.get(TOKEN_ENV) or None,
+        help=f"Server token, if it requires one (default: ${TOKEN_ENV})",
+    )
+    args = parser.parse_args(argv)
+
+    import websocket
+
+    params = [] if args.no_ack else ["ack=1"]
+    if args.decimate > 1:
+        params.append(f"decimate={args.decimate}")
+    url = args.url + (("&" if "?" in args.url else "?") + "&".join(params) if params else "")
+    headers = [f"Authorization: Bearer {args.token}"] if args.token else None
+    ws = websocket.create_connection(url, timeout=5, header=headers)
+    try:
+        print(json.dumps(json.loads(ws.recv()), indent=2))
+        started = last_report = time.monotonic()
+        samples = 0
+        frames = 0
+        header = None
+        age_ms = float("nan")
+        while not args.duration or time.monotonic() - started < args.duration:
+            data = ws.recv()
+            if isinstance(data, str):
+                continue
+            header, ts, _vals = decode_frame(data)
+            samples += ts.size
+            frames += 1
+            if ts.size:
+                age_ms = (time.time() - ts[-1]) * 1000.0
+            now = time.monotonic()
+            if now - last_report >= 1.0:
+                print(
+                    f"{samples / (now - last_report):7.1f} samples/s  decimate {header['decimate']:3d}  "
+                    f"dropped {header['dropped']:6d}  age {age_ms:6.1f} ms"
+                )
+                samples = 0
+                last_report = now
+            if args.slow:
+                time.sleep(args.slow)
+            if not args.no_ack:
+                ws.send(json.dumps({"ack": frames}))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        ws.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
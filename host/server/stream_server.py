@@ -0,0 +1,729 @@
+# host/server/stream_server.py
+#
+# Local network streaming server for remote clinician dashboards (Starlette + uvicorn).
+#
+# Live samples go out over WebSocket as binary batched frames; recorded
+# sessions and the session index are served over HTTP. The server reads
+# devices through open_shared_backend(), so when a patient window on this
+# machine already owns the glove the server subscribes to its hub instead
+# of opening the USB port a second time.
+#
+# Acquisition never waits on a client: one pump per device drains the
+# backend every PUMP_INTERVAL_S and hands each client an encoded frame
+# through a bounded queue. Frames that queue up while a client is busy are
+# merged into one on send. A client that still cannot keep up loses its
+# oldest frames (counted in the frame header) and is decimated harder until
+# it catches up; other clients and the backend are unaffected.
+#
+# Usage:
+#   python -m host.server.stream_server --sim
+#   python -m host.server.stream_server --port /dev/ttyACM0 --port replay:data/logs/x.csv
+#   python -m host.server.stream_server --sim --host 0.0.0.0 --token <secret>   # reachable from the LAN
+#   python -m host.server.stream_client ws://127.0.0.1:8765/ws/stream/sim
+#
+# Authentication: with a token (--token or $CARDINAL_GRIP_STREAM_TOKEN) every
+# HTTP and WebSocket route requires it, as "Authorization: Bearer <token>"
+# or ?token=<token> (browsers cannot set headers on a WebSocket). Sessions
+# and live force streams are patient data, so the server refuses to bind a
+# non-loopback address without a token.
+#
+# Endpoints:
+#   GET  /health
+#   GET  /api/devices                          name, port, channels, stats, clients
+#   GET  /api/sessions?mode=&source=&since=&until=&limit=&offset=
+#   GET  /api/sessions/{id}                    index row, re-scoring rows, .meta.json
+#   GET  /api/sessions/{id}/data?decimate=N    recorded samples as JSON
+#   GET  /api/sessions/{id}/file               the recorded file itself
+#   WS   /ws/stream/{device}?decimate=N&ack=1  live frames (see encode_frame)
+#
+# WebSocket protocol: the server first sends one JSON text message
+# describing the stream (channels, names, frame layout), then binary
+# frames. The client may send {"decimate": N} at any time.
+#
+# Flow control: TCP alone lets a slow client fall minutes behind (socket
+# buffers hold a lot of small frames). Clients that connect with ?ack=1
+# send {"ack": <frames received>} as they consume frames; the server keeps
+# at most MAX_FRAMES_IN_FLIGHT unacknowledged, so a slow client's queue
+# fills, its oldest frames are dropped and its latency stays bounded.
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import hmac
+import struct
+import sqlite3
+import ipaddress
+import asyncio
+import logging
+import argparse
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import QueryParams
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import FileResponse, JSONResponse
+from starlette.routing import Route, WebSocketRoute
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+# host/server/stream_server.py → parent = server/, grandparent = host/, great-grandparent = project root
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+HOST_DIR = os.path.dirname(SERVER_DIR)
+PROJECT_ROOT = os.path.dirname(HOST_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from comms.acquisition_hub import open_shared_backend
+from comms.base_backend import backend_stats
+from comms.channel_layout import backend_channel_names, backend_num_channels
+from host.gui.common.session_logging import SESSIONS_DB_PATH
+from model.session_store import load_session, read_session_meta
+
+logger = logging.getLogger("cardinal_grip.server")
+
+LOG_FILE = os.path.join(PROJECT_ROOT, "logger", "cardinal_grip.log")
+LOGS_DIR = os.path.join(PROJECT_ROOT, "data", "logs")
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_HTTP_PORT = 8765
+TOKEN_ENV = "CARDINAL_GRIP_STREAM_TOKEN"
+
+PUMP_INTERVAL_S = 0.05     # one frame per client per 50 ms (when there is data)
+CLIENT_QUEUE_FRAMES = 20   # ~1 s of frames per client before the oldest are dropped
+MAX_FRAMES_IN_FLIGHT = 4   # sent but not yet acknowledged (ack clients only)
+MAX_DECIMATE = 64
+DECIMATE_COOLDOWN_S = 1.0  # at most one doubling per second while a client falls behind
+RECOVER_AFTER_FRAMES = 100 # frames sent without a drop before adaptive decimation eases off
+SESSION_PAGE_LIMIT = 500
+
+# ---------- Binary frames ----------
+#
+# Header (little endian): magic b"CGF1", uint16 num_channels, uint16 decimate,
+# uint32 seq of the last sample in the frame, uint32 samples dropped for this
+# client so far. Then packed records of float64 timestamp + uint16[num_channels]
+# ADC -- the same record layout as .cgs session files.
+
+FRAME_MAGIC = b"CGF1"
+FRAME_HEADER = struct.Struct("<4sHHII")
+
+
+def _frame_dtype(num_channels: int) -> np.dtype:
+    return np.dtype([("t", "<f8"), ("ch", "<u2", (num_channels,))])
+
+
+def encode_frame(seq: int, ts: np.ndarray, vals: np.ndarray, decimate: int = 1, dropped: int = 0) -> bytes:
+    """(N,) timestamps + (N, C) ADC values -> one binary frame."""
+    num_channels = vals.shape[1]
+    records = np.empty(ts.size, dtype=_frame_dtype(num_channels))
+    records["t"] = ts
+    records["ch"] = vals
+    header = FRAME_HEADER.pack(FRAME_MAGIC, num_channels, decimate, seq & 0xFFFFFFFF, dropped & 0xFFFFFFFF)
+    return header + records.tobytes()
+
+
+def decode_frame(data: bytes) -> Tuple[dict, np.ndarray, np.ndarray]:
+    """Binary frame -> (header dict, (N,) timestamps, (N, C) ADC values)."""
+    magic, num_channels, decimate, seq, dropped = FRAME_HEADER.unpack_from(data)
+    if magic != FRAME_MAGIC:
+        raise ValueError("not a Cardinal Grip stream frame")
+    records = np.frombuffer(data, dtype=_frame_dtype(num_channels), offset=FRAME_HEADER.size)
+    header = {"num_channels": num_channels, "decimate": decimate, "seq": seq, "dropped": dropped}
+    return header, records["t"], records["ch"]
+
+
+def merge_frames(frames: List[bytes]) -> bytes:
+    """Consecutive frames of one stream as one frame (header of the newest)."""
+    return frames[-1][: FRAME_HEADER.size] + b"".join(f[FRAME_HEADER.size:] for f in frames)
+
+
+# ---------- Live streams ----------
+
+
+class StreamClient:
+    """
+    One WebSocket subscriber: a bounded frame queue plus its decimation.
+
+    `requested` is what the client asked for; `decimate` is what it gets,
+    which doubles whenever frames had to be dropped and eases back after
+    RECOVER_AFTER_FRAMES clean frames.
+    """
+
+    def __init__(self, requested: int = 1, ack: bool = False, queue_frames: int = CLIENT_QUEUE_FRAMES):
+        self.requested = max(1, min(MAX_DECIMATE, int(requested)))
+        self.decimate = self.requested
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_frames)
+        self.ack_mode = ack
+        self.frames_sent = 0
+        self.frames_acked = 0
+        self._credit = asyncio.Event()
+        self.phase = 0              # samples to skip before the next kept one
+        self.dropped = 0            # samples lost to backpressure
+        self.sent = 0               # samples queued
+        self._clean_frames = 0
+        self._last_escalation = 0.0
+
+    async def next_frame(self) -> bytes:
+        """The next frame to send; ack clients wait here until they have credit."""
+        while self.ack_mode and self.frames_sent - self.frames_acked >= MAX_FRAMES_IN_FLIGHT:
+            self._credit.clear()
+            await self._credit.wait()
+        frames = [await self.queue.get()]
+        while not self.queue.empty():
+            frames.append(self.queue.get_nowait())
+        self.frames_sent += 1
+        return frames[0] if len(frames) == 1 else merge_frames(frames)
+
+    def ack(self, frames: int) -> None:
+        self.frames_acked = max(self.frames_acked, min(int(frames), self.frames_sent))
+        self._credit.set()
+
+    def set_requested(self, decimate: int) -> None:
+        self.requested = max(1, min(MAX_DECIMATE, int(decimate)))
+        self.decimate = max(self.decimate, self.requested) if self.dropped else self.requested
+
+    def select(self, n: int) -> slice:
+        """Which of the next n samples this client keeps (stride, phase carried over)."""
+        d = self.decimate
+        keep = slice(self.phase, None, d)
+        self.phase = (self.phase - n) % d
+        return keep
+
+    def offer(self, frame: bytes, samples: int) -> None:
+        """Queue a frame without ever waiting; drop the oldest when full."""
+        if self.queue.full():
+            try:
+                old = self.queue.get_nowait()
+                self.dropped += max(0, (len(old) - FRAME_HEADER.size) // self._record_size(old))
+            except asyncio.QueueEmpty:
+                pass
+            now = time.monotonic()
+            if self.decimate < MAX_DECIMATE and now - self._last_escalation >= DECIMATE_COOLDOWN_S:
+                self.decimate = min(MAX_DECIMATE, self.decimate * 2)
+                self.phase = 0
+                self._last_escalation = now
+                logger.info("Stream client falling behind; decimating by %d", self.decimate)
+            self._clean_frames = 0
+        else:
+            self._clean_frames += 1
+            if self._clean_frames >= RECOVER_AFTER_FRAMES and self.decimate > self.requested:
+                self.decimate = max(self.requested, self.decimate // 2)
+                self.phase = 0
+                self._clean_frames = 0
+        self.queue.put_nowait(frame)
+        self.sent += samples
+
+    @staticmethod
+    def _record_size(frame: bytes) -> int:
+        return _frame_dtype(FRAME_HEADER.unpack_from(frame)[1]).itemsize
+
+    def stats(self) -> dict:
+        return {
+            "requested": self.requested,
+            "decimate": self.decimate,
+            "queued_frames": self.queue.qsize(),
+            "in_flight_frames": self.frames_sent - self.frames_acked if self.ack_mode else None,
+            "sent_samples": self.sent,
+            "dropped_samples": self.dropped,
+        }
+
+
+class DeviceStream:
+    """
+    A backend plus its subscribers. pump() runs on the event loop: it
+    drains the backend (non-blocking, the backend's own thread does the
+    I/O) and fans one frame per decimation setting out to the clients.
+    """
+
+    def __init__(self, name: str, backend):
+        self.name = name
+        self.backend = backend
+        self.num_channels = backend_num_channels(backend)
+        self.channel_names = backend_channel_names(backend, num_channels=self.num_channels)
+        self.clients: List[StreamClient] = []
+        self.cursor = 0
+        self.samples = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def describe(self) -> dict:
+        return {
+            "device": self.name,
+            "port": getattr(self.backend, "port", None),
+            "num_channels": self.num_channels,
+            "channel_names": self.channel_names,
+            "frame": {
+                "header": FRAME_HEADER.format,
+                "magic": FRAME_MAGIC.decode("ascii"),
+                "record": ["<f8 timestamp", f"<u2[{self.num_channels}] adc"],
+            },
+        }
+
+    def pump_once(self) -> int:
+        self.cursor, ts_list, vals_list = self.backend.get_samples_since(self.cursor)
+        n = len(ts_list)
+        if not n:
+            return 0
+        self.samples += n
+        ts = np.asarray(ts_list, dtype=float)
+        vals = np.clip(np.asarray(vals_list, dtype=np.int64).reshape(n, -1)[:, : self.num_channels], 0, 0xFFFF)
+        if vals.shape[1] < self.num_channels:
+            vals = np.pad(vals, ((0, 0), (0, self.num_channels - vals.shape[1])))
+        # Clients on the same stride and phase share one encoded frame
+        encoded: Dict[Tuple[int, int, int], Tuple[Optional[bytes], int]] = {}
+        for client in list(self.clients):
+            key = (client.decimate, client.phase, client.dropped)
+            keep = client.select(n)
+            cached = encoded.get(key)
+            if cached is None:
+                idx = np.arange(n)[keep]
+                frame = None
+                if idx.size:
+                    last_seq = self.cursor - (n - 1 - int(idx[-1]))
+                    frame = encode_frame(last_seq, ts[idx], vals[idx], client.decimate, client.dropped)
+                cached = encoded[key] = (frame, int(idx.size))
+            frame, count = cached
+            if frame is not None:
+                client.offer(frame, count)
+        return n
+
+    async def _pump_loop(self) -> None:
+        while True:
+            try:
+                self.pump_once()
+            except Exception:
+                logger.exception("Stream pump for %s failed", self.name)
+            await asyncio.sleep(PUMP_INTERVAL_S)
+
+    def start(self) -> None:
+        # Only new samples are streamed
+        self.cursor, _ts, _vals = self.backend.get_samples_since(0)
+        self._task = asyncio.get_running_loop().create_task(self._pump_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            self.backend.stop()
+        except Exception:
+            logger.exception("Error stopping backend for %s", self.name)
+
+
+# ---------- Session index ----------
+
+
+def _index_connection() -> Optional[sqlite3.Connection]:
+    """Read-only connection to sessions_index.db (None if it doesn't exist yet)."""
+    if not os.path.isfile(SESSIONS_DB_PATH):
+        return None
+    conn = sqlite3.connect(f"file:{SESSIONS_DB_PATH}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def query_sessions(
+    mode: Optional[str] = None,
+    source: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0,
+) -> List[dict]:
+    """Session index rows, newest first; since/until compare ISO timestamps."""
+    clauses, params = [], []
+    for column, op, value in (
+        ("mode", "=", mode),
+        ("source", "=", source),
+        ("timestamp", ">=", since),
+        ("timestamp", "<", until),
+    ):
+        if value:
+            clauses.append(f"{column} {op} ?")
+            params.append(value)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    params += [max(1, min(SESSION_PAGE_LIMIT, int(limit))), max(0, int(offset))]
+
+    conn = _index_connection()
+    if conn is None:
+        return []
+    try:
+        rows = conn.execute(
+            f"SELECT * FROM sessions {where} ORDER BY timestamp DESC LIMIT ? OFFSET ?", params
+        ).fetchall()
+    finally:
+        conn.close()
+    return [dict(row) for row in rows]
+
+
+def get_session(session_id: str) -> Optional[dict]:
+    """One index row plus its offline re-scoring rows (if any)."""
+    conn = _index_connection()
+    if conn is None:
+        return None
+    try:
+        row = conn.execute("SELECT * FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        if row is None:
+            return None
+        session = dict(row)
+        scores = []
+        if session.get("csv_path"):
+            try:
+                scores = [
+                    dict(r)
+                    for r in conn.execute(
+                        "SELECT * FROM session_scores WHERE csv_path = ?", (session["csv_path"],)
+                    )
+                ]
+            except sqlite3.OperationalError:
+                pass    # no re-scoring run yet
+    finally:
+        conn.close()
+    for score in scores:
+        for key in ("reps_per_channel", "pct_in_band"):
+            try:
+                score[key] = json.loads(score[key])
+            except (TypeError, ValueError):
+                pass
+    session["scores"] = scores
+    return session
+
+
+def _resolve_recording(path: Optional[str]) -> Optional[str]:
+    """
+    An indexed csv_path, or the file of the same name in data/logs when the
+    index was written on another machine / checkout.
+    """
+    if not path:
+        return None
+    if os.path.isfile(path):
+        return path
+    local = os.path.join(LOGS_DIR, os.path.basename(path))
+    return local if os.path.isfile(local) else None
+
+
+def _session_file(session_id: str) -> Optional[str]:
+    """The recorded file of an indexed session; only indexed paths are ever served."""
+    session = get_session(session_id)
+    return _resolve_recording(session.get("csv_path")) if session else None
+
+
+# ---------- HTTP / WebSocket handlers ----------
+
+
+def _int_param(request: Request, name: str, default: int) -> int:
+    try:
+        return int(request.query_params.get(name, default))
+    except ValueError:
+        return default
+
+
+async def health(request: Request) -> JSONResponse:
+    return JSONResponse({"ok": True, "devices": sorted(request.app.state.streams)})
+
+
+async def list_devices(request: Request) -> JSONResponse:
+    out = []
+    for name, stream in request.app.state.streams.items():
+        info = stream.describe()
+        info.pop("frame")
+        info["stats"] = backend_stats(stream.backend)
+        info["clients"] = [c.stats() for c in stream.clients]
+        out.append(info)
+    return JSONResponse(out)
+
+
+async def list_sessions(request: Request) -> JSONResponse:
+    q = request.query_params
+    rows = await run_in_threadpool(
+        query_sessions,
+        mode=q.get("mode"),
+        source=q.get("source"),
+        since=q.get("since"),
+        until=q.get("until"),
+        limit=_int_param(request, "limit", 100),
+        offset=_int_param(request, "offset", 0),
+    )
+    return JSONResponse(rows)
+
+
+async def session_detail(request: Request) -> JSONResponse:
+    session = await run_in_threadpool(get_session, request.path_params["session_id"])
+    if session is None:
+        return JSONResponse({"error": "unknown session"}, status_code=404)
+    path = _resolve_recording(session.get("csv_path"))
+    session["meta"] = read_session_meta(path) if path else None
+    session["has_data"] = path is not None
+    return JSONResponse(session)
+
+
+async def session_data(request: Request) -> JSONResponse:
+    path = await run_in_threadpool(_session_file, request.path_params["session_id"])
+    if path is None:
+        return JSONResponse({"error": "no recorded data for this session"}, status_code=404)
+    decimate = max(1, _int_param(request, "decimate", 1))
+    try:
+        data = await run_in_threadpool(load_session, path)
+    except Exception:
+        logger.exception("Failed to load session file %s", path)
+        return JSONResponse({"error": "session file unreadable"}, status_code=500)
+    return JSONResponse(
+        {
+            "path": os.path.basename(path),
+            "num_channels": data.num_channels,
+            "num_samples": data.num_samples,
+            "duration_s": data.duration_s,
+            "tmin": data.tmin,
+            "tmax": data.tmax,
+            "decimate": decimate,
+            "time": data.time[::decimate].tolist(),
+            "channels": data.channels[:, ::decimate].tolist(),
+        }
+    )
+
+
+async def session_file(request: Request):
+    path = await run_in_threadpool(_session_file, request.path_params["session_id"])
+    if path is None:
+        return JSONResponse({"error": "no recorded data for this session"}, status_code=404)
+    return FileResponse(path, filename=os.path.basename(path))
+
+
+async def stream_ws(websocket: WebSocket) -> None:
+    stream = websocket.app.state.streams.get(websocket.path_params["device"])
+    if stream is None:
+        await websocket.close(code=4404)
+        return
+    try:
+        requested = int(websocket.query_params.get("decimate", 1))
+    except ValueError:
+        requested = 1
+    await websocket.accept()
+    client = StreamClient(requested, ack=websocket.query_params.get("ack") == "1")
+    await websocket.send_text(json.dumps(dict(stream.describe(), decimate=client.decimate)))
+    stream.clients.append(client)
+    peer = f"{websocket.client.host}:{websocket.client.port}" if websocket.client else "?"
+    logger.info(
+        "Stream client %s subscribed to %s (decimate=%d, ack=%s)", peer, stream.name, client.decimate, client.ack_mode
+    )
+
+    async def send_frames() -> None:
+        while True:
+            frame = await client.next_frame()
+            await websocket.send_bytes(frame)
+
+    async def read_controls() -> None:
+        while True:
+            msg = await websocket.receive_text()
+            try:
+                control = json.loads(msg)
+                if "ack" in control:
+                    client.ack(control["ack"])
+                if "decimate" in control:
+                    client.set_requested(control["decimate"])
+            except (ValueError, AttributeError, TypeError):
+                logger.debug("Ignoring stream control message %r", msg)
+
+    tasks = [asyncio.create_task(send_frames()), asyncio.create_task(read_controls())]
+    try:
+        done, _pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            exc = task.exception()
+            if exc is not None and not isinstance(exc, (WebSocketDisconnect, RuntimeError, OSError)):
+                logger.error("Stream client %s failed: %r", peer, exc)
+    finally:
+        for task in tasks:
+            task.cancel()
+        stream.clients.remove(client)
+        logger.info("Stream client %s left %s (%s)", peer, stream.name, client.stats())
+
+
+# ---------- Authentication ----------
+
+
+def is_loopback(host: str) -> bool:
+    """Whether a bind address only accepts connections from this machine."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _request_token(scope: dict) -> Optional[str]:
+    for name, value in scope.get("headers", []):
+        if name == b"authorization":
+            scheme, _, credentials = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer":
+                return credentials.strip()
+    return QueryParams(scope.get("query_string", b"")).get("token")
+
+
+class TokenAuth:
+    """
+    ASGI middleware requiring `token` on every HTTP request (401 otherwise)
+    and WebSocket connection (closed with 1008, policy violation).
+    """
+
+    def __init__(self, app, token: str):
+        self.app = app
+        self._token = token.encode("utf-8")
+
+    def _authorized(self, scope: dict) -> bool:
+        given = _request_token(scope)
+        return given is not None and hmac.compare_digest(given.encode("utf-8"), self._token)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] not in ("http", "websocket") or self._authorized(scope):
+            await self.app(scope, receive, send)
+            return
+        client = scope.get("client")
+        logger.warning(
+            "Rejected unauthenticated %s %s from %s",
+            scope["type"],
+            scope.get("path"),
+            f"{client[0]}:{client[1]}" if client else "?",
+        )
+        if scope["type"] == "websocket":
+            await send({"type": "websocket.close", "code": 1008})
+            return
+        response = JSONResponse(
+            {"error": "authentication required"}, status_code=401, headers={"WWW-Authenticate": "Bearer"}
+        )
+        await response(scope, receive, send)
+
+
+# ---------- App ----------
+
+
+def create_app(backends: Dict[str, object], token: Optional[str] = None) -> Starlette:
+    """
+    App serving `backends` ({name: started backend}); the app stops them
+    on shutdown. With `token`, every route requires it (see TokenAuth).
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        app.state.streams = {name: DeviceStream(name, backend) for name, backend in backends.items()}
+        for stream in app.state.streams.values():
+            stream.start()
+        logger.info("Stream server serving %s", ", ".join(app.state.streams) or "(no devices)")
+        try:
+            yield
+        finally:
+            for stream in app.state.streams.values():
+                await stream.stop()
+            logger.info("Stream server stopped")
+
+    routes = [
+        Route("/health", health),
+        Route("/api/devices", list_devices),
+        Route("/api/sessions", list_sessions),
+        Route("/api/sessions/{session_id}", session_detail),
+        Route("/api/sessions/{session_id}/data", session_data),
+        Route("/api/sessions/{session_id}/file", session_file),
+        WebSocketRoute("/ws/stream/{device}", stream_ws),
+    ]
+    middleware = [Middleware(TokenAuth, token=token)] if token else []
+    return Starlette(routes=routes, middleware=middleware, lifespan=lifespan)
+
+
+def device_name(spec: str, taken) -> str:
+    """
+    URL-safe stream name for a --port spec: the serial device's basename
+    ("ttyACM0"), the recording's name for "replay:<file>", else the scheme
+    ("shm", "multi"); "glove" for auto-detect. Suffixed to stay unique.
+    """
+    scheme, sep, rest = spec.partition(":")
+    if not spec:
+        name = "glove"
+    elif sep and scheme == "replay":
+        name = os.path.splitext(os.path.basename(rest))[0]
+    elif sep and "/" not in scheme and "\\" not in scheme and len(scheme) > 1:
+        name = scheme.split("@")[0]
+    else:
+        name = os.path.basename(spec.rstrip("/\\"))
+    name = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in name) or "device"
+    unique, i = name, 1
+    while unique in taken:
+        i += 1
+        unique = f"{name}{i}"
+    return unique
+
+
+def open_backends(ports: List[str], sim: bool, baud: int) -> Dict[str, object]:
+    """Named backends from the CLI: "sim", then one per --port ("" = auto-detect)."""
+    from comms.serial_backend import SerialBackend
+    from comms.sim_backend import SimBackend
+
+    backends: Dict[str, object] = {}
+    if sim:
+        backends["sim"] = open_shared_backend(SimBackend, port=None, timeout=0.01)
+    for spec in ports:
+        name = device_name(spec, backends)
+        backends[name] = open_shared_backend(SerialBackend, port=spec or None, baud=baud, timeout=0.01)
+    return backends
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="cardinal-grip-stream-server",
+        description="Serve live glove data and recorded sessions to remote dashboards.",
+    )
+    parser.add_argument("--sim", action="store_true", help="Serve a SimBackend as device 'sim'")
+    parser.add_argument(
+        "--port",
+        action="append",
+        default=[],
+        help="Device to serve (repeatable): serial port, 'auto', 'shm:<name>', 'multi:...', 'replay:<file>'",
+    )
+    parser.add_argument("--baud", type=int, default=115200)
+    parser.add_argument(
+        "--host", default=DEFAULT_HOST, help="Bind address (0.0.0.0 to serve the LAN; requires --token)"
+    )
+    parser.add_argument("--http-port", type=int, default=DEFAULT_HTTP_PORT)
+    parser.add_argument(
+        "--token",
+        default=os.environ.get(TOKEN_ENV) or None,
+        help=f"Require this token on every request (default: ${TOKEN_ENV})",
+    )
+    args = parser.parse_args(argv)
+    if not args.token and not is_loopback(args.host):
+        parser.error(f"--host {args.host} serves patient data beyond this machine; set --token or ${TOKEN_ENV}")
+
+    from logger.app_logging import configure_logging
+    configure_logging(LOG_FILE, level=logging.INFO)
+
+    import uvicorn
+
+    ports = ["" if p == "auto" else p for p in args.port]
+    if not args.sim and not ports:
+        ports = [""]    # auto-detect one glove
+    try:
+        backends = open_backends(ports, args.sim, args.baud)
+    except Exception:
+        logger.exception("Failed to open devices %s", args.port or "(auto-detect)")
+        return 1
+
+    logger.info(
+        "Stream server listening on http://%s:%d (%s)",
+        args.host,
+        args.http_port,
+        "token required" if args.token else "no authentication, loopback only",
+    )
+    uvicorn.run(create_app(backends, token=args.token), host=args.host, port=args.http_port, log_config=None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
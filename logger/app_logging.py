@@ -2,7 +2,13 @@
 
 import sys
 import os
+import json
+import time
+import queue
+import atexit
 import logging
+import logging.handlers
+import threading
 import uuid
 
 import colorama
@@ -59,6 +65,189 @@ class RunIdFilter(logging.Filter):
         return True
 
 
+# ========================================================
+#   JSON Lines formatter (machine-readable run logs)
+# ========================================================
+
+# Attributes every LogRecord has; anything else came in via extra= and is
+# written as a structured field
+_STANDARD_RECORD_ATTRS = frozenset(
+    vars(logging.makeLogRecord({})).keys() | {"message", "asctime", "run_id"}
+)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    One JSON object per line:
+
+        {"ts": "2026-10-19T14:03:12.345", "run_id": "a3f9c1b2", "level": "INFO",
+         "logger": "cardinal_grip.gui.patient_game", "msg": "...",
+         "instance_id": 2, "backend": {...}, ...}
+
+    "ts" is local time, ISO 8601, and always first, so logger.query_logs can
+    filter on time without parsing the JSON. Extra fields passed with
+    logger.xxx(..., extra={...}) are included as-is (non-JSON values are repr'd).
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        ts = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created))
+        doc = {
+            "ts": f"{ts}.{int(record.msecs):03d}",
+            "run_id": getattr(record, "run_id", None),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_RECORD_ATTRS and not key.startswith("_"):
+                doc[key] = value
+        if record.exc_info:
+            doc["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            doc["exc"] = record.exc_text
+        return json.dumps(doc, default=repr, ensure_ascii=False)
+
+
+# ========================================================
+#   Rate limiting for hot-path loggers
+# ========================================================
+
+# logger name prefix -> (max records per message per window, window seconds, max level limited)
+# The GUI ticks (20 ms), backend threads and SimBackend key events can log far
+# faster than anyone reads; warnings and errors from these loggers still pass.
+DEFAULT_RATE_LIMITS = {
+    "cardinal_grip.gui.patient_monitor": (5, 1.0, logging.DEBUG),
+    "cardinal_grip.gui.patient_game":    (5, 1.0, logging.DEBUG),
+    "cardinal_grip.comms.sim":           (10, 1.0, logging.DEBUG),
+    "cardinal_grip.comms.serial":        (10, 1.0, logging.DEBUG),
+}
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Per-logger rate limit: at most `limit` records with the same logger name
+    and message template per `window` seconds, for records at or below the
+    rule's level. The first record let through after a suppressed stretch
+    says how many were dropped.
+    """
+    def __init__(self, rules: dict):
+        super().__init__()
+        # Longest prefix first so "a.b.c" beats "a.b"
+        self.rules = sorted(rules.items(), key=lambda kv: len(kv[0]), reverse=True)
+        self._state: dict = {}     # (name, msg) -> [window_start, count, suppressed]
+        self._lock = threading.Lock()
+
+    def _rule_for(self, name: str):
+        for prefix, rule in self.rules:
+            if name == prefix or name.startswith(prefix + "."):
+                return rule
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rule = self._rule_for(record.name)
+        if rule is None:
+            return True
+        limit, window, max_level = rule
+        if record.levelno > max_level:
+            return True
+
+        msg = record.msg if isinstance(record.msg, str) else type(record.msg).__name__
+        key = (record.name, msg)
+        now = time.monotonic()
+        with self._lock:
+            state = self._state.get(key)
+            if state is None or now - state[0] >= window:
+                suppressed = state[2] if state is not None else 0
+                self._state[key] = [now, 1, 0]
+            elif state[1] < limit:
+                state[1] += 1
+                suppressed = 0
+            else:
+                state[2] += 1
+                return False
+
+        if suppressed:
+            # Rare path: format here so the note can be appended safely
+            record.msg = f"{record.getMessage()} [+{suppressed} similar suppressed]"
+            record.args = None
+        return True
+
+
+# ========================================================
+#   Background (queue) handler
+# ========================================================
+
+LOG_QUEUE_SIZE = 10000
+
+# Text log and JSON Lines log both rotate: <file>, <file>.1, ... <file>.N
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+JSON_LOG_MAX_BYTES = 20 * 1024 * 1024
+JSON_LOG_BACKUP_COUNT = 50        # ~1 GB of history
+
+
+def json_log_path(log_file: str) -> str:
+    """cardinal_grip.log -> cardinal_grip.jsonl (same directory)."""
+    return os.path.splitext(log_file)[0] + ".jsonl"
+
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for an in-process QueueListener.
+
+    The stock prepare() formats the message on the calling thread; here the
+    record goes on the queue as-is, so %-formatting, coloring and file I/O
+    all happen on the listener thread. Callers should therefore pass values
+    (not containers they keep mutating) as log arguments.
+
+    If the queue is full (listener stalled), records are dropped and counted
+    rather than blocking the caller.
+    """
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: logging.handlers.QueueListener | None = None
+_queue_handler: AsyncQueueHandler | None = None
+
+
+def shutdown_logging() -> None:
+    """
+    Drain the queue and stop the listener thread (registered with atexit;
+    safe to call more than once).
+    """
+    global _listener
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    if _queue_handler is not None and _queue_handler.dropped:
+        # Listener is gone: write straight to its handlers
+        record = logging.makeLogRecord({
+            "name": "cardinal_grip",
+            "levelno": logging.WARNING,
+            "levelname": "WARNING",
+            "msg": "%d log records dropped (queue full)",
+            "args": (_queue_handler.dropped,),
+            "run_id": getattr(_queue_handler, "run_id", "-"),
+        })
+        for handler in listener.handlers:
+            handler.handle(record)
+    for handler in listener.handlers:
+        handler.flush()
+
+
 # ========================================================
 #   Main configuration
 # ========================================================
@@ -66,17 +255,27 @@ class RunIdFilter(logging.Filter):
 def configure_logging(
     log_file: str | None,
     level: int = logging.DEBUG,
+    rate_limits: dict | None = None,
+    json_log_file: str | None = None,
 ) -> logging.Logger:
     """
     Configure logging once for the 'cardinal_grip' application.
 
     - Sets up a colored console handler.
-    - Optionally sets up a file handler if log_file is not None.
+    - Optionally sets up a rotating text file handler if log_file is not
+      None, plus a rotating JSON Lines log next to it (json_log_file,
+      default <log_file stem>.jsonl; see logger.query_logs).
+    - Both run on a QueueListener thread; the root logger only gets a
+      non-blocking AsyncQueueHandler, so callers never format or do I/O.
     - Attaches a per-run ID (run_id) to all records.
+    - Rate-limits hot-path loggers (rate_limits, default DEFAULT_RATE_LIMITS;
+      pass {} to disable).
     - Is idempotent: calling this again will not add duplicate handlers.
 
     Returns the main 'cardinal_grip' logger.
     """
+    global _listener, _queue_handler
+
     root = logging.getLogger()
 
     # If already configured, don't add handlers again
@@ -100,10 +299,7 @@ def configure_logging(
     )
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(console_formatter)
-    console_handler.addFilter(run_filter)
-
-    root.setLevel(level)
-    root.addHandler(console_handler)
+    handlers = [console_handler]
 
     # ---- File (no color) ----
     if log_file:
@@ -111,10 +307,44 @@ def configure_logging(
             "%(asctime)s - %(run_id)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%m-%d-%Y %I:%M:%S %p",
         )
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+        )
         file_handler.setFormatter(file_formatter)
-        file_handler.addFilter(run_filter)
-        root.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # ---- JSON Lines (structured, rotating) ----
+    if json_log_file is None and log_file:
+        json_log_file = json_log_path(log_file)
+    if json_log_file:
+        json_handler = logging.handlers.RotatingFileHandler(
+            json_log_file,
+            maxBytes=JSON_LOG_MAX_BYTES,
+            backupCount=JSON_LOG_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        json_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(json_handler)
+
+    # ---- Queue: callers enqueue, the listener thread formats + writes ----
+    # run_id and rate limits are applied on the calling side (cheap), so
+    # suppressed records never reach the queue.
+    queue_handler = AsyncQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+    queue_handler.run_id = run_id
+    queue_handler.addFilter(run_filter)
+    limits = DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits
+    if limits:
+        queue_handler.addFilter(RateLimitFilter(limits))
+
+    listener = logging.handlers.QueueListener(
+        queue_handler.queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    _listener, _queue_handler = listener, queue_handler
+    atexit.register(shutdown_logging)
+
+    root.setLevel(level)
+    root.addHandler(queue_handler)
 
     # Main app logger
     app_logger = logging.getLogger("cardinal_grip")
@@ -0,0 +1,343 @@
+# logger/profiling.py
+#
+# Opt-in profiling for the GUI entry points (--profile).
+#
+# Two layers:
+#   * call timers: GUI tick methods (poll_sensor, game_tick, ...) are wrapped
+#     with a perf_counter_ns pair and attributed per window instance
+#     ("PatientWindow#2.poll_sensor"), so several open windows can be told
+#     apart. Backend thread loops (_read_loop, _run_loop) are wrapped once
+#     per thread and report thread CPU time per produced sample.
+#   * cProfile (mode "full"): the GUI thread is profiled as a whole and the
+#     stats are written as a .prof file (pstats / snakeviz / `python -m pstats`).
+#
+# On stop() a summary table is printed to stderr, logged as structured
+# fields, and written next to the .prof file under logger/profiles/.
+#
+#   profiler = start_profiling("patient_dashboard", mode="full")
+#   ...app.exec()...
+#   profiler.stop()
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import json
+import cProfile
+import logging
+import argparse
+import importlib
+import threading
+from datetime import datetime
+from functools import wraps
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger("cardinal_grip.profiling")
+
+LOGGER_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_DIR = os.path.join(LOGGER_DIR, "profiles")
+
+PROFILE_MODES = ("timers", "full")
+
+# "module:Class.method" -> wrapped as per-call timers / per-thread loops
+DEFAULT_CALL_TARGETS = (
+    "host.gui.patient_dashboard.patient_app:PatientWindow.poll_sensor",
+    "host.gui.patient_dashboard.patient_game_app:PatientGameWindow.game_tick",
+)
+DEFAULT_LOOP_TARGETS = (
+    "comms.serial_backend:SerialBackend._read_loop",
+    "comms.sim_backend:SimBackend._run_loop",
+)
+
+SAMPLE_RING = 4096      # per-call durations kept for percentiles
+
+
+# ---------- argparse helper ----------
+
+def add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="full",
+        choices=PROFILE_MODES,
+        help="Time GUI ticks and backend loops; 'full' (default) also writes a cProfile .prof "
+             f"file. Results go to {PROFILE_DIR}",
+    )
+
+
+# ---------- stats ----------
+
+class CallStats:
+    __slots__ = ("count", "total_ns", "max_ns", "ring")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.ring = [0] * SAMPLE_RING
+
+    def add(self, dt_ns: int) -> None:
+        self.ring[self.count % SAMPLE_RING] = dt_ns
+        self.count += 1
+        self.total_ns += dt_ns
+        if dt_ns > self.max_ns:
+            self.max_ns = dt_ns
+
+    def row(self, wall_s: float) -> dict:
+        kept = sorted(self.ring[: min(self.count, SAMPLE_RING)])
+
+        def pct(p: float) -> float:
+            return kept[min(len(kept) - 1, int(p * len(kept)))] / 1e6 if kept else 0.0
+
+        return {
+            "calls": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_ms": self.total_ns / self.count / 1e6 if self.count else 0.0,
+            "p95_ms": pct(0.95),
+            "max_ms": self.max_ns / 1e6,
+            "share": self.total_ns / 1e9 / wall_s if wall_s > 0 else 0.0,
+        }
+
+
+class LoopStats:
+    """One backend thread loop: wall / thread CPU time and samples produced."""
+
+    __slots__ = ("thread_ident", "wall_start", "cpu_start", "samples_start",
+                 "wall_s", "cpu_s", "samples", "backend")
+
+    def __init__(self, backend, thread_ident: int):
+        self.backend = backend
+        self.thread_ident = thread_ident
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.thread_time()
+        self.samples_start = _backend_samples(backend)
+        self.wall_s: Optional[float] = None      # set when the loop returns
+        self.cpu_s: Optional[float] = None
+        self.samples = 0
+
+    def finish(self) -> None:
+        self.wall_s = time.perf_counter() - self.wall_start
+        self.cpu_s = time.thread_time() - self.cpu_start
+        self.samples = _backend_samples(self.backend) - self.samples_start
+
+    def row(self) -> dict:
+        running = self.wall_s is None
+        wall = time.perf_counter() - self.wall_start if running else self.wall_s
+        cpu = self.cpu_s
+        samples = self.samples
+        if running:
+            samples = _backend_samples(self.backend) - self.samples_start
+            cpu = _thread_cpu(self.thread_ident)
+            if cpu is not None:
+                cpu -= self.cpu_start
+        return {
+            "running": running,
+            "wall_s": wall,
+            "cpu_s": cpu,
+            "samples": samples,
+            "cpu_share": cpu / wall if cpu is not None and wall > 0 else None,
+            "us_per_sample": cpu / samples * 1e6 if cpu is not None and samples else None,
+        }
+
+
+def _backend_samples(backend) -> int:
+    try:
+        return int(backend.get_stats().get("samples", 0))
+    except Exception:
+        return 0
+
+
+def _thread_cpu(ident: int) -> Optional[float]:
+    """CPU time of another (still running) thread, where the OS exposes it."""
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(ident))
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _instance_label(obj) -> str:
+    instance_id = getattr(obj, "instance_id", None)
+    return f"{type(obj).__name__}#{instance_id if instance_id is not None else hex(id(obj))}"
+
+
+def _resolve(target: str):
+    module_name, _, attr = target.partition(":")
+    cls_name, _, method = attr.rpartition(".")
+    cls = getattr(importlib.import_module(module_name), cls_name)
+    return cls, method
+
+
+# ---------- profiler ----------
+
+class Profiler:
+    def __init__(self, app_name: str, mode: str = "full", out_dir: str = PROFILE_DIR):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode {mode!r} (expected one of {PROFILE_MODES})")
+        self.app_name = app_name
+        self.mode = mode
+        self.out_dir = out_dir
+        self.calls: Dict[str, CallStats] = {}
+        self.loops: Dict[str, LoopStats] = {}
+        self._lock = threading.Lock()
+        self._patched = []          # (cls, name, original)
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._started = None
+        self._stopped = False
+
+    # ---------- instrumentation ----------
+
+    def instrument_call(self, cls, method: str) -> None:
+        """Time every call of cls.method, keyed per instance."""
+        original = getattr(cls, method)
+        calls = self.calls
+        lock = self._lock
+        perf_ns = time.perf_counter_ns
+
+        @wraps(original)
+        def timed(obj, *args, **kwargs):
+            t0 = perf_ns()
+            try:
+                return original(obj, *args, **kwargs)
+            finally:
+                dt = perf_ns() - t0
+                key = f"{_instance_label(obj)}.{method}"
+                stats = calls.get(key)
+                if stats is None:
+                    with lock:
+                        stats = calls.setdefault(key, CallStats())
+                stats.add(dt)
+
+        self._patch(cls, method, original, timed)
+
+    def instrument_loop(self, cls, method: str) -> None:
+        """Measure a backend's thread loop as a whole (CPU per sample)."""
+        original = getattr(cls, method)
+        loops = self.loops
+        lock = self._lock
+
+        @wraps(original)
+        def measured(obj, *args, **kwargs):
+            ident = threading.get_ident()
+            stats = LoopStats(obj, ident)
+            with lock:
+                loops[f"{type(obj).__name__}.{method} [{threading.current_thread().name}]"] = stats
+            try:
+                return original(obj, *args, **kwargs)
+            finally:
+                stats.finish()
+
+        self._patch(cls, method, original, measured)
+
+    def _patch(self, cls, method, original, wrapper) -> None:
+        setattr(cls, method, wrapper)
+        self._patched.append((cls, method, original))
+
+    def instrument(self, call_targets: Iterable[str] = (), loop_targets: Iterable[str] = ()) -> None:
+        for target in call_targets:
+            try:
+                self.instrument_call(*_resolve(target))
+            except Exception:
+                logger.exception("Profiler: could not instrument %s", target)
+        for target in loop_targets:
+            try:
+                self.instrument_loop(*_resolve(target))
+            except Exception:
+                logger.exception("Profiler: could not instrument %s", target)
+
+    # ---------- lifecycle ----------
+
+    def start(self) -> "Profiler":
+        self._started = time.perf_counter()
+        if self.mode == "full":
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        logger.info("Profiling %s (mode=%s)", self.app_name, self.mode)
+        return self
+
+    def stop(self) -> Optional[str]:
+        """Restore the wrapped methods and write the report; returns the summary path."""
+        if self._stopped or self._started is None:
+            return None
+        self._stopped = True
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        wall_s = time.perf_counter() - self._started
+        for cls, method, original in reversed(self._patched):
+            setattr(cls, method, original)
+
+        summary = self.summary(wall_s)
+        table = format_summary(summary)
+        print(table, file=sys.stderr)
+
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = os.path.join(self.out_dir, f"{self.app_name}_{stamp}")
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            with open(base + ".txt", "w", encoding="utf-8") as f:
+                f.write(table + "\n")
+            with open(base + ".json", "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2)
+            if self._cprofile is not None:
+                self._cprofile.dump_stats(base + ".prof")
+        except Exception:
+            logger.exception("Profiler: failed to write report to %s.*", base)
+            return None
+
+        logger.info(
+            "Profile written to %s.* (%.1f s)",
+            base,
+            wall_s,
+            extra={"profile": summary},
+        )
+        return base + ".txt"
+
+    def summary(self, wall_s: float) -> dict:
+        with self._lock:
+            calls = dict(self.calls)
+            loops = dict(self.loops)
+        return {
+            "app": self.app_name,
+            "mode": self.mode,
+            "wall_s": wall_s,
+            "calls": {k: calls[k].row(wall_s) for k in sorted(calls)},
+            "loops": {k: loops[k].row() for k in sorted(loops)},
+        }
+
+
+def format_summary(summary: dict) -> str:
+    lines = [
+        f"Profile: {summary['app']} ({summary['mode']}), {summary['wall_s']:.1f} s wall",
+        "",
+        f"{'GUI call':<40} {'calls':>8} {'total ms':>10} {'mean ms':>8} {'p95 ms':>8} {'max ms':>8} {'share':>6}",
+    ]
+    for key, r in summary["calls"].items():
+        lines.append(
+            f"{key:<40} {r['calls']:>8d} {r['total_ms']:>10.1f} {r['mean_ms']:>8.3f} "
+            f"{r['p95_ms']:>8.3f} {r['max_ms']:>8.2f} {r['share']:>6.1%}"
+        )
+    if not summary["calls"]:
+        lines.append("  (no instrumented calls ran)")
+
+    lines += ["", f"{'Backend loop':<48} {'wall s':>8} {'cpu s':>8} {'cpu %':>6} {'samples':>9} {'µs/sample':>10}"]
+    for key, r in summary["loops"].items():
+        cpu = f"{r['cpu_s']:.2f}" if r["cpu_s"] is not None else "?"
+        share = f"{r['cpu_share']:.1%}" if r["cpu_share"] is not None else "?"
+        per = f"{r['us_per_sample']:.1f}" if r["us_per_sample"] is not None else "–"
+        state = " (running)" if r["running"] else ""
+        lines.append(f"{key + state:<48} {r['wall_s']:>8.1f} {cpu:>8} {share:>6} {r['samples']:>9d} {per:>10}")
+    if not summary["loops"]:
+        lines.append("  (no backend loops ran)")
+    return "\n".join(lines)
+
+
+def start_profiling(
+    app_name: str,
+    mode: str = "full",
+    call_targets: Iterable[str] = DEFAULT_CALL_TARGETS,
+    loop_targets: Iterable[str] = DEFAULT_LOOP_TARGETS,
+) -> Profiler:
+    """Instrument the default targets (plus any extras) and start."""
+    profiler = Profiler(app_name, mode)
+    profiler.instrument(call_targets, loop_targets)
+    return profiler.start()
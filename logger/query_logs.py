@@ -0,0 +1,191 @@
+# logger/query_logs.py
+#
+# Search the structured JSON Lines run logs (cardinal_grip.jsonl and its
+# rotated backups, written by app_logging.configure_logging).
+#
+# Usage:
+#   python -m logger.query_logs --list-runs
+#   python -m logger.query_logs --run-id a3f9c1b2
+#   python -m logger.query_logs --since "2026-10-01" --until "2026-10-08 18:00" --level WARNING
+#   python -m logger.query_logs --run-id a3f9 --logger cardinal_grip.gui --grep latency --json
+#
+# Time filters and run_id are checked on the raw line before JSON parsing,
+# and rotated files last written before --since are skipped entirely, so
+# narrow queries over weeks of logs stay fast.
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import glob
+import logging
+import argparse
+from datetime import date, datetime, time
+from typing import Iterator, Optional
+
+LOGGER_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_JSON_LOG = os.path.join(LOGGER_DIR, "cardinal_grip.jsonl")
+
+# Lines start with {"ts": "YYYY-MM-DDTHH:MM:SS.mmm" (see JsonLinesFormatter)
+_TS_PREFIX = '{"ts": "'
+_TS_LEN = len("2026-01-01T00:00:00.000")
+
+_LEVELS = {name: logging.getLevelName(name) for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")}
+
+_BASE_FIELDS = ("ts", "run_id", "level", "logger", "msg", "thread", "exc")
+
+
+def log_files(path: str = DEFAULT_JSON_LOG) -> list[str]:
+    """The log and its rotated backups, oldest first (…, .jsonl.2, .jsonl.1, .jsonl)."""
+    def backup_index(p: str) -> int:
+        suffix = p[len(path):].lstrip(".")
+        return int(suffix) if suffix.isdigit() else 0
+
+    files = [p for p in glob.glob(glob.escape(path) + "*") if p == path or p[len(path):].lstrip(".").isdigit()]
+    return sorted(files, key=backup_index, reverse=True)
+
+
+def parse_time(text: Optional[str]) -> Optional[str]:
+    """User time ("2026-10-01", "2026-10-01 14:00", ISO) -> comparable ts string."""
+    if not text:
+        return None
+    try:
+        dt = datetime.fromisoformat(text.strip().replace(" ", "T"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a date/time: {text!r}")
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}"
+
+
+def parse_until(text: Optional[str]) -> Optional[str]:
+    """Like parse_time, but a date alone means the end of that day (inclusive)."""
+    if not text:
+        return None
+    try:
+        day = date.fromisoformat(text.strip())
+    except ValueError:
+        return parse_time(text)
+    return parse_time(datetime.combine(day, time.max).isoformat())
+
+
+def iter_records(
+    files: list[str],
+    run_id: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    min_level: int = 0,
+    logger_prefix: Optional[str] = None,
+    grep: Optional[str] = None,
+) -> Iterator[dict]:
+    run_needle = f'"run_id": "{run_id}' if run_id else None
+    since_epoch = datetime.fromisoformat(since).timestamp() if since else None
+
+    for path in files:
+        try:
+            if since_epoch is not None and os.path.getmtime(path) < since_epoch:
+                continue        # nothing in this file is new enough
+            f = open(path, "r", encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        with f:
+            for line in f:
+                if line.startswith(_TS_PREFIX):
+                    ts = line[len(_TS_PREFIX):len(_TS_PREFIX) + _TS_LEN]
+                    if since and ts < since:
+                        continue
+                    if until and ts > until:
+                        continue
+                if run_needle and run_needle not in line:
+                    continue
+                if grep and grep not in line:
+                    continue
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                if min_level and _LEVELS.get(rec.get("level"), 0) < min_level:
+                    continue
+                if logger_prefix:
+                    name = rec.get("logger") or ""
+                    if name != logger_prefix and not name.startswith(logger_prefix + "."):
+                        continue
+                yield rec
+
+
+def format_record(rec: dict) -> str:
+    extra = {k: v for k, v in rec.items() if k not in _BASE_FIELDS}
+    text = f"{rec.get('ts')} {rec.get('run_id')} {rec.get('level', ''):<8} {rec.get('logger')} - {rec.get('msg')}"
+    if extra:
+        text += "  " + json.dumps(extra, separators=(",", ":"), default=str)
+    if rec.get("exc"):
+        text += "\n" + rec["exc"]
+    return text
+
+
+def list_runs(records: Iterator[dict]) -> list[dict]:
+    runs: dict[str, dict] = {}
+    for rec in records:
+        rid = rec.get("run_id") or "-"
+        run = runs.get(rid)
+        if run is None:
+            run = runs[rid] = {"run_id": rid, "first": rec.get("ts"), "last": rec.get("ts"), "records": 0, "warnings": 0}
+        run["last"] = rec.get("ts")
+        run["records"] += 1
+        if _LEVELS.get(rec.get("level"), 0) >= logging.WARNING:
+            run["warnings"] += 1
+    return list(runs.values())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="cardinal-grip-logs",
+        description="Filter the structured (JSON Lines) Cardinal Grip run logs.",
+    )
+    parser.add_argument("--file", default=DEFAULT_JSON_LOG, help="JSON Lines log (rotated backups are included)")
+    parser.add_argument("--run-id", help="Only this run (prefix match)")
+    parser.add_argument("--since", type=parse_time, help='Start time, e.g. "2026-10-01" or "2026-10-01 14:00"')
+    parser.add_argument("--until", type=parse_until, help="End time (inclusive; a date alone covers that whole day)")
+    parser.add_argument("--level", choices=list(_LEVELS), help="Minimum level")
+    parser.add_argument("--logger", dest="logger_prefix", help="Logger name or prefix, e.g. cardinal_grip.gui")
+    parser.add_argument("--grep", help="Substring anywhere in the record")
+    parser.add_argument("--limit", type=int, default=0, help="Stop after N records (0 = no limit)")
+    parser.add_argument("--list-runs", action="store_true", help="Summarise matching runs instead of printing records")
+    parser.add_argument("--json", action="store_true", help="Print matching records as JSON Lines")
+    args = parser.parse_args(argv)
+
+    files = log_files(args.file)
+    if not files:
+        print(f"No logs found at {args.file}", file=sys.stderr)
+        return 1
+
+    records = iter_records(
+        files,
+        run_id=args.run_id,
+        since=args.since,
+        until=args.until,
+        min_level=_LEVELS[args.level] if args.level else 0,
+        logger_prefix=args.logger_prefix,
+        grep=args.grep,
+    )
+
+    try:
+        if args.list_runs:
+            for run in list_runs(records):
+                print(
+                    f"{run['run_id']}  {run['first']} → {run['last']}  "
+                    f"{run['records']} records, {run['warnings']} warnings+"
+                )
+            return 0
+
+        for n, rec in enumerate(records, 1):
+            print(json.dumps(rec, ensure_ascii=False) if args.json else format_record(rec))
+            if args.limit and n >= args.limit:
+                break
+    except BrokenPipeError:
+        # e.g. piped into head
+        sys.stderr.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+# model/calibration_fit.py
+
+"""
+Fitting force calibrations from many (ADC, known force) pairs.
+
+fit_calibration() builds one of the model.calibration_force kinds from all
+captured samples of a channel, with ordinary least squares or a robust
+Huber IRLS fit (for captures with a few bumped / mis-seated samples), and
+reports the residuals so the clinician can judge the fit before saving.
+
+    result = fit_calibration(adc, newtons, kind="power", robust=True)
+    result.calibration.convert(batch)
+    result.rmse, result.max_abs_residual, result.r2
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from .calibration_force import (
+    ForceCalibration,
+    PiecewiseLinearCalibration,
+    PowerLawCalibration,
+)
+
+FIT_KINDS = ("linear", "power", "piecewise")
+
+HUBER_K = 1.345          # 95% efficiency under Gaussian noise
+IRLS_MAX_ITER = 50
+IRLS_TOL = 1e-8
+
+
+@dataclass
+class FitResult:
+    calibration: object
+    kind: str
+    robust: bool
+    n: int
+    residuals: np.ndarray      # force residuals (N) per input pair: predicted - measured
+    rmse: float
+    max_abs_residual: float
+    r2: float
+
+    def summary(self) -> dict:
+        """JSON-friendly fit statistics (stored with the calibration)."""
+        return {
+            "kind": self.kind,
+            "robust": self.robust,
+            "n": self.n,
+            "rmse_n": round(self.rmse, 6),
+            "max_abs_residual_n": round(self.max_abs_residual, 6),
+            "r2": round(self.r2, 6),
+        }
+
+
+def _weighted_lstsq(X: np.ndarray, y: np.ndarray, w: Optional[np.ndarray] = None) -> np.ndarray:
+    if w is None:
+        coef, *_ = np.linalg.lstsq(X, y, rcond=None)
+        return coef
+    sw = np.sqrt(w)
+    coef, *_ = np.linalg.lstsq(X * sw[:, None], y * sw, rcond=None)
+    return coef
+
+
+def _huber_irls(X: np.ndarray, y: np.ndarray, k: float = HUBER_K) -> np.ndarray:
+    """
+    Huber M-estimate by iteratively reweighted least squares.
+    Residual scale is re-estimated each pass from the MAD.
+    """
+    coef = _weighted_lstsq(X, y)
+    for _ in range(IRLS_MAX_ITER):
+        r = y - X @ coef
+        scale = 1.4826 * np.median(np.abs(r - np.median(r)))
+        if scale <= 0:
+            break
+        u = np.abs(r) / (k * scale)
+        w = np.where(u <= 1.0, 1.0, 1.0 / np.maximum(u, 1e-12))
+        new = _weighted_lstsq(X, y, w)
+        if np.max(np.abs(new - coef)) <= IRLS_TOL * (1.0 + np.max(np.abs(coef))):
+            coef = new
+            break
+        coef = new
+    return coef
+
+
+def _fit_linear(adc, force, robust):
+    X = np.column_stack((adc, np.ones_like(adc)))
+    slope, intercept = _huber_irls(X, force) if robust else _weighted_lstsq(X, force)
+    if slope == 0:
+        raise ValueError("linear fit has zero slope (force does not vary with ADC)")
+    # F = slope * (adc - adc_offset) with force_offset 0: adc_offset = -intercept / slope
+    return ForceCalibration(slope=float(slope), adc_offset=float(-intercept / slope))
+
+
+def _fit_power(adc, force, robust, adc_zero):
+    if adc_zero is None:
+        # No-load reading: the zero-force samples if captured, else just below the lowest ADC
+        unloaded = adc[force <= 0]
+        adc_zero = float(np.median(unloaded)) if unloaded.size else float(adc.min()) - 1.0
+    x = adc - adc_zero
+    keep = (x > 0) & (force > 0)
+    if np.count_nonzero(keep) < 2:
+        raise ValueError("power fit needs at least two loaded samples above the no-load ADC")
+    X = np.column_stack((np.log(x[keep]), np.ones(np.count_nonzero(keep))))
+    y = np.log(force[keep])
+    exponent, log_scale = _huber_irls(X, y) if robust else _weighted_lstsq(X, y)
+    return PowerLawCalibration(
+        scale=float(np.exp(log_scale)), exponent=float(exponent), adc_zero=float(adc_zero)
+    )
+
+
+def _fit_piecewise(adc, force, robust):
+    # One knot per distinct load: its ADC is the mean (or median if robust)
+    levels = np.unique(force)
+    if levels.size < 2:
+        raise ValueError("piecewise fit needs at least two different loads")
+    center = np.median if robust else np.mean
+    knots_adc = np.array([center(adc[force == lv]) for lv in levels])
+    order = np.argsort(knots_adc)
+    knots_adc, levels = knots_adc[order], levels[order]
+    # Loads that read identically (saturated sensor) collapse into one knot
+    keep = np.concatenate(([True], np.diff(knots_adc) > 0))
+    if np.count_nonzero(keep) < 2:
+        raise ValueError("piecewise fit needs loads with different ADC readings")
+    return PiecewiseLinearCalibration(knots_adc[keep].tolist(), levels[keep].tolist())
+
+
+def fit_calibration(
+    adc,
+    force,
+    kind: str = "power",
+    robust: bool = False,
+    adc_zero: Optional[float] = None,
+) -> FitResult:
+    """
+    Fit one channel from paired samples.
+
+    adc:   (N,) ADC counts
+    force: (N,) known force in newtons for each sample (0 for unloaded)
+    kind:  "linear", "power" (FSR-style) or "piecewise"
+    robust: Huber IRLS instead of plain least squares (piecewise: medians)
+    adc_zero: no-load reading for "power"; estimated from 0 N samples if None
+    """
+    a = np.asarray(adc, dtype=float).reshape(-1)
+    f = np.asarray(force, dtype=float).reshape(-1)
+    if a.size != f.size:
+        raise ValueError("adc and force must have the same length")
+    if a.size < 2:
+        raise ValueError("need at least two samples to fit")
+
+    if kind == "linear":
+        cal = _fit_linear(a, f, robust)
+    elif kind == "power":
+        cal = _fit_power(a, f, robust, adc_zero)
+    elif kind == "piecewise":
+        cal = _fit_piecewise(a, f, robust)
+    else:
+        raise ValueError(f"Unknown fit kind {kind!r} (expected one of {FIT_KINDS})")
+
+    pred = np.asarray(cal.adc_to_force(a), dtype=float)
+    residuals = pred - f
+    ss_res = float(np.sum(residuals ** 2))
+    ss_tot = float(np.sum((f - f.mean()) ** 2))
+    return FitResult(
+        calibration=cal,
+        kind=kind,
+        robust=robust,
+        n=int(a.size),
+        residuals=residuals,
+        rmse=float(np.sqrt(ss_res / a.size)),
+        max_abs_residual=float(np.max(np.abs(residuals))),
+        r2=1.0 - ss_res / ss_tot if ss_tot > 0 else 0.0,
+    )
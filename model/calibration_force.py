@@ -1,29 +1,103 @@
-# model/force_calibration.py
+# model/calibration_force.py
+
+"""
+ADC -> force (N) calibration.
+
+Every calibration converts scalars *or* whole NumPy arrays / sample
+batches, and can precompute a 4096-entry lookup table (one entry per
+12-bit ADC code) so the hot path is a single array index:
+
+    cal = PowerLawCalibration.from_points(adc, newtons)
+    forces = cal.lut()[adc_batch]            # or cal.convert(adc_batch)
+
+Kinds:
+  - ForceCalibration            linear, F = slope * (adc - adc_offset) + force_offset
+  - PiecewiseLinearCalibration  interpolates measured (adc, N) points
+  - PowerLawCalibration         F = scale * (adc - adc_zero)^exponent, the usual FSR response
+
+GloveCalibration groups one calibration per channel and converts (N, C)
+batches through a stacked (C, 4096) table.
+
+Calibrations are frozen dataclasses: the tables are cached on first use,
+so a calibration never changes after it is built (fit a new one instead).
+"""
 
 import json
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+ADC_CODES = 4096        # 12-bit ESP32 ADC
+
+
+def _as_index(adc) -> np.ndarray:
+    """ADC values (any shape) -> valid LUT indices."""
+    return np.clip(np.rint(np.asarray(adc)), 0, ADC_CODES - 1).astype(np.intp)
 
 
-@dataclass
-class ForceCalibration:
+class _LutMixin(ABC):
+    """Shared LUT / batch conversion for all calibration kinds."""
+
+    kind = ""
+
+    @abstractmethod
+    def adc_to_force(self, adc):
+        """ADC counts (scalar or array) -> force in N."""
+
+    @cached_property
+    def _lut(self) -> np.ndarray:
+        table = np.asarray(self.adc_to_force(np.arange(ADC_CODES, dtype=float)), dtype=np.float32)
+        table.setflags(write=False)
+        return table
+
+    def lut(self) -> np.ndarray:
+        """Read-only float32[4096] table: lut()[adc] == adc_to_force(adc)."""
+        return self._lut
+
+    def convert(self, adc) -> np.ndarray:
+        """Vectorized ADC -> N through the LUT (integer ADC codes)."""
+        return self._lut[_as_index(adc)]
+
+
+@dataclass(frozen=True)
+class ForceCalibration(_LutMixin):
     """
     Simple linear calibration:
         F(N) = slope * (adc - adc_offset) + force_offset
 
     For most use-cases you can set force_offset = 0 and just use:
         F = slope * (adc - adc_offset)
+
+    adc_to_force / force_to_adc accept scalars or arrays.
     """
     slope: float          # N per ADC count
     adc_offset: float = 0.0
     force_offset: float = 0.0
 
-    def adc_to_force(self, adc: float) -> float:
-        return self.slope * (adc - self.adc_offset) + self.force_offset
+    kind = "linear"
+
+    def adc_to_force(self, adc):
+        if np.isscalar(adc):
+            return self.slope * (adc - self.adc_offset) + self.force_offset
+        return self.slope * (np.asarray(adc, dtype=float) - self.adc_offset) + self.force_offset
 
-    def force_to_adc(self, force: float) -> float:
+    def force_to_adc(self, force):
         # inverse mapping
-        return (force - self.force_offset) / self.slope + self.adc_offset
+        if np.isscalar(force):
+            return (force - self.force_offset) / self.slope + self.adc_offset
+        return (np.asarray(force, dtype=float) - self.force_offset) / self.slope + self.adc_offset
+
+    def to_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "slope": self.slope,
+            "adc_offset": self.adc_offset,
+            "force_offset": self.force_offset,
+        }
 
     @classmethod
     def from_two_point(cls, adc1: float, F1: float, adc2: float, F2: float):
@@ -43,19 +117,185 @@ class ForceCalibration:
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("w") as f:
-            json.dump(
-                {
-                    "slope": self.slope,
-                    "adc_offset": self.adc_offset,
-                    "force_offset": self.force_offset,
-                },
-                f,
-                indent=2,
-            )
+            json.dump(self.to_dict(), f, indent=2)
 
     @classmethod
     def load(cls, path: str | Path) -> "ForceCalibration":
         path = Path(path)
         with path.open("r") as f:
             data = json.load(f)
-        return cls(**data)
\ No newline at end of file
+        data.pop("kind", None)
+        return cls(**data)
+
+
+@dataclass(frozen=True)
+class PiecewiseLinearCalibration(_LutMixin):
+    """
+    Interpolates measured (adc, N) points; flat beyond the first / last point.
+
+    Points are sorted by ADC and stored as tuples. Force should be
+    non-decreasing for force_to_adc() to be meaningful.
+    """
+    adc_points: tuple
+    force_points: tuple
+
+    kind = "piecewise"
+
+    def __post_init__(self):
+        adc = np.asarray(self.adc_points, dtype=float)
+        force = np.asarray(self.force_points, dtype=float)
+        if adc.shape != force.shape or adc.size < 2:
+            raise ValueError("need at least two (adc, force) points of equal length")
+        order = np.argsort(adc)
+        adc, force = adc[order], force[order]
+        if np.any(np.diff(adc) == 0):
+            raise ValueError("adc_points must be distinct")
+        adc.setflags(write=False)
+        force.setflags(write=False)
+        object.__setattr__(self, "_adc", adc)
+        object.__setattr__(self, "_force", force)
+        object.__setattr__(self, "adc_points", tuple(adc.tolist()))
+        object.__setattr__(self, "force_points", tuple(force.tolist()))
+
+    def adc_to_force(self, adc):
+        out = np.interp(np.asarray(adc, dtype=float), self._adc, self._force)
+        return float(out) if np.ndim(out) == 0 else out
+
+    def force_to_adc(self, force):
+        out = np.interp(np.asarray(force, dtype=float), self._force, self._adc)
+        return float(out) if np.ndim(out) == 0 else out
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, "adc_points": list(self.adc_points), "force_points": list(self.force_points)}
+
+
+@dataclass(frozen=True)
+class PowerLawCalibration(_LutMixin):
+    """
+    FSR power-law response:
+        F(N) = scale * max(adc - adc_zero, 0) ** exponent
+
+    adc_zero is the no-load reading; below it the force is 0.
+    """
+    scale: float
+    exponent: float
+    adc_zero: float = 0.0
+
+    kind = "power"
+
+    def adc_to_force(self, adc):
+        x = np.maximum(np.asarray(adc, dtype=float) - self.adc_zero, 0.0)
+        out = self.scale * np.power(x, self.exponent)
+        return float(out) if np.ndim(out) == 0 else out
+
+    def force_to_adc(self, force):
+        f = np.maximum(np.asarray(force, dtype=float), 0.0)
+        out = np.power(f / self.scale, 1.0 / self.exponent) + self.adc_zero
+        return float(out) if np.ndim(out) == 0 else out
+
+    @classmethod
+    def from_points(cls, adc, force, adc_zero: float = 0.0) -> "PowerLawCalibration":
+        """
+        Log-log least-squares fit of F = scale * (adc - adc_zero)^exponent.
+        Points at or below adc_zero / with F <= 0 carry no information and are skipped.
+        """
+        x = np.asarray(adc, dtype=float) - adc_zero
+        f = np.asarray(force, dtype=float)
+        keep = (x > 0) & (f > 0)
+        if np.count_nonzero(keep) < 2:
+            raise ValueError("need at least two points above adc_zero with positive force")
+        exponent, log_scale = np.polyfit(np.log(x[keep]), np.log(f[keep]), 1)
+        return cls(scale=float(np.exp(log_scale)), exponent=float(exponent), adc_zero=float(adc_zero))
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, "scale": self.scale, "exponent": self.exponent, "adc_zero": self.adc_zero}
+
+
+CALIBRATION_KINDS = {
+    ForceCalibration.kind: ForceCalibration,
+    PiecewiseLinearCalibration.kind: PiecewiseLinearCalibration,
+    PowerLawCalibration.kind: PowerLawCalibration,
+}
+
+
+def calibration_from_dict(data: dict):
+    """Inverse of .to_dict(); files without "kind" are linear (older format)."""
+    data = dict(data)
+    kind = data.pop("kind", ForceCalibration.kind)
+    try:
+        cls = CALIBRATION_KINDS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown calibration kind {kind!r}") from None
+    return cls(**data)
+
+
+@dataclass(frozen=True)
+class GloveCalibration:
+    """
+    One calibration per channel; converts whole (N, C) sample batches with a
+    stacked (C, 4096) lookup table. Channels are stored as a tuple.
+    """
+    channels: tuple = field(default_factory=tuple)
+
+    def __post_init__(self):
+        object.__setattr__(self, "channels", tuple(self.channels))
+
+    @property
+    def num_channels(self) -> int:
+        return len(self.channels)
+
+    @cached_property
+    def _table(self) -> np.ndarray:
+        table = np.stack([cal.lut() for cal in self.channels])    # (C, 4096)
+        table.setflags(write=False)
+        return table
+
+    def lut(self) -> np.ndarray:
+        """Read-only float32[C, 4096] table."""
+        return self._table
+
+    def to_force(self, values) -> np.ndarray:
+        """
+        (C,) or (N, C) ADC counts -> force in N, same shape (float32).
+        Extra columns beyond num_channels are ignored.
+        """
+        idx = _as_index(values)
+        c = self.num_channels
+        if idx.ndim == 1:
+            return self._table[np.arange(c), idx[:c]]
+        return self._table[np.arange(c), idx[:, :c]]
+
+    def to_adc(self, forces, channel: Optional[int] = None):
+        """Inverse mapping for thresholds / UI (not hot path)."""
+        if channel is not None:
+            return self.channels[channel].force_to_adc(forces)
+        f = np.asarray(forces, dtype=float)
+        return np.stack(
+            [self.channels[c].force_to_adc(f[..., c]) for c in range(self.num_channels)],
+            axis=-1,
+        )
+
+    @classmethod
+    def uniform(cls, calibration, num_channels: int = 4) -> "GloveCalibration":
+        return cls(channels=[calibration] * num_channels)
+
+    # ---- persistence ----
+
+    def to_dict(self) -> dict:
+        return {"channels": [cal.to_dict() for cal in self.channels]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GloveCalibration":
+        return cls(channels=[calibration_from_dict(d) for d in data.get("channels", [])])
+
+    def save(self, path: str | Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "GloveCalibration":
+        path = Path(path)
+        with path.open("r") as f:
+            return cls.from_dict(json.load(f))
\ No newline at end of file
@@ -0,0 +1,165 @@
+# model/calibration_store.py
+
+"""
+Versioned per-glove calibration files.
+
+    data/calibration/<glove_id>/v001.json, v002.json, ...
+
+Each save creates the next version; nothing is overwritten, so a session
+recorded against v003 can always be re-read with v003. Files hold the
+GloveCalibration (see model.calibration_force) plus fit statistics and
+capture metadata. calibration_ref() is the small dict that session
+metadata stores to point at the calibration in use.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import json
+import logging
+from datetime import datetime
+from typing import Optional, Tuple
+
+from .calibration_force import GloveCalibration
+
+logger = logging.getLogger("cardinal_grip.calibration")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CALIBRATION_DIR = os.path.join(PROJECT_ROOT, "data", "calibration")
+DEFAULT_GLOVE_ID = "default"
+
+FORMAT_VERSION = 1
+_VERSION_RE = re.compile(r"^v(\d+)\.json$")
+
+
+def _glove_dir(glove_id: str, base_dir: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", glove_id) or DEFAULT_GLOVE_ID
+    return os.path.join(base_dir, safe)
+
+
+def list_versions(glove_id: str = DEFAULT_GLOVE_ID, base_dir: str = CALIBRATION_DIR) -> list[int]:
+    directory = _glove_dir(glove_id, base_dir)
+    if not os.path.isdir(directory):
+        return []
+    versions = []
+    for name in os.listdir(directory):
+        m = _VERSION_RE.match(name)
+        if m:
+            versions.append(int(m.group(1)))
+    return sorted(versions)
+
+
+def calibration_path(glove_id: str, version: int, base_dir: str = CALIBRATION_DIR) -> str:
+    return os.path.join(_glove_dir(glove_id, base_dir), f"v{version:03d}.json")
+
+
+def save_glove_calibration(
+    glove: GloveCalibration,
+    glove_id: str = DEFAULT_GLOVE_ID,
+    fits: Optional[list] = None,
+    notes: str = "",
+    extra: Optional[dict] = None,
+    base_dir: str = CALIBRATION_DIR,
+) -> Tuple[str, int]:
+    """
+    Write the next version for glove_id. fits: per-channel FitResult.summary()
+    dicts (or None). Returns (path, version).
+    """
+    directory = _glove_dir(glove_id, base_dir)
+    os.makedirs(directory, exist_ok=True)
+    existing = list_versions(glove_id, base_dir)
+    version = (existing[-1] + 1) if existing else 1
+
+    doc = {
+        "format": FORMAT_VERSION,
+        "glove_id": glove_id,
+        "version": version,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "units": "N",
+        "notes": notes,
+        "fits": fits or [],
+        **glove.to_dict(),
+    }
+    if extra:
+        doc.update(extra)
+
+    path = calibration_path(glove_id, version, base_dir)
+    # "x": never clobber a version written concurrently
+    with open(path, "x") as f:
+        json.dump(doc, f, indent=2)
+    logger.info("Saved calibration %s v%03d -> %s", glove_id, version, path)
+    return path, version
+
+
+def load_glove_calibration(
+    glove_id: str = DEFAULT_GLOVE_ID,
+    version: Optional[int] = None,
+    base_dir: str = CALIBRATION_DIR,
+) -> Tuple[GloveCalibration, dict]:
+    """
+    Load a version (default: latest). Returns (GloveCalibration, full document).
+    Raises FileNotFoundError if the glove has no calibration.
+    """
+    if version is None:
+        versions = list_versions(glove_id, base_dir)
+        if not versions:
+            raise FileNotFoundError(f"No calibration saved for glove {glove_id!r}")
+        version = versions[-1]
+    path = calibration_path(glove_id, version, base_dir)
+    with open(path, "r") as f:
+        doc = json.load(f)
+    doc["_path"] = path      # not persisted; lets calibration_ref() point at the real file
+    return GloveCalibration.from_dict(doc), doc
+
+
+def calibration_ref(doc: Optional[dict]) -> Optional[dict]:
+    """What session metadata stores to reference a loaded calibration."""
+    if not doc:
+        return None
+    return {
+        "glove_id": doc.get("glove_id"),
+        "version": doc.get("version"),
+        "created_at": doc.get("created_at"),
+        "path": doc.get("_path")
+        or calibration_path(doc.get("glove_id", DEFAULT_GLOVE_ID), int(doc.get("version", 0))),
+    }
+
+
+def load_current_calibration(
+    glove_id: str = DEFAULT_GLOVE_ID,
+    base_dir: str = CALIBRATION_DIR,
+) -> Tuple[Optional[GloveCalibration], Optional[dict]]:
+    """Latest calibration for glove_id, or (None, None) if there is none / it is unreadable."""
+    try:
+        return load_glove_calibration(glove_id, None, base_dir)
+    except FileNotFoundError:
+        return None, None
+    except Exception:
+        logger.exception("Failed to load calibration for glove %s", glove_id)
+        return None, None
+
+
+def load_calibration_ref(ref: Optional[dict]) -> Tuple[Optional[GloveCalibration], Optional[dict]]:
+    """
+    Resolve a calibration_ref() dict (e.g. from session metadata) back to the
+    calibration it names, or (None, None) if it can't be found.
+    """
+    if not ref:
+        return None, None
+    path = ref.get("path")
+    try:
+        if path and os.path.isfile(path):
+            with open(path, "r") as f:
+                doc = json.load(f)
+            doc["_path"] = path
+            return GloveCalibration.from_dict(doc), doc
+        if ref.get("version") is not None:
+            return load_glove_calibration(ref.get("glove_id") or DEFAULT_GLOVE_ID, int(ref["version"]))
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.exception("Failed to load calibration %s", ref)
+        return None, None
+    logger.warning("Calibration %s not found", ref)
+    return None, None
@@ -0,0 +1,237 @@
+# model/rep_engine.py
+
+"""
+GUI-independent rep / combo detection.
+
+RepEngine consumes timestamped sample batches (every backend sample, not
+GUI ticks) and emits RepEvents. It has no Qt dependency, so the game, the
+dual launcher, headless recording and offline re-scoring all share the same
+rules:
+
+  - A channel earns a rep after HOLD_SECONDS of continuous in-band time.
+    The hold restarts from zero after each rep and whenever the channel
+    leaves the band.
+  - A combo rep is earned after HOLD_SECONDS with ALL channels in band.
+    Leaving the all-in state with a partial combo hold is a "combo_fail".
+
+Band membership comes from an optional ZoneTracker (hysteresis + minimum
+dwell, so one noisy sample can't end a hold) or, without one, from plain
+classify_zones(). Classification is vectorized over the batch; the hold
+timers are resolved per in-band run with cumulative sums, so cost scales
+with the number of runs/reps, not with the number of samples.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .zones import ZONE_IN, ZoneTracker, classify_zones
+
+DEFAULT_HOLD_SECONDS = 5.0
+
+# Event kinds
+EVENT_ENTER = "enter"              # channel entered the band
+EVENT_EXIT = "exit"                # channel left the band
+EVENT_REP = "rep"                  # channel completed a hold
+EVENT_COMBO_ENTER = "combo_enter"  # all channels entered the band
+EVENT_COMBO_FAIL = "combo_fail"    # all-in state lost with a partial hold
+EVENT_COMBO = "combo"              # all channels completed a hold
+
+
+@dataclass(frozen=True)
+class RepEvent:
+    kind: str
+    t: float                       # timestamp of the triggering sample
+    channel: Optional[int] = None  # None for combo events
+    count: int = 0                 # running total for rep / combo events
+
+
+def _scan_holds(
+    flags: np.ndarray,
+    dt: np.ndarray,
+    prev_flag: bool,
+    carry_hold: float,
+    hold_seconds: float,
+):
+    """
+    Resolve enter / exit / completion indices for one boolean stream.
+
+    Returns (enters, exits, completes, final_hold) where exits is a list of
+    (index, hold_before_exit).
+    """
+    n = flags.size
+    f = flags.astype(np.int8)
+    edges = np.diff(np.concatenate(([1 if prev_flag else 0], f)))
+    enters = np.flatnonzero(edges == 1)
+    exit_idx = np.flatnonzero(edges == -1)
+
+    # In-band runs as [start, end] inclusive
+    starts = np.flatnonzero(flags & np.concatenate(([True], ~flags[:-1])))
+    ends = np.flatnonzero(flags & np.concatenate((~flags[1:], [True])))
+
+    completes: List[int] = []
+    hold_at_end: dict[int, float] = {}
+    hold = 0.0
+
+    for s, e in zip(starts, ends):
+        carry = carry_hold if (s == 0 and prev_flag) else 0.0
+        cum = carry + np.cumsum(dt[s:e + 1])
+        base = 0.0
+        pos = 0
+        while pos < cum.size:
+            k = pos + int(np.searchsorted(cum[pos:] - base, hold_seconds, side="left"))
+            if k >= cum.size:
+                break
+            completes.append(int(s + k))
+            base = float(cum[k])
+            pos = k + 1
+        held = float(cum[-1] - base)
+        hold_at_end[int(e)] = held
+        if e == n - 1:
+            hold = held
+
+    exits = []
+    for x in exit_idx:
+        if x == 0:
+            held = carry_hold if prev_flag else 0.0
+        else:
+            held = hold_at_end.get(int(x) - 1, 0.0)
+        exits.append((int(x), held))
+
+    return enters, exits, completes, hold
+
+
+class RepEngine:
+    """
+    Stateful rep / combo detector for `num_channels` channels.
+
+    Counts (reps_per_channel, combo_reps) are cumulative and can be seeded
+    from persisted stats; hold timers are reset by reset_holds().
+    """
+
+    def __init__(
+        self,
+        num_channels: int = 4,
+        hold_seconds: float = DEFAULT_HOLD_SECONDS,
+        combo_hold_seconds: Optional[float] = None,
+        reps_per_channel: Optional[Sequence[int]] = None,
+        combo_reps: int = 0,
+        zone_tracker: Optional[ZoneTracker] = None,
+    ):
+        self.num_channels = num_channels
+        self.zone_tracker = zone_tracker
+        self.hold_seconds = float(hold_seconds)
+        self.combo_hold_seconds = float(
+            hold_seconds if combo_hold_seconds is None else combo_hold_seconds
+        )
+
+        self.reps_per_channel: List[int] = (
+            list(reps_per_channel) if reps_per_channel is not None
+            else [0] * num_channels
+        )
+        self.combo_reps = int(combo_reps)
+
+        self.reset_holds()
+
+    # ---------- state ----------
+
+    def reset_holds(self) -> None:
+        """Clear hold timers and band state (start of a session)."""
+        self.hold_time: List[float] = [0.0] * self.num_channels
+        self.in_band: List[bool] = [False] * self.num_channels
+        self.combo_hold_time = 0.0
+        self.all_in_band = False
+        self._last_t: Optional[float] = None
+        if getattr(self, "zone_tracker", None) is not None:
+            self.zone_tracker.reset()
+
+    def hold_remaining(self, channel: int) -> float:
+        return max(0.0, self.hold_seconds - self.hold_time[channel])
+
+    def combo_remaining(self) -> float:
+        return max(0.0, self.combo_hold_seconds - self.combo_hold_time)
+
+    def combo_fraction(self) -> float:
+        if self.combo_hold_seconds <= 0:
+            return 0.0
+        return max(0.0, min(1.0, self.combo_hold_time / self.combo_hold_seconds))
+
+    # ---------- processing ----------
+
+    def process(self, timestamps, values, tmin: float, tmax: float) -> List[RepEvent]:
+        """
+        Feed a batch of samples and return the events it produced, in time order.
+
+        timestamps: (N,) host timestamps in seconds (monotonic within a stream)
+        values:     (N, C) ADC counts
+        """
+        ts = np.asarray(timestamps, dtype=float).reshape(-1)
+        n = ts.size
+        if n == 0:
+            return []
+        vals = np.asarray(values, dtype=float).reshape(n, -1)
+        if vals.shape[1] < self.num_channels:
+            vals = np.pad(vals, ((0, 0), (0, self.num_channels - vals.shape[1])))
+        vals = vals[:, : self.num_channels]
+
+        if self.zone_tracker is not None:
+            in_band = self.zone_tracker.update(ts, vals, tmin, tmax) == ZONE_IN
+        else:
+            in_band = classify_zones(vals, tmin, tmax) == ZONE_IN
+        return self.process_flags(ts, in_band)
+
+    def process_flags(self, timestamps, in_band) -> List[RepEvent]:
+        """
+        Same as process(), but with precomputed (N, C) in-band flags.
+        """
+        ts = np.asarray(timestamps, dtype=float).reshape(-1)
+        n = ts.size
+        if n == 0:
+            return []
+        flags = np.asarray(in_band, dtype=bool).reshape(n, self.num_channels)
+
+        prev_t = ts[0] if self._last_t is None else self._last_t
+        dt = np.diff(ts, prepend=prev_t)
+        np.maximum(dt, 0.0, out=dt)
+
+        events: List[RepEvent] = []
+
+        for c in range(self.num_channels):
+            enters, exits, completes, hold = _scan_holds(
+                flags[:, c], dt, self.in_band[c], self.hold_time[c], self.hold_seconds
+            )
+            for i in enters:
+                events.append(RepEvent(EVENT_ENTER, float(ts[i]), c))
+            for i, _held in exits:
+                events.append(RepEvent(EVENT_EXIT, float(ts[i]), c))
+            for i in completes:
+                self.reps_per_channel[c] += 1
+                events.append(
+                    RepEvent(EVENT_REP, float(ts[i]), c, self.reps_per_channel[c])
+                )
+            self.hold_time[c] = hold
+            self.in_band[c] = bool(flags[-1, c])
+
+        all_in = flags.all(axis=1)
+        enters, exits, completes, hold = _scan_holds(
+            all_in, dt, self.all_in_band, self.combo_hold_time, self.combo_hold_seconds
+        )
+        for i in enters:
+            events.append(RepEvent(EVENT_COMBO_ENTER, float(ts[i])))
+        for i, held in exits:
+            if held > 0.0:
+                events.append(RepEvent(EVENT_COMBO_FAIL, float(ts[i])))
+        for i in completes:
+            self.combo_reps += 1
+            events.append(RepEvent(EVENT_COMBO, float(ts[i]), None, self.combo_reps))
+        self.combo_hold_time = hold
+        self.all_in_band = bool(all_in[-1])
+
+        self._last_t = float(ts[-1])
+
+        # Stable sort keeps per-channel events ahead of combo events at equal t
+        events.sort(key=lambda e: e.t)
+        return events
@@ -0,0 +1,250 @@
+# model/session_rescore.py
+#
+# Offline batch re-scoring of recorded sessions.
+#
+# Runs the same RepEngine rules the game uses over every recorded CSV, in
+# parallel across a process pool, with alternate thresholds / hold times,
+# and writes per-session results into data/sessions_index.db
+# (table session_scores).
+#
+# Usage:
+#   python -m model.session_rescore                          # CSV thresholds (or 1200–2000)
+#   python -m model.session_rescore --tmin 900 --tmax 1800   # "what if" band
+#   python -m model.session_rescore --hold 3 --combo-hold 4
+#   python -m model.session_rescore --from-index             # files in the session catalog
+#   python -m model.session_rescore --raw-zones              # no hysteresis / dwell (pre-ZoneTracker rules)
+#   python -m model.session_rescore --dry-run                # print only, no DB writes
+
+from __future__ import annotations
+
+import os
+import sys
+import argparse
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
+
+import numpy as np
+
+# model/session_rescore.py → parent = model/, grandparent = project root
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from model.rep_engine import RepEngine, DEFAULT_HOLD_SECONDS
+from model.session_store import load_session, find_session_csvs
+from model.zones import ZONE_IN, ZoneTracker, classify_zones
+
+logger = logging.getLogger("cardinal_grip.sessions.rescore")
+
+LOGS_DIR = os.path.join(PROJECT_ROOT, "data", "logs")
+LOG_FILE = os.path.join(PROJECT_ROOT, "logger", "cardinal_grip.log")
+
+DEFAULT_TMIN = 1200
+DEFAULT_TMAX = 2000
+
+
+def score_session(
+    path: str,
+    tmin: Optional[float] = None,
+    tmax: Optional[float] = None,
+    hold_seconds: float = DEFAULT_HOLD_SECONDS,
+    combo_hold_seconds: Optional[float] = None,
+    hysteresis: bool = True,
+) -> dict:
+    """
+    Score one recorded session (CSV or .cgs) with the RepEngine.
+
+    tmin / tmax default to the thresholds stored in the CSV, then to
+    DEFAULT_TMIN / DEFAULT_TMAX for older recordings without them.
+    hysteresis=True applies the same ZoneTracker rules as the game.
+    """
+    session = load_session(path)
+
+    if tmin is None:
+        tmin = session.tmin if session.tmin is not None else DEFAULT_TMIN
+    if tmax is None:
+        tmax = session.tmax if session.tmax is not None else DEFAULT_TMAX
+    if combo_hold_seconds is None:
+        combo_hold_seconds = hold_seconds
+
+    values = session.channels.T  # (N, C)
+    if hysteresis:
+        zones = ZoneTracker(session.num_channels).update(session.time, values, tmin, tmax)
+    else:
+        zones = classify_zones(values, tmin, tmax)
+    in_band = zones == ZONE_IN
+
+    engine = RepEngine(
+        num_channels=session.num_channels,
+        hold_seconds=hold_seconds,
+        combo_hold_seconds=combo_hold_seconds,
+    )
+    engine.process_flags(session.time, in_band)
+
+    if in_band.size:
+        pct_in_band = [round(float(p), 2) for p in in_band.mean(axis=0) * 100.0]
+    else:
+        pct_in_band = [0.0] * session.num_channels
+
+    reps = list(engine.reps_per_channel)
+    return {
+        "csv_path": os.path.abspath(path),
+        "tmin": float(tmin),
+        "tmax": float(tmax),
+        "hold_seconds": float(hold_seconds),
+        "combo_hold_seconds": float(combo_hold_seconds),
+        "hysteresis": bool(hysteresis),
+        "samples": session.num_samples,
+        "duration_s": round(session.duration_s, 3),
+        "reps_per_channel": reps,
+        "fingers_used": sum(1 for r in reps if r > 0),
+        "total_reps": int(np.sum(reps)),
+        "combo_reps": engine.combo_reps,
+        "pct_in_band": pct_in_band,
+    }
+
+
+def _score_worker(args) -> tuple[str, Optional[dict], Optional[str]]:
+    path, tmin, tmax, hold, combo_hold, hysteresis = args
+    try:
+        return path, score_session(path, tmin, tmax, hold, combo_hold, hysteresis), None
+    except Exception as e:  # reported by the parent, never kills the pool
+        return path, None, f"{type(e).__name__}: {e}"
+
+
+def rescore_sessions(
+    paths: list[str],
+    tmin: Optional[float] = None,
+    tmax: Optional[float] = None,
+    hold_seconds: float = DEFAULT_HOLD_SECONDS,
+    combo_hold_seconds: Optional[float] = None,
+    workers: Optional[int] = None,
+    hysteresis: bool = True,
+) -> tuple[list[dict], list[tuple[str, str]]]:
+    """
+    Score `paths` in parallel. Returns (results, failures), results ordered like paths.
+    """
+    jobs = [(p, tmin, tmax, hold_seconds, combo_hold_seconds, hysteresis) for p in paths]
+    results: dict[str, dict] = {}
+    failures: list[tuple[str, str]] = []
+
+    if workers == 1 or len(jobs) <= 1:
+        outcomes = map(_score_worker, jobs)
+        for path, result, err in outcomes:
+            if err:
+                failures.append((path, err))
+            else:
+                results[path] = result
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_score_worker, job) for job in jobs]
+            for fut in as_completed(futures):
+                path, result, err = fut.result()
+                if err:
+                    failures.append((path, err))
+                else:
+                    results[path] = result
+
+    ordered = [results[p] for p in paths if p in results]
+    return ordered, failures
+
+
+def scenario_label(tmin, tmax, hold_seconds, combo_hold_seconds, hysteresis: bool = True) -> str:
+    if tmin is None and tmax is None:
+        band = "csv"
+    else:
+        lo = "csv" if tmin is None else f"{tmin:g}"
+        hi = "csv" if tmax is None else f"{tmax:g}"
+        band = f"{lo}_{hi}"
+    label = f"band_{band}_hold_{hold_seconds:g}"
+    if combo_hold_seconds is not None and combo_hold_seconds != hold_seconds:
+        label += f"_combo_{combo_hold_seconds:g}"
+    if not hysteresis:
+        label += "_raw"
+    return label
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Re-score recorded Cardinal Grip sessions with alternate thresholds.",
+    )
+    parser.add_argument("--logs-dir", default=LOGS_DIR, help="Directory of session CSV / .cgs files")
+    parser.add_argument(
+        "--from-index",
+        action="store_true",
+        help="Score the CSVs referenced by data/sessions_index.db instead of --logs-dir",
+    )
+    parser.add_argument("paths", nargs="*", help="Explicit CSV files (overrides --logs-dir)")
+    parser.add_argument("--tmin", type=float, default=None, help="Band min (ADC); default from CSV")
+    parser.add_argument("--tmax", type=float, default=None, help="Band max (ADC); default from CSV")
+    parser.add_argument("--hold", type=float, default=DEFAULT_HOLD_SECONDS, help="Rep hold seconds")
+    parser.add_argument("--combo-hold", type=float, default=None, help="Combo hold seconds (default: --hold)")
+    parser.add_argument("--raw-zones", action="store_true", help="Plain band checks without hysteresis / dwell")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count)")
+    parser.add_argument("--scenario", default=None, help="Label stored with the results")
+    parser.add_argument("--dry-run", action="store_true", help="Print results without writing to SQLite")
+    args = parser.parse_args(argv)
+
+    from logger.app_logging import configure_logging
+    configure_logging(LOG_FILE, level=logging.INFO)
+
+    if args.tmin is not None and args.tmax is not None and args.tmax < args.tmin:
+        parser.error("--tmax must be >= --tmin")
+
+    if args.paths:
+        paths = [os.path.abspath(p) for p in args.paths]
+    elif args.from_index:
+        from host.gui.common.session_logging import indexed_csv_paths
+        paths = indexed_csv_paths()
+    else:
+        paths = find_session_csvs(args.logs_dir, include_binary=True)
+
+    if not paths:
+        logger.warning("No session CSVs found to score.")
+        return 1
+
+    scenario = args.scenario or scenario_label(
+        args.tmin, args.tmax, args.hold, args.combo_hold, hysteresis=not args.raw_zones
+    )
+    logger.info("Re-scoring %d session(s) (scenario=%s)", len(paths), scenario)
+
+    t0 = time.perf_counter()
+    results, failures = rescore_sessions(
+        paths,
+        tmin=args.tmin,
+        tmax=args.tmax,
+        hold_seconds=args.hold,
+        combo_hold_seconds=args.combo_hold,
+        workers=args.workers,
+        hysteresis=not args.raw_zones,
+    )
+    elapsed = time.perf_counter() - t0
+
+    for r in results:
+        print(
+            f"{os.path.basename(r['csv_path']):<40} "
+            f"band {r['tmin']:>5.0f}-{r['tmax']:<5.0f} "
+            f"reps {r['reps_per_channel']} total {r['total_reps']:>3} "
+            f"combo {r['combo_reps']:>2}  in-band% {r['pct_in_band']}"
+        )
+    for path, err in failures:
+        logger.error("Failed to score %s: %s", path, err)
+
+    logger.info(
+        "Scored %d/%d session(s) in %.2f s",
+        len(results),
+        len(paths),
+        elapsed,
+    )
+
+    if results and not args.dry_run:
+        from host.gui.common.session_logging import record_session_scores
+        record_session_scores(results, scenario)
+
+    return 0 if not failures else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
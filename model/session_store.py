@@ -0,0 +1,518 @@
+# model/session_store.py
+
+"""
+Reading and writing recorded session files (no Qt).
+
+CSV layout written by PatientWindow.save_csv() and CsvSessionWriter:
+    time_s, ch0_adc, ..., ch3_adc, [tmin_adc, tmax_adc]
+Threshold columns are optional (older recordings don't have them).
+
+Binary layout (.cgs) written by BinarySessionWriter:
+    8-byte magic b"CGSESS1\n", uint32 num_channels, uint32 reserved,
+    then packed records of float64 time_s + uint16[num_channels] ADC.
+Thresholds and other context live in the "<file>.meta.json" sidecar that
+both writers maintain.
+"""
+
+from __future__ import annotations
+
+import os
+import csv
+import json
+import struct
+import tempfile
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger("cardinal_grip.sessions.store")
+
+DEFAULT_NUM_CHANNELS = 4
+
+BIN_MAGIC = b"CGSESS1\n"
+BIN_HEADER = struct.Struct("<8sII")
+BIN_EXT = ".cgs"
+META_SUFFIX = ".meta.json"
+
+
+def _record_dtype(num_channels: int) -> np.dtype:
+    return np.dtype([("t", "<f8"), ("ch", "<u2", (num_channels,))])
+
+
+@dataclass
+class SessionData:
+    path: str
+    time: np.ndarray           # shape (N,)
+    channels: np.ndarray       # shape (C, N), ADC counts
+    tmin: Optional[float] = None
+    tmax: Optional[float] = None
+
+    @property
+    def num_channels(self) -> int:
+        return int(self.channels.shape[0])
+
+    @property
+    def num_samples(self) -> int:
+        return int(self.time.size)
+
+    @property
+    def duration_s(self) -> float:
+        if self.time.size < 2:
+            return 0.0
+        return float(self.time[-1] - self.time[0])
+
+
+def _channel_columns(header: list[str], num_channels: Optional[int]) -> list[int]:
+    """
+    Column index for each ch{c}_adc. Headerless/legacy files fall back to
+    positional columns 1..C.
+    """
+    name_to_idx = {name.strip(): i for i, name in enumerate(header)}
+    if num_channels is None:
+        num_channels = 0
+        while f"ch{num_channels}_adc" in name_to_idx:
+            num_channels += 1
+        if num_channels == 0:
+            num_channels = DEFAULT_NUM_CHANNELS
+    return [name_to_idx.get(f"ch{c}_adc", c + 1) for c in range(num_channels)]
+
+
+def load_session_csv(path: str, num_channels: Optional[int] = None) -> SessionData:
+    """
+    Load a session CSV into NumPy arrays.
+
+    Well-formed files are parsed in one vectorized pass; files with blank,
+    short or non-numeric rows fall back to a tolerant row-by-row reader
+    (bad time -> row skipped, bad channel value -> 0.0).
+    """
+    with open(path, "r", newline="") as f:
+        # readline() (not csv iteration) keeps f.tell() usable for the fallback
+        header_line = f.readline()
+        if not header_line:
+            raise ValueError("CSV file is empty")
+        header = next(csv.reader([header_line]))
+
+        name_to_idx = {name.strip(): i for i, name in enumerate(header)}
+        t_idx = name_to_idx.get("time_s", 0)
+        ch_idx = _channel_columns(header, num_channels)
+        tmin_idx = name_to_idx.get("tmin_adc")
+        tmax_idx = name_to_idx.get("tmax_adc")
+
+        data_start = f.tell()
+        try:
+            table = np.loadtxt(f, delimiter=",", ndmin=2, dtype=float)
+            if table.size and table.shape[1] <= max([t_idx, *ch_idx]):
+                raise ValueError("too few columns")
+        except ValueError:
+            f.seek(data_start)
+            return _load_tolerant(
+                path, csv.reader(f), t_idx, ch_idx, tmin_idx, tmax_idx
+            )
+
+    if table.size == 0:
+        return SessionData(
+            path=path,
+            time=np.zeros(0, dtype=float),
+            channels=np.zeros((len(ch_idx), 0), dtype=float),
+        )
+
+    tmin = float(table[0, tmin_idx]) if tmin_idx is not None and tmin_idx < table.shape[1] else None
+    tmax = float(table[0, tmax_idx]) if tmax_idx is not None and tmax_idx < table.shape[1] else None
+
+    return SessionData(
+        path=path,
+        time=np.ascontiguousarray(table[:, t_idx]),
+        channels=np.ascontiguousarray(table[:, ch_idx].T),
+        tmin=tmin,
+        tmax=tmax,
+    )
+
+
+def _load_tolerant(path, reader, t_idx, ch_idx, tmin_idx, tmax_idx) -> SessionData:
+    times: list[float] = []
+    channels: list[list[float]] = [[] for _ in ch_idx]
+    first_tmin = None
+    first_tmax = None
+
+    for row in reader:
+        if not row:
+            continue
+        try:
+            t = float(row[t_idx])
+        except (ValueError, IndexError):
+            continue
+        times.append(t)
+
+        for c, idx in enumerate(ch_idx):
+            try:
+                v = float(row[idx])
+            except (ValueError, IndexError, TypeError):
+                v = 0.0
+            channels[c].append(v)
+
+        # Capture thresholds from the first row that has them
+        if first_tmin is None and tmin_idx is not None and tmin_idx < len(row):
+            try:
+                first_tmin = float(row[tmin_idx])
+            except (ValueError, TypeError):
+                pass
+        if first_tmax is None and tmax_idx is not None and tmax_idx < len(row):
+            try:
+                first_tmax = float(row[tmax_idx])
+            except (ValueError, TypeError):
+                pass
+
+    return SessionData(
+        path=path,
+        time=np.array(times, dtype=float),
+        channels=np.array(channels, dtype=float).reshape(len(ch_idx), len(times)),
+        tmin=first_tmin,
+        tmax=first_tmax,
+    )
+
+
+def load_session_bin(path: str) -> SessionData:
+    """Load a .cgs binary session; thresholds come from the sidecar, if any."""
+    with open(path, "rb") as f:
+        magic, num_channels, _reserved = BIN_HEADER.unpack(f.read(BIN_HEADER.size))
+        if magic != BIN_MAGIC:
+            raise ValueError(f"{path} is not a Cardinal Grip binary session")
+        dtype = _record_dtype(num_channels)
+        raw = f.read()
+
+    # A record cut short by a crash / power loss is dropped
+    usable = len(raw) - len(raw) % dtype.itemsize
+    records = np.frombuffer(raw[:usable], dtype=dtype)
+
+    meta = read_session_meta(path) or {}
+    return SessionData(
+        path=path,
+        time=records["t"].astype(float),
+        channels=np.ascontiguousarray(records["ch"].T.astype(float)),
+        tmin=meta.get("tmin"),
+        tmax=meta.get("tmax"),
+    )
+
+
+def load_session(path: str, num_channels: Optional[int] = None) -> SessionData:
+    """Load a CSV or .cgs session by extension."""
+    if path.lower().endswith(BIN_EXT):
+        return load_session_bin(path)
+    return load_session_csv(path, num_channels=num_channels)
+
+
+# ---------- Writing ----------
+
+
+def _write_json_atomic(path: str, data: dict) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".meta-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_session_meta(path: str, meta: dict) -> None:
+    """Write the "<path>.meta.json" sidecar for a session file (atomic)."""
+    _write_json_atomic(path + META_SUFFIX, meta)
+
+
+def read_session_meta(path: str) -> Optional[dict]:
+    """The "<path>.meta.json" sidecar for a session file, or None."""
+    try:
+        with open(path + META_SUFFIX, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class _SessionWriter:
+    """
+    Shared bookkeeping for session writers: relative time base, sample
+    count and the .meta.json sidecar (rewritten on flush and close).
+    """
+
+    fmt = ""
+
+    def __init__(
+        self,
+        path: str,
+        num_channels: int = DEFAULT_NUM_CHANNELS,
+        tmin: Optional[float] = None,
+        tmax: Optional[float] = None,
+        t0: Optional[float] = None,
+        meta: Optional[dict] = None,
+    ):
+        self.path = path
+        self.num_channels = num_channels
+        self.tmin = tmin
+        self.tmax = tmax
+        self.t0 = t0
+        self.samples = 0
+        self.started_at = datetime.now()
+        self.extra_meta = dict(meta or {})
+        self.closed = False
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def _rel_times(self, timestamps) -> np.ndarray:
+        ts = np.asarray(timestamps, dtype=float).reshape(-1)
+        if self.t0 is None and ts.size:
+            self.t0 = float(ts[0])
+        return ts - (self.t0 or 0.0)
+
+    def _vals(self, values, n: int) -> np.ndarray:
+        vals = np.asarray(values).reshape(n, -1)[:, : self.num_channels]
+        return np.clip(vals, 0, 4095)
+
+    def meta(self) -> dict:
+        out = {
+            "path": os.path.abspath(self.path),
+            "format": self.fmt,
+            "num_channels": self.num_channels,
+            "samples": self.samples,
+            "tmin": self.tmin,
+            "tmax": self.tmax,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "t0": self.t0,
+            "complete": self.closed,
+        }
+        if self.closed:
+            out["ended_at"] = datetime.now().isoformat(timespec="seconds")
+        out.update(self.extra_meta)
+        return out
+
+    def write_meta(self) -> None:
+        try:
+            _write_json_atomic(self.path + META_SUFFIX, self.meta())
+        except Exception:
+            logger.exception("Failed to write session metadata for %s", self.path)
+
+    def write_batch(self, timestamps, values) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        self.write_meta()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self.write_meta()
+
+
+class CsvSessionWriter(_SessionWriter):
+    """Appends samples in the PatientWindow.save_csv() column layout."""
+
+    fmt = "csv"
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(path, **kwargs)
+        self._f = open(path, "w", newline="")
+        self._writer = csv.writer(self._f)
+        self._writer.writerow(
+            ["time_s"]
+            + [f"ch{c}_adc" for c in range(self.num_channels)]
+            + ["tmin_adc", "tmax_adc"]
+        )
+        self.write_meta()
+
+    def write_batch(self, timestamps, values) -> None:
+        rel = self._rel_times(timestamps)
+        n = rel.size
+        if n == 0:
+            return
+        vals = self._vals(values, n).astype(int)
+        tmin = "" if self.tmin is None else f"{self.tmin:g}"
+        tmax = "" if self.tmax is None else f"{self.tmax:g}"
+        self._writer.writerows(
+            [round(float(t), 6), *row, tmin, tmax]
+            for t, row in zip(rel, vals.tolist())
+        )
+        self.samples += n
+
+    def flush(self) -> None:
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        super().flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._f.close()
+        super().close()
+
+
+class BinarySessionWriter(_SessionWriter):
+    """Appends packed float64 + uint16[C] records (about 3x smaller than CSV)."""
+
+    fmt = "bin"
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(path, **kwargs)
+        self._dtype = _record_dtype(self.num_channels)
+        self._f = open(path, "wb")
+        self._f.write(BIN_HEADER.pack(BIN_MAGIC, self.num_channels, 0))
+        self.write_meta()
+
+    def write_batch(self, timestamps, values) -> None:
+        rel = self._rel_times(timestamps)
+        n = rel.size
+        if n == 0:
+            return
+        records = np.empty(n, dtype=self._dtype)
+        records["t"] = rel
+        records["ch"] = self._vals(values, n)
+        self._f.write(records.tobytes())
+        self.samples += n
+
+    def flush(self) -> None:
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        super().flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._f.close()
+        super().close()
+
+
+SESSION_WRITERS = {"csv": (CsvSessionWriter, ".csv"), "bin": (BinarySessionWriter, BIN_EXT)}
+
+
+class RotatingSessionWriter:
+    """
+    Writes a long capture as consecutive part files:
+        <out_dir>/<prefix>_<YYYYmmdd_HHMMSS>.csv / .cgs
+
+    A new part starts after `rotate_seconds` of samples (0 = never).
+    on_rotate(writer) is called with each finished (closed) part.
+    All parts share the first sample's time base, so time_s continues
+    across files.
+    """
+
+    def __init__(
+        self,
+        out_dir: str,
+        fmt: str = "csv",
+        prefix: str = "record_session",
+        rotate_seconds: float = 0.0,
+        num_channels: int = DEFAULT_NUM_CHANNELS,
+        tmin: Optional[float] = None,
+        tmax: Optional[float] = None,
+        meta: Optional[dict] = None,
+        on_rotate=None,
+    ):
+        if fmt not in SESSION_WRITERS:
+            raise ValueError(f"Unknown session format {fmt!r} (expected one of {sorted(SESSION_WRITERS)})")
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.prefix = prefix
+        self.rotate_seconds = max(0.0, float(rotate_seconds))
+        self.num_channels = num_channels
+        self.tmin = tmin
+        self.tmax = tmax
+        self.meta = dict(meta or {})
+        self.on_rotate = on_rotate
+
+        self.part = 0
+        self.t0: Optional[float] = None
+        self.paths: list[str] = []
+        self.current: Optional[_SessionWriter] = None
+        self._part_started_t: Optional[float] = None
+
+    def _new_part(self, first_ts: float) -> None:
+        self.part += 1
+        cls, ext = SESSION_WRITERS[self.fmt]
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.out_dir, f"{self.prefix}_{stamp}{ext}")
+        if os.path.exists(path):
+            path = os.path.join(self.out_dir, f"{self.prefix}_{stamp}_{self.part:03d}{ext}")
+
+        meta = dict(self.meta, part=self.part)
+        self.current = cls(
+            path,
+            num_channels=self.num_channels,
+            tmin=self.tmin,
+            tmax=self.tmax,
+            t0=self.t0,
+            meta=meta,
+        )
+        self.paths.append(path)
+        self._part_started_t = first_ts
+        logger.info("Recording part %d -> %s", self.part, path)
+
+    def _finish_part(self) -> None:
+        writer, self.current = self.current, None
+        if writer is None:
+            return
+        writer.close()
+        if self.on_rotate is not None:
+            try:
+                self.on_rotate(writer)
+            except Exception:
+                logger.exception("on_rotate callback failed for %s", writer.path)
+
+    def write_batch(self, timestamps, values) -> None:
+        ts = np.asarray(timestamps, dtype=float).reshape(-1)
+        n = ts.size
+        if n == 0:
+            return
+        vals = np.asarray(values).reshape(n, -1)
+        if self.t0 is None:
+            self.t0 = float(ts[0])
+
+        start = 0
+        while start < n:
+            if self.current is None:
+                self._new_part(float(ts[start]))
+
+            end = n
+            if self.rotate_seconds > 0:
+                limit = self._part_started_t + self.rotate_seconds
+                end = start + int(np.searchsorted(ts[start:], limit, side="left"))
+                if end == start:
+                    # This part is full; next sample opens a new one
+                    self._finish_part()
+                    continue
+
+            self.current.write_batch(ts[start:end], vals[start:end])
+            start = end
+
+    def flush(self) -> None:
+        if self.current is not None:
+            self.current.flush()
+
+    def close(self) -> None:
+        self._finish_part()
+
+
+def find_session_csvs(logs_dir: str, include_binary: bool = False) -> list[str]:
+    """All *.csv (and optionally *.cgs) files directly under logs_dir, oldest first."""
+    if not os.path.isdir(logs_dir):
+        return []
+    exts = (".csv", BIN_EXT) if include_binary else (".csv",)
+    paths = [
+        os.path.join(logs_dir, name)
+        for name in os.listdir(logs_dir)
+        if name.lower().endswith(exts)
+    ]
+    paths.sort(key=os.path.getmtime)
+    return paths
@@ -0,0 +1,147 @@
+# model/units.py
+
+"""
+Force units for display, statistics and exports.
+
+Everything upstream (backends, RepEngine, thresholds, session files) stays in
+ADC counts; the calibration (model.calibration_force) maps counts to newtons,
+and this module picks the display unit from settings and folds the unit
+conversion into the calibration's lookup table, so converting a batch is a
+single (C, 4096) table gather no matter which unit is shown.
+
+    scale, doc = ForceScale.from_settings(SETTINGS_PATH, num_channels=4)
+    force = scale.convert(batch)          # (N, C) in scale.unit, or None if uncalibrated
+    scale.format(force[-1, 0])            # "12.3 N"
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import logging
+from functools import cached_property
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .calibration_force import ADC_CODES, GloveCalibration, _as_index
+from .calibration_store import DEFAULT_GLOVE_ID, load_current_calibration
+
+logger = logging.getLogger("cardinal_grip.units")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SETTINGS_PATH = os.path.join(PROJECT_ROOT, "data", "settings.json")
+
+UNIT_NEWTON = "N"
+UNIT_LBF = "lbf"
+FORCE_UNITS = (UNIT_NEWTON, UNIT_LBF)
+
+N_PER_LBF = 4.4482216152605
+
+
+def force_unit_for(setting: Optional[str]) -> str:
+    """
+    Map a "units" setting to a force unit. Accepts both settings pages'
+    spellings ("Imperial" / "Metric", "Imperial (psi, lbf)" / "Metric (kPa, N)").
+    """
+    if setting and str(setting).strip().lower().startswith("imperial"):
+        return UNIT_LBF
+    return UNIT_NEWTON
+
+
+def load_force_unit(settings_path: str = SETTINGS_PATH) -> str:
+    """Force unit from a settings JSON file; newtons if missing or unreadable."""
+    try:
+        with open(settings_path, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return UNIT_NEWTON
+    except Exception:
+        logger.exception("Failed to read units from %s", settings_path)
+        return UNIT_NEWTON
+    return force_unit_for(data.get("units") if isinstance(data, dict) else None)
+
+
+def newtons_to(values, unit: str):
+    """Convert newtons (scalar or array) to `unit`."""
+    if unit == UNIT_LBF:
+        return values / N_PER_LBF
+    return values
+
+
+class ForceScale:
+    """
+    ADC -> force in the display unit, per channel.
+
+    The unit factor is applied to the calibration's (C, 4096) table once, so
+    convert() costs one gather per batch. Channels the calibration doesn't
+    cover convert to NaN. An uncalibrated scale converts to None and the
+    views fall back to ADC only.
+    """
+
+    def __init__(
+        self,
+        calibration: Optional[GloveCalibration] = None,
+        unit: str = UNIT_NEWTON,
+        num_channels: Optional[int] = None,
+    ):
+        if unit not in FORCE_UNITS:
+            raise ValueError(f"Unknown force unit {unit!r} (expected one of {FORCE_UNITS})")
+        self.calibration = calibration
+        self.unit = unit
+        self.num_channels = num_channels or (calibration.num_channels if calibration else 0)
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings_path: str = SETTINGS_PATH,
+        num_channels: Optional[int] = None,
+        glove_id: str = DEFAULT_GLOVE_ID,
+    ) -> Tuple["ForceScale", Optional[dict]]:
+        """Unit from settings + the glove's current calibration. Returns (scale, calibration doc)."""
+        calibration, doc = load_current_calibration(glove_id)
+        return cls(calibration, load_force_unit(settings_path), num_channels), doc
+
+    @property
+    def calibrated(self) -> bool:
+        return self.calibration is not None and self.num_channels > 0
+
+    @cached_property
+    def table(self) -> np.ndarray:
+        """Read-only float32[num_channels, 4096] in self.unit (NaN rows for uncovered channels)."""
+        table = np.full((self.num_channels, ADC_CODES), np.nan, dtype=np.float32)
+        if self.calibration is not None:
+            lut = self.calibration.lut()[: self.num_channels]
+            table[: lut.shape[0]] = newtons_to(lut, self.unit)
+        table.setflags(write=False)
+        return table
+
+    @cached_property
+    def mean_curve(self) -> np.ndarray:
+        """(4096,) channel-averaged table, for shared axes and band labels."""
+        covered = min(self.num_channels, self.calibration.num_channels) if self.calibration else 0
+        curve = self.table[:covered].mean(axis=0) if covered else np.zeros(ADC_CODES, dtype=np.float32)
+        curve.setflags(write=False)
+        return curve
+
+    def convert(self, values) -> Optional[np.ndarray]:
+        """(C,) or (N, C) ADC counts -> float32 force in self.unit, or None if uncalibrated."""
+        if not self.calibrated:
+            return None
+        idx = _as_index(values)
+        c = min(self.num_channels, idx.shape[-1])
+        rows = np.arange(c)
+        if idx.ndim == 1:
+            return self.table[rows, idx[:c]]
+        return self.table[rows, idx[:, :c]]
+
+    def convert_mean(self, adc) -> Optional[float]:
+        """One ADC value (e.g. a threshold) -> channel-averaged force, or None."""
+        if not self.calibrated:
+            return None
+        return float(self.mean_curve[int(np.clip(round(adc), 0, ADC_CODES - 1))])
+
+    def format(self, force: Optional[float], digits: int = 1) -> str:
+        if force is None or not np.isfinite(force):
+            return f"– {self.unit}"
+        return f"{force:.{digits}f} {self.unit}"
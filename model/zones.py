@@ -0,0 +1,165 @@
+# model/zones.py
+
+"""
+Target-band zone classification shared by the GUIs and the rep engine.
+
+Zones are small ints so whole sample batches can be classified at once:
+    ZONE_LOW  (-1): below tmin
+    ZONE_IN    (0): tmin <= v <= tmax
+    ZONE_HIGH  (1): above tmax
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+ADC_MAX = 4095
+
+ZONE_LOW = -1
+ZONE_IN = 0
+ZONE_HIGH = 1
+
+ZONE_NAMES = {ZONE_LOW: "low", ZONE_IN: "in", ZONE_HIGH: "high"}
+
+
+def classify_zones(values, tmin: float, tmax: float) -> np.ndarray:
+    """
+    Vectorized zone classification.
+
+    values: scalar, (C,) or (N, C) array-like of ADC counts.
+    Returns an int8 array of the same shape with ZONE_* codes.
+    """
+    v = np.asarray(values)
+    zones = np.zeros(v.shape, dtype=np.int8)
+    zones[v < tmin] = ZONE_LOW
+    zones[v > tmax] = ZONE_HIGH
+    return zones
+
+
+def zone_color(val: float, tmin: float, tmax: float, zone: Optional[int] = None) -> str:
+    """
+    Color name for a single value, as used by the game bars:
+      - below band: orange (far) -> yellow (close)
+      - in band:    yellowgreen -> green -> darkgreen
+      - above band: darkred (close) -> red (far)
+
+    `zone` (a ZoneTracker zone) picks the band instead of the raw value, so
+    the bar agrees with the debounced state the rep engine counts; the
+    value only picks the shade within it.
+    """
+    if zone is None:
+        zone = ZONE_LOW if val < tmin else ZONE_HIGH if val > tmax else ZONE_IN
+    if zone == ZONE_LOW:
+        frac_below = (val / tmin) if tmin > 0 else 0.0
+        return "orange" if frac_below < 0.5 else "yellow"
+    if zone == ZONE_HIGH:
+        span_high = max(1, ADC_MAX - tmax)
+        frac_above = (val - tmax) / span_high
+        return "darkred" if frac_above < 0.5 else "red"
+
+    span = max(tmax - tmin, 1)
+    frac_in = (val - tmin) / span
+    if frac_in < 1 / 3:
+        return "yellowgreen"
+    if frac_in < 2 / 3:
+        return "green"
+    return "darkgreen"
+
+
+# ---------- Hysteresis / debounce ----------
+
+DEFAULT_ENTER_MARGIN = 15.0   # ADC counts inside the band needed to enter it
+DEFAULT_EXIT_MARGIN = 30.0    # ADC counts outside the band needed to leave it
+DEFAULT_MIN_DWELL = 0.10      # s a new zone must persist before it is accepted
+
+
+class ZoneTracker:
+    """
+    Per-channel zone state machine with hysteresis and minimum dwell.
+
+    - Entering the band needs v inside [tmin + enter_margin, tmax - enter_margin].
+    - Leaving it needs v outside [tmin - exit_margin, tmax + exit_margin].
+    - Any zone change must hold for min_dwell seconds before it is accepted,
+      so a single noisy sample can't end a hold or retrigger entry cues.
+
+    update() takes timestamped (N, C) batches and returns the confirmed
+    zone of every sample; state carries over between batches.
+    """
+
+    def __init__(
+        self,
+        num_channels: int = 4,
+        enter_margin: float = DEFAULT_ENTER_MARGIN,
+        exit_margin: float = DEFAULT_EXIT_MARGIN,
+        min_dwell: float = DEFAULT_MIN_DWELL,
+    ):
+        self.num_channels = num_channels
+        self.enter_margin = max(0.0, float(enter_margin))
+        self.exit_margin = max(0.0, float(exit_margin))
+        self.min_dwell = max(0.0, float(min_dwell))
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget state; the next sample is taken at face value."""
+        self.zones = np.full(self.num_channels, ZONE_LOW, dtype=np.int8)
+        self._pending = self.zones.copy()
+        self._pending_since = np.zeros(self.num_channels, dtype=float)
+        self._primed = False
+
+    def _enter_bounds(self, tmin: float, tmax: float):
+        # Narrow bands: never require more than reaching the band's middle
+        mid = (tmin + tmax) / 2.0
+        return min(tmin + self.enter_margin, mid), max(tmax - self.enter_margin, mid)
+
+    def update(self, timestamps, values, tmin: float, tmax: float) -> np.ndarray:
+        """
+        timestamps: (N,) seconds; values: (N, C) ADC counts.
+        Returns (N, C) int8 confirmed zones.
+        """
+        ts = np.asarray(timestamps, dtype=float).reshape(-1)
+        n = ts.size
+        if n == 0:
+            return np.zeros((0, self.num_channels), dtype=np.int8)
+        vals = np.asarray(values, dtype=float).reshape(n, -1)[:, : self.num_channels]
+
+        raw = classify_zones(vals, tmin, tmax)
+        enter_lo, enter_hi = self._enter_bounds(tmin, tmax)
+        enter_ok = (vals >= enter_lo) & (vals <= enter_hi)
+        stay_ok = (vals >= tmin - self.exit_margin) & (vals <= tmax + self.exit_margin)
+
+        if not self._primed:
+            self.zones[:] = raw[0]
+            self._pending[:] = raw[0]
+            self._pending_since[:] = ts[0]
+            self._primed = True
+
+        zones = self.zones
+        pending = self._pending
+        since = self._pending_since
+        out = np.empty((n, self.num_channels), dtype=np.int8)
+
+        # Recursive in time, vectorized across channels
+        for k in range(n):
+            cand = raw[k].copy()
+            in_now = zones == ZONE_IN
+            cand[in_now & stay_ok[k]] = ZONE_IN
+            blocked = ~in_now & (cand == ZONE_IN) & ~enter_ok[k]
+            cand[blocked] = zones[blocked]
+
+            changed = cand != zones
+            fresh = changed & (cand != pending)
+            pending[fresh] = cand[fresh]
+            since[fresh] = ts[k]
+            pending[~changed] = zones[~changed]
+
+            accept = changed & (ts[k] - since >= self.min_dwell)
+            zones[accept] = cand[accept]
+            out[k] = zones
+
+        return out
+
+    def update_one(self, t: float, values, tmin: float, tmax: float) -> np.ndarray:
+        """Single-sample convenience wrapper: (C,) values -> (C,) zones."""
+        return self.update([t], [values], tmin, tmax)[0]
@@ -0,0 +1,15 @@
+# tests/conftest.py
+
+import os
+import sys
+
+# tests/conftest.py → parent = tests/, grandparent = project root
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(TESTS_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# GUI tests run headless
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Never bind the acquisition hub's TCP port from tests
+os.environ.setdefault("CARDINAL_GRIP_HUB_PORT", "0")
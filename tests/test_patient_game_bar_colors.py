@@ -0,0 +1,72 @@
+# tests/test_patient_game_bar_colors.py
+
+import time
+
+import pytest
+
+# QtMultimedia needs the system audio libraries (libpulse on Linux)
+pytest.importorskip("PyQt6.QtMultimedia", exc_type=ImportError)
+
+from PyQt6.QtWidgets import QApplication
+
+from comms.sample_buffer import SampleBuffer
+
+TMIN = 1200
+TMAX = 2000
+
+
+class _Feed:
+    """Backend-shaped source: the window drains it via get_samples_since()."""
+
+    def __init__(self, num_channels: int = 4):
+        self.num_channels = num_channels
+        self._samples = SampleBuffer(num_channels)
+
+    def push(self, value: int) -> None:
+        self._samples.append(time.time(), [value] * self.num_channels)
+
+    def get_samples_since(self, cursor):
+        return self._samples.since(cursor)
+
+    def get_latest(self):
+        return self._samples.latest()
+
+    def get_last_timestamp(self):
+        return self._samples.last_timestamp()
+
+    def get_stats(self) -> dict:
+        return {"samples": self._samples.seq}
+
+
+@pytest.fixture
+def window():
+    app = QApplication.instance() or QApplication([])
+    from host.gui.patient_dashboard.patient_game_app import PatientGameWindow
+
+    win = PatientGameWindow(log_to_json=False)
+    win._play_sound = lambda cue: None
+    win.target_min_slider.setValue(TMIN)
+    win.target_max_slider.setValue(TMAX)
+    win.backend = _Feed(win.num_channels)
+    yield win
+    win.timer.stop()
+    win.backend = None
+    win.close()
+    win.deleteLater()
+    app.processEvents()
+
+
+def test_bar_color_follows_values_without_session(window):
+    assert not window.timer.isActive()
+
+    window.backend.push(200)
+    window.game_tick()
+    assert window._bar_colors[0] == "orange"
+
+    window.backend.push((TMIN + TMAX) // 2)
+    window.game_tick()
+    assert window._bar_colors[0] == "green"
+
+    window.backend.push(4000)
+    window.game_tick()
+    assert window._bar_colors[0] == "red"
@@ -0,0 +1,45 @@
+# tests/test_query_logs.py
+
+import json
+
+from logger.query_logs import iter_records, main, parse_until
+
+TIMESTAMPS = [
+    "2026-09-30T23:59:59.999",
+    "2026-10-01T00:00:00.000",
+    "2026-10-01T12:30:00.000",
+    "2026-10-01T23:59:59.999",
+    "2026-10-02T00:00:00.000",
+]
+
+
+def _write_log(path):
+    with open(path, "w", encoding="utf-8") as f:
+        for i, ts in enumerate(TIMESTAMPS):
+            rec = {"ts": ts, "run_id": "a3f9c1b2", "level": "INFO", "logger": "cardinal_grip.test", "msg": f"line {i}"}
+            f.write(json.dumps(rec) + "\n")
+
+
+def test_until_date_covers_whole_day(tmp_path):
+    log = tmp_path / "cardinal_grip.jsonl"
+    _write_log(log)
+
+    recs = list(iter_records([str(log)], until=parse_until("2026-10-01")))
+    assert [r["ts"] for r in recs] == TIMESTAMPS[:4]
+
+
+def test_until_with_time_is_exact(tmp_path):
+    log = tmp_path / "cardinal_grip.jsonl"
+    _write_log(log)
+
+    recs = list(iter_records([str(log)], until=parse_until("2026-10-01 12:30")))
+    assert [r["ts"] for r in recs] == TIMESTAMPS[:3]
+
+
+def test_cli_since_until_same_day(tmp_path, capsys):
+    log = tmp_path / "cardinal_grip.jsonl"
+    _write_log(log)
+
+    assert main(["--file", str(log), "--since", "2026-10-01", "--until", "2026-10-01", "--json"]) == 0
+    out = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["ts"] for r in out] == TIMESTAMPS[1:4]